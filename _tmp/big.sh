@@ -0,0 +1,10000 @@
+x0=0
+x1=1
+x2=2
+x3=3
+x4=4
+x5=5
+x6=6
+x7=7
+x8=8
+x9=9
+x10=10
+x11=11
+x12=12
+x13=13
+x14=14
+x15=15
+x16=16
+x17=17
+x18=18
+x19=19
+x20=20
+x21=21
+x22=22
+x23=23
+x24=24
+x25=25
+x26=26
+x27=27
+x28=28
+x29=29
+x30=30
+x31=31
+x32=32
+x33=33
+x34=34
+x35=35
+x36=36
+x37=37
+x38=38
+x39=39
+x40=40
+x41=41
+x42=42
+x43=43
+x44=44
+x45=45
+x46=46
+x47=47
+x48=48
+x49=49
+x50=50
+x51=51
+x52=52
+x53=53
+x54=54
+x55=55
+x56=56
+x57=57
+x58=58
+x59=59
+x60=60
+x61=61
+x62=62
+x63=63
+x64=64
+x65=65
+x66=66
+x67=67
+x68=68
+x69=69
+x70=70
+x71=71
+x72=72
+x73=73
+x74=74
+x75=75
+x76=76
+x77=77
+x78=78
+x79=79
+x80=80
+x81=81
+x82=82
+x83=83
+x84=84
+x85=85
+x86=86
+x87=87
+x88=88
+x89=89
+x90=90
+x91=91
+x92=92
+x93=93
+x94=94
+x95=95
+x96=96
+x97=97
+x98=98
+x99=99
+x0=100
+x1=101
+x2=102
+x3=103
+x4=104
+x5=105
+x6=106
+x7=107
+x8=108
+x9=109
+x10=110
+x11=111
+x12=112
+x13=113
+x14=114
+x15=115
+x16=116
+x17=117
+x18=118
+x19=119
+x20=120
+x21=121
+x22=122
+x23=123
+x24=124
+x25=125
+x26=126
+x27=127
+x28=128
+x29=129
+x30=130
+x31=131
+x32=132
+x33=133
+x34=134
+x35=135
+x36=136
+x37=137
+x38=138
+x39=139
+x40=140
+x41=141
+x42=142
+x43=143
+x44=144
+x45=145
+x46=146
+x47=147
+x48=148
+x49=149
+x50=150
+x51=151
+x52=152
+x53=153
+x54=154
+x55=155
+x56=156
+x57=157
+x58=158
+x59=159
+x60=160
+x61=161
+x62=162
+x63=163
+x64=164
+x65=165
+x66=166
+x67=167
+x68=168
+x69=169
+x70=170
+x71=171
+x72=172
+x73=173
+x74=174
+x75=175
+x76=176
+x77=177
+x78=178
+x79=179
+x80=180
+x81=181
+x82=182
+x83=183
+x84=184
+x85=185
+x86=186
+x87=187
+x88=188
+x89=189
+x90=190
+x91=191
+x92=192
+x93=193
+x94=194
+x95=195
+x96=196
+x97=197
+x98=198
+x99=199
+x0=200
+x1=201
+x2=202
+x3=203
+x4=204
+x5=205
+x6=206
+x7=207
+x8=208
+x9=209
+x10=210
+x11=211
+x12=212
+x13=213
+x14=214
+x15=215
+x16=216
+x17=217
+x18=218
+x19=219
+x20=220
+x21=221
+x22=222
+x23=223
+x24=224
+x25=225
+x26=226
+x27=227
+x28=228
+x29=229
+x30=230
+x31=231
+x32=232
+x33=233
+x34=234
+x35=235
+x36=236
+x37=237
+x38=238
+x39=239
+x40=240
+x41=241
+x42=242
+x43=243
+x44=244
+x45=245
+x46=246
+x47=247
+x48=248
+x49=249
+x50=250
+x51=251
+x52=252
+x53=253
+x54=254
+x55=255
+x56=256
+x57=257
+x58=258
+x59=259
+x60=260
+x61=261
+x62=262
+x63=263
+x64=264
+x65=265
+x66=266
+x67=267
+x68=268
+x69=269
+x70=270
+x71=271
+x72=272
+x73=273
+x74=274
+x75=275
+x76=276
+x77=277
+x78=278
+x79=279
+x80=280
+x81=281
+x82=282
+x83=283
+x84=284
+x85=285
+x86=286
+x87=287
+x88=288
+x89=289
+x90=290
+x91=291
+x92=292
+x93=293
+x94=294
+x95=295
+x96=296
+x97=297
+x98=298
+x99=299
+x0=300
+x1=301
+x2=302
+x3=303
+x4=304
+x5=305
+x6=306
+x7=307
+x8=308
+x9=309
+x10=310
+x11=311
+x12=312
+x13=313
+x14=314
+x15=315
+x16=316
+x17=317
+x18=318
+x19=319
+x20=320
+x21=321
+x22=322
+x23=323
+x24=324
+x25=325
+x26=326
+x27=327
+x28=328
+x29=329
+x30=330
+x31=331
+x32=332
+x33=333
+x34=334
+x35=335
+x36=336
+x37=337
+x38=338
+x39=339
+x40=340
+x41=341
+x42=342
+x43=343
+x44=344
+x45=345
+x46=346
+x47=347
+x48=348
+x49=349
+x50=350
+x51=351
+x52=352
+x53=353
+x54=354
+x55=355
+x56=356
+x57=357
+x58=358
+x59=359
+x60=360
+x61=361
+x62=362
+x63=363
+x64=364
+x65=365
+x66=366
+x67=367
+x68=368
+x69=369
+x70=370
+x71=371
+x72=372
+x73=373
+x74=374
+x75=375
+x76=376
+x77=377
+x78=378
+x79=379
+x80=380
+x81=381
+x82=382
+x83=383
+x84=384
+x85=385
+x86=386
+x87=387
+x88=388
+x89=389
+x90=390
+x91=391
+x92=392
+x93=393
+x94=394
+x95=395
+x96=396
+x97=397
+x98=398
+x99=399
+x0=400
+x1=401
+x2=402
+x3=403
+x4=404
+x5=405
+x6=406
+x7=407
+x8=408
+x9=409
+x10=410
+x11=411
+x12=412
+x13=413
+x14=414
+x15=415
+x16=416
+x17=417
+x18=418
+x19=419
+x20=420
+x21=421
+x22=422
+x23=423
+x24=424
+x25=425
+x26=426
+x27=427
+x28=428
+x29=429
+x30=430
+x31=431
+x32=432
+x33=433
+x34=434
+x35=435
+x36=436
+x37=437
+x38=438
+x39=439
+x40=440
+x41=441
+x42=442
+x43=443
+x44=444
+x45=445
+x46=446
+x47=447
+x48=448
+x49=449
+x50=450
+x51=451
+x52=452
+x53=453
+x54=454
+x55=455
+x56=456
+x57=457
+x58=458
+x59=459
+x60=460
+x61=461
+x62=462
+x63=463
+x64=464
+x65=465
+x66=466
+x67=467
+x68=468
+x69=469
+x70=470
+x71=471
+x72=472
+x73=473
+x74=474
+x75=475
+x76=476
+x77=477
+x78=478
+x79=479
+x80=480
+x81=481
+x82=482
+x83=483
+x84=484
+x85=485
+x86=486
+x87=487
+x88=488
+x89=489
+x90=490
+x91=491
+x92=492
+x93=493
+x94=494
+x95=495
+x96=496
+x97=497
+x98=498
+x99=499
+x0=500
+x1=501
+x2=502
+x3=503
+x4=504
+x5=505
+x6=506
+x7=507
+x8=508
+x9=509
+x10=510
+x11=511
+x12=512
+x13=513
+x14=514
+x15=515
+x16=516
+x17=517
+x18=518
+x19=519
+x20=520
+x21=521
+x22=522
+x23=523
+x24=524
+x25=525
+x26=526
+x27=527
+x28=528
+x29=529
+x30=530
+x31=531
+x32=532
+x33=533
+x34=534
+x35=535
+x36=536
+x37=537
+x38=538
+x39=539
+x40=540
+x41=541
+x42=542
+x43=543
+x44=544
+x45=545
+x46=546
+x47=547
+x48=548
+x49=549
+x50=550
+x51=551
+x52=552
+x53=553
+x54=554
+x55=555
+x56=556
+x57=557
+x58=558
+x59=559
+x60=560
+x61=561
+x62=562
+x63=563
+x64=564
+x65=565
+x66=566
+x67=567
+x68=568
+x69=569
+x70=570
+x71=571
+x72=572
+x73=573
+x74=574
+x75=575
+x76=576
+x77=577
+x78=578
+x79=579
+x80=580
+x81=581
+x82=582
+x83=583
+x84=584
+x85=585
+x86=586
+x87=587
+x88=588
+x89=589
+x90=590
+x91=591
+x92=592
+x93=593
+x94=594
+x95=595
+x96=596
+x97=597
+x98=598
+x99=599
+x0=600
+x1=601
+x2=602
+x3=603
+x4=604
+x5=605
+x6=606
+x7=607
+x8=608
+x9=609
+x10=610
+x11=611
+x12=612
+x13=613
+x14=614
+x15=615
+x16=616
+x17=617
+x18=618
+x19=619
+x20=620
+x21=621
+x22=622
+x23=623
+x24=624
+x25=625
+x26=626
+x27=627
+x28=628
+x29=629
+x30=630
+x31=631
+x32=632
+x33=633
+x34=634
+x35=635
+x36=636
+x37=637
+x38=638
+x39=639
+x40=640
+x41=641
+x42=642
+x43=643
+x44=644
+x45=645
+x46=646
+x47=647
+x48=648
+x49=649
+x50=650
+x51=651
+x52=652
+x53=653
+x54=654
+x55=655
+x56=656
+x57=657
+x58=658
+x59=659
+x60=660
+x61=661
+x62=662
+x63=663
+x64=664
+x65=665
+x66=666
+x67=667
+x68=668
+x69=669
+x70=670
+x71=671
+x72=672
+x73=673
+x74=674
+x75=675
+x76=676
+x77=677
+x78=678
+x79=679
+x80=680
+x81=681
+x82=682
+x83=683
+x84=684
+x85=685
+x86=686
+x87=687
+x88=688
+x89=689
+x90=690
+x91=691
+x92=692
+x93=693
+x94=694
+x95=695
+x96=696
+x97=697
+x98=698
+x99=699
+x0=700
+x1=701
+x2=702
+x3=703
+x4=704
+x5=705
+x6=706
+x7=707
+x8=708
+x9=709
+x10=710
+x11=711
+x12=712
+x13=713
+x14=714
+x15=715
+x16=716
+x17=717
+x18=718
+x19=719
+x20=720
+x21=721
+x22=722
+x23=723
+x24=724
+x25=725
+x26=726
+x27=727
+x28=728
+x29=729
+x30=730
+x31=731
+x32=732
+x33=733
+x34=734
+x35=735
+x36=736
+x37=737
+x38=738
+x39=739
+x40=740
+x41=741
+x42=742
+x43=743
+x44=744
+x45=745
+x46=746
+x47=747
+x48=748
+x49=749
+x50=750
+x51=751
+x52=752
+x53=753
+x54=754
+x55=755
+x56=756
+x57=757
+x58=758
+x59=759
+x60=760
+x61=761
+x62=762
+x63=763
+x64=764
+x65=765
+x66=766
+x67=767
+x68=768
+x69=769
+x70=770
+x71=771
+x72=772
+x73=773
+x74=774
+x75=775
+x76=776
+x77=777
+x78=778
+x79=779
+x80=780
+x81=781
+x82=782
+x83=783
+x84=784
+x85=785
+x86=786
+x87=787
+x88=788
+x89=789
+x90=790
+x91=791
+x92=792
+x93=793
+x94=794
+x95=795
+x96=796
+x97=797
+x98=798
+x99=799
+x0=800
+x1=801
+x2=802
+x3=803
+x4=804
+x5=805
+x6=806
+x7=807
+x8=808
+x9=809
+x10=810
+x11=811
+x12=812
+x13=813
+x14=814
+x15=815
+x16=816
+x17=817
+x18=818
+x19=819
+x20=820
+x21=821
+x22=822
+x23=823
+x24=824
+x25=825
+x26=826
+x27=827
+x28=828
+x29=829
+x30=830
+x31=831
+x32=832
+x33=833
+x34=834
+x35=835
+x36=836
+x37=837
+x38=838
+x39=839
+x40=840
+x41=841
+x42=842
+x43=843
+x44=844
+x45=845
+x46=846
+x47=847
+x48=848
+x49=849
+x50=850
+x51=851
+x52=852
+x53=853
+x54=854
+x55=855
+x56=856
+x57=857
+x58=858
+x59=859
+x60=860
+x61=861
+x62=862
+x63=863
+x64=864
+x65=865
+x66=866
+x67=867
+x68=868
+x69=869
+x70=870
+x71=871
+x72=872
+x73=873
+x74=874
+x75=875
+x76=876
+x77=877
+x78=878
+x79=879
+x80=880
+x81=881
+x82=882
+x83=883
+x84=884
+x85=885
+x86=886
+x87=887
+x88=888
+x89=889
+x90=890
+x91=891
+x92=892
+x93=893
+x94=894
+x95=895
+x96=896
+x97=897
+x98=898
+x99=899
+x0=900
+x1=901
+x2=902
+x3=903
+x4=904
+x5=905
+x6=906
+x7=907
+x8=908
+x9=909
+x10=910
+x11=911
+x12=912
+x13=913
+x14=914
+x15=915
+x16=916
+x17=917
+x18=918
+x19=919
+x20=920
+x21=921
+x22=922
+x23=923
+x24=924
+x25=925
+x26=926
+x27=927
+x28=928
+x29=929
+x30=930
+x31=931
+x32=932
+x33=933
+x34=934
+x35=935
+x36=936
+x37=937
+x38=938
+x39=939
+x40=940
+x41=941
+x42=942
+x43=943
+x44=944
+x45=945
+x46=946
+x47=947
+x48=948
+x49=949
+x50=950
+x51=951
+x52=952
+x53=953
+x54=954
+x55=955
+x56=956
+x57=957
+x58=958
+x59=959
+x60=960
+x61=961
+x62=962
+x63=963
+x64=964
+x65=965
+x66=966
+x67=967
+x68=968
+x69=969
+x70=970
+x71=971
+x72=972
+x73=973
+x74=974
+x75=975
+x76=976
+x77=977
+x78=978
+x79=979
+x80=980
+x81=981
+x82=982
+x83=983
+x84=984
+x85=985
+x86=986
+x87=987
+x88=988
+x89=989
+x90=990
+x91=991
+x92=992
+x93=993
+x94=994
+x95=995
+x96=996
+x97=997
+x98=998
+x99=999
+x0=1000
+x1=1001
+x2=1002
+x3=1003
+x4=1004
+x5=1005
+x6=1006
+x7=1007
+x8=1008
+x9=1009
+x10=1010
+x11=1011
+x12=1012
+x13=1013
+x14=1014
+x15=1015
+x16=1016
+x17=1017
+x18=1018
+x19=1019
+x20=1020
+x21=1021
+x22=1022
+x23=1023
+x24=1024
+x25=1025
+x26=1026
+x27=1027
+x28=1028
+x29=1029
+x30=1030
+x31=1031
+x32=1032
+x33=1033
+x34=1034
+x35=1035
+x36=1036
+x37=1037
+x38=1038
+x39=1039
+x40=1040
+x41=1041
+x42=1042
+x43=1043
+x44=1044
+x45=1045
+x46=1046
+x47=1047
+x48=1048
+x49=1049
+x50=1050
+x51=1051
+x52=1052
+x53=1053
+x54=1054
+x55=1055
+x56=1056
+x57=1057
+x58=1058
+x59=1059
+x60=1060
+x61=1061
+x62=1062
+x63=1063
+x64=1064
+x65=1065
+x66=1066
+x67=1067
+x68=1068
+x69=1069
+x70=1070
+x71=1071
+x72=1072
+x73=1073
+x74=1074
+x75=1075
+x76=1076
+x77=1077
+x78=1078
+x79=1079
+x80=1080
+x81=1081
+x82=1082
+x83=1083
+x84=1084
+x85=1085
+x86=1086
+x87=1087
+x88=1088
+x89=1089
+x90=1090
+x91=1091
+x92=1092
+x93=1093
+x94=1094
+x95=1095
+x96=1096
+x97=1097
+x98=1098
+x99=1099
+x0=1100
+x1=1101
+x2=1102
+x3=1103
+x4=1104
+x5=1105
+x6=1106
+x7=1107
+x8=1108
+x9=1109
+x10=1110
+x11=1111
+x12=1112
+x13=1113
+x14=1114
+x15=1115
+x16=1116
+x17=1117
+x18=1118
+x19=1119
+x20=1120
+x21=1121
+x22=1122
+x23=1123
+x24=1124
+x25=1125
+x26=1126
+x27=1127
+x28=1128
+x29=1129
+x30=1130
+x31=1131
+x32=1132
+x33=1133
+x34=1134
+x35=1135
+x36=1136
+x37=1137
+x38=1138
+x39=1139
+x40=1140
+x41=1141
+x42=1142
+x43=1143
+x44=1144
+x45=1145
+x46=1146
+x47=1147
+x48=1148
+x49=1149
+x50=1150
+x51=1151
+x52=1152
+x53=1153
+x54=1154
+x55=1155
+x56=1156
+x57=1157
+x58=1158
+x59=1159
+x60=1160
+x61=1161
+x62=1162
+x63=1163
+x64=1164
+x65=1165
+x66=1166
+x67=1167
+x68=1168
+x69=1169
+x70=1170
+x71=1171
+x72=1172
+x73=1173
+x74=1174
+x75=1175
+x76=1176
+x77=1177
+x78=1178
+x79=1179
+x80=1180
+x81=1181
+x82=1182
+x83=1183
+x84=1184
+x85=1185
+x86=1186
+x87=1187
+x88=1188
+x89=1189
+x90=1190
+x91=1191
+x92=1192
+x93=1193
+x94=1194
+x95=1195
+x96=1196
+x97=1197
+x98=1198
+x99=1199
+x0=1200
+x1=1201
+x2=1202
+x3=1203
+x4=1204
+x5=1205
+x6=1206
+x7=1207
+x8=1208
+x9=1209
+x10=1210
+x11=1211
+x12=1212
+x13=1213
+x14=1214
+x15=1215
+x16=1216
+x17=1217
+x18=1218
+x19=1219
+x20=1220
+x21=1221
+x22=1222
+x23=1223
+x24=1224
+x25=1225
+x26=1226
+x27=1227
+x28=1228
+x29=1229
+x30=1230
+x31=1231
+x32=1232
+x33=1233
+x34=1234
+x35=1235
+x36=1236
+x37=1237
+x38=1238
+x39=1239
+x40=1240
+x41=1241
+x42=1242
+x43=1243
+x44=1244
+x45=1245
+x46=1246
+x47=1247
+x48=1248
+x49=1249
+x50=1250
+x51=1251
+x52=1252
+x53=1253
+x54=1254
+x55=1255
+x56=1256
+x57=1257
+x58=1258
+x59=1259
+x60=1260
+x61=1261
+x62=1262
+x63=1263
+x64=1264
+x65=1265
+x66=1266
+x67=1267
+x68=1268
+x69=1269
+x70=1270
+x71=1271
+x72=1272
+x73=1273
+x74=1274
+x75=1275
+x76=1276
+x77=1277
+x78=1278
+x79=1279
+x80=1280
+x81=1281
+x82=1282
+x83=1283
+x84=1284
+x85=1285
+x86=1286
+x87=1287
+x88=1288
+x89=1289
+x90=1290
+x91=1291
+x92=1292
+x93=1293
+x94=1294
+x95=1295
+x96=1296
+x97=1297
+x98=1298
+x99=1299
+x0=1300
+x1=1301
+x2=1302
+x3=1303
+x4=1304
+x5=1305
+x6=1306
+x7=1307
+x8=1308
+x9=1309
+x10=1310
+x11=1311
+x12=1312
+x13=1313
+x14=1314
+x15=1315
+x16=1316
+x17=1317
+x18=1318
+x19=1319
+x20=1320
+x21=1321
+x22=1322
+x23=1323
+x24=1324
+x25=1325
+x26=1326
+x27=1327
+x28=1328
+x29=1329
+x30=1330
+x31=1331
+x32=1332
+x33=1333
+x34=1334
+x35=1335
+x36=1336
+x37=1337
+x38=1338
+x39=1339
+x40=1340
+x41=1341
+x42=1342
+x43=1343
+x44=1344
+x45=1345
+x46=1346
+x47=1347
+x48=1348
+x49=1349
+x50=1350
+x51=1351
+x52=1352
+x53=1353
+x54=1354
+x55=1355
+x56=1356
+x57=1357
+x58=1358
+x59=1359
+x60=1360
+x61=1361
+x62=1362
+x63=1363
+x64=1364
+x65=1365
+x66=1366
+x67=1367
+x68=1368
+x69=1369
+x70=1370
+x71=1371
+x72=1372
+x73=1373
+x74=1374
+x75=1375
+x76=1376
+x77=1377
+x78=1378
+x79=1379
+x80=1380
+x81=1381
+x82=1382
+x83=1383
+x84=1384
+x85=1385
+x86=1386
+x87=1387
+x88=1388
+x89=1389
+x90=1390
+x91=1391
+x92=1392
+x93=1393
+x94=1394
+x95=1395
+x96=1396
+x97=1397
+x98=1398
+x99=1399
+x0=1400
+x1=1401
+x2=1402
+x3=1403
+x4=1404
+x5=1405
+x6=1406
+x7=1407
+x8=1408
+x9=1409
+x10=1410
+x11=1411
+x12=1412
+x13=1413
+x14=1414
+x15=1415
+x16=1416
+x17=1417
+x18=1418
+x19=1419
+x20=1420
+x21=1421
+x22=1422
+x23=1423
+x24=1424
+x25=1425
+x26=1426
+x27=1427
+x28=1428
+x29=1429
+x30=1430
+x31=1431
+x32=1432
+x33=1433
+x34=1434
+x35=1435
+x36=1436
+x37=1437
+x38=1438
+x39=1439
+x40=1440
+x41=1441
+x42=1442
+x43=1443
+x44=1444
+x45=1445
+x46=1446
+x47=1447
+x48=1448
+x49=1449
+x50=1450
+x51=1451
+x52=1452
+x53=1453
+x54=1454
+x55=1455
+x56=1456
+x57=1457
+x58=1458
+x59=1459
+x60=1460
+x61=1461
+x62=1462
+x63=1463
+x64=1464
+x65=1465
+x66=1466
+x67=1467
+x68=1468
+x69=1469
+x70=1470
+x71=1471
+x72=1472
+x73=1473
+x74=1474
+x75=1475
+x76=1476
+x77=1477
+x78=1478
+x79=1479
+x80=1480
+x81=1481
+x82=1482
+x83=1483
+x84=1484
+x85=1485
+x86=1486
+x87=1487
+x88=1488
+x89=1489
+x90=1490
+x91=1491
+x92=1492
+x93=1493
+x94=1494
+x95=1495
+x96=1496
+x97=1497
+x98=1498
+x99=1499
+x0=1500
+x1=1501
+x2=1502
+x3=1503
+x4=1504
+x5=1505
+x6=1506
+x7=1507
+x8=1508
+x9=1509
+x10=1510
+x11=1511
+x12=1512
+x13=1513
+x14=1514
+x15=1515
+x16=1516
+x17=1517
+x18=1518
+x19=1519
+x20=1520
+x21=1521
+x22=1522
+x23=1523
+x24=1524
+x25=1525
+x26=1526
+x27=1527
+x28=1528
+x29=1529
+x30=1530
+x31=1531
+x32=1532
+x33=1533
+x34=1534
+x35=1535
+x36=1536
+x37=1537
+x38=1538
+x39=1539
+x40=1540
+x41=1541
+x42=1542
+x43=1543
+x44=1544
+x45=1545
+x46=1546
+x47=1547
+x48=1548
+x49=1549
+x50=1550
+x51=1551
+x52=1552
+x53=1553
+x54=1554
+x55=1555
+x56=1556
+x57=1557
+x58=1558
+x59=1559
+x60=1560
+x61=1561
+x62=1562
+x63=1563
+x64=1564
+x65=1565
+x66=1566
+x67=1567
+x68=1568
+x69=1569
+x70=1570
+x71=1571
+x72=1572
+x73=1573
+x74=1574
+x75=1575
+x76=1576
+x77=1577
+x78=1578
+x79=1579
+x80=1580
+x81=1581
+x82=1582
+x83=1583
+x84=1584
+x85=1585
+x86=1586
+x87=1587
+x88=1588
+x89=1589
+x90=1590
+x91=1591
+x92=1592
+x93=1593
+x94=1594
+x95=1595
+x96=1596
+x97=1597
+x98=1598
+x99=1599
+x0=1600
+x1=1601
+x2=1602
+x3=1603
+x4=1604
+x5=1605
+x6=1606
+x7=1607
+x8=1608
+x9=1609
+x10=1610
+x11=1611
+x12=1612
+x13=1613
+x14=1614
+x15=1615
+x16=1616
+x17=1617
+x18=1618
+x19=1619
+x20=1620
+x21=1621
+x22=1622
+x23=1623
+x24=1624
+x25=1625
+x26=1626
+x27=1627
+x28=1628
+x29=1629
+x30=1630
+x31=1631
+x32=1632
+x33=1633
+x34=1634
+x35=1635
+x36=1636
+x37=1637
+x38=1638
+x39=1639
+x40=1640
+x41=1641
+x42=1642
+x43=1643
+x44=1644
+x45=1645
+x46=1646
+x47=1647
+x48=1648
+x49=1649
+x50=1650
+x51=1651
+x52=1652
+x53=1653
+x54=1654
+x55=1655
+x56=1656
+x57=1657
+x58=1658
+x59=1659
+x60=1660
+x61=1661
+x62=1662
+x63=1663
+x64=1664
+x65=1665
+x66=1666
+x67=1667
+x68=1668
+x69=1669
+x70=1670
+x71=1671
+x72=1672
+x73=1673
+x74=1674
+x75=1675
+x76=1676
+x77=1677
+x78=1678
+x79=1679
+x80=1680
+x81=1681
+x82=1682
+x83=1683
+x84=1684
+x85=1685
+x86=1686
+x87=1687
+x88=1688
+x89=1689
+x90=1690
+x91=1691
+x92=1692
+x93=1693
+x94=1694
+x95=1695
+x96=1696
+x97=1697
+x98=1698
+x99=1699
+x0=1700
+x1=1701
+x2=1702
+x3=1703
+x4=1704
+x5=1705
+x6=1706
+x7=1707
+x8=1708
+x9=1709
+x10=1710
+x11=1711
+x12=1712
+x13=1713
+x14=1714
+x15=1715
+x16=1716
+x17=1717
+x18=1718
+x19=1719
+x20=1720
+x21=1721
+x22=1722
+x23=1723
+x24=1724
+x25=1725
+x26=1726
+x27=1727
+x28=1728
+x29=1729
+x30=1730
+x31=1731
+x32=1732
+x33=1733
+x34=1734
+x35=1735
+x36=1736
+x37=1737
+x38=1738
+x39=1739
+x40=1740
+x41=1741
+x42=1742
+x43=1743
+x44=1744
+x45=1745
+x46=1746
+x47=1747
+x48=1748
+x49=1749
+x50=1750
+x51=1751
+x52=1752
+x53=1753
+x54=1754
+x55=1755
+x56=1756
+x57=1757
+x58=1758
+x59=1759
+x60=1760
+x61=1761
+x62=1762
+x63=1763
+x64=1764
+x65=1765
+x66=1766
+x67=1767
+x68=1768
+x69=1769
+x70=1770
+x71=1771
+x72=1772
+x73=1773
+x74=1774
+x75=1775
+x76=1776
+x77=1777
+x78=1778
+x79=1779
+x80=1780
+x81=1781
+x82=1782
+x83=1783
+x84=1784
+x85=1785
+x86=1786
+x87=1787
+x88=1788
+x89=1789
+x90=1790
+x91=1791
+x92=1792
+x93=1793
+x94=1794
+x95=1795
+x96=1796
+x97=1797
+x98=1798
+x99=1799
+x0=1800
+x1=1801
+x2=1802
+x3=1803
+x4=1804
+x5=1805
+x6=1806
+x7=1807
+x8=1808
+x9=1809
+x10=1810
+x11=1811
+x12=1812
+x13=1813
+x14=1814
+x15=1815
+x16=1816
+x17=1817
+x18=1818
+x19=1819
+x20=1820
+x21=1821
+x22=1822
+x23=1823
+x24=1824
+x25=1825
+x26=1826
+x27=1827
+x28=1828
+x29=1829
+x30=1830
+x31=1831
+x32=1832
+x33=1833
+x34=1834
+x35=1835
+x36=1836
+x37=1837
+x38=1838
+x39=1839
+x40=1840
+x41=1841
+x42=1842
+x43=1843
+x44=1844
+x45=1845
+x46=1846
+x47=1847
+x48=1848
+x49=1849
+x50=1850
+x51=1851
+x52=1852
+x53=1853
+x54=1854
+x55=1855
+x56=1856
+x57=1857
+x58=1858
+x59=1859
+x60=1860
+x61=1861
+x62=1862
+x63=1863
+x64=1864
+x65=1865
+x66=1866
+x67=1867
+x68=1868
+x69=1869
+x70=1870
+x71=1871
+x72=1872
+x73=1873
+x74=1874
+x75=1875
+x76=1876
+x77=1877
+x78=1878
+x79=1879
+x80=1880
+x81=1881
+x82=1882
+x83=1883
+x84=1884
+x85=1885
+x86=1886
+x87=1887
+x88=1888
+x89=1889
+x90=1890
+x91=1891
+x92=1892
+x93=1893
+x94=1894
+x95=1895
+x96=1896
+x97=1897
+x98=1898
+x99=1899
+x0=1900
+x1=1901
+x2=1902
+x3=1903
+x4=1904
+x5=1905
+x6=1906
+x7=1907
+x8=1908
+x9=1909
+x10=1910
+x11=1911
+x12=1912
+x13=1913
+x14=1914
+x15=1915
+x16=1916
+x17=1917
+x18=1918
+x19=1919
+x20=1920
+x21=1921
+x22=1922
+x23=1923
+x24=1924
+x25=1925
+x26=1926
+x27=1927
+x28=1928
+x29=1929
+x30=1930
+x31=1931
+x32=1932
+x33=1933
+x34=1934
+x35=1935
+x36=1936
+x37=1937
+x38=1938
+x39=1939
+x40=1940
+x41=1941
+x42=1942
+x43=1943
+x44=1944
+x45=1945
+x46=1946
+x47=1947
+x48=1948
+x49=1949
+x50=1950
+x51=1951
+x52=1952
+x53=1953
+x54=1954
+x55=1955
+x56=1956
+x57=1957
+x58=1958
+x59=1959
+x60=1960
+x61=1961
+x62=1962
+x63=1963
+x64=1964
+x65=1965
+x66=1966
+x67=1967
+x68=1968
+x69=1969
+x70=1970
+x71=1971
+x72=1972
+x73=1973
+x74=1974
+x75=1975
+x76=1976
+x77=1977
+x78=1978
+x79=1979
+x80=1980
+x81=1981
+x82=1982
+x83=1983
+x84=1984
+x85=1985
+x86=1986
+x87=1987
+x88=1988
+x89=1989
+x90=1990
+x91=1991
+x92=1992
+x93=1993
+x94=1994
+x95=1995
+x96=1996
+x97=1997
+x98=1998
+x99=1999
+x0=2000
+x1=2001
+x2=2002
+x3=2003
+x4=2004
+x5=2005
+x6=2006
+x7=2007
+x8=2008
+x9=2009
+x10=2010
+x11=2011
+x12=2012
+x13=2013
+x14=2014
+x15=2015
+x16=2016
+x17=2017
+x18=2018
+x19=2019
+x20=2020
+x21=2021
+x22=2022
+x23=2023
+x24=2024
+x25=2025
+x26=2026
+x27=2027
+x28=2028
+x29=2029
+x30=2030
+x31=2031
+x32=2032
+x33=2033
+x34=2034
+x35=2035
+x36=2036
+x37=2037
+x38=2038
+x39=2039
+x40=2040
+x41=2041
+x42=2042
+x43=2043
+x44=2044
+x45=2045
+x46=2046
+x47=2047
+x48=2048
+x49=2049
+x50=2050
+x51=2051
+x52=2052
+x53=2053
+x54=2054
+x55=2055
+x56=2056
+x57=2057
+x58=2058
+x59=2059
+x60=2060
+x61=2061
+x62=2062
+x63=2063
+x64=2064
+x65=2065
+x66=2066
+x67=2067
+x68=2068
+x69=2069
+x70=2070
+x71=2071
+x72=2072
+x73=2073
+x74=2074
+x75=2075
+x76=2076
+x77=2077
+x78=2078
+x79=2079
+x80=2080
+x81=2081
+x82=2082
+x83=2083
+x84=2084
+x85=2085
+x86=2086
+x87=2087
+x88=2088
+x89=2089
+x90=2090
+x91=2091
+x92=2092
+x93=2093
+x94=2094
+x95=2095
+x96=2096
+x97=2097
+x98=2098
+x99=2099
+x0=2100
+x1=2101
+x2=2102
+x3=2103
+x4=2104
+x5=2105
+x6=2106
+x7=2107
+x8=2108
+x9=2109
+x10=2110
+x11=2111
+x12=2112
+x13=2113
+x14=2114
+x15=2115
+x16=2116
+x17=2117
+x18=2118
+x19=2119
+x20=2120
+x21=2121
+x22=2122
+x23=2123
+x24=2124
+x25=2125
+x26=2126
+x27=2127
+x28=2128
+x29=2129
+x30=2130
+x31=2131
+x32=2132
+x33=2133
+x34=2134
+x35=2135
+x36=2136
+x37=2137
+x38=2138
+x39=2139
+x40=2140
+x41=2141
+x42=2142
+x43=2143
+x44=2144
+x45=2145
+x46=2146
+x47=2147
+x48=2148
+x49=2149
+x50=2150
+x51=2151
+x52=2152
+x53=2153
+x54=2154
+x55=2155
+x56=2156
+x57=2157
+x58=2158
+x59=2159
+x60=2160
+x61=2161
+x62=2162
+x63=2163
+x64=2164
+x65=2165
+x66=2166
+x67=2167
+x68=2168
+x69=2169
+x70=2170
+x71=2171
+x72=2172
+x73=2173
+x74=2174
+x75=2175
+x76=2176
+x77=2177
+x78=2178
+x79=2179
+x80=2180
+x81=2181
+x82=2182
+x83=2183
+x84=2184
+x85=2185
+x86=2186
+x87=2187
+x88=2188
+x89=2189
+x90=2190
+x91=2191
+x92=2192
+x93=2193
+x94=2194
+x95=2195
+x96=2196
+x97=2197
+x98=2198
+x99=2199
+x0=2200
+x1=2201
+x2=2202
+x3=2203
+x4=2204
+x5=2205
+x6=2206
+x7=2207
+x8=2208
+x9=2209
+x10=2210
+x11=2211
+x12=2212
+x13=2213
+x14=2214
+x15=2215
+x16=2216
+x17=2217
+x18=2218
+x19=2219
+x20=2220
+x21=2221
+x22=2222
+x23=2223
+x24=2224
+x25=2225
+x26=2226
+x27=2227
+x28=2228
+x29=2229
+x30=2230
+x31=2231
+x32=2232
+x33=2233
+x34=2234
+x35=2235
+x36=2236
+x37=2237
+x38=2238
+x39=2239
+x40=2240
+x41=2241
+x42=2242
+x43=2243
+x44=2244
+x45=2245
+x46=2246
+x47=2247
+x48=2248
+x49=2249
+x50=2250
+x51=2251
+x52=2252
+x53=2253
+x54=2254
+x55=2255
+x56=2256
+x57=2257
+x58=2258
+x59=2259
+x60=2260
+x61=2261
+x62=2262
+x63=2263
+x64=2264
+x65=2265
+x66=2266
+x67=2267
+x68=2268
+x69=2269
+x70=2270
+x71=2271
+x72=2272
+x73=2273
+x74=2274
+x75=2275
+x76=2276
+x77=2277
+x78=2278
+x79=2279
+x80=2280
+x81=2281
+x82=2282
+x83=2283
+x84=2284
+x85=2285
+x86=2286
+x87=2287
+x88=2288
+x89=2289
+x90=2290
+x91=2291
+x92=2292
+x93=2293
+x94=2294
+x95=2295
+x96=2296
+x97=2297
+x98=2298
+x99=2299
+x0=2300
+x1=2301
+x2=2302
+x3=2303
+x4=2304
+x5=2305
+x6=2306
+x7=2307
+x8=2308
+x9=2309
+x10=2310
+x11=2311
+x12=2312
+x13=2313
+x14=2314
+x15=2315
+x16=2316
+x17=2317
+x18=2318
+x19=2319
+x20=2320
+x21=2321
+x22=2322
+x23=2323
+x24=2324
+x25=2325
+x26=2326
+x27=2327
+x28=2328
+x29=2329
+x30=2330
+x31=2331
+x32=2332
+x33=2333
+x34=2334
+x35=2335
+x36=2336
+x37=2337
+x38=2338
+x39=2339
+x40=2340
+x41=2341
+x42=2342
+x43=2343
+x44=2344
+x45=2345
+x46=2346
+x47=2347
+x48=2348
+x49=2349
+x50=2350
+x51=2351
+x52=2352
+x53=2353
+x54=2354
+x55=2355
+x56=2356
+x57=2357
+x58=2358
+x59=2359
+x60=2360
+x61=2361
+x62=2362
+x63=2363
+x64=2364
+x65=2365
+x66=2366
+x67=2367
+x68=2368
+x69=2369
+x70=2370
+x71=2371
+x72=2372
+x73=2373
+x74=2374
+x75=2375
+x76=2376
+x77=2377
+x78=2378
+x79=2379
+x80=2380
+x81=2381
+x82=2382
+x83=2383
+x84=2384
+x85=2385
+x86=2386
+x87=2387
+x88=2388
+x89=2389
+x90=2390
+x91=2391
+x92=2392
+x93=2393
+x94=2394
+x95=2395
+x96=2396
+x97=2397
+x98=2398
+x99=2399
+x0=2400
+x1=2401
+x2=2402
+x3=2403
+x4=2404
+x5=2405
+x6=2406
+x7=2407
+x8=2408
+x9=2409
+x10=2410
+x11=2411
+x12=2412
+x13=2413
+x14=2414
+x15=2415
+x16=2416
+x17=2417
+x18=2418
+x19=2419
+x20=2420
+x21=2421
+x22=2422
+x23=2423
+x24=2424
+x25=2425
+x26=2426
+x27=2427
+x28=2428
+x29=2429
+x30=2430
+x31=2431
+x32=2432
+x33=2433
+x34=2434
+x35=2435
+x36=2436
+x37=2437
+x38=2438
+x39=2439
+x40=2440
+x41=2441
+x42=2442
+x43=2443
+x44=2444
+x45=2445
+x46=2446
+x47=2447
+x48=2448
+x49=2449
+x50=2450
+x51=2451
+x52=2452
+x53=2453
+x54=2454
+x55=2455
+x56=2456
+x57=2457
+x58=2458
+x59=2459
+x60=2460
+x61=2461
+x62=2462
+x63=2463
+x64=2464
+x65=2465
+x66=2466
+x67=2467
+x68=2468
+x69=2469
+x70=2470
+x71=2471
+x72=2472
+x73=2473
+x74=2474
+x75=2475
+x76=2476
+x77=2477
+x78=2478
+x79=2479
+x80=2480
+x81=2481
+x82=2482
+x83=2483
+x84=2484
+x85=2485
+x86=2486
+x87=2487
+x88=2488
+x89=2489
+x90=2490
+x91=2491
+x92=2492
+x93=2493
+x94=2494
+x95=2495
+x96=2496
+x97=2497
+x98=2498
+x99=2499
+x0=2500
+x1=2501
+x2=2502
+x3=2503
+x4=2504
+x5=2505
+x6=2506
+x7=2507
+x8=2508
+x9=2509
+x10=2510
+x11=2511
+x12=2512
+x13=2513
+x14=2514
+x15=2515
+x16=2516
+x17=2517
+x18=2518
+x19=2519
+x20=2520
+x21=2521
+x22=2522
+x23=2523
+x24=2524
+x25=2525
+x26=2526
+x27=2527
+x28=2528
+x29=2529
+x30=2530
+x31=2531
+x32=2532
+x33=2533
+x34=2534
+x35=2535
+x36=2536
+x37=2537
+x38=2538
+x39=2539
+x40=2540
+x41=2541
+x42=2542
+x43=2543
+x44=2544
+x45=2545
+x46=2546
+x47=2547
+x48=2548
+x49=2549
+x50=2550
+x51=2551
+x52=2552
+x53=2553
+x54=2554
+x55=2555
+x56=2556
+x57=2557
+x58=2558
+x59=2559
+x60=2560
+x61=2561
+x62=2562
+x63=2563
+x64=2564
+x65=2565
+x66=2566
+x67=2567
+x68=2568
+x69=2569
+x70=2570
+x71=2571
+x72=2572
+x73=2573
+x74=2574
+x75=2575
+x76=2576
+x77=2577
+x78=2578
+x79=2579
+x80=2580
+x81=2581
+x82=2582
+x83=2583
+x84=2584
+x85=2585
+x86=2586
+x87=2587
+x88=2588
+x89=2589
+x90=2590
+x91=2591
+x92=2592
+x93=2593
+x94=2594
+x95=2595
+x96=2596
+x97=2597
+x98=2598
+x99=2599
+x0=2600
+x1=2601
+x2=2602
+x3=2603
+x4=2604
+x5=2605
+x6=2606
+x7=2607
+x8=2608
+x9=2609
+x10=2610
+x11=2611
+x12=2612
+x13=2613
+x14=2614
+x15=2615
+x16=2616
+x17=2617
+x18=2618
+x19=2619
+x20=2620
+x21=2621
+x22=2622
+x23=2623
+x24=2624
+x25=2625
+x26=2626
+x27=2627
+x28=2628
+x29=2629
+x30=2630
+x31=2631
+x32=2632
+x33=2633
+x34=2634
+x35=2635
+x36=2636
+x37=2637
+x38=2638
+x39=2639
+x40=2640
+x41=2641
+x42=2642
+x43=2643
+x44=2644
+x45=2645
+x46=2646
+x47=2647
+x48=2648
+x49=2649
+x50=2650
+x51=2651
+x52=2652
+x53=2653
+x54=2654
+x55=2655
+x56=2656
+x57=2657
+x58=2658
+x59=2659
+x60=2660
+x61=2661
+x62=2662
+x63=2663
+x64=2664
+x65=2665
+x66=2666
+x67=2667
+x68=2668
+x69=2669
+x70=2670
+x71=2671
+x72=2672
+x73=2673
+x74=2674
+x75=2675
+x76=2676
+x77=2677
+x78=2678
+x79=2679
+x80=2680
+x81=2681
+x82=2682
+x83=2683
+x84=2684
+x85=2685
+x86=2686
+x87=2687
+x88=2688
+x89=2689
+x90=2690
+x91=2691
+x92=2692
+x93=2693
+x94=2694
+x95=2695
+x96=2696
+x97=2697
+x98=2698
+x99=2699
+x0=2700
+x1=2701
+x2=2702
+x3=2703
+x4=2704
+x5=2705
+x6=2706
+x7=2707
+x8=2708
+x9=2709
+x10=2710
+x11=2711
+x12=2712
+x13=2713
+x14=2714
+x15=2715
+x16=2716
+x17=2717
+x18=2718
+x19=2719
+x20=2720
+x21=2721
+x22=2722
+x23=2723
+x24=2724
+x25=2725
+x26=2726
+x27=2727
+x28=2728
+x29=2729
+x30=2730
+x31=2731
+x32=2732
+x33=2733
+x34=2734
+x35=2735
+x36=2736
+x37=2737
+x38=2738
+x39=2739
+x40=2740
+x41=2741
+x42=2742
+x43=2743
+x44=2744
+x45=2745
+x46=2746
+x47=2747
+x48=2748
+x49=2749
+x50=2750
+x51=2751
+x52=2752
+x53=2753
+x54=2754
+x55=2755
+x56=2756
+x57=2757
+x58=2758
+x59=2759
+x60=2760
+x61=2761
+x62=2762
+x63=2763
+x64=2764
+x65=2765
+x66=2766
+x67=2767
+x68=2768
+x69=2769
+x70=2770
+x71=2771
+x72=2772
+x73=2773
+x74=2774
+x75=2775
+x76=2776
+x77=2777
+x78=2778
+x79=2779
+x80=2780
+x81=2781
+x82=2782
+x83=2783
+x84=2784
+x85=2785
+x86=2786
+x87=2787
+x88=2788
+x89=2789
+x90=2790
+x91=2791
+x92=2792
+x93=2793
+x94=2794
+x95=2795
+x96=2796
+x97=2797
+x98=2798
+x99=2799
+x0=2800
+x1=2801
+x2=2802
+x3=2803
+x4=2804
+x5=2805
+x6=2806
+x7=2807
+x8=2808
+x9=2809
+x10=2810
+x11=2811
+x12=2812
+x13=2813
+x14=2814
+x15=2815
+x16=2816
+x17=2817
+x18=2818
+x19=2819
+x20=2820
+x21=2821
+x22=2822
+x23=2823
+x24=2824
+x25=2825
+x26=2826
+x27=2827
+x28=2828
+x29=2829
+x30=2830
+x31=2831
+x32=2832
+x33=2833
+x34=2834
+x35=2835
+x36=2836
+x37=2837
+x38=2838
+x39=2839
+x40=2840
+x41=2841
+x42=2842
+x43=2843
+x44=2844
+x45=2845
+x46=2846
+x47=2847
+x48=2848
+x49=2849
+x50=2850
+x51=2851
+x52=2852
+x53=2853
+x54=2854
+x55=2855
+x56=2856
+x57=2857
+x58=2858
+x59=2859
+x60=2860
+x61=2861
+x62=2862
+x63=2863
+x64=2864
+x65=2865
+x66=2866
+x67=2867
+x68=2868
+x69=2869
+x70=2870
+x71=2871
+x72=2872
+x73=2873
+x74=2874
+x75=2875
+x76=2876
+x77=2877
+x78=2878
+x79=2879
+x80=2880
+x81=2881
+x82=2882
+x83=2883
+x84=2884
+x85=2885
+x86=2886
+x87=2887
+x88=2888
+x89=2889
+x90=2890
+x91=2891
+x92=2892
+x93=2893
+x94=2894
+x95=2895
+x96=2896
+x97=2897
+x98=2898
+x99=2899
+x0=2900
+x1=2901
+x2=2902
+x3=2903
+x4=2904
+x5=2905
+x6=2906
+x7=2907
+x8=2908
+x9=2909
+x10=2910
+x11=2911
+x12=2912
+x13=2913
+x14=2914
+x15=2915
+x16=2916
+x17=2917
+x18=2918
+x19=2919
+x20=2920
+x21=2921
+x22=2922
+x23=2923
+x24=2924
+x25=2925
+x26=2926
+x27=2927
+x28=2928
+x29=2929
+x30=2930
+x31=2931
+x32=2932
+x33=2933
+x34=2934
+x35=2935
+x36=2936
+x37=2937
+x38=2938
+x39=2939
+x40=2940
+x41=2941
+x42=2942
+x43=2943
+x44=2944
+x45=2945
+x46=2946
+x47=2947
+x48=2948
+x49=2949
+x50=2950
+x51=2951
+x52=2952
+x53=2953
+x54=2954
+x55=2955
+x56=2956
+x57=2957
+x58=2958
+x59=2959
+x60=2960
+x61=2961
+x62=2962
+x63=2963
+x64=2964
+x65=2965
+x66=2966
+x67=2967
+x68=2968
+x69=2969
+x70=2970
+x71=2971
+x72=2972
+x73=2973
+x74=2974
+x75=2975
+x76=2976
+x77=2977
+x78=2978
+x79=2979
+x80=2980
+x81=2981
+x82=2982
+x83=2983
+x84=2984
+x85=2985
+x86=2986
+x87=2987
+x88=2988
+x89=2989
+x90=2990
+x91=2991
+x92=2992
+x93=2993
+x94=2994
+x95=2995
+x96=2996
+x97=2997
+x98=2998
+x99=2999
+x0=3000
+x1=3001
+x2=3002
+x3=3003
+x4=3004
+x5=3005
+x6=3006
+x7=3007
+x8=3008
+x9=3009
+x10=3010
+x11=3011
+x12=3012
+x13=3013
+x14=3014
+x15=3015
+x16=3016
+x17=3017
+x18=3018
+x19=3019
+x20=3020
+x21=3021
+x22=3022
+x23=3023
+x24=3024
+x25=3025
+x26=3026
+x27=3027
+x28=3028
+x29=3029
+x30=3030
+x31=3031
+x32=3032
+x33=3033
+x34=3034
+x35=3035
+x36=3036
+x37=3037
+x38=3038
+x39=3039
+x40=3040
+x41=3041
+x42=3042
+x43=3043
+x44=3044
+x45=3045
+x46=3046
+x47=3047
+x48=3048
+x49=3049
+x50=3050
+x51=3051
+x52=3052
+x53=3053
+x54=3054
+x55=3055
+x56=3056
+x57=3057
+x58=3058
+x59=3059
+x60=3060
+x61=3061
+x62=3062
+x63=3063
+x64=3064
+x65=3065
+x66=3066
+x67=3067
+x68=3068
+x69=3069
+x70=3070
+x71=3071
+x72=3072
+x73=3073
+x74=3074
+x75=3075
+x76=3076
+x77=3077
+x78=3078
+x79=3079
+x80=3080
+x81=3081
+x82=3082
+x83=3083
+x84=3084
+x85=3085
+x86=3086
+x87=3087
+x88=3088
+x89=3089
+x90=3090
+x91=3091
+x92=3092
+x93=3093
+x94=3094
+x95=3095
+x96=3096
+x97=3097
+x98=3098
+x99=3099
+x0=3100
+x1=3101
+x2=3102
+x3=3103
+x4=3104
+x5=3105
+x6=3106
+x7=3107
+x8=3108
+x9=3109
+x10=3110
+x11=3111
+x12=3112
+x13=3113
+x14=3114
+x15=3115
+x16=3116
+x17=3117
+x18=3118
+x19=3119
+x20=3120
+x21=3121
+x22=3122
+x23=3123
+x24=3124
+x25=3125
+x26=3126
+x27=3127
+x28=3128
+x29=3129
+x30=3130
+x31=3131
+x32=3132
+x33=3133
+x34=3134
+x35=3135
+x36=3136
+x37=3137
+x38=3138
+x39=3139
+x40=3140
+x41=3141
+x42=3142
+x43=3143
+x44=3144
+x45=3145
+x46=3146
+x47=3147
+x48=3148
+x49=3149
+x50=3150
+x51=3151
+x52=3152
+x53=3153
+x54=3154
+x55=3155
+x56=3156
+x57=3157
+x58=3158
+x59=3159
+x60=3160
+x61=3161
+x62=3162
+x63=3163
+x64=3164
+x65=3165
+x66=3166
+x67=3167
+x68=3168
+x69=3169
+x70=3170
+x71=3171
+x72=3172
+x73=3173
+x74=3174
+x75=3175
+x76=3176
+x77=3177
+x78=3178
+x79=3179
+x80=3180
+x81=3181
+x82=3182
+x83=3183
+x84=3184
+x85=3185
+x86=3186
+x87=3187
+x88=3188
+x89=3189
+x90=3190
+x91=3191
+x92=3192
+x93=3193
+x94=3194
+x95=3195
+x96=3196
+x97=3197
+x98=3198
+x99=3199
+x0=3200
+x1=3201
+x2=3202
+x3=3203
+x4=3204
+x5=3205
+x6=3206
+x7=3207
+x8=3208
+x9=3209
+x10=3210
+x11=3211
+x12=3212
+x13=3213
+x14=3214
+x15=3215
+x16=3216
+x17=3217
+x18=3218
+x19=3219
+x20=3220
+x21=3221
+x22=3222
+x23=3223
+x24=3224
+x25=3225
+x26=3226
+x27=3227
+x28=3228
+x29=3229
+x30=3230
+x31=3231
+x32=3232
+x33=3233
+x34=3234
+x35=3235
+x36=3236
+x37=3237
+x38=3238
+x39=3239
+x40=3240
+x41=3241
+x42=3242
+x43=3243
+x44=3244
+x45=3245
+x46=3246
+x47=3247
+x48=3248
+x49=3249
+x50=3250
+x51=3251
+x52=3252
+x53=3253
+x54=3254
+x55=3255
+x56=3256
+x57=3257
+x58=3258
+x59=3259
+x60=3260
+x61=3261
+x62=3262
+x63=3263
+x64=3264
+x65=3265
+x66=3266
+x67=3267
+x68=3268
+x69=3269
+x70=3270
+x71=3271
+x72=3272
+x73=3273
+x74=3274
+x75=3275
+x76=3276
+x77=3277
+x78=3278
+x79=3279
+x80=3280
+x81=3281
+x82=3282
+x83=3283
+x84=3284
+x85=3285
+x86=3286
+x87=3287
+x88=3288
+x89=3289
+x90=3290
+x91=3291
+x92=3292
+x93=3293
+x94=3294
+x95=3295
+x96=3296
+x97=3297
+x98=3298
+x99=3299
+x0=3300
+x1=3301
+x2=3302
+x3=3303
+x4=3304
+x5=3305
+x6=3306
+x7=3307
+x8=3308
+x9=3309
+x10=3310
+x11=3311
+x12=3312
+x13=3313
+x14=3314
+x15=3315
+x16=3316
+x17=3317
+x18=3318
+x19=3319
+x20=3320
+x21=3321
+x22=3322
+x23=3323
+x24=3324
+x25=3325
+x26=3326
+x27=3327
+x28=3328
+x29=3329
+x30=3330
+x31=3331
+x32=3332
+x33=3333
+x34=3334
+x35=3335
+x36=3336
+x37=3337
+x38=3338
+x39=3339
+x40=3340
+x41=3341
+x42=3342
+x43=3343
+x44=3344
+x45=3345
+x46=3346
+x47=3347
+x48=3348
+x49=3349
+x50=3350
+x51=3351
+x52=3352
+x53=3353
+x54=3354
+x55=3355
+x56=3356
+x57=3357
+x58=3358
+x59=3359
+x60=3360
+x61=3361
+x62=3362
+x63=3363
+x64=3364
+x65=3365
+x66=3366
+x67=3367
+x68=3368
+x69=3369
+x70=3370
+x71=3371
+x72=3372
+x73=3373
+x74=3374
+x75=3375
+x76=3376
+x77=3377
+x78=3378
+x79=3379
+x80=3380
+x81=3381
+x82=3382
+x83=3383
+x84=3384
+x85=3385
+x86=3386
+x87=3387
+x88=3388
+x89=3389
+x90=3390
+x91=3391
+x92=3392
+x93=3393
+x94=3394
+x95=3395
+x96=3396
+x97=3397
+x98=3398
+x99=3399
+x0=3400
+x1=3401
+x2=3402
+x3=3403
+x4=3404
+x5=3405
+x6=3406
+x7=3407
+x8=3408
+x9=3409
+x10=3410
+x11=3411
+x12=3412
+x13=3413
+x14=3414
+x15=3415
+x16=3416
+x17=3417
+x18=3418
+x19=3419
+x20=3420
+x21=3421
+x22=3422
+x23=3423
+x24=3424
+x25=3425
+x26=3426
+x27=3427
+x28=3428
+x29=3429
+x30=3430
+x31=3431
+x32=3432
+x33=3433
+x34=3434
+x35=3435
+x36=3436
+x37=3437
+x38=3438
+x39=3439
+x40=3440
+x41=3441
+x42=3442
+x43=3443
+x44=3444
+x45=3445
+x46=3446
+x47=3447
+x48=3448
+x49=3449
+x50=3450
+x51=3451
+x52=3452
+x53=3453
+x54=3454
+x55=3455
+x56=3456
+x57=3457
+x58=3458
+x59=3459
+x60=3460
+x61=3461
+x62=3462
+x63=3463
+x64=3464
+x65=3465
+x66=3466
+x67=3467
+x68=3468
+x69=3469
+x70=3470
+x71=3471
+x72=3472
+x73=3473
+x74=3474
+x75=3475
+x76=3476
+x77=3477
+x78=3478
+x79=3479
+x80=3480
+x81=3481
+x82=3482
+x83=3483
+x84=3484
+x85=3485
+x86=3486
+x87=3487
+x88=3488
+x89=3489
+x90=3490
+x91=3491
+x92=3492
+x93=3493
+x94=3494
+x95=3495
+x96=3496
+x97=3497
+x98=3498
+x99=3499
+x0=3500
+x1=3501
+x2=3502
+x3=3503
+x4=3504
+x5=3505
+x6=3506
+x7=3507
+x8=3508
+x9=3509
+x10=3510
+x11=3511
+x12=3512
+x13=3513
+x14=3514
+x15=3515
+x16=3516
+x17=3517
+x18=3518
+x19=3519
+x20=3520
+x21=3521
+x22=3522
+x23=3523
+x24=3524
+x25=3525
+x26=3526
+x27=3527
+x28=3528
+x29=3529
+x30=3530
+x31=3531
+x32=3532
+x33=3533
+x34=3534
+x35=3535
+x36=3536
+x37=3537
+x38=3538
+x39=3539
+x40=3540
+x41=3541
+x42=3542
+x43=3543
+x44=3544
+x45=3545
+x46=3546
+x47=3547
+x48=3548
+x49=3549
+x50=3550
+x51=3551
+x52=3552
+x53=3553
+x54=3554
+x55=3555
+x56=3556
+x57=3557
+x58=3558
+x59=3559
+x60=3560
+x61=3561
+x62=3562
+x63=3563
+x64=3564
+x65=3565
+x66=3566
+x67=3567
+x68=3568
+x69=3569
+x70=3570
+x71=3571
+x72=3572
+x73=3573
+x74=3574
+x75=3575
+x76=3576
+x77=3577
+x78=3578
+x79=3579
+x80=3580
+x81=3581
+x82=3582
+x83=3583
+x84=3584
+x85=3585
+x86=3586
+x87=3587
+x88=3588
+x89=3589
+x90=3590
+x91=3591
+x92=3592
+x93=3593
+x94=3594
+x95=3595
+x96=3596
+x97=3597
+x98=3598
+x99=3599
+x0=3600
+x1=3601
+x2=3602
+x3=3603
+x4=3604
+x5=3605
+x6=3606
+x7=3607
+x8=3608
+x9=3609
+x10=3610
+x11=3611
+x12=3612
+x13=3613
+x14=3614
+x15=3615
+x16=3616
+x17=3617
+x18=3618
+x19=3619
+x20=3620
+x21=3621
+x22=3622
+x23=3623
+x24=3624
+x25=3625
+x26=3626
+x27=3627
+x28=3628
+x29=3629
+x30=3630
+x31=3631
+x32=3632
+x33=3633
+x34=3634
+x35=3635
+x36=3636
+x37=3637
+x38=3638
+x39=3639
+x40=3640
+x41=3641
+x42=3642
+x43=3643
+x44=3644
+x45=3645
+x46=3646
+x47=3647
+x48=3648
+x49=3649
+x50=3650
+x51=3651
+x52=3652
+x53=3653
+x54=3654
+x55=3655
+x56=3656
+x57=3657
+x58=3658
+x59=3659
+x60=3660
+x61=3661
+x62=3662
+x63=3663
+x64=3664
+x65=3665
+x66=3666
+x67=3667
+x68=3668
+x69=3669
+x70=3670
+x71=3671
+x72=3672
+x73=3673
+x74=3674
+x75=3675
+x76=3676
+x77=3677
+x78=3678
+x79=3679
+x80=3680
+x81=3681
+x82=3682
+x83=3683
+x84=3684
+x85=3685
+x86=3686
+x87=3687
+x88=3688
+x89=3689
+x90=3690
+x91=3691
+x92=3692
+x93=3693
+x94=3694
+x95=3695
+x96=3696
+x97=3697
+x98=3698
+x99=3699
+x0=3700
+x1=3701
+x2=3702
+x3=3703
+x4=3704
+x5=3705
+x6=3706
+x7=3707
+x8=3708
+x9=3709
+x10=3710
+x11=3711
+x12=3712
+x13=3713
+x14=3714
+x15=3715
+x16=3716
+x17=3717
+x18=3718
+x19=3719
+x20=3720
+x21=3721
+x22=3722
+x23=3723
+x24=3724
+x25=3725
+x26=3726
+x27=3727
+x28=3728
+x29=3729
+x30=3730
+x31=3731
+x32=3732
+x33=3733
+x34=3734
+x35=3735
+x36=3736
+x37=3737
+x38=3738
+x39=3739
+x40=3740
+x41=3741
+x42=3742
+x43=3743
+x44=3744
+x45=3745
+x46=3746
+x47=3747
+x48=3748
+x49=3749
+x50=3750
+x51=3751
+x52=3752
+x53=3753
+x54=3754
+x55=3755
+x56=3756
+x57=3757
+x58=3758
+x59=3759
+x60=3760
+x61=3761
+x62=3762
+x63=3763
+x64=3764
+x65=3765
+x66=3766
+x67=3767
+x68=3768
+x69=3769
+x70=3770
+x71=3771
+x72=3772
+x73=3773
+x74=3774
+x75=3775
+x76=3776
+x77=3777
+x78=3778
+x79=3779
+x80=3780
+x81=3781
+x82=3782
+x83=3783
+x84=3784
+x85=3785
+x86=3786
+x87=3787
+x88=3788
+x89=3789
+x90=3790
+x91=3791
+x92=3792
+x93=3793
+x94=3794
+x95=3795
+x96=3796
+x97=3797
+x98=3798
+x99=3799
+x0=3800
+x1=3801
+x2=3802
+x3=3803
+x4=3804
+x5=3805
+x6=3806
+x7=3807
+x8=3808
+x9=3809
+x10=3810
+x11=3811
+x12=3812
+x13=3813
+x14=3814
+x15=3815
+x16=3816
+x17=3817
+x18=3818
+x19=3819
+x20=3820
+x21=3821
+x22=3822
+x23=3823
+x24=3824
+x25=3825
+x26=3826
+x27=3827
+x28=3828
+x29=3829
+x30=3830
+x31=3831
+x32=3832
+x33=3833
+x34=3834
+x35=3835
+x36=3836
+x37=3837
+x38=3838
+x39=3839
+x40=3840
+x41=3841
+x42=3842
+x43=3843
+x44=3844
+x45=3845
+x46=3846
+x47=3847
+x48=3848
+x49=3849
+x50=3850
+x51=3851
+x52=3852
+x53=3853
+x54=3854
+x55=3855
+x56=3856
+x57=3857
+x58=3858
+x59=3859
+x60=3860
+x61=3861
+x62=3862
+x63=3863
+x64=3864
+x65=3865
+x66=3866
+x67=3867
+x68=3868
+x69=3869
+x70=3870
+x71=3871
+x72=3872
+x73=3873
+x74=3874
+x75=3875
+x76=3876
+x77=3877
+x78=3878
+x79=3879
+x80=3880
+x81=3881
+x82=3882
+x83=3883
+x84=3884
+x85=3885
+x86=3886
+x87=3887
+x88=3888
+x89=3889
+x90=3890
+x91=3891
+x92=3892
+x93=3893
+x94=3894
+x95=3895
+x96=3896
+x97=3897
+x98=3898
+x99=3899
+x0=3900
+x1=3901
+x2=3902
+x3=3903
+x4=3904
+x5=3905
+x6=3906
+x7=3907
+x8=3908
+x9=3909
+x10=3910
+x11=3911
+x12=3912
+x13=3913
+x14=3914
+x15=3915
+x16=3916
+x17=3917
+x18=3918
+x19=3919
+x20=3920
+x21=3921
+x22=3922
+x23=3923
+x24=3924
+x25=3925
+x26=3926
+x27=3927
+x28=3928
+x29=3929
+x30=3930
+x31=3931
+x32=3932
+x33=3933
+x34=3934
+x35=3935
+x36=3936
+x37=3937
+x38=3938
+x39=3939
+x40=3940
+x41=3941
+x42=3942
+x43=3943
+x44=3944
+x45=3945
+x46=3946
+x47=3947
+x48=3948
+x49=3949
+x50=3950
+x51=3951
+x52=3952
+x53=3953
+x54=3954
+x55=3955
+x56=3956
+x57=3957
+x58=3958
+x59=3959
+x60=3960
+x61=3961
+x62=3962
+x63=3963
+x64=3964
+x65=3965
+x66=3966
+x67=3967
+x68=3968
+x69=3969
+x70=3970
+x71=3971
+x72=3972
+x73=3973
+x74=3974
+x75=3975
+x76=3976
+x77=3977
+x78=3978
+x79=3979
+x80=3980
+x81=3981
+x82=3982
+x83=3983
+x84=3984
+x85=3985
+x86=3986
+x87=3987
+x88=3988
+x89=3989
+x90=3990
+x91=3991
+x92=3992
+x93=3993
+x94=3994
+x95=3995
+x96=3996
+x97=3997
+x98=3998
+x99=3999
+x0=4000
+x1=4001
+x2=4002
+x3=4003
+x4=4004
+x5=4005
+x6=4006
+x7=4007
+x8=4008
+x9=4009
+x10=4010
+x11=4011
+x12=4012
+x13=4013
+x14=4014
+x15=4015
+x16=4016
+x17=4017
+x18=4018
+x19=4019
+x20=4020
+x21=4021
+x22=4022
+x23=4023
+x24=4024
+x25=4025
+x26=4026
+x27=4027
+x28=4028
+x29=4029
+x30=4030
+x31=4031
+x32=4032
+x33=4033
+x34=4034
+x35=4035
+x36=4036
+x37=4037
+x38=4038
+x39=4039
+x40=4040
+x41=4041
+x42=4042
+x43=4043
+x44=4044
+x45=4045
+x46=4046
+x47=4047
+x48=4048
+x49=4049
+x50=4050
+x51=4051
+x52=4052
+x53=4053
+x54=4054
+x55=4055
+x56=4056
+x57=4057
+x58=4058
+x59=4059
+x60=4060
+x61=4061
+x62=4062
+x63=4063
+x64=4064
+x65=4065
+x66=4066
+x67=4067
+x68=4068
+x69=4069
+x70=4070
+x71=4071
+x72=4072
+x73=4073
+x74=4074
+x75=4075
+x76=4076
+x77=4077
+x78=4078
+x79=4079
+x80=4080
+x81=4081
+x82=4082
+x83=4083
+x84=4084
+x85=4085
+x86=4086
+x87=4087
+x88=4088
+x89=4089
+x90=4090
+x91=4091
+x92=4092
+x93=4093
+x94=4094
+x95=4095
+x96=4096
+x97=4097
+x98=4098
+x99=4099
+x0=4100
+x1=4101
+x2=4102
+x3=4103
+x4=4104
+x5=4105
+x6=4106
+x7=4107
+x8=4108
+x9=4109
+x10=4110
+x11=4111
+x12=4112
+x13=4113
+x14=4114
+x15=4115
+x16=4116
+x17=4117
+x18=4118
+x19=4119
+x20=4120
+x21=4121
+x22=4122
+x23=4123
+x24=4124
+x25=4125
+x26=4126
+x27=4127
+x28=4128
+x29=4129
+x30=4130
+x31=4131
+x32=4132
+x33=4133
+x34=4134
+x35=4135
+x36=4136
+x37=4137
+x38=4138
+x39=4139
+x40=4140
+x41=4141
+x42=4142
+x43=4143
+x44=4144
+x45=4145
+x46=4146
+x47=4147
+x48=4148
+x49=4149
+x50=4150
+x51=4151
+x52=4152
+x53=4153
+x54=4154
+x55=4155
+x56=4156
+x57=4157
+x58=4158
+x59=4159
+x60=4160
+x61=4161
+x62=4162
+x63=4163
+x64=4164
+x65=4165
+x66=4166
+x67=4167
+x68=4168
+x69=4169
+x70=4170
+x71=4171
+x72=4172
+x73=4173
+x74=4174
+x75=4175
+x76=4176
+x77=4177
+x78=4178
+x79=4179
+x80=4180
+x81=4181
+x82=4182
+x83=4183
+x84=4184
+x85=4185
+x86=4186
+x87=4187
+x88=4188
+x89=4189
+x90=4190
+x91=4191
+x92=4192
+x93=4193
+x94=4194
+x95=4195
+x96=4196
+x97=4197
+x98=4198
+x99=4199
+x0=4200
+x1=4201
+x2=4202
+x3=4203
+x4=4204
+x5=4205
+x6=4206
+x7=4207
+x8=4208
+x9=4209
+x10=4210
+x11=4211
+x12=4212
+x13=4213
+x14=4214
+x15=4215
+x16=4216
+x17=4217
+x18=4218
+x19=4219
+x20=4220
+x21=4221
+x22=4222
+x23=4223
+x24=4224
+x25=4225
+x26=4226
+x27=4227
+x28=4228
+x29=4229
+x30=4230
+x31=4231
+x32=4232
+x33=4233
+x34=4234
+x35=4235
+x36=4236
+x37=4237
+x38=4238
+x39=4239
+x40=4240
+x41=4241
+x42=4242
+x43=4243
+x44=4244
+x45=4245
+x46=4246
+x47=4247
+x48=4248
+x49=4249
+x50=4250
+x51=4251
+x52=4252
+x53=4253
+x54=4254
+x55=4255
+x56=4256
+x57=4257
+x58=4258
+x59=4259
+x60=4260
+x61=4261
+x62=4262
+x63=4263
+x64=4264
+x65=4265
+x66=4266
+x67=4267
+x68=4268
+x69=4269
+x70=4270
+x71=4271
+x72=4272
+x73=4273
+x74=4274
+x75=4275
+x76=4276
+x77=4277
+x78=4278
+x79=4279
+x80=4280
+x81=4281
+x82=4282
+x83=4283
+x84=4284
+x85=4285
+x86=4286
+x87=4287
+x88=4288
+x89=4289
+x90=4290
+x91=4291
+x92=4292
+x93=4293
+x94=4294
+x95=4295
+x96=4296
+x97=4297
+x98=4298
+x99=4299
+x0=4300
+x1=4301
+x2=4302
+x3=4303
+x4=4304
+x5=4305
+x6=4306
+x7=4307
+x8=4308
+x9=4309
+x10=4310
+x11=4311
+x12=4312
+x13=4313
+x14=4314
+x15=4315
+x16=4316
+x17=4317
+x18=4318
+x19=4319
+x20=4320
+x21=4321
+x22=4322
+x23=4323
+x24=4324
+x25=4325
+x26=4326
+x27=4327
+x28=4328
+x29=4329
+x30=4330
+x31=4331
+x32=4332
+x33=4333
+x34=4334
+x35=4335
+x36=4336
+x37=4337
+x38=4338
+x39=4339
+x40=4340
+x41=4341
+x42=4342
+x43=4343
+x44=4344
+x45=4345
+x46=4346
+x47=4347
+x48=4348
+x49=4349
+x50=4350
+x51=4351
+x52=4352
+x53=4353
+x54=4354
+x55=4355
+x56=4356
+x57=4357
+x58=4358
+x59=4359
+x60=4360
+x61=4361
+x62=4362
+x63=4363
+x64=4364
+x65=4365
+x66=4366
+x67=4367
+x68=4368
+x69=4369
+x70=4370
+x71=4371
+x72=4372
+x73=4373
+x74=4374
+x75=4375
+x76=4376
+x77=4377
+x78=4378
+x79=4379
+x80=4380
+x81=4381
+x82=4382
+x83=4383
+x84=4384
+x85=4385
+x86=4386
+x87=4387
+x88=4388
+x89=4389
+x90=4390
+x91=4391
+x92=4392
+x93=4393
+x94=4394
+x95=4395
+x96=4396
+x97=4397
+x98=4398
+x99=4399
+x0=4400
+x1=4401
+x2=4402
+x3=4403
+x4=4404
+x5=4405
+x6=4406
+x7=4407
+x8=4408
+x9=4409
+x10=4410
+x11=4411
+x12=4412
+x13=4413
+x14=4414
+x15=4415
+x16=4416
+x17=4417
+x18=4418
+x19=4419
+x20=4420
+x21=4421
+x22=4422
+x23=4423
+x24=4424
+x25=4425
+x26=4426
+x27=4427
+x28=4428
+x29=4429
+x30=4430
+x31=4431
+x32=4432
+x33=4433
+x34=4434
+x35=4435
+x36=4436
+x37=4437
+x38=4438
+x39=4439
+x40=4440
+x41=4441
+x42=4442
+x43=4443
+x44=4444
+x45=4445
+x46=4446
+x47=4447
+x48=4448
+x49=4449
+x50=4450
+x51=4451
+x52=4452
+x53=4453
+x54=4454
+x55=4455
+x56=4456
+x57=4457
+x58=4458
+x59=4459
+x60=4460
+x61=4461
+x62=4462
+x63=4463
+x64=4464
+x65=4465
+x66=4466
+x67=4467
+x68=4468
+x69=4469
+x70=4470
+x71=4471
+x72=4472
+x73=4473
+x74=4474
+x75=4475
+x76=4476
+x77=4477
+x78=4478
+x79=4479
+x80=4480
+x81=4481
+x82=4482
+x83=4483
+x84=4484
+x85=4485
+x86=4486
+x87=4487
+x88=4488
+x89=4489
+x90=4490
+x91=4491
+x92=4492
+x93=4493
+x94=4494
+x95=4495
+x96=4496
+x97=4497
+x98=4498
+x99=4499
+x0=4500
+x1=4501
+x2=4502
+x3=4503
+x4=4504
+x5=4505
+x6=4506
+x7=4507
+x8=4508
+x9=4509
+x10=4510
+x11=4511
+x12=4512
+x13=4513
+x14=4514
+x15=4515
+x16=4516
+x17=4517
+x18=4518
+x19=4519
+x20=4520
+x21=4521
+x22=4522
+x23=4523
+x24=4524
+x25=4525
+x26=4526
+x27=4527
+x28=4528
+x29=4529
+x30=4530
+x31=4531
+x32=4532
+x33=4533
+x34=4534
+x35=4535
+x36=4536
+x37=4537
+x38=4538
+x39=4539
+x40=4540
+x41=4541
+x42=4542
+x43=4543
+x44=4544
+x45=4545
+x46=4546
+x47=4547
+x48=4548
+x49=4549
+x50=4550
+x51=4551
+x52=4552
+x53=4553
+x54=4554
+x55=4555
+x56=4556
+x57=4557
+x58=4558
+x59=4559
+x60=4560
+x61=4561
+x62=4562
+x63=4563
+x64=4564
+x65=4565
+x66=4566
+x67=4567
+x68=4568
+x69=4569
+x70=4570
+x71=4571
+x72=4572
+x73=4573
+x74=4574
+x75=4575
+x76=4576
+x77=4577
+x78=4578
+x79=4579
+x80=4580
+x81=4581
+x82=4582
+x83=4583
+x84=4584
+x85=4585
+x86=4586
+x87=4587
+x88=4588
+x89=4589
+x90=4590
+x91=4591
+x92=4592
+x93=4593
+x94=4594
+x95=4595
+x96=4596
+x97=4597
+x98=4598
+x99=4599
+x0=4600
+x1=4601
+x2=4602
+x3=4603
+x4=4604
+x5=4605
+x6=4606
+x7=4607
+x8=4608
+x9=4609
+x10=4610
+x11=4611
+x12=4612
+x13=4613
+x14=4614
+x15=4615
+x16=4616
+x17=4617
+x18=4618
+x19=4619
+x20=4620
+x21=4621
+x22=4622
+x23=4623
+x24=4624
+x25=4625
+x26=4626
+x27=4627
+x28=4628
+x29=4629
+x30=4630
+x31=4631
+x32=4632
+x33=4633
+x34=4634
+x35=4635
+x36=4636
+x37=4637
+x38=4638
+x39=4639
+x40=4640
+x41=4641
+x42=4642
+x43=4643
+x44=4644
+x45=4645
+x46=4646
+x47=4647
+x48=4648
+x49=4649
+x50=4650
+x51=4651
+x52=4652
+x53=4653
+x54=4654
+x55=4655
+x56=4656
+x57=4657
+x58=4658
+x59=4659
+x60=4660
+x61=4661
+x62=4662
+x63=4663
+x64=4664
+x65=4665
+x66=4666
+x67=4667
+x68=4668
+x69=4669
+x70=4670
+x71=4671
+x72=4672
+x73=4673
+x74=4674
+x75=4675
+x76=4676
+x77=4677
+x78=4678
+x79=4679
+x80=4680
+x81=4681
+x82=4682
+x83=4683
+x84=4684
+x85=4685
+x86=4686
+x87=4687
+x88=4688
+x89=4689
+x90=4690
+x91=4691
+x92=4692
+x93=4693
+x94=4694
+x95=4695
+x96=4696
+x97=4697
+x98=4698
+x99=4699
+x0=4700
+x1=4701
+x2=4702
+x3=4703
+x4=4704
+x5=4705
+x6=4706
+x7=4707
+x8=4708
+x9=4709
+x10=4710
+x11=4711
+x12=4712
+x13=4713
+x14=4714
+x15=4715
+x16=4716
+x17=4717
+x18=4718
+x19=4719
+x20=4720
+x21=4721
+x22=4722
+x23=4723
+x24=4724
+x25=4725
+x26=4726
+x27=4727
+x28=4728
+x29=4729
+x30=4730
+x31=4731
+x32=4732
+x33=4733
+x34=4734
+x35=4735
+x36=4736
+x37=4737
+x38=4738
+x39=4739
+x40=4740
+x41=4741
+x42=4742
+x43=4743
+x44=4744
+x45=4745
+x46=4746
+x47=4747
+x48=4748
+x49=4749
+x50=4750
+x51=4751
+x52=4752
+x53=4753
+x54=4754
+x55=4755
+x56=4756
+x57=4757
+x58=4758
+x59=4759
+x60=4760
+x61=4761
+x62=4762
+x63=4763
+x64=4764
+x65=4765
+x66=4766
+x67=4767
+x68=4768
+x69=4769
+x70=4770
+x71=4771
+x72=4772
+x73=4773
+x74=4774
+x75=4775
+x76=4776
+x77=4777
+x78=4778
+x79=4779
+x80=4780
+x81=4781
+x82=4782
+x83=4783
+x84=4784
+x85=4785
+x86=4786
+x87=4787
+x88=4788
+x89=4789
+x90=4790
+x91=4791
+x92=4792
+x93=4793
+x94=4794
+x95=4795
+x96=4796
+x97=4797
+x98=4798
+x99=4799
+x0=4800
+x1=4801
+x2=4802
+x3=4803
+x4=4804
+x5=4805
+x6=4806
+x7=4807
+x8=4808
+x9=4809
+x10=4810
+x11=4811
+x12=4812
+x13=4813
+x14=4814
+x15=4815
+x16=4816
+x17=4817
+x18=4818
+x19=4819
+x20=4820
+x21=4821
+x22=4822
+x23=4823
+x24=4824
+x25=4825
+x26=4826
+x27=4827
+x28=4828
+x29=4829
+x30=4830
+x31=4831
+x32=4832
+x33=4833
+x34=4834
+x35=4835
+x36=4836
+x37=4837
+x38=4838
+x39=4839
+x40=4840
+x41=4841
+x42=4842
+x43=4843
+x44=4844
+x45=4845
+x46=4846
+x47=4847
+x48=4848
+x49=4849
+x50=4850
+x51=4851
+x52=4852
+x53=4853
+x54=4854
+x55=4855
+x56=4856
+x57=4857
+x58=4858
+x59=4859
+x60=4860
+x61=4861
+x62=4862
+x63=4863
+x64=4864
+x65=4865
+x66=4866
+x67=4867
+x68=4868
+x69=4869
+x70=4870
+x71=4871
+x72=4872
+x73=4873
+x74=4874
+x75=4875
+x76=4876
+x77=4877
+x78=4878
+x79=4879
+x80=4880
+x81=4881
+x82=4882
+x83=4883
+x84=4884
+x85=4885
+x86=4886
+x87=4887
+x88=4888
+x89=4889
+x90=4890
+x91=4891
+x92=4892
+x93=4893
+x94=4894
+x95=4895
+x96=4896
+x97=4897
+x98=4898
+x99=4899
+x0=4900
+x1=4901
+x2=4902
+x3=4903
+x4=4904
+x5=4905
+x6=4906
+x7=4907
+x8=4908
+x9=4909
+x10=4910
+x11=4911
+x12=4912
+x13=4913
+x14=4914
+x15=4915
+x16=4916
+x17=4917
+x18=4918
+x19=4919
+x20=4920
+x21=4921
+x22=4922
+x23=4923
+x24=4924
+x25=4925
+x26=4926
+x27=4927
+x28=4928
+x29=4929
+x30=4930
+x31=4931
+x32=4932
+x33=4933
+x34=4934
+x35=4935
+x36=4936
+x37=4937
+x38=4938
+x39=4939
+x40=4940
+x41=4941
+x42=4942
+x43=4943
+x44=4944
+x45=4945
+x46=4946
+x47=4947
+x48=4948
+x49=4949
+x50=4950
+x51=4951
+x52=4952
+x53=4953
+x54=4954
+x55=4955
+x56=4956
+x57=4957
+x58=4958
+x59=4959
+x60=4960
+x61=4961
+x62=4962
+x63=4963
+x64=4964
+x65=4965
+x66=4966
+x67=4967
+x68=4968
+x69=4969
+x70=4970
+x71=4971
+x72=4972
+x73=4973
+x74=4974
+x75=4975
+x76=4976
+x77=4977
+x78=4978
+x79=4979
+x80=4980
+x81=4981
+x82=4982
+x83=4983
+x84=4984
+x85=4985
+x86=4986
+x87=4987
+x88=4988
+x89=4989
+x90=4990
+x91=4991
+x92=4992
+x93=4993
+x94=4994
+x95=4995
+x96=4996
+x97=4997
+x98=4998
+x99=4999
+x0=5000
+x1=5001
+x2=5002
+x3=5003
+x4=5004
+x5=5005
+x6=5006
+x7=5007
+x8=5008
+x9=5009
+x10=5010
+x11=5011
+x12=5012
+x13=5013
+x14=5014
+x15=5015
+x16=5016
+x17=5017
+x18=5018
+x19=5019
+x20=5020
+x21=5021
+x22=5022
+x23=5023
+x24=5024
+x25=5025
+x26=5026
+x27=5027
+x28=5028
+x29=5029
+x30=5030
+x31=5031
+x32=5032
+x33=5033
+x34=5034
+x35=5035
+x36=5036
+x37=5037
+x38=5038
+x39=5039
+x40=5040
+x41=5041
+x42=5042
+x43=5043
+x44=5044
+x45=5045
+x46=5046
+x47=5047
+x48=5048
+x49=5049
+x50=5050
+x51=5051
+x52=5052
+x53=5053
+x54=5054
+x55=5055
+x56=5056
+x57=5057
+x58=5058
+x59=5059
+x60=5060
+x61=5061
+x62=5062
+x63=5063
+x64=5064
+x65=5065
+x66=5066
+x67=5067
+x68=5068
+x69=5069
+x70=5070
+x71=5071
+x72=5072
+x73=5073
+x74=5074
+x75=5075
+x76=5076
+x77=5077
+x78=5078
+x79=5079
+x80=5080
+x81=5081
+x82=5082
+x83=5083
+x84=5084
+x85=5085
+x86=5086
+x87=5087
+x88=5088
+x89=5089
+x90=5090
+x91=5091
+x92=5092
+x93=5093
+x94=5094
+x95=5095
+x96=5096
+x97=5097
+x98=5098
+x99=5099
+x0=5100
+x1=5101
+x2=5102
+x3=5103
+x4=5104
+x5=5105
+x6=5106
+x7=5107
+x8=5108
+x9=5109
+x10=5110
+x11=5111
+x12=5112
+x13=5113
+x14=5114
+x15=5115
+x16=5116
+x17=5117
+x18=5118
+x19=5119
+x20=5120
+x21=5121
+x22=5122
+x23=5123
+x24=5124
+x25=5125
+x26=5126
+x27=5127
+x28=5128
+x29=5129
+x30=5130
+x31=5131
+x32=5132
+x33=5133
+x34=5134
+x35=5135
+x36=5136
+x37=5137
+x38=5138
+x39=5139
+x40=5140
+x41=5141
+x42=5142
+x43=5143
+x44=5144
+x45=5145
+x46=5146
+x47=5147
+x48=5148
+x49=5149
+x50=5150
+x51=5151
+x52=5152
+x53=5153
+x54=5154
+x55=5155
+x56=5156
+x57=5157
+x58=5158
+x59=5159
+x60=5160
+x61=5161
+x62=5162
+x63=5163
+x64=5164
+x65=5165
+x66=5166
+x67=5167
+x68=5168
+x69=5169
+x70=5170
+x71=5171
+x72=5172
+x73=5173
+x74=5174
+x75=5175
+x76=5176
+x77=5177
+x78=5178
+x79=5179
+x80=5180
+x81=5181
+x82=5182
+x83=5183
+x84=5184
+x85=5185
+x86=5186
+x87=5187
+x88=5188
+x89=5189
+x90=5190
+x91=5191
+x92=5192
+x93=5193
+x94=5194
+x95=5195
+x96=5196
+x97=5197
+x98=5198
+x99=5199
+x0=5200
+x1=5201
+x2=5202
+x3=5203
+x4=5204
+x5=5205
+x6=5206
+x7=5207
+x8=5208
+x9=5209
+x10=5210
+x11=5211
+x12=5212
+x13=5213
+x14=5214
+x15=5215
+x16=5216
+x17=5217
+x18=5218
+x19=5219
+x20=5220
+x21=5221
+x22=5222
+x23=5223
+x24=5224
+x25=5225
+x26=5226
+x27=5227
+x28=5228
+x29=5229
+x30=5230
+x31=5231
+x32=5232
+x33=5233
+x34=5234
+x35=5235
+x36=5236
+x37=5237
+x38=5238
+x39=5239
+x40=5240
+x41=5241
+x42=5242
+x43=5243
+x44=5244
+x45=5245
+x46=5246
+x47=5247
+x48=5248
+x49=5249
+x50=5250
+x51=5251
+x52=5252
+x53=5253
+x54=5254
+x55=5255
+x56=5256
+x57=5257
+x58=5258
+x59=5259
+x60=5260
+x61=5261
+x62=5262
+x63=5263
+x64=5264
+x65=5265
+x66=5266
+x67=5267
+x68=5268
+x69=5269
+x70=5270
+x71=5271
+x72=5272
+x73=5273
+x74=5274
+x75=5275
+x76=5276
+x77=5277
+x78=5278
+x79=5279
+x80=5280
+x81=5281
+x82=5282
+x83=5283
+x84=5284
+x85=5285
+x86=5286
+x87=5287
+x88=5288
+x89=5289
+x90=5290
+x91=5291
+x92=5292
+x93=5293
+x94=5294
+x95=5295
+x96=5296
+x97=5297
+x98=5298
+x99=5299
+x0=5300
+x1=5301
+x2=5302
+x3=5303
+x4=5304
+x5=5305
+x6=5306
+x7=5307
+x8=5308
+x9=5309
+x10=5310
+x11=5311
+x12=5312
+x13=5313
+x14=5314
+x15=5315
+x16=5316
+x17=5317
+x18=5318
+x19=5319
+x20=5320
+x21=5321
+x22=5322
+x23=5323
+x24=5324
+x25=5325
+x26=5326
+x27=5327
+x28=5328
+x29=5329
+x30=5330
+x31=5331
+x32=5332
+x33=5333
+x34=5334
+x35=5335
+x36=5336
+x37=5337
+x38=5338
+x39=5339
+x40=5340
+x41=5341
+x42=5342
+x43=5343
+x44=5344
+x45=5345
+x46=5346
+x47=5347
+x48=5348
+x49=5349
+x50=5350
+x51=5351
+x52=5352
+x53=5353
+x54=5354
+x55=5355
+x56=5356
+x57=5357
+x58=5358
+x59=5359
+x60=5360
+x61=5361
+x62=5362
+x63=5363
+x64=5364
+x65=5365
+x66=5366
+x67=5367
+x68=5368
+x69=5369
+x70=5370
+x71=5371
+x72=5372
+x73=5373
+x74=5374
+x75=5375
+x76=5376
+x77=5377
+x78=5378
+x79=5379
+x80=5380
+x81=5381
+x82=5382
+x83=5383
+x84=5384
+x85=5385
+x86=5386
+x87=5387
+x88=5388
+x89=5389
+x90=5390
+x91=5391
+x92=5392
+x93=5393
+x94=5394
+x95=5395
+x96=5396
+x97=5397
+x98=5398
+x99=5399
+x0=5400
+x1=5401
+x2=5402
+x3=5403
+x4=5404
+x5=5405
+x6=5406
+x7=5407
+x8=5408
+x9=5409
+x10=5410
+x11=5411
+x12=5412
+x13=5413
+x14=5414
+x15=5415
+x16=5416
+x17=5417
+x18=5418
+x19=5419
+x20=5420
+x21=5421
+x22=5422
+x23=5423
+x24=5424
+x25=5425
+x26=5426
+x27=5427
+x28=5428
+x29=5429
+x30=5430
+x31=5431
+x32=5432
+x33=5433
+x34=5434
+x35=5435
+x36=5436
+x37=5437
+x38=5438
+x39=5439
+x40=5440
+x41=5441
+x42=5442
+x43=5443
+x44=5444
+x45=5445
+x46=5446
+x47=5447
+x48=5448
+x49=5449
+x50=5450
+x51=5451
+x52=5452
+x53=5453
+x54=5454
+x55=5455
+x56=5456
+x57=5457
+x58=5458
+x59=5459
+x60=5460
+x61=5461
+x62=5462
+x63=5463
+x64=5464
+x65=5465
+x66=5466
+x67=5467
+x68=5468
+x69=5469
+x70=5470
+x71=5471
+x72=5472
+x73=5473
+x74=5474
+x75=5475
+x76=5476
+x77=5477
+x78=5478
+x79=5479
+x80=5480
+x81=5481
+x82=5482
+x83=5483
+x84=5484
+x85=5485
+x86=5486
+x87=5487
+x88=5488
+x89=5489
+x90=5490
+x91=5491
+x92=5492
+x93=5493
+x94=5494
+x95=5495
+x96=5496
+x97=5497
+x98=5498
+x99=5499
+x0=5500
+x1=5501
+x2=5502
+x3=5503
+x4=5504
+x5=5505
+x6=5506
+x7=5507
+x8=5508
+x9=5509
+x10=5510
+x11=5511
+x12=5512
+x13=5513
+x14=5514
+x15=5515
+x16=5516
+x17=5517
+x18=5518
+x19=5519
+x20=5520
+x21=5521
+x22=5522
+x23=5523
+x24=5524
+x25=5525
+x26=5526
+x27=5527
+x28=5528
+x29=5529
+x30=5530
+x31=5531
+x32=5532
+x33=5533
+x34=5534
+x35=5535
+x36=5536
+x37=5537
+x38=5538
+x39=5539
+x40=5540
+x41=5541
+x42=5542
+x43=5543
+x44=5544
+x45=5545
+x46=5546
+x47=5547
+x48=5548
+x49=5549
+x50=5550
+x51=5551
+x52=5552
+x53=5553
+x54=5554
+x55=5555
+x56=5556
+x57=5557
+x58=5558
+x59=5559
+x60=5560
+x61=5561
+x62=5562
+x63=5563
+x64=5564
+x65=5565
+x66=5566
+x67=5567
+x68=5568
+x69=5569
+x70=5570
+x71=5571
+x72=5572
+x73=5573
+x74=5574
+x75=5575
+x76=5576
+x77=5577
+x78=5578
+x79=5579
+x80=5580
+x81=5581
+x82=5582
+x83=5583
+x84=5584
+x85=5585
+x86=5586
+x87=5587
+x88=5588
+x89=5589
+x90=5590
+x91=5591
+x92=5592
+x93=5593
+x94=5594
+x95=5595
+x96=5596
+x97=5597
+x98=5598
+x99=5599
+x0=5600
+x1=5601
+x2=5602
+x3=5603
+x4=5604
+x5=5605
+x6=5606
+x7=5607
+x8=5608
+x9=5609
+x10=5610
+x11=5611
+x12=5612
+x13=5613
+x14=5614
+x15=5615
+x16=5616
+x17=5617
+x18=5618
+x19=5619
+x20=5620
+x21=5621
+x22=5622
+x23=5623
+x24=5624
+x25=5625
+x26=5626
+x27=5627
+x28=5628
+x29=5629
+x30=5630
+x31=5631
+x32=5632
+x33=5633
+x34=5634
+x35=5635
+x36=5636
+x37=5637
+x38=5638
+x39=5639
+x40=5640
+x41=5641
+x42=5642
+x43=5643
+x44=5644
+x45=5645
+x46=5646
+x47=5647
+x48=5648
+x49=5649
+x50=5650
+x51=5651
+x52=5652
+x53=5653
+x54=5654
+x55=5655
+x56=5656
+x57=5657
+x58=5658
+x59=5659
+x60=5660
+x61=5661
+x62=5662
+x63=5663
+x64=5664
+x65=5665
+x66=5666
+x67=5667
+x68=5668
+x69=5669
+x70=5670
+x71=5671
+x72=5672
+x73=5673
+x74=5674
+x75=5675
+x76=5676
+x77=5677
+x78=5678
+x79=5679
+x80=5680
+x81=5681
+x82=5682
+x83=5683
+x84=5684
+x85=5685
+x86=5686
+x87=5687
+x88=5688
+x89=5689
+x90=5690
+x91=5691
+x92=5692
+x93=5693
+x94=5694
+x95=5695
+x96=5696
+x97=5697
+x98=5698
+x99=5699
+x0=5700
+x1=5701
+x2=5702
+x3=5703
+x4=5704
+x5=5705
+x6=5706
+x7=5707
+x8=5708
+x9=5709
+x10=5710
+x11=5711
+x12=5712
+x13=5713
+x14=5714
+x15=5715
+x16=5716
+x17=5717
+x18=5718
+x19=5719
+x20=5720
+x21=5721
+x22=5722
+x23=5723
+x24=5724
+x25=5725
+x26=5726
+x27=5727
+x28=5728
+x29=5729
+x30=5730
+x31=5731
+x32=5732
+x33=5733
+x34=5734
+x35=5735
+x36=5736
+x37=5737
+x38=5738
+x39=5739
+x40=5740
+x41=5741
+x42=5742
+x43=5743
+x44=5744
+x45=5745
+x46=5746
+x47=5747
+x48=5748
+x49=5749
+x50=5750
+x51=5751
+x52=5752
+x53=5753
+x54=5754
+x55=5755
+x56=5756
+x57=5757
+x58=5758
+x59=5759
+x60=5760
+x61=5761
+x62=5762
+x63=5763
+x64=5764
+x65=5765
+x66=5766
+x67=5767
+x68=5768
+x69=5769
+x70=5770
+x71=5771
+x72=5772
+x73=5773
+x74=5774
+x75=5775
+x76=5776
+x77=5777
+x78=5778
+x79=5779
+x80=5780
+x81=5781
+x82=5782
+x83=5783
+x84=5784
+x85=5785
+x86=5786
+x87=5787
+x88=5788
+x89=5789
+x90=5790
+x91=5791
+x92=5792
+x93=5793
+x94=5794
+x95=5795
+x96=5796
+x97=5797
+x98=5798
+x99=5799
+x0=5800
+x1=5801
+x2=5802
+x3=5803
+x4=5804
+x5=5805
+x6=5806
+x7=5807
+x8=5808
+x9=5809
+x10=5810
+x11=5811
+x12=5812
+x13=5813
+x14=5814
+x15=5815
+x16=5816
+x17=5817
+x18=5818
+x19=5819
+x20=5820
+x21=5821
+x22=5822
+x23=5823
+x24=5824
+x25=5825
+x26=5826
+x27=5827
+x28=5828
+x29=5829
+x30=5830
+x31=5831
+x32=5832
+x33=5833
+x34=5834
+x35=5835
+x36=5836
+x37=5837
+x38=5838
+x39=5839
+x40=5840
+x41=5841
+x42=5842
+x43=5843
+x44=5844
+x45=5845
+x46=5846
+x47=5847
+x48=5848
+x49=5849
+x50=5850
+x51=5851
+x52=5852
+x53=5853
+x54=5854
+x55=5855
+x56=5856
+x57=5857
+x58=5858
+x59=5859
+x60=5860
+x61=5861
+x62=5862
+x63=5863
+x64=5864
+x65=5865
+x66=5866
+x67=5867
+x68=5868
+x69=5869
+x70=5870
+x71=5871
+x72=5872
+x73=5873
+x74=5874
+x75=5875
+x76=5876
+x77=5877
+x78=5878
+x79=5879
+x80=5880
+x81=5881
+x82=5882
+x83=5883
+x84=5884
+x85=5885
+x86=5886
+x87=5887
+x88=5888
+x89=5889
+x90=5890
+x91=5891
+x92=5892
+x93=5893
+x94=5894
+x95=5895
+x96=5896
+x97=5897
+x98=5898
+x99=5899
+x0=5900
+x1=5901
+x2=5902
+x3=5903
+x4=5904
+x5=5905
+x6=5906
+x7=5907
+x8=5908
+x9=5909
+x10=5910
+x11=5911
+x12=5912
+x13=5913
+x14=5914
+x15=5915
+x16=5916
+x17=5917
+x18=5918
+x19=5919
+x20=5920
+x21=5921
+x22=5922
+x23=5923
+x24=5924
+x25=5925
+x26=5926
+x27=5927
+x28=5928
+x29=5929
+x30=5930
+x31=5931
+x32=5932
+x33=5933
+x34=5934
+x35=5935
+x36=5936
+x37=5937
+x38=5938
+x39=5939
+x40=5940
+x41=5941
+x42=5942
+x43=5943
+x44=5944
+x45=5945
+x46=5946
+x47=5947
+x48=5948
+x49=5949
+x50=5950
+x51=5951
+x52=5952
+x53=5953
+x54=5954
+x55=5955
+x56=5956
+x57=5957
+x58=5958
+x59=5959
+x60=5960
+x61=5961
+x62=5962
+x63=5963
+x64=5964
+x65=5965
+x66=5966
+x67=5967
+x68=5968
+x69=5969
+x70=5970
+x71=5971
+x72=5972
+x73=5973
+x74=5974
+x75=5975
+x76=5976
+x77=5977
+x78=5978
+x79=5979
+x80=5980
+x81=5981
+x82=5982
+x83=5983
+x84=5984
+x85=5985
+x86=5986
+x87=5987
+x88=5988
+x89=5989
+x90=5990
+x91=5991
+x92=5992
+x93=5993
+x94=5994
+x95=5995
+x96=5996
+x97=5997
+x98=5998
+x99=5999
+x0=6000
+x1=6001
+x2=6002
+x3=6003
+x4=6004
+x5=6005
+x6=6006
+x7=6007
+x8=6008
+x9=6009
+x10=6010
+x11=6011
+x12=6012
+x13=6013
+x14=6014
+x15=6015
+x16=6016
+x17=6017
+x18=6018
+x19=6019
+x20=6020
+x21=6021
+x22=6022
+x23=6023
+x24=6024
+x25=6025
+x26=6026
+x27=6027
+x28=6028
+x29=6029
+x30=6030
+x31=6031
+x32=6032
+x33=6033
+x34=6034
+x35=6035
+x36=6036
+x37=6037
+x38=6038
+x39=6039
+x40=6040
+x41=6041
+x42=6042
+x43=6043
+x44=6044
+x45=6045
+x46=6046
+x47=6047
+x48=6048
+x49=6049
+x50=6050
+x51=6051
+x52=6052
+x53=6053
+x54=6054
+x55=6055
+x56=6056
+x57=6057
+x58=6058
+x59=6059
+x60=6060
+x61=6061
+x62=6062
+x63=6063
+x64=6064
+x65=6065
+x66=6066
+x67=6067
+x68=6068
+x69=6069
+x70=6070
+x71=6071
+x72=6072
+x73=6073
+x74=6074
+x75=6075
+x76=6076
+x77=6077
+x78=6078
+x79=6079
+x80=6080
+x81=6081
+x82=6082
+x83=6083
+x84=6084
+x85=6085
+x86=6086
+x87=6087
+x88=6088
+x89=6089
+x90=6090
+x91=6091
+x92=6092
+x93=6093
+x94=6094
+x95=6095
+x96=6096
+x97=6097
+x98=6098
+x99=6099
+x0=6100
+x1=6101
+x2=6102
+x3=6103
+x4=6104
+x5=6105
+x6=6106
+x7=6107
+x8=6108
+x9=6109
+x10=6110
+x11=6111
+x12=6112
+x13=6113
+x14=6114
+x15=6115
+x16=6116
+x17=6117
+x18=6118
+x19=6119
+x20=6120
+x21=6121
+x22=6122
+x23=6123
+x24=6124
+x25=6125
+x26=6126
+x27=6127
+x28=6128
+x29=6129
+x30=6130
+x31=6131
+x32=6132
+x33=6133
+x34=6134
+x35=6135
+x36=6136
+x37=6137
+x38=6138
+x39=6139
+x40=6140
+x41=6141
+x42=6142
+x43=6143
+x44=6144
+x45=6145
+x46=6146
+x47=6147
+x48=6148
+x49=6149
+x50=6150
+x51=6151
+x52=6152
+x53=6153
+x54=6154
+x55=6155
+x56=6156
+x57=6157
+x58=6158
+x59=6159
+x60=6160
+x61=6161
+x62=6162
+x63=6163
+x64=6164
+x65=6165
+x66=6166
+x67=6167
+x68=6168
+x69=6169
+x70=6170
+x71=6171
+x72=6172
+x73=6173
+x74=6174
+x75=6175
+x76=6176
+x77=6177
+x78=6178
+x79=6179
+x80=6180
+x81=6181
+x82=6182
+x83=6183
+x84=6184
+x85=6185
+x86=6186
+x87=6187
+x88=6188
+x89=6189
+x90=6190
+x91=6191
+x92=6192
+x93=6193
+x94=6194
+x95=6195
+x96=6196
+x97=6197
+x98=6198
+x99=6199
+x0=6200
+x1=6201
+x2=6202
+x3=6203
+x4=6204
+x5=6205
+x6=6206
+x7=6207
+x8=6208
+x9=6209
+x10=6210
+x11=6211
+x12=6212
+x13=6213
+x14=6214
+x15=6215
+x16=6216
+x17=6217
+x18=6218
+x19=6219
+x20=6220
+x21=6221
+x22=6222
+x23=6223
+x24=6224
+x25=6225
+x26=6226
+x27=6227
+x28=6228
+x29=6229
+x30=6230
+x31=6231
+x32=6232
+x33=6233
+x34=6234
+x35=6235
+x36=6236
+x37=6237
+x38=6238
+x39=6239
+x40=6240
+x41=6241
+x42=6242
+x43=6243
+x44=6244
+x45=6245
+x46=6246
+x47=6247
+x48=6248
+x49=6249
+x50=6250
+x51=6251
+x52=6252
+x53=6253
+x54=6254
+x55=6255
+x56=6256
+x57=6257
+x58=6258
+x59=6259
+x60=6260
+x61=6261
+x62=6262
+x63=6263
+x64=6264
+x65=6265
+x66=6266
+x67=6267
+x68=6268
+x69=6269
+x70=6270
+x71=6271
+x72=6272
+x73=6273
+x74=6274
+x75=6275
+x76=6276
+x77=6277
+x78=6278
+x79=6279
+x80=6280
+x81=6281
+x82=6282
+x83=6283
+x84=6284
+x85=6285
+x86=6286
+x87=6287
+x88=6288
+x89=6289
+x90=6290
+x91=6291
+x92=6292
+x93=6293
+x94=6294
+x95=6295
+x96=6296
+x97=6297
+x98=6298
+x99=6299
+x0=6300
+x1=6301
+x2=6302
+x3=6303
+x4=6304
+x5=6305
+x6=6306
+x7=6307
+x8=6308
+x9=6309
+x10=6310
+x11=6311
+x12=6312
+x13=6313
+x14=6314
+x15=6315
+x16=6316
+x17=6317
+x18=6318
+x19=6319
+x20=6320
+x21=6321
+x22=6322
+x23=6323
+x24=6324
+x25=6325
+x26=6326
+x27=6327
+x28=6328
+x29=6329
+x30=6330
+x31=6331
+x32=6332
+x33=6333
+x34=6334
+x35=6335
+x36=6336
+x37=6337
+x38=6338
+x39=6339
+x40=6340
+x41=6341
+x42=6342
+x43=6343
+x44=6344
+x45=6345
+x46=6346
+x47=6347
+x48=6348
+x49=6349
+x50=6350
+x51=6351
+x52=6352
+x53=6353
+x54=6354
+x55=6355
+x56=6356
+x57=6357
+x58=6358
+x59=6359
+x60=6360
+x61=6361
+x62=6362
+x63=6363
+x64=6364
+x65=6365
+x66=6366
+x67=6367
+x68=6368
+x69=6369
+x70=6370
+x71=6371
+x72=6372
+x73=6373
+x74=6374
+x75=6375
+x76=6376
+x77=6377
+x78=6378
+x79=6379
+x80=6380
+x81=6381
+x82=6382
+x83=6383
+x84=6384
+x85=6385
+x86=6386
+x87=6387
+x88=6388
+x89=6389
+x90=6390
+x91=6391
+x92=6392
+x93=6393
+x94=6394
+x95=6395
+x96=6396
+x97=6397
+x98=6398
+x99=6399
+x0=6400
+x1=6401
+x2=6402
+x3=6403
+x4=6404
+x5=6405
+x6=6406
+x7=6407
+x8=6408
+x9=6409
+x10=6410
+x11=6411
+x12=6412
+x13=6413
+x14=6414
+x15=6415
+x16=6416
+x17=6417
+x18=6418
+x19=6419
+x20=6420
+x21=6421
+x22=6422
+x23=6423
+x24=6424
+x25=6425
+x26=6426
+x27=6427
+x28=6428
+x29=6429
+x30=6430
+x31=6431
+x32=6432
+x33=6433
+x34=6434
+x35=6435
+x36=6436
+x37=6437
+x38=6438
+x39=6439
+x40=6440
+x41=6441
+x42=6442
+x43=6443
+x44=6444
+x45=6445
+x46=6446
+x47=6447
+x48=6448
+x49=6449
+x50=6450
+x51=6451
+x52=6452
+x53=6453
+x54=6454
+x55=6455
+x56=6456
+x57=6457
+x58=6458
+x59=6459
+x60=6460
+x61=6461
+x62=6462
+x63=6463
+x64=6464
+x65=6465
+x66=6466
+x67=6467
+x68=6468
+x69=6469
+x70=6470
+x71=6471
+x72=6472
+x73=6473
+x74=6474
+x75=6475
+x76=6476
+x77=6477
+x78=6478
+x79=6479
+x80=6480
+x81=6481
+x82=6482
+x83=6483
+x84=6484
+x85=6485
+x86=6486
+x87=6487
+x88=6488
+x89=6489
+x90=6490
+x91=6491
+x92=6492
+x93=6493
+x94=6494
+x95=6495
+x96=6496
+x97=6497
+x98=6498
+x99=6499
+x0=6500
+x1=6501
+x2=6502
+x3=6503
+x4=6504
+x5=6505
+x6=6506
+x7=6507
+x8=6508
+x9=6509
+x10=6510
+x11=6511
+x12=6512
+x13=6513
+x14=6514
+x15=6515
+x16=6516
+x17=6517
+x18=6518
+x19=6519
+x20=6520
+x21=6521
+x22=6522
+x23=6523
+x24=6524
+x25=6525
+x26=6526
+x27=6527
+x28=6528
+x29=6529
+x30=6530
+x31=6531
+x32=6532
+x33=6533
+x34=6534
+x35=6535
+x36=6536
+x37=6537
+x38=6538
+x39=6539
+x40=6540
+x41=6541
+x42=6542
+x43=6543
+x44=6544
+x45=6545
+x46=6546
+x47=6547
+x48=6548
+x49=6549
+x50=6550
+x51=6551
+x52=6552
+x53=6553
+x54=6554
+x55=6555
+x56=6556
+x57=6557
+x58=6558
+x59=6559
+x60=6560
+x61=6561
+x62=6562
+x63=6563
+x64=6564
+x65=6565
+x66=6566
+x67=6567
+x68=6568
+x69=6569
+x70=6570
+x71=6571
+x72=6572
+x73=6573
+x74=6574
+x75=6575
+x76=6576
+x77=6577
+x78=6578
+x79=6579
+x80=6580
+x81=6581
+x82=6582
+x83=6583
+x84=6584
+x85=6585
+x86=6586
+x87=6587
+x88=6588
+x89=6589
+x90=6590
+x91=6591
+x92=6592
+x93=6593
+x94=6594
+x95=6595
+x96=6596
+x97=6597
+x98=6598
+x99=6599
+x0=6600
+x1=6601
+x2=6602
+x3=6603
+x4=6604
+x5=6605
+x6=6606
+x7=6607
+x8=6608
+x9=6609
+x10=6610
+x11=6611
+x12=6612
+x13=6613
+x14=6614
+x15=6615
+x16=6616
+x17=6617
+x18=6618
+x19=6619
+x20=6620
+x21=6621
+x22=6622
+x23=6623
+x24=6624
+x25=6625
+x26=6626
+x27=6627
+x28=6628
+x29=6629
+x30=6630
+x31=6631
+x32=6632
+x33=6633
+x34=6634
+x35=6635
+x36=6636
+x37=6637
+x38=6638
+x39=6639
+x40=6640
+x41=6641
+x42=6642
+x43=6643
+x44=6644
+x45=6645
+x46=6646
+x47=6647
+x48=6648
+x49=6649
+x50=6650
+x51=6651
+x52=6652
+x53=6653
+x54=6654
+x55=6655
+x56=6656
+x57=6657
+x58=6658
+x59=6659
+x60=6660
+x61=6661
+x62=6662
+x63=6663
+x64=6664
+x65=6665
+x66=6666
+x67=6667
+x68=6668
+x69=6669
+x70=6670
+x71=6671
+x72=6672
+x73=6673
+x74=6674
+x75=6675
+x76=6676
+x77=6677
+x78=6678
+x79=6679
+x80=6680
+x81=6681
+x82=6682
+x83=6683
+x84=6684
+x85=6685
+x86=6686
+x87=6687
+x88=6688
+x89=6689
+x90=6690
+x91=6691
+x92=6692
+x93=6693
+x94=6694
+x95=6695
+x96=6696
+x97=6697
+x98=6698
+x99=6699
+x0=6700
+x1=6701
+x2=6702
+x3=6703
+x4=6704
+x5=6705
+x6=6706
+x7=6707
+x8=6708
+x9=6709
+x10=6710
+x11=6711
+x12=6712
+x13=6713
+x14=6714
+x15=6715
+x16=6716
+x17=6717
+x18=6718
+x19=6719
+x20=6720
+x21=6721
+x22=6722
+x23=6723
+x24=6724
+x25=6725
+x26=6726
+x27=6727
+x28=6728
+x29=6729
+x30=6730
+x31=6731
+x32=6732
+x33=6733
+x34=6734
+x35=6735
+x36=6736
+x37=6737
+x38=6738
+x39=6739
+x40=6740
+x41=6741
+x42=6742
+x43=6743
+x44=6744
+x45=6745
+x46=6746
+x47=6747
+x48=6748
+x49=6749
+x50=6750
+x51=6751
+x52=6752
+x53=6753
+x54=6754
+x55=6755
+x56=6756
+x57=6757
+x58=6758
+x59=6759
+x60=6760
+x61=6761
+x62=6762
+x63=6763
+x64=6764
+x65=6765
+x66=6766
+x67=6767
+x68=6768
+x69=6769
+x70=6770
+x71=6771
+x72=6772
+x73=6773
+x74=6774
+x75=6775
+x76=6776
+x77=6777
+x78=6778
+x79=6779
+x80=6780
+x81=6781
+x82=6782
+x83=6783
+x84=6784
+x85=6785
+x86=6786
+x87=6787
+x88=6788
+x89=6789
+x90=6790
+x91=6791
+x92=6792
+x93=6793
+x94=6794
+x95=6795
+x96=6796
+x97=6797
+x98=6798
+x99=6799
+x0=6800
+x1=6801
+x2=6802
+x3=6803
+x4=6804
+x5=6805
+x6=6806
+x7=6807
+x8=6808
+x9=6809
+x10=6810
+x11=6811
+x12=6812
+x13=6813
+x14=6814
+x15=6815
+x16=6816
+x17=6817
+x18=6818
+x19=6819
+x20=6820
+x21=6821
+x22=6822
+x23=6823
+x24=6824
+x25=6825
+x26=6826
+x27=6827
+x28=6828
+x29=6829
+x30=6830
+x31=6831
+x32=6832
+x33=6833
+x34=6834
+x35=6835
+x36=6836
+x37=6837
+x38=6838
+x39=6839
+x40=6840
+x41=6841
+x42=6842
+x43=6843
+x44=6844
+x45=6845
+x46=6846
+x47=6847
+x48=6848
+x49=6849
+x50=6850
+x51=6851
+x52=6852
+x53=6853
+x54=6854
+x55=6855
+x56=6856
+x57=6857
+x58=6858
+x59=6859
+x60=6860
+x61=6861
+x62=6862
+x63=6863
+x64=6864
+x65=6865
+x66=6866
+x67=6867
+x68=6868
+x69=6869
+x70=6870
+x71=6871
+x72=6872
+x73=6873
+x74=6874
+x75=6875
+x76=6876
+x77=6877
+x78=6878
+x79=6879
+x80=6880
+x81=6881
+x82=6882
+x83=6883
+x84=6884
+x85=6885
+x86=6886
+x87=6887
+x88=6888
+x89=6889
+x90=6890
+x91=6891
+x92=6892
+x93=6893
+x94=6894
+x95=6895
+x96=6896
+x97=6897
+x98=6898
+x99=6899
+x0=6900
+x1=6901
+x2=6902
+x3=6903
+x4=6904
+x5=6905
+x6=6906
+x7=6907
+x8=6908
+x9=6909
+x10=6910
+x11=6911
+x12=6912
+x13=6913
+x14=6914
+x15=6915
+x16=6916
+x17=6917
+x18=6918
+x19=6919
+x20=6920
+x21=6921
+x22=6922
+x23=6923
+x24=6924
+x25=6925
+x26=6926
+x27=6927
+x28=6928
+x29=6929
+x30=6930
+x31=6931
+x32=6932
+x33=6933
+x34=6934
+x35=6935
+x36=6936
+x37=6937
+x38=6938
+x39=6939
+x40=6940
+x41=6941
+x42=6942
+x43=6943
+x44=6944
+x45=6945
+x46=6946
+x47=6947
+x48=6948
+x49=6949
+x50=6950
+x51=6951
+x52=6952
+x53=6953
+x54=6954
+x55=6955
+x56=6956
+x57=6957
+x58=6958
+x59=6959
+x60=6960
+x61=6961
+x62=6962
+x63=6963
+x64=6964
+x65=6965
+x66=6966
+x67=6967
+x68=6968
+x69=6969
+x70=6970
+x71=6971
+x72=6972
+x73=6973
+x74=6974
+x75=6975
+x76=6976
+x77=6977
+x78=6978
+x79=6979
+x80=6980
+x81=6981
+x82=6982
+x83=6983
+x84=6984
+x85=6985
+x86=6986
+x87=6987
+x88=6988
+x89=6989
+x90=6990
+x91=6991
+x92=6992
+x93=6993
+x94=6994
+x95=6995
+x96=6996
+x97=6997
+x98=6998
+x99=6999
+x0=7000
+x1=7001
+x2=7002
+x3=7003
+x4=7004
+x5=7005
+x6=7006
+x7=7007
+x8=7008
+x9=7009
+x10=7010
+x11=7011
+x12=7012
+x13=7013
+x14=7014
+x15=7015
+x16=7016
+x17=7017
+x18=7018
+x19=7019
+x20=7020
+x21=7021
+x22=7022
+x23=7023
+x24=7024
+x25=7025
+x26=7026
+x27=7027
+x28=7028
+x29=7029
+x30=7030
+x31=7031
+x32=7032
+x33=7033
+x34=7034
+x35=7035
+x36=7036
+x37=7037
+x38=7038
+x39=7039
+x40=7040
+x41=7041
+x42=7042
+x43=7043
+x44=7044
+x45=7045
+x46=7046
+x47=7047
+x48=7048
+x49=7049
+x50=7050
+x51=7051
+x52=7052
+x53=7053
+x54=7054
+x55=7055
+x56=7056
+x57=7057
+x58=7058
+x59=7059
+x60=7060
+x61=7061
+x62=7062
+x63=7063
+x64=7064
+x65=7065
+x66=7066
+x67=7067
+x68=7068
+x69=7069
+x70=7070
+x71=7071
+x72=7072
+x73=7073
+x74=7074
+x75=7075
+x76=7076
+x77=7077
+x78=7078
+x79=7079
+x80=7080
+x81=7081
+x82=7082
+x83=7083
+x84=7084
+x85=7085
+x86=7086
+x87=7087
+x88=7088
+x89=7089
+x90=7090
+x91=7091
+x92=7092
+x93=7093
+x94=7094
+x95=7095
+x96=7096
+x97=7097
+x98=7098
+x99=7099
+x0=7100
+x1=7101
+x2=7102
+x3=7103
+x4=7104
+x5=7105
+x6=7106
+x7=7107
+x8=7108
+x9=7109
+x10=7110
+x11=7111
+x12=7112
+x13=7113
+x14=7114
+x15=7115
+x16=7116
+x17=7117
+x18=7118
+x19=7119
+x20=7120
+x21=7121
+x22=7122
+x23=7123
+x24=7124
+x25=7125
+x26=7126
+x27=7127
+x28=7128
+x29=7129
+x30=7130
+x31=7131
+x32=7132
+x33=7133
+x34=7134
+x35=7135
+x36=7136
+x37=7137
+x38=7138
+x39=7139
+x40=7140
+x41=7141
+x42=7142
+x43=7143
+x44=7144
+x45=7145
+x46=7146
+x47=7147
+x48=7148
+x49=7149
+x50=7150
+x51=7151
+x52=7152
+x53=7153
+x54=7154
+x55=7155
+x56=7156
+x57=7157
+x58=7158
+x59=7159
+x60=7160
+x61=7161
+x62=7162
+x63=7163
+x64=7164
+x65=7165
+x66=7166
+x67=7167
+x68=7168
+x69=7169
+x70=7170
+x71=7171
+x72=7172
+x73=7173
+x74=7174
+x75=7175
+x76=7176
+x77=7177
+x78=7178
+x79=7179
+x80=7180
+x81=7181
+x82=7182
+x83=7183
+x84=7184
+x85=7185
+x86=7186
+x87=7187
+x88=7188
+x89=7189
+x90=7190
+x91=7191
+x92=7192
+x93=7193
+x94=7194
+x95=7195
+x96=7196
+x97=7197
+x98=7198
+x99=7199
+x0=7200
+x1=7201
+x2=7202
+x3=7203
+x4=7204
+x5=7205
+x6=7206
+x7=7207
+x8=7208
+x9=7209
+x10=7210
+x11=7211
+x12=7212
+x13=7213
+x14=7214
+x15=7215
+x16=7216
+x17=7217
+x18=7218
+x19=7219
+x20=7220
+x21=7221
+x22=7222
+x23=7223
+x24=7224
+x25=7225
+x26=7226
+x27=7227
+x28=7228
+x29=7229
+x30=7230
+x31=7231
+x32=7232
+x33=7233
+x34=7234
+x35=7235
+x36=7236
+x37=7237
+x38=7238
+x39=7239
+x40=7240
+x41=7241
+x42=7242
+x43=7243
+x44=7244
+x45=7245
+x46=7246
+x47=7247
+x48=7248
+x49=7249
+x50=7250
+x51=7251
+x52=7252
+x53=7253
+x54=7254
+x55=7255
+x56=7256
+x57=7257
+x58=7258
+x59=7259
+x60=7260
+x61=7261
+x62=7262
+x63=7263
+x64=7264
+x65=7265
+x66=7266
+x67=7267
+x68=7268
+x69=7269
+x70=7270
+x71=7271
+x72=7272
+x73=7273
+x74=7274
+x75=7275
+x76=7276
+x77=7277
+x78=7278
+x79=7279
+x80=7280
+x81=7281
+x82=7282
+x83=7283
+x84=7284
+x85=7285
+x86=7286
+x87=7287
+x88=7288
+x89=7289
+x90=7290
+x91=7291
+x92=7292
+x93=7293
+x94=7294
+x95=7295
+x96=7296
+x97=7297
+x98=7298
+x99=7299
+x0=7300
+x1=7301
+x2=7302
+x3=7303
+x4=7304
+x5=7305
+x6=7306
+x7=7307
+x8=7308
+x9=7309
+x10=7310
+x11=7311
+x12=7312
+x13=7313
+x14=7314
+x15=7315
+x16=7316
+x17=7317
+x18=7318
+x19=7319
+x20=7320
+x21=7321
+x22=7322
+x23=7323
+x24=7324
+x25=7325
+x26=7326
+x27=7327
+x28=7328
+x29=7329
+x30=7330
+x31=7331
+x32=7332
+x33=7333
+x34=7334
+x35=7335
+x36=7336
+x37=7337
+x38=7338
+x39=7339
+x40=7340
+x41=7341
+x42=7342
+x43=7343
+x44=7344
+x45=7345
+x46=7346
+x47=7347
+x48=7348
+x49=7349
+x50=7350
+x51=7351
+x52=7352
+x53=7353
+x54=7354
+x55=7355
+x56=7356
+x57=7357
+x58=7358
+x59=7359
+x60=7360
+x61=7361
+x62=7362
+x63=7363
+x64=7364
+x65=7365
+x66=7366
+x67=7367
+x68=7368
+x69=7369
+x70=7370
+x71=7371
+x72=7372
+x73=7373
+x74=7374
+x75=7375
+x76=7376
+x77=7377
+x78=7378
+x79=7379
+x80=7380
+x81=7381
+x82=7382
+x83=7383
+x84=7384
+x85=7385
+x86=7386
+x87=7387
+x88=7388
+x89=7389
+x90=7390
+x91=7391
+x92=7392
+x93=7393
+x94=7394
+x95=7395
+x96=7396
+x97=7397
+x98=7398
+x99=7399
+x0=7400
+x1=7401
+x2=7402
+x3=7403
+x4=7404
+x5=7405
+x6=7406
+x7=7407
+x8=7408
+x9=7409
+x10=7410
+x11=7411
+x12=7412
+x13=7413
+x14=7414
+x15=7415
+x16=7416
+x17=7417
+x18=7418
+x19=7419
+x20=7420
+x21=7421
+x22=7422
+x23=7423
+x24=7424
+x25=7425
+x26=7426
+x27=7427
+x28=7428
+x29=7429
+x30=7430
+x31=7431
+x32=7432
+x33=7433
+x34=7434
+x35=7435
+x36=7436
+x37=7437
+x38=7438
+x39=7439
+x40=7440
+x41=7441
+x42=7442
+x43=7443
+x44=7444
+x45=7445
+x46=7446
+x47=7447
+x48=7448
+x49=7449
+x50=7450
+x51=7451
+x52=7452
+x53=7453
+x54=7454
+x55=7455
+x56=7456
+x57=7457
+x58=7458
+x59=7459
+x60=7460
+x61=7461
+x62=7462
+x63=7463
+x64=7464
+x65=7465
+x66=7466
+x67=7467
+x68=7468
+x69=7469
+x70=7470
+x71=7471
+x72=7472
+x73=7473
+x74=7474
+x75=7475
+x76=7476
+x77=7477
+x78=7478
+x79=7479
+x80=7480
+x81=7481
+x82=7482
+x83=7483
+x84=7484
+x85=7485
+x86=7486
+x87=7487
+x88=7488
+x89=7489
+x90=7490
+x91=7491
+x92=7492
+x93=7493
+x94=7494
+x95=7495
+x96=7496
+x97=7497
+x98=7498
+x99=7499
+x0=7500
+x1=7501
+x2=7502
+x3=7503
+x4=7504
+x5=7505
+x6=7506
+x7=7507
+x8=7508
+x9=7509
+x10=7510
+x11=7511
+x12=7512
+x13=7513
+x14=7514
+x15=7515
+x16=7516
+x17=7517
+x18=7518
+x19=7519
+x20=7520
+x21=7521
+x22=7522
+x23=7523
+x24=7524
+x25=7525
+x26=7526
+x27=7527
+x28=7528
+x29=7529
+x30=7530
+x31=7531
+x32=7532
+x33=7533
+x34=7534
+x35=7535
+x36=7536
+x37=7537
+x38=7538
+x39=7539
+x40=7540
+x41=7541
+x42=7542
+x43=7543
+x44=7544
+x45=7545
+x46=7546
+x47=7547
+x48=7548
+x49=7549
+x50=7550
+x51=7551
+x52=7552
+x53=7553
+x54=7554
+x55=7555
+x56=7556
+x57=7557
+x58=7558
+x59=7559
+x60=7560
+x61=7561
+x62=7562
+x63=7563
+x64=7564
+x65=7565
+x66=7566
+x67=7567
+x68=7568
+x69=7569
+x70=7570
+x71=7571
+x72=7572
+x73=7573
+x74=7574
+x75=7575
+x76=7576
+x77=7577
+x78=7578
+x79=7579
+x80=7580
+x81=7581
+x82=7582
+x83=7583
+x84=7584
+x85=7585
+x86=7586
+x87=7587
+x88=7588
+x89=7589
+x90=7590
+x91=7591
+x92=7592
+x93=7593
+x94=7594
+x95=7595
+x96=7596
+x97=7597
+x98=7598
+x99=7599
+x0=7600
+x1=7601
+x2=7602
+x3=7603
+x4=7604
+x5=7605
+x6=7606
+x7=7607
+x8=7608
+x9=7609
+x10=7610
+x11=7611
+x12=7612
+x13=7613
+x14=7614
+x15=7615
+x16=7616
+x17=7617
+x18=7618
+x19=7619
+x20=7620
+x21=7621
+x22=7622
+x23=7623
+x24=7624
+x25=7625
+x26=7626
+x27=7627
+x28=7628
+x29=7629
+x30=7630
+x31=7631
+x32=7632
+x33=7633
+x34=7634
+x35=7635
+x36=7636
+x37=7637
+x38=7638
+x39=7639
+x40=7640
+x41=7641
+x42=7642
+x43=7643
+x44=7644
+x45=7645
+x46=7646
+x47=7647
+x48=7648
+x49=7649
+x50=7650
+x51=7651
+x52=7652
+x53=7653
+x54=7654
+x55=7655
+x56=7656
+x57=7657
+x58=7658
+x59=7659
+x60=7660
+x61=7661
+x62=7662
+x63=7663
+x64=7664
+x65=7665
+x66=7666
+x67=7667
+x68=7668
+x69=7669
+x70=7670
+x71=7671
+x72=7672
+x73=7673
+x74=7674
+x75=7675
+x76=7676
+x77=7677
+x78=7678
+x79=7679
+x80=7680
+x81=7681
+x82=7682
+x83=7683
+x84=7684
+x85=7685
+x86=7686
+x87=7687
+x88=7688
+x89=7689
+x90=7690
+x91=7691
+x92=7692
+x93=7693
+x94=7694
+x95=7695
+x96=7696
+x97=7697
+x98=7698
+x99=7699
+x0=7700
+x1=7701
+x2=7702
+x3=7703
+x4=7704
+x5=7705
+x6=7706
+x7=7707
+x8=7708
+x9=7709
+x10=7710
+x11=7711
+x12=7712
+x13=7713
+x14=7714
+x15=7715
+x16=7716
+x17=7717
+x18=7718
+x19=7719
+x20=7720
+x21=7721
+x22=7722
+x23=7723
+x24=7724
+x25=7725
+x26=7726
+x27=7727
+x28=7728
+x29=7729
+x30=7730
+x31=7731
+x32=7732
+x33=7733
+x34=7734
+x35=7735
+x36=7736
+x37=7737
+x38=7738
+x39=7739
+x40=7740
+x41=7741
+x42=7742
+x43=7743
+x44=7744
+x45=7745
+x46=7746
+x47=7747
+x48=7748
+x49=7749
+x50=7750
+x51=7751
+x52=7752
+x53=7753
+x54=7754
+x55=7755
+x56=7756
+x57=7757
+x58=7758
+x59=7759
+x60=7760
+x61=7761
+x62=7762
+x63=7763
+x64=7764
+x65=7765
+x66=7766
+x67=7767
+x68=7768
+x69=7769
+x70=7770
+x71=7771
+x72=7772
+x73=7773
+x74=7774
+x75=7775
+x76=7776
+x77=7777
+x78=7778
+x79=7779
+x80=7780
+x81=7781
+x82=7782
+x83=7783
+x84=7784
+x85=7785
+x86=7786
+x87=7787
+x88=7788
+x89=7789
+x90=7790
+x91=7791
+x92=7792
+x93=7793
+x94=7794
+x95=7795
+x96=7796
+x97=7797
+x98=7798
+x99=7799
+x0=7800
+x1=7801
+x2=7802
+x3=7803
+x4=7804
+x5=7805
+x6=7806
+x7=7807
+x8=7808
+x9=7809
+x10=7810
+x11=7811
+x12=7812
+x13=7813
+x14=7814
+x15=7815
+x16=7816
+x17=7817
+x18=7818
+x19=7819
+x20=7820
+x21=7821
+x22=7822
+x23=7823
+x24=7824
+x25=7825
+x26=7826
+x27=7827
+x28=7828
+x29=7829
+x30=7830
+x31=7831
+x32=7832
+x33=7833
+x34=7834
+x35=7835
+x36=7836
+x37=7837
+x38=7838
+x39=7839
+x40=7840
+x41=7841
+x42=7842
+x43=7843
+x44=7844
+x45=7845
+x46=7846
+x47=7847
+x48=7848
+x49=7849
+x50=7850
+x51=7851
+x52=7852
+x53=7853
+x54=7854
+x55=7855
+x56=7856
+x57=7857
+x58=7858
+x59=7859
+x60=7860
+x61=7861
+x62=7862
+x63=7863
+x64=7864
+x65=7865
+x66=7866
+x67=7867
+x68=7868
+x69=7869
+x70=7870
+x71=7871
+x72=7872
+x73=7873
+x74=7874
+x75=7875
+x76=7876
+x77=7877
+x78=7878
+x79=7879
+x80=7880
+x81=7881
+x82=7882
+x83=7883
+x84=7884
+x85=7885
+x86=7886
+x87=7887
+x88=7888
+x89=7889
+x90=7890
+x91=7891
+x92=7892
+x93=7893
+x94=7894
+x95=7895
+x96=7896
+x97=7897
+x98=7898
+x99=7899
+x0=7900
+x1=7901
+x2=7902
+x3=7903
+x4=7904
+x5=7905
+x6=7906
+x7=7907
+x8=7908
+x9=7909
+x10=7910
+x11=7911
+x12=7912
+x13=7913
+x14=7914
+x15=7915
+x16=7916
+x17=7917
+x18=7918
+x19=7919
+x20=7920
+x21=7921
+x22=7922
+x23=7923
+x24=7924
+x25=7925
+x26=7926
+x27=7927
+x28=7928
+x29=7929
+x30=7930
+x31=7931
+x32=7932
+x33=7933
+x34=7934
+x35=7935
+x36=7936
+x37=7937
+x38=7938
+x39=7939
+x40=7940
+x41=7941
+x42=7942
+x43=7943
+x44=7944
+x45=7945
+x46=7946
+x47=7947
+x48=7948
+x49=7949
+x50=7950
+x51=7951
+x52=7952
+x53=7953
+x54=7954
+x55=7955
+x56=7956
+x57=7957
+x58=7958
+x59=7959
+x60=7960
+x61=7961
+x62=7962
+x63=7963
+x64=7964
+x65=7965
+x66=7966
+x67=7967
+x68=7968
+x69=7969
+x70=7970
+x71=7971
+x72=7972
+x73=7973
+x74=7974
+x75=7975
+x76=7976
+x77=7977
+x78=7978
+x79=7979
+x80=7980
+x81=7981
+x82=7982
+x83=7983
+x84=7984
+x85=7985
+x86=7986
+x87=7987
+x88=7988
+x89=7989
+x90=7990
+x91=7991
+x92=7992
+x93=7993
+x94=7994
+x95=7995
+x96=7996
+x97=7997
+x98=7998
+x99=7999
+x0=8000
+x1=8001
+x2=8002
+x3=8003
+x4=8004
+x5=8005
+x6=8006
+x7=8007
+x8=8008
+x9=8009
+x10=8010
+x11=8011
+x12=8012
+x13=8013
+x14=8014
+x15=8015
+x16=8016
+x17=8017
+x18=8018
+x19=8019
+x20=8020
+x21=8021
+x22=8022
+x23=8023
+x24=8024
+x25=8025
+x26=8026
+x27=8027
+x28=8028
+x29=8029
+x30=8030
+x31=8031
+x32=8032
+x33=8033
+x34=8034
+x35=8035
+x36=8036
+x37=8037
+x38=8038
+x39=8039
+x40=8040
+x41=8041
+x42=8042
+x43=8043
+x44=8044
+x45=8045
+x46=8046
+x47=8047
+x48=8048
+x49=8049
+x50=8050
+x51=8051
+x52=8052
+x53=8053
+x54=8054
+x55=8055
+x56=8056
+x57=8057
+x58=8058
+x59=8059
+x60=8060
+x61=8061
+x62=8062
+x63=8063
+x64=8064
+x65=8065
+x66=8066
+x67=8067
+x68=8068
+x69=8069
+x70=8070
+x71=8071
+x72=8072
+x73=8073
+x74=8074
+x75=8075
+x76=8076
+x77=8077
+x78=8078
+x79=8079
+x80=8080
+x81=8081
+x82=8082
+x83=8083
+x84=8084
+x85=8085
+x86=8086
+x87=8087
+x88=8088
+x89=8089
+x90=8090
+x91=8091
+x92=8092
+x93=8093
+x94=8094
+x95=8095
+x96=8096
+x97=8097
+x98=8098
+x99=8099
+x0=8100
+x1=8101
+x2=8102
+x3=8103
+x4=8104
+x5=8105
+x6=8106
+x7=8107
+x8=8108
+x9=8109
+x10=8110
+x11=8111
+x12=8112
+x13=8113
+x14=8114
+x15=8115
+x16=8116
+x17=8117
+x18=8118
+x19=8119
+x20=8120
+x21=8121
+x22=8122
+x23=8123
+x24=8124
+x25=8125
+x26=8126
+x27=8127
+x28=8128
+x29=8129
+x30=8130
+x31=8131
+x32=8132
+x33=8133
+x34=8134
+x35=8135
+x36=8136
+x37=8137
+x38=8138
+x39=8139
+x40=8140
+x41=8141
+x42=8142
+x43=8143
+x44=8144
+x45=8145
+x46=8146
+x47=8147
+x48=8148
+x49=8149
+x50=8150
+x51=8151
+x52=8152
+x53=8153
+x54=8154
+x55=8155
+x56=8156
+x57=8157
+x58=8158
+x59=8159
+x60=8160
+x61=8161
+x62=8162
+x63=8163
+x64=8164
+x65=8165
+x66=8166
+x67=8167
+x68=8168
+x69=8169
+x70=8170
+x71=8171
+x72=8172
+x73=8173
+x74=8174
+x75=8175
+x76=8176
+x77=8177
+x78=8178
+x79=8179
+x80=8180
+x81=8181
+x82=8182
+x83=8183
+x84=8184
+x85=8185
+x86=8186
+x87=8187
+x88=8188
+x89=8189
+x90=8190
+x91=8191
+x92=8192
+x93=8193
+x94=8194
+x95=8195
+x96=8196
+x97=8197
+x98=8198
+x99=8199
+x0=8200
+x1=8201
+x2=8202
+x3=8203
+x4=8204
+x5=8205
+x6=8206
+x7=8207
+x8=8208
+x9=8209
+x10=8210
+x11=8211
+x12=8212
+x13=8213
+x14=8214
+x15=8215
+x16=8216
+x17=8217
+x18=8218
+x19=8219
+x20=8220
+x21=8221
+x22=8222
+x23=8223
+x24=8224
+x25=8225
+x26=8226
+x27=8227
+x28=8228
+x29=8229
+x30=8230
+x31=8231
+x32=8232
+x33=8233
+x34=8234
+x35=8235
+x36=8236
+x37=8237
+x38=8238
+x39=8239
+x40=8240
+x41=8241
+x42=8242
+x43=8243
+x44=8244
+x45=8245
+x46=8246
+x47=8247
+x48=8248
+x49=8249
+x50=8250
+x51=8251
+x52=8252
+x53=8253
+x54=8254
+x55=8255
+x56=8256
+x57=8257
+x58=8258
+x59=8259
+x60=8260
+x61=8261
+x62=8262
+x63=8263
+x64=8264
+x65=8265
+x66=8266
+x67=8267
+x68=8268
+x69=8269
+x70=8270
+x71=8271
+x72=8272
+x73=8273
+x74=8274
+x75=8275
+x76=8276
+x77=8277
+x78=8278
+x79=8279
+x80=8280
+x81=8281
+x82=8282
+x83=8283
+x84=8284
+x85=8285
+x86=8286
+x87=8287
+x88=8288
+x89=8289
+x90=8290
+x91=8291
+x92=8292
+x93=8293
+x94=8294
+x95=8295
+x96=8296
+x97=8297
+x98=8298
+x99=8299
+x0=8300
+x1=8301
+x2=8302
+x3=8303
+x4=8304
+x5=8305
+x6=8306
+x7=8307
+x8=8308
+x9=8309
+x10=8310
+x11=8311
+x12=8312
+x13=8313
+x14=8314
+x15=8315
+x16=8316
+x17=8317
+x18=8318
+x19=8319
+x20=8320
+x21=8321
+x22=8322
+x23=8323
+x24=8324
+x25=8325
+x26=8326
+x27=8327
+x28=8328
+x29=8329
+x30=8330
+x31=8331
+x32=8332
+x33=8333
+x34=8334
+x35=8335
+x36=8336
+x37=8337
+x38=8338
+x39=8339
+x40=8340
+x41=8341
+x42=8342
+x43=8343
+x44=8344
+x45=8345
+x46=8346
+x47=8347
+x48=8348
+x49=8349
+x50=8350
+x51=8351
+x52=8352
+x53=8353
+x54=8354
+x55=8355
+x56=8356
+x57=8357
+x58=8358
+x59=8359
+x60=8360
+x61=8361
+x62=8362
+x63=8363
+x64=8364
+x65=8365
+x66=8366
+x67=8367
+x68=8368
+x69=8369
+x70=8370
+x71=8371
+x72=8372
+x73=8373
+x74=8374
+x75=8375
+x76=8376
+x77=8377
+x78=8378
+x79=8379
+x80=8380
+x81=8381
+x82=8382
+x83=8383
+x84=8384
+x85=8385
+x86=8386
+x87=8387
+x88=8388
+x89=8389
+x90=8390
+x91=8391
+x92=8392
+x93=8393
+x94=8394
+x95=8395
+x96=8396
+x97=8397
+x98=8398
+x99=8399
+x0=8400
+x1=8401
+x2=8402
+x3=8403
+x4=8404
+x5=8405
+x6=8406
+x7=8407
+x8=8408
+x9=8409
+x10=8410
+x11=8411
+x12=8412
+x13=8413
+x14=8414
+x15=8415
+x16=8416
+x17=8417
+x18=8418
+x19=8419
+x20=8420
+x21=8421
+x22=8422
+x23=8423
+x24=8424
+x25=8425
+x26=8426
+x27=8427
+x28=8428
+x29=8429
+x30=8430
+x31=8431
+x32=8432
+x33=8433
+x34=8434
+x35=8435
+x36=8436
+x37=8437
+x38=8438
+x39=8439
+x40=8440
+x41=8441
+x42=8442
+x43=8443
+x44=8444
+x45=8445
+x46=8446
+x47=8447
+x48=8448
+x49=8449
+x50=8450
+x51=8451
+x52=8452
+x53=8453
+x54=8454
+x55=8455
+x56=8456
+x57=8457
+x58=8458
+x59=8459
+x60=8460
+x61=8461
+x62=8462
+x63=8463
+x64=8464
+x65=8465
+x66=8466
+x67=8467
+x68=8468
+x69=8469
+x70=8470
+x71=8471
+x72=8472
+x73=8473
+x74=8474
+x75=8475
+x76=8476
+x77=8477
+x78=8478
+x79=8479
+x80=8480
+x81=8481
+x82=8482
+x83=8483
+x84=8484
+x85=8485
+x86=8486
+x87=8487
+x88=8488
+x89=8489
+x90=8490
+x91=8491
+x92=8492
+x93=8493
+x94=8494
+x95=8495
+x96=8496
+x97=8497
+x98=8498
+x99=8499
+x0=8500
+x1=8501
+x2=8502
+x3=8503
+x4=8504
+x5=8505
+x6=8506
+x7=8507
+x8=8508
+x9=8509
+x10=8510
+x11=8511
+x12=8512
+x13=8513
+x14=8514
+x15=8515
+x16=8516
+x17=8517
+x18=8518
+x19=8519
+x20=8520
+x21=8521
+x22=8522
+x23=8523
+x24=8524
+x25=8525
+x26=8526
+x27=8527
+x28=8528
+x29=8529
+x30=8530
+x31=8531
+x32=8532
+x33=8533
+x34=8534
+x35=8535
+x36=8536
+x37=8537
+x38=8538
+x39=8539
+x40=8540
+x41=8541
+x42=8542
+x43=8543
+x44=8544
+x45=8545
+x46=8546
+x47=8547
+x48=8548
+x49=8549
+x50=8550
+x51=8551
+x52=8552
+x53=8553
+x54=8554
+x55=8555
+x56=8556
+x57=8557
+x58=8558
+x59=8559
+x60=8560
+x61=8561
+x62=8562
+x63=8563
+x64=8564
+x65=8565
+x66=8566
+x67=8567
+x68=8568
+x69=8569
+x70=8570
+x71=8571
+x72=8572
+x73=8573
+x74=8574
+x75=8575
+x76=8576
+x77=8577
+x78=8578
+x79=8579
+x80=8580
+x81=8581
+x82=8582
+x83=8583
+x84=8584
+x85=8585
+x86=8586
+x87=8587
+x88=8588
+x89=8589
+x90=8590
+x91=8591
+x92=8592
+x93=8593
+x94=8594
+x95=8595
+x96=8596
+x97=8597
+x98=8598
+x99=8599
+x0=8600
+x1=8601
+x2=8602
+x3=8603
+x4=8604
+x5=8605
+x6=8606
+x7=8607
+x8=8608
+x9=8609
+x10=8610
+x11=8611
+x12=8612
+x13=8613
+x14=8614
+x15=8615
+x16=8616
+x17=8617
+x18=8618
+x19=8619
+x20=8620
+x21=8621
+x22=8622
+x23=8623
+x24=8624
+x25=8625
+x26=8626
+x27=8627
+x28=8628
+x29=8629
+x30=8630
+x31=8631
+x32=8632
+x33=8633
+x34=8634
+x35=8635
+x36=8636
+x37=8637
+x38=8638
+x39=8639
+x40=8640
+x41=8641
+x42=8642
+x43=8643
+x44=8644
+x45=8645
+x46=8646
+x47=8647
+x48=8648
+x49=8649
+x50=8650
+x51=8651
+x52=8652
+x53=8653
+x54=8654
+x55=8655
+x56=8656
+x57=8657
+x58=8658
+x59=8659
+x60=8660
+x61=8661
+x62=8662
+x63=8663
+x64=8664
+x65=8665
+x66=8666
+x67=8667
+x68=8668
+x69=8669
+x70=8670
+x71=8671
+x72=8672
+x73=8673
+x74=8674
+x75=8675
+x76=8676
+x77=8677
+x78=8678
+x79=8679
+x80=8680
+x81=8681
+x82=8682
+x83=8683
+x84=8684
+x85=8685
+x86=8686
+x87=8687
+x88=8688
+x89=8689
+x90=8690
+x91=8691
+x92=8692
+x93=8693
+x94=8694
+x95=8695
+x96=8696
+x97=8697
+x98=8698
+x99=8699
+x0=8700
+x1=8701
+x2=8702
+x3=8703
+x4=8704
+x5=8705
+x6=8706
+x7=8707
+x8=8708
+x9=8709
+x10=8710
+x11=8711
+x12=8712
+x13=8713
+x14=8714
+x15=8715
+x16=8716
+x17=8717
+x18=8718
+x19=8719
+x20=8720
+x21=8721
+x22=8722
+x23=8723
+x24=8724
+x25=8725
+x26=8726
+x27=8727
+x28=8728
+x29=8729
+x30=8730
+x31=8731
+x32=8732
+x33=8733
+x34=8734
+x35=8735
+x36=8736
+x37=8737
+x38=8738
+x39=8739
+x40=8740
+x41=8741
+x42=8742
+x43=8743
+x44=8744
+x45=8745
+x46=8746
+x47=8747
+x48=8748
+x49=8749
+x50=8750
+x51=8751
+x52=8752
+x53=8753
+x54=8754
+x55=8755
+x56=8756
+x57=8757
+x58=8758
+x59=8759
+x60=8760
+x61=8761
+x62=8762
+x63=8763
+x64=8764
+x65=8765
+x66=8766
+x67=8767
+x68=8768
+x69=8769
+x70=8770
+x71=8771
+x72=8772
+x73=8773
+x74=8774
+x75=8775
+x76=8776
+x77=8777
+x78=8778
+x79=8779
+x80=8780
+x81=8781
+x82=8782
+x83=8783
+x84=8784
+x85=8785
+x86=8786
+x87=8787
+x88=8788
+x89=8789
+x90=8790
+x91=8791
+x92=8792
+x93=8793
+x94=8794
+x95=8795
+x96=8796
+x97=8797
+x98=8798
+x99=8799
+x0=8800
+x1=8801
+x2=8802
+x3=8803
+x4=8804
+x5=8805
+x6=8806
+x7=8807
+x8=8808
+x9=8809
+x10=8810
+x11=8811
+x12=8812
+x13=8813
+x14=8814
+x15=8815
+x16=8816
+x17=8817
+x18=8818
+x19=8819
+x20=8820
+x21=8821
+x22=8822
+x23=8823
+x24=8824
+x25=8825
+x26=8826
+x27=8827
+x28=8828
+x29=8829
+x30=8830
+x31=8831
+x32=8832
+x33=8833
+x34=8834
+x35=8835
+x36=8836
+x37=8837
+x38=8838
+x39=8839
+x40=8840
+x41=8841
+x42=8842
+x43=8843
+x44=8844
+x45=8845
+x46=8846
+x47=8847
+x48=8848
+x49=8849
+x50=8850
+x51=8851
+x52=8852
+x53=8853
+x54=8854
+x55=8855
+x56=8856
+x57=8857
+x58=8858
+x59=8859
+x60=8860
+x61=8861
+x62=8862
+x63=8863
+x64=8864
+x65=8865
+x66=8866
+x67=8867
+x68=8868
+x69=8869
+x70=8870
+x71=8871
+x72=8872
+x73=8873
+x74=8874
+x75=8875
+x76=8876
+x77=8877
+x78=8878
+x79=8879
+x80=8880
+x81=8881
+x82=8882
+x83=8883
+x84=8884
+x85=8885
+x86=8886
+x87=8887
+x88=8888
+x89=8889
+x90=8890
+x91=8891
+x92=8892
+x93=8893
+x94=8894
+x95=8895
+x96=8896
+x97=8897
+x98=8898
+x99=8899
+x0=8900
+x1=8901
+x2=8902
+x3=8903
+x4=8904
+x5=8905
+x6=8906
+x7=8907
+x8=8908
+x9=8909
+x10=8910
+x11=8911
+x12=8912
+x13=8913
+x14=8914
+x15=8915
+x16=8916
+x17=8917
+x18=8918
+x19=8919
+x20=8920
+x21=8921
+x22=8922
+x23=8923
+x24=8924
+x25=8925
+x26=8926
+x27=8927
+x28=8928
+x29=8929
+x30=8930
+x31=8931
+x32=8932
+x33=8933
+x34=8934
+x35=8935
+x36=8936
+x37=8937
+x38=8938
+x39=8939
+x40=8940
+x41=8941
+x42=8942
+x43=8943
+x44=8944
+x45=8945
+x46=8946
+x47=8947
+x48=8948
+x49=8949
+x50=8950
+x51=8951
+x52=8952
+x53=8953
+x54=8954
+x55=8955
+x56=8956
+x57=8957
+x58=8958
+x59=8959
+x60=8960
+x61=8961
+x62=8962
+x63=8963
+x64=8964
+x65=8965
+x66=8966
+x67=8967
+x68=8968
+x69=8969
+x70=8970
+x71=8971
+x72=8972
+x73=8973
+x74=8974
+x75=8975
+x76=8976
+x77=8977
+x78=8978
+x79=8979
+x80=8980
+x81=8981
+x82=8982
+x83=8983
+x84=8984
+x85=8985
+x86=8986
+x87=8987
+x88=8988
+x89=8989
+x90=8990
+x91=8991
+x92=8992
+x93=8993
+x94=8994
+x95=8995
+x96=8996
+x97=8997
+x98=8998
+x99=8999
+x0=9000
+x1=9001
+x2=9002
+x3=9003
+x4=9004
+x5=9005
+x6=9006
+x7=9007
+x8=9008
+x9=9009
+x10=9010
+x11=9011
+x12=9012
+x13=9013
+x14=9014
+x15=9015
+x16=9016
+x17=9017
+x18=9018
+x19=9019
+x20=9020
+x21=9021
+x22=9022
+x23=9023
+x24=9024
+x25=9025
+x26=9026
+x27=9027
+x28=9028
+x29=9029
+x30=9030
+x31=9031
+x32=9032
+x33=9033
+x34=9034
+x35=9035
+x36=9036
+x37=9037
+x38=9038
+x39=9039
+x40=9040
+x41=9041
+x42=9042
+x43=9043
+x44=9044
+x45=9045
+x46=9046
+x47=9047
+x48=9048
+x49=9049
+x50=9050
+x51=9051
+x52=9052
+x53=9053
+x54=9054
+x55=9055
+x56=9056
+x57=9057
+x58=9058
+x59=9059
+x60=9060
+x61=9061
+x62=9062
+x63=9063
+x64=9064
+x65=9065
+x66=9066
+x67=9067
+x68=9068
+x69=9069
+x70=9070
+x71=9071
+x72=9072
+x73=9073
+x74=9074
+x75=9075
+x76=9076
+x77=9077
+x78=9078
+x79=9079
+x80=9080
+x81=9081
+x82=9082
+x83=9083
+x84=9084
+x85=9085
+x86=9086
+x87=9087
+x88=9088
+x89=9089
+x90=9090
+x91=9091
+x92=9092
+x93=9093
+x94=9094
+x95=9095
+x96=9096
+x97=9097
+x98=9098
+x99=9099
+x0=9100
+x1=9101
+x2=9102
+x3=9103
+x4=9104
+x5=9105
+x6=9106
+x7=9107
+x8=9108
+x9=9109
+x10=9110
+x11=9111
+x12=9112
+x13=9113
+x14=9114
+x15=9115
+x16=9116
+x17=9117
+x18=9118
+x19=9119
+x20=9120
+x21=9121
+x22=9122
+x23=9123
+x24=9124
+x25=9125
+x26=9126
+x27=9127
+x28=9128
+x29=9129
+x30=9130
+x31=9131
+x32=9132
+x33=9133
+x34=9134
+x35=9135
+x36=9136
+x37=9137
+x38=9138
+x39=9139
+x40=9140
+x41=9141
+x42=9142
+x43=9143
+x44=9144
+x45=9145
+x46=9146
+x47=9147
+x48=9148
+x49=9149
+x50=9150
+x51=9151
+x52=9152
+x53=9153
+x54=9154
+x55=9155
+x56=9156
+x57=9157
+x58=9158
+x59=9159
+x60=9160
+x61=9161
+x62=9162
+x63=9163
+x64=9164
+x65=9165
+x66=9166
+x67=9167
+x68=9168
+x69=9169
+x70=9170
+x71=9171
+x72=9172
+x73=9173
+x74=9174
+x75=9175
+x76=9176
+x77=9177
+x78=9178
+x79=9179
+x80=9180
+x81=9181
+x82=9182
+x83=9183
+x84=9184
+x85=9185
+x86=9186
+x87=9187
+x88=9188
+x89=9189
+x90=9190
+x91=9191
+x92=9192
+x93=9193
+x94=9194
+x95=9195
+x96=9196
+x97=9197
+x98=9198
+x99=9199
+x0=9200
+x1=9201
+x2=9202
+x3=9203
+x4=9204
+x5=9205
+x6=9206
+x7=9207
+x8=9208
+x9=9209
+x10=9210
+x11=9211
+x12=9212
+x13=9213
+x14=9214
+x15=9215
+x16=9216
+x17=9217
+x18=9218
+x19=9219
+x20=9220
+x21=9221
+x22=9222
+x23=9223
+x24=9224
+x25=9225
+x26=9226
+x27=9227
+x28=9228
+x29=9229
+x30=9230
+x31=9231
+x32=9232
+x33=9233
+x34=9234
+x35=9235
+x36=9236
+x37=9237
+x38=9238
+x39=9239
+x40=9240
+x41=9241
+x42=9242
+x43=9243
+x44=9244
+x45=9245
+x46=9246
+x47=9247
+x48=9248
+x49=9249
+x50=9250
+x51=9251
+x52=9252
+x53=9253
+x54=9254
+x55=9255
+x56=9256
+x57=9257
+x58=9258
+x59=9259
+x60=9260
+x61=9261
+x62=9262
+x63=9263
+x64=9264
+x65=9265
+x66=9266
+x67=9267
+x68=9268
+x69=9269
+x70=9270
+x71=9271
+x72=9272
+x73=9273
+x74=9274
+x75=9275
+x76=9276
+x77=9277
+x78=9278
+x79=9279
+x80=9280
+x81=9281
+x82=9282
+x83=9283
+x84=9284
+x85=9285
+x86=9286
+x87=9287
+x88=9288
+x89=9289
+x90=9290
+x91=9291
+x92=9292
+x93=9293
+x94=9294
+x95=9295
+x96=9296
+x97=9297
+x98=9298
+x99=9299
+x0=9300
+x1=9301
+x2=9302
+x3=9303
+x4=9304
+x5=9305
+x6=9306
+x7=9307
+x8=9308
+x9=9309
+x10=9310
+x11=9311
+x12=9312
+x13=9313
+x14=9314
+x15=9315
+x16=9316
+x17=9317
+x18=9318
+x19=9319
+x20=9320
+x21=9321
+x22=9322
+x23=9323
+x24=9324
+x25=9325
+x26=9326
+x27=9327
+x28=9328
+x29=9329
+x30=9330
+x31=9331
+x32=9332
+x33=9333
+x34=9334
+x35=9335
+x36=9336
+x37=9337
+x38=9338
+x39=9339
+x40=9340
+x41=9341
+x42=9342
+x43=9343
+x44=9344
+x45=9345
+x46=9346
+x47=9347
+x48=9348
+x49=9349
+x50=9350
+x51=9351
+x52=9352
+x53=9353
+x54=9354
+x55=9355
+x56=9356
+x57=9357
+x58=9358
+x59=9359
+x60=9360
+x61=9361
+x62=9362
+x63=9363
+x64=9364
+x65=9365
+x66=9366
+x67=9367
+x68=9368
+x69=9369
+x70=9370
+x71=9371
+x72=9372
+x73=9373
+x74=9374
+x75=9375
+x76=9376
+x77=9377
+x78=9378
+x79=9379
+x80=9380
+x81=9381
+x82=9382
+x83=9383
+x84=9384
+x85=9385
+x86=9386
+x87=9387
+x88=9388
+x89=9389
+x90=9390
+x91=9391
+x92=9392
+x93=9393
+x94=9394
+x95=9395
+x96=9396
+x97=9397
+x98=9398
+x99=9399
+x0=9400
+x1=9401
+x2=9402
+x3=9403
+x4=9404
+x5=9405
+x6=9406
+x7=9407
+x8=9408
+x9=9409
+x10=9410
+x11=9411
+x12=9412
+x13=9413
+x14=9414
+x15=9415
+x16=9416
+x17=9417
+x18=9418
+x19=9419
+x20=9420
+x21=9421
+x22=9422
+x23=9423
+x24=9424
+x25=9425
+x26=9426
+x27=9427
+x28=9428
+x29=9429
+x30=9430
+x31=9431
+x32=9432
+x33=9433
+x34=9434
+x35=9435
+x36=9436
+x37=9437
+x38=9438
+x39=9439
+x40=9440
+x41=9441
+x42=9442
+x43=9443
+x44=9444
+x45=9445
+x46=9446
+x47=9447
+x48=9448
+x49=9449
+x50=9450
+x51=9451
+x52=9452
+x53=9453
+x54=9454
+x55=9455
+x56=9456
+x57=9457
+x58=9458
+x59=9459
+x60=9460
+x61=9461
+x62=9462
+x63=9463
+x64=9464
+x65=9465
+x66=9466
+x67=9467
+x68=9468
+x69=9469
+x70=9470
+x71=9471
+x72=9472
+x73=9473
+x74=9474
+x75=9475
+x76=9476
+x77=9477
+x78=9478
+x79=9479
+x80=9480
+x81=9481
+x82=9482
+x83=9483
+x84=9484
+x85=9485
+x86=9486
+x87=9487
+x88=9488
+x89=9489
+x90=9490
+x91=9491
+x92=9492
+x93=9493
+x94=9494
+x95=9495
+x96=9496
+x97=9497
+x98=9498
+x99=9499
+x0=9500
+x1=9501
+x2=9502
+x3=9503
+x4=9504
+x5=9505
+x6=9506
+x7=9507
+x8=9508
+x9=9509
+x10=9510
+x11=9511
+x12=9512
+x13=9513
+x14=9514
+x15=9515
+x16=9516
+x17=9517
+x18=9518
+x19=9519
+x20=9520
+x21=9521
+x22=9522
+x23=9523
+x24=9524
+x25=9525
+x26=9526
+x27=9527
+x28=9528
+x29=9529
+x30=9530
+x31=9531
+x32=9532
+x33=9533
+x34=9534
+x35=9535
+x36=9536
+x37=9537
+x38=9538
+x39=9539
+x40=9540
+x41=9541
+x42=9542
+x43=9543
+x44=9544
+x45=9545
+x46=9546
+x47=9547
+x48=9548
+x49=9549
+x50=9550
+x51=9551
+x52=9552
+x53=9553
+x54=9554
+x55=9555
+x56=9556
+x57=9557
+x58=9558
+x59=9559
+x60=9560
+x61=9561
+x62=9562
+x63=9563
+x64=9564
+x65=9565
+x66=9566
+x67=9567
+x68=9568
+x69=9569
+x70=9570
+x71=9571
+x72=9572
+x73=9573
+x74=9574
+x75=9575
+x76=9576
+x77=9577
+x78=9578
+x79=9579
+x80=9580
+x81=9581
+x82=9582
+x83=9583
+x84=9584
+x85=9585
+x86=9586
+x87=9587
+x88=9588
+x89=9589
+x90=9590
+x91=9591
+x92=9592
+x93=9593
+x94=9594
+x95=9595
+x96=9596
+x97=9597
+x98=9598
+x99=9599
+x0=9600
+x1=9601
+x2=9602
+x3=9603
+x4=9604
+x5=9605
+x6=9606
+x7=9607
+x8=9608
+x9=9609
+x10=9610
+x11=9611
+x12=9612
+x13=9613
+x14=9614
+x15=9615
+x16=9616
+x17=9617
+x18=9618
+x19=9619
+x20=9620
+x21=9621
+x22=9622
+x23=9623
+x24=9624
+x25=9625
+x26=9626
+x27=9627
+x28=9628
+x29=9629
+x30=9630
+x31=9631
+x32=9632
+x33=9633
+x34=9634
+x35=9635
+x36=9636
+x37=9637
+x38=9638
+x39=9639
+x40=9640
+x41=9641
+x42=9642
+x43=9643
+x44=9644
+x45=9645
+x46=9646
+x47=9647
+x48=9648
+x49=9649
+x50=9650
+x51=9651
+x52=9652
+x53=9653
+x54=9654
+x55=9655
+x56=9656
+x57=9657
+x58=9658
+x59=9659
+x60=9660
+x61=9661
+x62=9662
+x63=9663
+x64=9664
+x65=9665
+x66=9666
+x67=9667
+x68=9668
+x69=9669
+x70=9670
+x71=9671
+x72=9672
+x73=9673
+x74=9674
+x75=9675
+x76=9676
+x77=9677
+x78=9678
+x79=9679
+x80=9680
+x81=9681
+x82=9682
+x83=9683
+x84=9684
+x85=9685
+x86=9686
+x87=9687
+x88=9688
+x89=9689
+x90=9690
+x91=9691
+x92=9692
+x93=9693
+x94=9694
+x95=9695
+x96=9696
+x97=9697
+x98=9698
+x99=9699
+x0=9700
+x1=9701
+x2=9702
+x3=9703
+x4=9704
+x5=9705
+x6=9706
+x7=9707
+x8=9708
+x9=9709
+x10=9710
+x11=9711
+x12=9712
+x13=9713
+x14=9714
+x15=9715
+x16=9716
+x17=9717
+x18=9718
+x19=9719
+x20=9720
+x21=9721
+x22=9722
+x23=9723
+x24=9724
+x25=9725
+x26=9726
+x27=9727
+x28=9728
+x29=9729
+x30=9730
+x31=9731
+x32=9732
+x33=9733
+x34=9734
+x35=9735
+x36=9736
+x37=9737
+x38=9738
+x39=9739
+x40=9740
+x41=9741
+x42=9742
+x43=9743
+x44=9744
+x45=9745
+x46=9746
+x47=9747
+x48=9748
+x49=9749
+x50=9750
+x51=9751
+x52=9752
+x53=9753
+x54=9754
+x55=9755
+x56=9756
+x57=9757
+x58=9758
+x59=9759
+x60=9760
+x61=9761
+x62=9762
+x63=9763
+x64=9764
+x65=9765
+x66=9766
+x67=9767
+x68=9768
+x69=9769
+x70=9770
+x71=9771
+x72=9772
+x73=9773
+x74=9774
+x75=9775
+x76=9776
+x77=9777
+x78=9778
+x79=9779
+x80=9780
+x81=9781
+x82=9782
+x83=9783
+x84=9784
+x85=9785
+x86=9786
+x87=9787
+x88=9788
+x89=9789
+x90=9790
+x91=9791
+x92=9792
+x93=9793
+x94=9794
+x95=9795
+x96=9796
+x97=9797
+x98=9798
+x99=9799
+x0=9800
+x1=9801
+x2=9802
+x3=9803
+x4=9804
+x5=9805
+x6=9806
+x7=9807
+x8=9808
+x9=9809
+x10=9810
+x11=9811
+x12=9812
+x13=9813
+x14=9814
+x15=9815
+x16=9816
+x17=9817
+x18=9818
+x19=9819
+x20=9820
+x21=9821
+x22=9822
+x23=9823
+x24=9824
+x25=9825
+x26=9826
+x27=9827
+x28=9828
+x29=9829
+x30=9830
+x31=9831
+x32=9832
+x33=9833
+x34=9834
+x35=9835
+x36=9836
+x37=9837
+x38=9838
+x39=9839
+x40=9840
+x41=9841
+x42=9842
+x43=9843
+x44=9844
+x45=9845
+x46=9846
+x47=9847
+x48=9848
+x49=9849
+x50=9850
+x51=9851
+x52=9852
+x53=9853
+x54=9854
+x55=9855
+x56=9856
+x57=9857
+x58=9858
+x59=9859
+x60=9860
+x61=9861
+x62=9862
+x63=9863
+x64=9864
+x65=9865
+x66=9866
+x67=9867
+x68=9868
+x69=9869
+x70=9870
+x71=9871
+x72=9872
+x73=9873
+x74=9874
+x75=9875
+x76=9876
+x77=9877
+x78=9878
+x79=9879
+x80=9880
+x81=9881
+x82=9882
+x83=9883
+x84=9884
+x85=9885
+x86=9886
+x87=9887
+x88=9888
+x89=9889
+x90=9890
+x91=9891
+x92=9892
+x93=9893
+x94=9894
+x95=9895
+x96=9896
+x97=9897
+x98=9898
+x99=9899
+x0=9900
+x1=9901
+x2=9902
+x3=9903
+x4=9904
+x5=9905
+x6=9906
+x7=9907
+x8=9908
+x9=9909
+x10=9910
+x11=9911
+x12=9912
+x13=9913
+x14=9914
+x15=9915
+x16=9916
+x17=9917
+x18=9918
+x19=9919
+x20=9920
+x21=9921
+x22=9922
+x23=9923
+x24=9924
+x25=9925
+x26=9926
+x27=9927
+x28=9928
+x29=9929
+x30=9930
+x31=9931
+x32=9932
+x33=9933
+x34=9934
+x35=9935
+x36=9936
+x37=9937
+x38=9938
+x39=9939
+x40=9940
+x41=9941
+x42=9942
+x43=9943
+x44=9944
+x45=9945
+x46=9946
+x47=9947
+x48=9948
+x49=9949
+x50=9950
+x51=9951
+x52=9952
+x53=9953
+x54=9954
+x55=9955
+x56=9956
+x57=9957
+x58=9958
+x59=9959
+x60=9960
+x61=9961
+x62=9962
+x63=9963
+x64=9964
+x65=9965
+x66=9966
+x67=9967
+x68=9968
+x69=9969
+x70=9970
+x71=9971
+x72=9972
+x73=9973
+x74=9974
+x75=9975
+x76=9976
+x77=9977
+x78=9978
+x79=9979
+x80=9980
+x81=9981
+x82=9982
+x83=9983
+x84=9984
+x85=9985
+x86=9986
+x87=9987
+x88=9988
+x89=9989
+x90=9990
+x91=9991
+x92=9992
+x93=9993
+x94=9994
+x95=9995
+x96=9996
+x97=9997
+x98=9998
+x99=9999
@@ -0,0 +1 @@
+for i in $(seq 200000); do echo line $i; done
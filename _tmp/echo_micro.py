@@ -0,0 +1,14 @@
+import os, sys, time
+sys.path.insert(0, '.')
+from core import cmd_exec, builtin, ui
+from osh import parse_lib
+mem = cmd_exec.Mem('', [])
+ex = cmd_exec.Executor(mem, builtin.Builtins(ui.NullStatusLine()), {}, {}, cmd_exec.ExecOpts(), parse_lib.MakeParserForExecutor)
+fd = os.open(os.devnull, os.O_WRONLY); sys.stdout.flush(); os.dup2(fd, 1)
+argv = ['echo', 'line', '12345']
+start = time.time()
+for i in range(1000000):
+  ex._Echo(argv)
+ex.fd_state.Flush() if hasattr(ex.fd_state, 'Flush') else None
+sys.stdout.flush()
+sys.stderr.write('%.2f s\n' % (time.time() - start))
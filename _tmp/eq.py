@@ -0,0 +1,19 @@
+import glob, sys
+from core import lexer
+from osh.lex import LEXER_DEF
+modes = list(LEXER_DEF.items())
+r = dict((m, lexer._RegexMatcher(p)) for m, p in modes)
+d = dict((m, lexer.CompileDfa(p)) for m, p in modes)
+print(set(type(x).__name__ for x in d.values()))
+n = 0
+for path in sorted(glob.glob('tests/*.sh'))[:int(sys.argv[1])]:
+  for line in open(path):
+    for m, _ in modes:
+      for pos in range(len(line)):
+        try: a = r[m].Match(line, pos)
+        except AssertionError: a = 'ERR'
+        try: b = d[m].Match(line, pos)
+        except AssertionError: b = 'ERR'
+        n += 1
+        if a != b: print(path, m, repr(line), pos, a, b); sys.exit(1)
+print('ok', n)
@@ -0,0 +1,10 @@
+import sys, time
+sys.path.insert(0, '.')
+from core import cmd_exec_test as t
+from core import alloc
+arena = alloc.Pool(compact=True).NewArena()
+ex = t.InitExecutor(arena=arena)
+t0=time.time()
+for i in range(10000):
+  ex._Eval(['eval', 'x=%d' % i])
+print(time.time()-t0, arena.NumSpans(), len(arena.lines))
@@ -0,0 +1,9 @@
+import sys, time
+sys.path.insert(0, '.')
+from core import lexer
+from osh import lex
+for eng in ['regex', 'dfa']:
+  t0=time.time()
+  for i in range(500):
+    lexer.LineLexer(lex.LEXER_DEF, '', engine=eng)
+  print(eng, (time.time()-t0)/500*1000, 'ms')
@@ -0,0 +1,7 @@
+import os
+def p(m): print(m, sorted(os.listdir('/dev/fd')))
+p('start')
+from core import alloc; p('alloc')
+from core import cmd_exec; p('cmd_exec')
+from core import word, reader; p('word')
+import core.cmd_exec_test; p('test')
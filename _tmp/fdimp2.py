@@ -0,0 +1,3 @@
+import os
+from osh import ast_
+print(sorted(os.listdir('/dev/fd')), os.readlink('/proc/self/fd/11') if os.path.exists('/proc/self/fd/11') else None, os.readlink('/proc/self/fd/12') if os.path.exists('/proc/self/fd/12') else None)
@@ -0,0 +1,5 @@
+import os
+from core import alloc
+for fd in sorted(os.listdir('/proc/self/fd')):
+  try: print(fd, os.readlink('/proc/self/fd/'+fd))
+  except OSError: pass
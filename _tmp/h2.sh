@@ -0,0 +1,4 @@
+read var <<EOF
+value
+EOF
+echo "var = $var"
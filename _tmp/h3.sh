@@ -0,0 +1,4 @@
+cat <<EOF \
+; echo two
+one
+EOF
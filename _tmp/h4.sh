@@ -0,0 +1,4 @@
+cat <<EOF; echo "two
+three"
+one
+EOF
@@ -0,0 +1,13 @@
+import io, sys
+sys.path.insert(0,'.')
+from asdl import encode, decode
+from core import alloc, reader, cmd_exec_test
+from osh import ast_ as ast, parse_lib
+code=sys.argv[1]
+arena = alloc.Pool().NewArena(); arena.AddSourcePath('x')
+_, c = parse_lib.MakeParserForTop(reader.StringLineReader(code, arena=arena), arena=arena)
+node = c.ParseWholeFile()
+f = io.BytesIO(); encode.EncodeRoot(node, encode.Params(), encode.BinOutput(f))
+v = decode.LazyRoot(f.getvalue(), ast, ast.command)
+ex = cmd_exec_test.InitExecutor()
+print('status', ex.Execute(v))
@@ -0,0 +1,3 @@
+f() { echo "v$1"; }
+for i in $(seq 1000); do x=$(f $i); done
+echo $x
@@ -0,0 +1,23 @@
+import sys, time
+sys.path.insert(0, '.')
+from core import cmd_exec_test as t
+from core import alloc, reader, word
+from core.id_kind import Id
+from osh import parse_lib
+arena = alloc.Pool(compact=True).NewArena()
+arena.AddSourcePath('<test>')
+ex = t.InitExecutor(arena=arena)
+N=int(sys.argv[1])
+code = ''.join('x=%d\n' % i for i in range(N))
+line_reader = reader.StringLineReader(code, arena=arena)
+w_parser, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+t0=time.time()
+while True:
+  mark = arena.Mark()
+  w = c_parser.Peek()
+  if word.CommandId(w) == Id.Eof_Real: break
+  node = c_parser.ParseCommandLine()
+  ex.Execute(node)
+  arena.ReleaseToMark(mark)
+  w_parser.Reset(); c_parser.Reset()
+print(time.time()-t0, arena.NumSpans(), len(arena.lines))
@@ -0,0 +1,5 @@
+import sys, time, cProfile
+sys.path.insert(0, '.')
+from core import cmd_exec_test
+ex = cmd_exec_test.InitExecutor()
+cProfile.run("for i in range(100000): ex._GetThunkForSimpleCommand(['ls'], {})", sort='tottime')
@@ -0,0 +1,6 @@
+for i in 1 2 3; do
+read x <<EOF
+v$i
+EOF
+echo $x
+done
@@ -0,0 +1,6 @@
+import sys, traceback, unittest
+sys.path.insert(0,'.')
+from core import cmd_exec_test as t
+r = unittest.TestResult()
+t.RedirectTest('testFilenameRedirect').run(r)
+open('_tmp/rt.out','w').write(repr(r.errors)+repr(r.failures))
@@ -0,0 +1,14 @@
+import sys, os, fcntl
+sys.path.insert(0,'.')
+from core import process
+orig = fcntl.fcntl
+def f(fd, op, arg=0):
+  r = orig(fd, op, arg)
+  os.write(99, ('fcntl %s %s %s -> %s %s\n' % (fd, op, arg, r, sorted(os.listdir('/dev/fd')))).encode())
+  return r
+process.fcntl.fcntl = f
+import unittest
+from core import cmd_exec_test as t
+r = unittest.TestResult()
+t.RedirectTest('testFilenameRedirect').run(r)
+os.write(99, (repr(r.errors)+'\n').encode())
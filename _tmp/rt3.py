@@ -0,0 +1,9 @@
+import sys, os
+sys.path.insert(0,'.')
+import unittest
+from core import cmd_exec_test as t
+for name in ['testMemoryStaysFlat','testFuncDefIsKept','testSourceRestoresPath']:
+  before = sorted(os.listdir('/dev/fd'))
+  r = unittest.TestResult()
+  t.ArenaReleaseTest(name).run(r)
+  os.write(99, ('%s %s -> %s\n' % (name, before, sorted(os.listdir('/dev/fd')))).encode())
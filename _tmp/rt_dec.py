@@ -0,0 +1,38 @@
+import io, sys, glob, time
+sys.path.insert(0,'.')
+from asdl import encode, decode
+from core import alloc, reader
+from osh import ast_ as ast, parse_lib
+n=0; bad=0
+for path in sorted(glob.glob('tests/*.test.sh'))+sorted(glob.glob('tests/*.sh')):
+  if '09-here-doc' in path: continue
+  code=open(path).read()
+  arena = alloc.Pool().NewArena(); arena.AddSourcePath(path)
+  _, c = parse_lib.MakeParserForTop(reader.StringLineReader(code, arena=arena), arena=arena)
+  try:
+    node = c.ParseWholeFile()
+  except AssertionError: continue
+  if not node: continue
+  f = io.BytesIO()
+  encode.EncodeRoot(node, encode.Params(), encode.BinOutput(f))
+  t0=time.time()
+  node2 = decode.DecodeRoot(f.getvalue(), ast, ast.command)
+  n+=1
+  if node != node2:
+    bad+=1; print('MISMATCH', path)
+print(n, bad)
+lz=0
+for path in sorted(glob.glob('tests/*.test.sh'))+sorted(glob.glob('tests/*.sh')):
+  if '09-here-doc' in path: continue
+  code=open(path).read()
+  arena = alloc.Pool().NewArena(); arena.AddSourcePath(path)
+  _, c = parse_lib.MakeParserForTop(reader.StringLineReader(code, arena=arena), arena=arena)
+  try:
+    node = c.ParseWholeFile()
+  except AssertionError: continue
+  if not node: continue
+  with open('_tmp/x.oheap','wb') as f:
+    encode.EncodeRoot(node, encode.Params(), encode.BinOutput(f))
+  v = decode.OpenFile('_tmp/x.oheap', ast, ast.command)
+  if not (v == node and node == v): lz+=1; print('LAZY MISMATCH', path)
+print('lazy bad', lz)
@@ -0,0 +1,16 @@
+import io, sys
+sys.path.insert(0,'.')
+from asdl import encode, decode
+from core import alloc, reader
+from osh import ast_ as ast, parse_lib
+code=sys.argv[1]
+arena = alloc.Pool().NewArena(); arena.AddSourcePath('x')
+_, c = parse_lib.MakeParserForTop(reader.StringLineReader(code, arena=arena), arena=arena)
+node = c.ParseWholeFile()
+f = io.BytesIO()
+encode.EncodeRoot(node, encode.Params(), encode.BinOutput(f))
+node2 = decode.DecodeRoot(f.getvalue(), ast, ast.command)
+print(node==node2)
+a=repr(node).splitlines(); b=repr(node2).splitlines()
+import difflib
+print('\n'.join(difflib.unified_diff(a,b,lineterm='')))
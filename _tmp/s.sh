@@ -0,0 +1,2 @@
+echo sourced $1
+g() { echo gg; }
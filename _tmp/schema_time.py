@@ -0,0 +1,18 @@
+import sys, time, types
+sys.path.insert(0, '.')
+t0=time.time()
+from asdl import asdl_ as asdl, py_meta
+from core.id_kind import Id
+t1=time.time()
+for rel in (False, True):
+  t=time.time(); m = asdl.parse('osh/osh.asdl'); t2=time.time()
+  app={'id': asdl.UserType(Id)}
+  asdl.check(m, app); t3=time.time()
+  py_meta.MakeTypes(m, types.ModuleType('x'), app, release=rel); t4=time.time()
+  print('release=%s parse %.2fms check %.2fms make %.2fms' % (rel, (t2-t)*1e3, (t3-t2)*1e3, (t4-t3)*1e3))
+t=time.time()
+import osh.ast_
+print('import ast_ %.2fms' % ((time.time()-t)*1e3))
+t=time.time()
+import core.runtime
+print('import runtime %.2fms' % ((time.time()-t)*1e3))
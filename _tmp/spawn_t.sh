@@ -0,0 +1,18 @@
+echo hi | tr a-z A-Z
+ls -d / /nonexistent 2>/dev/null
+ls -d / /nonexistent 2>&1 | wc -l
+echo foo > _tmp/sp.txt; cat _tmp/sp.txt
+cat < _tmp/sp.txt
+cat <<EOF2
+here $HOME
+EOF2
+x=$(ls -d /); echo "sub $x"
+y=$(cat <<EOF3
+a b
+EOF3
+)
+echo "$y"
+nosuchcmd; echo $?
+/bin/false; echo $?
+ls -d / > _tmp/sp2.txt; cat _tmp/sp2.txt
+seq 3 | sort -r | head -1
@@ -0,0 +1,15 @@
+#!/bin/bash
+# Run all spec tests vs bash and osh; emit "file case bash osh" lines
+cd /root/package
+out=${1:-_tmp/spec-results.txt}
+: > $out
+for f in $(ls tests/*.test.sh | grep -v -e arith.test -e dbracket -e regex.test); do
+  PYENV_VERSION=3.6.15 timeout 60 python3 sh_spec.py --tmp-env $PWD/_tmp/spec-tmp --path-env "$PWD/tests/bin:$PATH" $f /bin/bash _tmp/osh3b --format html 2>/dev/null \
+   | python3 -c '
+import re,sys
+name=sys.argv[1]
+for m in re.finditer(r"<tr><td>\s*(\d+)</td><td class=\"(\w+)\">.*?</td>\s*<td class=\"(\w+)\">", sys.stdin.read()):
+  print(name, m.group(1), m.group(2), m.group(3))
+' $f >> $out
+done
+awk '{print $4}' $out | sort | uniq -c
@@ -0,0 +1,13 @@
+import time, glob
+from core import lexer
+from osh.lex import LEXER_DEF, LexMode
+lines=[]
+for p in sorted(glob.glob('tests/*.sh')): lines += open(p).readlines()
+for eng in ['regex','dfa','regex','dfa']:
+  ll = lexer.LineLexer(LEXER_DEF, '', engine=eng)
+  t=time.time(); n=0
+  for line in lines:
+    ll.Reset(line, -1)
+    while not ll.AtEnd():
+      ll.Read(LexMode.OUTER); n+=1
+  print(eng, n, time.time()-t)
@@ -0,0 +1,13 @@
+import time, glob
+from core import lexer
+from osh.lex import LEXER_DEF, LexMode
+lines=[]
+for p in sorted(glob.glob('tests/*.sh')): lines += open(p).readlines()
+for eng in ['regex','dfa','regex','dfa']:
+  m = lexer.ENGINES[eng](LEXER_DEF[LexMode.OUTER])
+  t=time.time(); n=0
+  for line in lines:
+    pos = 0
+    while pos < len(line):
+      pos, _, _ = m.Match(line, pos); n+=1
+  print(eng, n, time.time()-t)
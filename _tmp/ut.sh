@@ -0,0 +1,14 @@
+#!/bin/bash
+# run all unit tests under py2 and py3
+cd /root/package
+export PYTHONPATH=.
+fail=0
+for t in {asdl,core,osh}/*_test.py; do
+  case $t in *arith_parse_test.py|*completion_test.py) continue;; esac
+  PYENV_VERSION=2.7.18 python2 $t > _tmp/ut.log 2>&1 || { echo "FAIL py2 $t"; tail -20 _tmp/ut.log; fail=1; }
+  if [ -z "$NOPY3" ]; then
+  case $t in *libc_test.py) continue;; esac
+  python3 $t > _tmp/ut.log 2>&1 || { echo "FAIL py3 $t"; tail -5 _tmp/ut.log; }
+  fi
+done
+echo done fail=$fail
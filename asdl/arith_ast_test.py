@@ -146,8 +146,8 @@ class ArithAstTest(unittest.TestCase):
     #print(repr(e))
     #print(e[0:4], e[4:8], e[8:])
 
-    # Header is OHP version 1
-    self.assertEqual(b'OHP\x01', e[0:4])
+    # Header is OHP version 2
+    self.assertEqual(b'OHP\x02', e[0:4])
 
     self.assertEqual(b'\x04', e[4:5])  # alignment 4
 
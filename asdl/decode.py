@@ -0,0 +1,287 @@
+"""
+decode.py - Read the oheap format written by encode.py.
+
+The types of the objects aren't stored in the file, so the decoder needs the
+same schema, in the form of the classes that py_meta.MakeTypes() created.
+
+There are two ways to decode:
+
+- DecodeRoot() creates the whole tree up front.
+- LazyRoot() and OpenFile() return a view of the root object.  Each field is
+  read from the buffer the first time it's accessed, so loading a tree takes
+  constant time, and OpenFile() doesn't even read the file.
+"""
+
+import mmap
+import struct
+
+from asdl import asdl_ as asdl
+from asdl import encode
+from asdl import py_meta
+from core import util
+
+
+class DecodeError(RuntimeError):
+  """The input isn't a valid oheap file."""
+
+
+def _ClassesByDescriptor(root):
+  """Map id(descriptor) -> class, for the types py_meta added to root."""
+  classes = {}
+  for name in dir(root):
+    cls = getattr(root, name)
+    if isinstance(cls, type) and issubclass(cls, py_meta.Obj):
+      if cls.DESCRIPTOR is not None:
+        classes[id(cls.DESCRIPTOR)] = cls
+  return classes
+
+
+class _LazyField(object):
+  """Decodes a field of a view the first time it's accessed.
+
+  This is a non-data descriptor, so the value stored in the instance __dict__
+  takes precedence after that, and it can be assigned like any other field.
+  """
+
+  def __init__(self, name, index, desc):
+    self.name = name
+    self.index = index
+    self.desc = desc
+
+  def __get__(self, obj, cls):
+    if obj is None:
+      return self
+    dec = obj._dec
+    val = dec._Value(obj._pos + self.index * dec.int_width, self.desc, True)
+    obj.__dict__[self.name] = val
+    return val
+
+
+_view_classes = {}  # class -> subclass with lazy fields
+
+
+def _ViewClass(cls):
+  try:
+    return _view_classes[cls]
+  except KeyError:
+    pass
+  attrs = {
+      # For __setattr__; all fields are present in the buffer.
+      '_assigned': dict.fromkeys(cls.FIELDS, True),
+  }
+  for i, name in enumerate(cls.FIELDS):
+    attrs[name] = _LazyField(name, i, cls.DESCRIPTOR_LOOKUP[name])
+  # Same name, so it prints the same way.
+  view_cls = type(cls.__name__, (cls,), attrs)
+  _view_classes[cls] = view_cls
+  return view_cls
+
+
+class Decoder(object):
+  """Create py_meta objects from an oheap buffer.
+
+  The buffer can be bytes, a bytearray, or an mmap.  Integers are read with
+  struct, so nothing is copied except strings.
+  """
+
+  def __init__(self, buf, root):
+    """
+    Args:
+      buf: bytes written by encode.EncodeRoot()
+      root: the module passed to py_meta.MakeTypes(), e.g. osh.ast_
+    """
+    if len(buf) < 8 or buf[:3] != encode.MAGIC[:3]:
+      raise DecodeError('Invalid oheap header %r' % buf[:4])
+    if buf[:4] != encode.MAGIC:
+      raise DecodeError('Unsupported oheap version %r' % buf[3:4])
+    self.buf = buf
+    self.alignment = struct.unpack_from('B', buf, 4)[0]
+    self.classes = _ClassesByDescriptor(root)
+    self.user_values = {}  # type -> {int: instance}, e.g. for Id
+
+    enc = encode.Params()  # for sizes and the None value
+    self.int_width = enc.int_width
+    self.max_int = enc.max_int
+    self.none_int = enc.none_int
+
+  def RootRef(self):
+    return self._Unsigned(5)
+
+  def _Unsigned(self, pos):
+    try:
+      lo, hi = struct.unpack_from('<HB', self.buf, pos)
+    except struct.error:
+      raise DecodeError('Offset %d is past the end of the buffer' % pos)
+    return lo | (hi << 16)
+
+  def _Signed(self, pos):
+    n = self._Unsigned(pos)
+    if n >= self.max_int:
+      n -= self.max_int << 1
+    return n
+
+  def _Str(self, ref):
+    pos = ref * self.alignment
+    end = self.buf.find(b'\0', pos)
+    if end == -1:
+      raise DecodeError('Unterminated string at offset %d' % pos)
+    s = self.buf[pos:end]
+    if util.PY2:
+      return s
+    return s.decode('utf-8')
+
+  def _Inline(self, desc, n):
+    """The inverse of encode._InlineValue()."""
+    if isinstance(desc, asdl.IntType):
+      return n
+    if isinstance(desc, asdl.BoolType):
+      return bool(n)
+    if isinstance(desc, asdl.UserType):
+      return self._UserValues(desc.typ)[n]
+    # Simple sum type, i.e. an enum
+    cls = self.classes[id(desc)]
+    return getattr(cls, desc.types[n - 1].name)
+
+  def _UserValues(self, typ):
+    """Map integer -> instance, for a type like Id.
+
+    Like the encoder, this assumes the instances are class attributes with an
+    enum_value.  They're compared with == and Python 2 has no default __ne__,
+    so we return the same instances rather than creating new ones.
+    """
+    try:
+      return self.user_values[typ]
+    except KeyError:
+      lookup = {}
+      for val in vars(typ).values():
+        if isinstance(val, typ):
+          lookup[val.enum_value] = val
+      self.user_values[typ] = lookup
+      return lookup
+
+  def _Value(self, pos, desc, lazy):
+    """Decode the field or array item at pos.
+
+    Args:
+      pos: byte offset
+      desc: the declared type
+      lazy: whether to return views of objects rather than decoding them
+    """
+    if isinstance(desc, asdl.MaybeType):
+      item_desc = desc.desc
+      if encode.IsInline(item_desc):
+        n = self._Signed(pos)
+        return None if n == self.none_int else self._Inline(item_desc, n)
+      ref = self._Unsigned(pos)
+      if not ref:
+        return None
+      return self.View(ref, item_desc) if lazy else self.Obj(ref, item_desc)
+
+    if encode.IsInline(desc):
+      return self._Inline(desc, self._Signed(pos))
+
+    ref = self._Unsigned(pos)
+    if isinstance(desc, asdl.StrType):
+      return self._Str(ref)
+    if isinstance(desc, asdl.ArrayType):
+      return self._Array(ref, desc.desc, lazy)
+    return self.View(ref, desc) if lazy else self.Obj(ref, desc)
+
+  def _Array(self, ref, item_desc, lazy):
+    pos = ref * self.alignment
+    n = self._Unsigned(pos)
+    pos += self.int_width
+
+    items = []
+    for i in range(n):
+      items.append(self._Value(pos, item_desc, lazy))
+      pos += self.int_width
+    return items
+
+  def _Class(self, ref, desc):
+    """Returns the class of the object at ref, and the offset of its fields."""
+    pos = ref * self.alignment
+    if isinstance(desc, asdl.Sum):
+      try:
+        tag = struct.unpack_from('B', self.buf, pos)[0]
+        cons = desc.types[tag - 1]
+      except (struct.error, IndexError):
+        raise DecodeError('Invalid tag at offset %d' % pos)
+      return self.classes[id(cons)], pos + 1
+    return self.classes[id(desc)], pos
+
+  def Obj(self, ref, desc):
+    """Decode the object at a ref, and everything it refers to.
+
+    Args:
+      ref: block index
+      desc: asdl.Sum or asdl.Product
+    """
+    cls, pos = self._Class(ref, desc)
+
+    values = []
+    for name in cls.FIELDS:
+      values.append(self._Value(pos, cls.DESCRIPTOR_LOOKUP[name], False))
+      pos += self.int_width
+
+    if issubclass(cls, py_meta.UncheckedObj):
+      return cls(*values)
+
+    # The data was type checked when it was encoded, so bypass __setattr__.
+    obj = cls.__new__(cls)
+    d = obj.__dict__
+    d['_assigned'] = dict.fromkeys(cls.FIELDS, True)
+    d.update(zip(cls.FIELDS, values))
+    return obj
+
+  def View(self, ref, desc):
+    """Return a view of the object at ref.
+
+    It's an instance of a subclass of the real class, so isinstance(), .tag,
+    ==, and printing work as usual.  Arrays are decoded into lists of views
+    when they're accessed.
+    """
+    cls, pos = self._Class(ref, desc)
+    view_cls = _ViewClass(cls)
+    obj = view_cls.__new__(view_cls)
+    d = obj.__dict__
+    d['_dec'] = self
+    d['_pos'] = pos
+    return obj
+
+
+def DecodeRoot(buf, root, cls):
+  """Decode a whole oheap buffer.
+
+  Args:
+    buf: bytes written by encode.EncodeRoot()
+    root: the module passed to py_meta.MakeTypes(), e.g. osh.ast_
+    cls: the type of the root object, e.g. ast.command
+
+  Returns:
+    A py_meta.CompoundObj
+  """
+  dec = Decoder(buf, root)
+  return dec.Obj(dec.RootRef(), cls.DESCRIPTOR)
+
+
+def LazyRoot(buf, root, cls):
+  """Like DecodeRoot(), but return a view of the root.
+
+  The buffer must not change while the view is used.
+  """
+  dec = Decoder(buf, root)
+  return dec.View(dec.RootRef(), cls.DESCRIPTOR)
+
+
+def OpenFile(path, root, cls):
+  """Map an oheap file into memory and return a view of its root.
+
+  The file stays mapped as long as the view or any node from it is alive.
+  """
+  with open(path, 'rb') as f:
+    try:
+      buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # empty file
+      raise DecodeError('%s is empty' % path)
+  return LazyRoot(buf, root, cls)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+decode_test.py: Tests for decode.py
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+from asdl import decode  # module under test
+from asdl import encode
+from core import alloc
+from core import reader
+from core.id_kind import Id
+from osh import ast_ as ast
+from osh import parse_lib
+
+
+def _Parse(code_str):
+  arena = alloc.Pool().NewArena()
+  arena.AddSourcePath('<test>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  node = c_parser.ParseWholeFile()
+  assert node is not None, c_parser.Error()
+  return node
+
+
+def _Encode(node):
+  f = io.BytesIO()
+  encode.EncodeRoot(node, encode.Params(), encode.BinOutput(f))
+  return f.getvalue()
+
+
+def _RoundTrip(node):
+  return decode.DecodeRoot(_Encode(node), ast, ast.command)
+
+
+class DecodeTest(unittest.TestCase):
+
+  def testRoundTrip(self):
+    for code_str in [
+        'echo hi',
+        'echo "$x" ${y:-default} > out 2>&1',
+        'f() { local x=1; return 2; }\nf',
+        'for i in 1 2 3; do echo $i; done',
+        'case $x in a|b) echo ab ;; *) echo other ;; esac',
+        'cat <<EOF\nhello $name\nEOF\n',
+        'a=(1 2 3); echo $((1 + 2 * x))',
+        '[[ -n $x && $y == z* ]] || echo no',
+        ]:
+      node = _Parse(code_str)
+      node2 = _RoundTrip(node)
+      self.assertEqual(node, node2, code_str)
+
+  def testValues(self):
+    node = _RoundTrip(_Parse('echo hi >&2'))
+    self.assertEqual(ast.SimpleCommand, node.__class__)
+
+    part = node.words[1].parts[0]
+    # Id instances are shared, not recreated
+    self.assertTrue(part.token.id is Id.Lit_Chars)
+    self.assertEqual('hi', part.token.val)
+
+    redir = node.redirects[0]
+    self.assertEqual(-1, redir.fd)  # a negative int
+
+  def testLazy(self):
+    node = _Parse('for i in a b; do echo $i; done\nls')
+    view = decode.LazyRoot(_Encode(node), ast, ast.command)
+    self.assertEqual(node, view)
+
+    view = decode.LazyRoot(_Encode(node), ast, ast.command)
+    self.assertTrue(isinstance(view, ast.CommandList))
+    self.assertEqual(ast.command_e.CommandList, view.tag)
+    self.assertFalse('children' in view.__dict__)  # not decoded yet
+
+    for_node = view.children[0]
+    self.assertTrue('children' in view.__dict__)
+    self.assertTrue(isinstance(for_node, ast.ForEach))
+    self.assertEqual('i', for_node.iter_name)
+    self.assertFalse('body' in for_node.__dict__)
+
+    # Fields can be assigned like any other object
+    for_node.iter_name = 'j'
+    self.assertEqual('j', for_node.iter_name)
+    self.assertRaises(AssertionError, setattr, for_node, 'iter_name', 42)
+
+  def testOpenFile(self):
+    node = _Parse('echo hi; echo bye')
+    fd, path = tempfile.mkstemp()
+    try:
+      with os.fdopen(fd, 'wb') as f:
+        f.write(_Encode(node))
+      self.assertEqual(node, decode.OpenFile(path, ast, ast.command))
+
+      with open(path, 'wb') as f:
+        pass
+      self.assertRaises(decode.DecodeError, decode.OpenFile, path, ast,
+                        ast.command)
+    finally:
+      os.remove(path)
+
+  def testInvalid(self):
+    self.assertRaises(decode.DecodeError, decode.DecodeRoot, b'XXXX\x04',
+                      ast, ast.command)
+
+    # Version 1 had unsigned ints, so it's rejected instead of misread.
+    data = _Encode(_Parse('echo hi'))
+    self.assertEqual(b'OHP\x02', data[:4])
+    self.assertRaises(decode.DecodeError, decode.DecodeRoot,
+                      b'OHP\x01' + data[4:], ast, ast.command)
+
+
+if __name__ == '__main__':
+  unittest.main()
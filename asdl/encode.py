@@ -9,6 +9,11 @@ from asdl import py_meta
 
 _DEFAULT_ALIGNMENT = 4
 
+# The header of an encoded tree.  The last byte is the format version, which
+# must be bumped whenever the encoding changes.  Version 2 has signed ints and
+# a reserved value for optional inline values that are None.
+MAGIC = b'OHP\x02'
+
 
 class BinOutput:
   """Write aligned blocks here.  Keeps track of block indexes for refs."""
@@ -20,7 +25,7 @@ class BinOutput:
     self.alignment = alignment
 
   def WriteRootRef(self, chunk):
-    self.f.seek(5)  # seek past 'OHP\x01\x04'
+    self.f.seek(5)  # seek past MAGIC and the alignment
 
     assert len(chunk) == 3
     self.f.write(chunk)
@@ -63,25 +68,37 @@ class Params:
     # also I guess steuff like SimpleCommand
     self.index_width = 2  # 16 bits, e.g. max 64K entries in an array
 
-    self.max_int = 1 << (self.ref_width * 8)
+    # Ints are signed; refs are unsigned.
+    self.max_int = 1 << (self.int_width * 8 - 1)
+    self.max_ref = 1 << (self.ref_width * 8)
     self.max_index = 1 << (self.index_width * 8)
     self.max_tag = 1 << (self.tag_width * 8)
 
+    # An optional int, bool, enum, or Id that is None.
+    self.none_int = -self.max_int
+
   def Tag(self, i, chunk):
     if i > self.max_tag:
       raise AssertionError('Invalid id %r' % i)
     chunk.append(i & 0xFF)
 
   def Int(self, n, chunk):
-    if n > self.max_int:
-      raise Error('%d is too big to fit in %d bytes' % (n, self.int_width))
+    if not -self.max_int <= n < self.max_int:
+      raise RuntimeError(
+          '%d is too big to fit in %d bytes' % (n, self.int_width))
 
     for i in range(self.int_width):
-      chunk.append(n & 0xFF)
+      chunk.append(n & 0xFF)  # two's complement
       n >>= 8
 
   def Ref(self, n, chunk):
-    self.Int(n, chunk)
+    if not 0 <= n < self.max_ref:
+      raise RuntimeError(
+          'ref %d is too big to fit in %d bytes' % (n, self.ref_width))
+
+    for i in range(self.ref_width):
+      chunk.append(n & 0xFF)
+      n >>= 8
 
   def _Pad(self, chunk):
     n = len(chunk)
@@ -96,7 +113,7 @@ class Params:
     # pre-compute and store a hash value.  They will be looked up in the stack
     # and so forth.
     # - You could also return a obj number or object ID.
-    chunk.extend(s.encode('utf-8'))
+    chunk.extend(_Utf8(s))
     chunk.append(0)  # NUL terminator
 
   def PaddedStr(self, s):
@@ -117,7 +134,7 @@ class Params:
     for i in range(self.index_width):
       chunk.append(n & 0xFF)
       n >>= 8
-    chunk.extend(buf.encode('utf-8'))
+    chunk.extend(_Utf8(buf))
 
   def PaddedBytes(self, buf):
     chunk = bytearray()
@@ -128,6 +145,34 @@ class Params:
     return self._Pad(chunk)
 
 
+def _Utf8(s):
+  # A Python 2 str is already bytes.  Encoding it would fail on non-ASCII.
+  if isinstance(s, bytes):
+    return s
+  return s.encode('utf-8')
+
+
+def IsInline(desc):
+  """Is a value of this type written inline as an integer?
+
+  That is an int, bool, enum, or Id.  Other types are written to their own
+  blocks and referenced.
+  """
+  return (isinstance(desc, asdl.IntType) or
+          isinstance(desc, asdl.BoolType) or
+          isinstance(desc, asdl.UserType) or
+          (isinstance(desc, asdl.Sum) and asdl.is_simple(desc)))
+
+
+def _InlineValue(desc, val):
+  if isinstance(desc, asdl.Sum):
+    return val.enum_id
+  if isinstance(desc, asdl.UserType):
+    # Assume Id for now
+    return val.enum_value
+  return int(val)
+
+
 def EncodeArray(obj_list, item_desc, enc, out):
   """
   Args:
@@ -148,6 +193,11 @@ def EncodeArray(obj_list, item_desc, enc, out):
     for item in obj_list:
       enc.Int(item.enum_id, array_chunk)
 
+  elif isinstance(item_desc, asdl.StrType):
+    for item in obj_list:
+      ref = out.Write(enc.PaddedStr(item))
+      enc.Ref(ref, array_chunk)
+
   else:
 
     # A simple value is either an int, enum, or pointer.  (Later: Iter<Str>
@@ -226,19 +276,18 @@ def EncodeObj(obj, enc, out):
 
     elif isinstance(desc, asdl.MaybeType):
       item_desc = desc.desc
-      ok = False
-      if isinstance(item_desc, asdl.Sum):
-        if not asdl.is_simple(item_desc):
-          ok = True
-      elif isinstance(item_desc, asdl.Product):
-        ok = True
-
-      # TODO: Fix this for span_id.  Need to extract a method.
-      if not ok:
+      if isinstance(item_desc, asdl.StrType):
         raise AssertionError(
-            "Currently not encoding simple optional types: %s", field_val)
+            "Currently not encoding optional strings: %s", field_val)
+
+      if IsInline(item_desc):
+        # Inline, with a reserved value for None, e.g. for span_id.
+        if field_val is None:
+          enc.Int(enc.none_int, this_chunk)
+        else:
+          enc.Int(_InlineValue(item_desc, field_val), this_chunk)
 
-      if field_val is None:
+      elif field_val is None:
         enc.Ref(0, this_chunk)
       else:
         ref = EncodeObj(field_val, enc, out)
@@ -259,7 +308,7 @@ def EncodeObj(obj, enc, out):
 
 
 def EncodeRoot(obj, enc, out):
-  ref = out.Write(b'OHP\x01')  # header, version 1
+  ref = out.Write(MAGIC)
   assert ref == 0
   # 4-byte alignment, then 3 byte placeholder for the root ref.
   ref = out.Write(b'\4\0\0\0')
@@ -27,6 +27,19 @@ class EncoderTest(unittest.TestCase):
 
     #p.Block([b'a', b'bc'])
 
+  def testSignedInt(self):
+    p = encode.Params(16)
+
+    chunk = bytearray()
+    p.Int(-1, chunk)
+    self.assertEqual(b'\xff\xff\xff', chunk)
+
+    chunk = bytearray()
+    p.Int(p.none_int, chunk)
+    self.assertEqual(b'\x00\x00\x80', chunk)
+
+    self.assertRaises(RuntimeError, p.Int, p.max_int, bytearray())
+
 
 if __name__ == '__main__':
   unittest.main()
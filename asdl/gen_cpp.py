@@ -411,9 +411,12 @@ def main(argv):
 
 class Obj {
  public:
-  // Decode a 3 byte integer from little endian
+  // Decode a 3 byte signed integer from little endian
   inline int Int(int n) const;
 
+  // Decode a 3 byte unsigned integer, for refs
+  inline int UInt(int n) const;
+
   inline const Obj& Ref(const %(pointer_type)s* base, int n) const;
 
   inline const Obj* Optional(const %(pointer_type)s* base, int n) const;
@@ -435,16 +438,21 @@ class Obj {
 
     f.write("""\
 inline int Obj::Int(int n) const {
+  int i = UInt(n);
+  return i < (1 << 23) ? i : i - (1 << 24);  // two's complement
+}
+
+inline int Obj::UInt(int n) const {
   return bytes_[n] + (bytes_[n+1] << 8) + (bytes_[n+2] << 16);
 }
 
 inline const Obj& Obj::Ref(const %(pointer_type)s* base, int n) const {
-  int offset = Int(n);
+  int offset = UInt(n);
   return reinterpret_cast<const Obj&>(base[offset]);
 }
 
 inline const Obj* Obj::Optional(const %(pointer_type)s* base, int n) const {
-  int offset = Int(n);
+  int offset = UInt(n);
   if (offset) {
     return reinterpret_cast<const Obj*>(base + offset);
   } else {
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+from __future__ import print_function
+"""
+gen_python.py
+
+Turn an ASDL schema into a Python module, so the shell doesn't have to parse
+the schema and create classes with metaprogramming every time it starts.
+
+Usage:
+  asdl/gen_python.py SCHEMA [NAME=MODULE.ATTR]... > OUT.py
+
+Each NAME=MODULE.ATTR argument declares an application type, e.g.
+id=core.id_kind.Id.
+
+The generated classes are the same as the ones py_meta.MakeTypes() creates:
+they have the same names, FIELDS, DESCRIPTOR, DESCRIPTOR_LOOKUP and tags, and
+the descriptors are instances of the classes in asdl_.py.  Whether they're
+checked or release classes is decided by py_meta.RELEASE when the module is
+imported.
+"""
+
+import hashlib
+import importlib
+import sys
+
+from asdl import asdl_ as asdl
+from asdl import gen_cpp
+
+
+_PRIMITIVES = {
+    'string': '_STR',
+    'int': '_INT',
+    'bool': '_BOOL',
+}
+
+
+class GenPyVisitor(gen_cpp.AsdlVisitor):
+  """Base class for the two passes over the schema."""
+
+  def Emit(self, s, depth=0):
+    # Unlike the C++ generator, don't reflow lines.  It can't break Python
+    # lines safely.
+    self.f.write('  ' * depth + s + '\n')
+
+  def EmitFooter(self):
+    pass
+
+
+def _FieldExpr(f):
+  extra = ''
+  if f.seq:
+    extra = ', seq=True'
+  elif f.opt:
+    extra = ', opt=True'
+  return 'asdl.Field(%r, %r%s)' % (f.type, f.name, extra)
+
+
+class DescriptorVisitor(GenPyVisitor):
+  """Emit the asdl.Sum and asdl.Product objects for each type.
+
+  They're all defined before the classes, since fields can refer to types
+  defined later.
+  """
+
+  def _EmitFields(self, fields, depth):
+    for f in fields:
+      self.Emit('%s,' % _FieldExpr(f), depth)
+
+  def VisitSum(self, sum, name, depth):
+    self.Emit('_%s_desc = asdl.Sum([' % name)
+    for cons in sum.types:
+      if cons.fields:
+        self.Emit('asdl.Constructor(%r, [' % cons.name, depth + 2)
+        self._EmitFields(cons.fields, depth + 4)
+        self.Emit(']),', depth + 2)
+      else:
+        self.Emit('asdl.Constructor(%r),' % cons.name, depth + 2)
+    self.Emit('])')
+
+  def VisitProduct(self, product, name, depth):
+    self.Emit('_%s_desc = asdl.Product([' % name)
+    self._EmitFields(product.fields, depth + 2)
+    self.Emit('])')
+
+
+class ClassDefVisitor(GenPyVisitor):
+  """Emit a class for each type and constructor."""
+
+  def __init__(self, f, app_types):
+    GenPyVisitor.__init__(self, f)
+    self.app_types = app_types
+    self.names = []  # for __all__
+
+  def _DescExpr(self, field):
+    type_name = field.type
+    if type_name in _PRIMITIVES:
+      expr = _PRIMITIVES[type_name]
+    elif type_name in self.app_types:
+      expr = '_%s' % type_name
+    else:
+      expr = '_%s_desc' % type_name
+
+    if field.seq:
+      return 'asdl.ArrayType(%s)' % expr
+    if field.opt:
+      return 'asdl.MaybeType(%s)' % expr
+    return expr
+
+  def _EmitBody(self, fields, depth):
+    # Every compound type gets 'int* spids', like py_meta.
+    names = [f.name for f in fields] + ['spids']
+    self.Emit('FIELDS = %r' % names, depth)
+    self.Emit('DESCRIPTOR_LOOKUP = {', depth)
+    for f in fields:
+      self.Emit('%r: %s,' % (f.name, self._DescExpr(f)), depth + 2)
+    self.Emit("'spids': _SPIDS,", depth + 2)
+    self.Emit('}', depth)
+
+    # Like py_meta._MakeInit()
+    self.Emit('if py_meta.RELEASE:', depth)
+    self.Emit('__slots__ = %r' % (tuple(names),), depth + 1)
+    params = ''.join(', %s=None' % n for n in names)
+    self.Emit('def __init__(self%s):' % params, depth + 1)
+    for f in fields:
+      if f.seq:
+        self.Emit('self.%s = [] if %s is None else %s' % (
+            f.name, f.name, f.name), depth + 2)
+      else:
+        self.Emit('self.%s = %s' % (f.name, f.name), depth + 2)
+    self.Emit('self.spids = [] if spids is None else spids', depth + 2)
+
+  def VisitSimpleSum(self, sum, name, depth):
+    self.Emit('class %s(py_meta.SimpleObj):' % name)
+    self.Emit('DESCRIPTOR = _%s_desc' % name, depth + 1)
+    self.Emit('')
+    for i, cons in enumerate(sum.types):
+      self.Emit('%s.%s = %s(%d, %r)' % (name, cons.name, name, i + 1,
+                                        cons.name))
+    self.Emit('')
+    self.Emit('')
+    self.names.append(name)
+
+  def VisitCompoundSum(self, sum, name, depth):
+    self.Emit('class %s(_CompoundObj):' % name)
+    self.Emit('DESCRIPTOR = _%s_desc' % name, depth + 1)
+    self.Emit('if py_meta.RELEASE:', depth + 1)
+    self.Emit('__slots__ = ()', depth + 2)
+    self.Emit('')
+    self.Emit('')
+    self.names.append(name)
+
+    for i, cons in enumerate(sum.types):
+      self.Emit('class %s(%s):' % (cons.name, name))
+      self.Emit('tag = %d' % (i + 1), depth + 1)
+      self.Emit('DESCRIPTOR = _%s_desc.types[%d]' % (name, i), depth + 1)
+      self._EmitBody(cons.fields, depth + 1)
+      self.Emit('')
+      self.Emit('')
+      self.names.append(cons.name)
+
+    enum_name = name + '_e'
+    self.Emit('class %s(object):' % enum_name)
+    for i, cons in enumerate(sum.types):
+      self.Emit('%s = %d' % (cons.name, i + 1), depth + 1)
+    self.Emit('')
+    self.Emit('')
+    self.names.append(enum_name)
+
+  def VisitProduct(self, product, name, depth):
+    self.Emit('class %s(_CompoundObj):' % name)
+    self.Emit('DESCRIPTOR = _%s_desc' % name, depth + 1)
+    self._EmitBody(product.fields, depth + 1)
+    self.Emit('')
+    self.Emit('')
+    self.names.append(name)
+
+
+def _ParseAppType(arg):
+  """'id=core.id_kind.Id' -> ('id', 'core.id_kind', 'Id')"""
+  try:
+    name, path = arg.split('=')
+    mod_name, attr = path.rsplit('.', 1)
+  except ValueError:
+    raise RuntimeError('Expected NAME=MODULE.ATTR, got %r' % arg)
+  return name, mod_name, attr
+
+
+def GenPython(schema_path, app_type_args, f):
+  """Write a Python module for the schema to f.
+
+  Args:
+    schema_path: path to the .asdl file
+    app_type_args: list of NAME=MODULE.ATTR strings
+    f: output file
+  """
+  with open(schema_path, 'rb') as schema_f:
+    schema_sha1 = hashlib.sha1(schema_f.read()).hexdigest()
+  module = asdl.parse(schema_path)
+
+  app_types = {}  # name -> asdl.UserType
+  imports = []
+  for arg in app_type_args:
+    name, mod_name, attr = _ParseAppType(arg)
+    typ = getattr(importlib.import_module(mod_name), attr)
+    app_types[name] = asdl.UserType(typ)
+    imports.append((name, mod_name, attr))
+
+  if not asdl.check(module, app_types):
+    raise RuntimeError('%s is invalid' % schema_path)
+
+  f.write('''\
+"""
+Generated by asdl/gen_python.py from %s.  Don't edit.
+"""
+
+from asdl import asdl_ as asdl
+from asdl import py_meta
+''' % schema_path)
+  for name, mod_name, attr in imports:
+    f.write('from %s import %s\n' % (mod_name, attr))
+
+  f.write('''
+# sha1 of the schema, for caches of encoded trees.
+SCHEMA_SHA1 = %r
+
+_STR = asdl.DESCRIPTORS_BY_NAME['string']
+_INT = asdl.DESCRIPTORS_BY_NAME['int']
+_BOOL = asdl.DESCRIPTORS_BY_NAME['bool']
+_SPIDS = asdl.ArrayType(asdl.IntType())
+''' % schema_sha1)
+  for name, mod_name, attr in imports:
+    f.write('_%s = asdl.UserType(%s)\n' % (name, attr))
+
+  f.write('''
+if py_meta.RELEASE:
+  _CompoundObj = py_meta.UncheckedObj
+else:
+  _CompoundObj = py_meta.CompoundObj
+
+''')
+
+  DescriptorVisitor(f).VisitModule(module)
+  f.write('\n\n')
+
+  v = ClassDefVisitor(f, app_types)
+  v.VisitModule(module)
+
+  f.write('__all__ = [\n')
+  for name in v.names:
+    f.write('    %r,\n' % name)
+  f.write(']\n')
+
+
+def main(argv):
+  try:
+    schema_path = argv[1]
+  except IndexError:
+    raise RuntimeError('Usage: gen_python.py SCHEMA [NAME=MODULE.ATTR]...')
+  GenPython(schema_path, argv[2:], sys.stdout)
+
+
+if __name__ == '__main__':
+  try:
+    main(sys.argv)
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
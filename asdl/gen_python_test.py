@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+gen_python_test.py: Tests for gen_python.py
+"""
+
+import types
+import unittest
+
+from asdl import arith_ast
+from asdl import asdl_ as asdl
+from asdl import gen_python  # module under test
+from asdl import py_meta
+from core import util
+
+
+def _Gen(schema_path, app_types=None):
+  f = util.Buffer()
+  gen_python.GenPython(schema_path, app_types or [], f)
+  return f.getvalue()
+
+
+def _DescKind(desc):
+  """Summarize a descriptor so they can be compared across modules."""
+  if isinstance(desc, asdl.ArrayType):
+    return ('array', _DescKind(desc.desc))
+  if isinstance(desc, asdl.MaybeType):
+    return ('maybe', _DescKind(desc.desc))
+  if isinstance(desc, asdl.Constructor):
+    return ('cons', desc.name)
+  return desc.__class__.__name__
+
+
+class GenPythonTest(unittest.TestCase):
+
+  def testCheckedIn(self):
+    # If this fails, run 'asdl/run.sh gen-python' and check in the result.
+    for schema_path, app_types, out_path in [
+        ('osh/osh.asdl', ['id=core.id_kind.Id'], 'osh/osh_asdl.py'),
+        ('core/runtime.asdl', [], 'core/runtime_asdl.py'),
+        ]:
+      with open(out_path) as f:
+        expected = f.read()
+      self.assertEqual(expected, _Gen(schema_path, app_types), out_path)
+
+  def testSameAsMakeTypes(self):
+    code = _Gen(arith_ast.schema_path)
+    for release in (False, True):
+      py_meta.RELEASE = release
+      try:
+        gen = {}
+        exec(code, gen)
+      finally:
+        py_meta.RELEASE = False
+
+      module = asdl.parse(arith_ast.schema_path)
+      made = types.ModuleType('arith_test_types')
+      py_meta.MakeTypes(module, made, release=release)
+
+      names = [n for n in dir(made) if not n.startswith('_')]
+      self.assertEqual(sorted(names), sorted(gen['__all__']))
+      for name in names:
+        c1 = getattr(made, name)
+        c2 = gen[name]
+        self.assertEqual(
+            [b.__name__ for b in c1.__mro__], [b.__name__ for b in c2.__mro__])
+        self.assertEqual(c1.__dict__.get('__slots__'),
+                         c2.__dict__.get('__slots__'))
+        self.assertEqual(getattr(c1, 'tag', None), getattr(c2, 'tag', None))
+        self.assertEqual(getattr(c1, 'FIELDS', None),
+                         getattr(c2, 'FIELDS', None))
+        self.assertEqual(_DescKind(getattr(c1, 'DESCRIPTOR', None)),
+                         _DescKind(getattr(c2, 'DESCRIPTOR', None)))
+        lookup1 = getattr(c1, 'DESCRIPTOR_LOOKUP', {})
+        lookup2 = getattr(c2, 'DESCRIPTOR_LOOKUP', {})
+        self.assertEqual(
+            dict((k, _DescKind(v)) for k, v in lookup1.items()),
+            dict((k, _DescKind(v)) for k, v in lookup2.items()))
+
+      # Check a constructor
+      node = gen['ArithBinary'](gen['op_id'].Plus, gen['Const'](1),
+                                gen['ArithVar']('x'))
+      self.assertEqual(['op_id', 'left', 'right', 'spids'], node.FIELDS)
+      self.assertEqual('x', node.right.name)
+      self.assertEqual([], node.spids)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -10,9 +10,10 @@ int GetRootRef(uint8_t* image) {
   if (image[0] != 'O') return -1;
   if (image[1] != 'H') return -1;
   if (image[2] != 'P') return -1;
-  if (image[3] != 4) return -1;
+  if (image[3] != 2) return -1;  // version 2
+  if (image[4] != 4) return -1;  // alignment 4
 
-  return image[4] + (image[5] << 8) + (image[6] << 16) + (image[7] << 24);
+  return image[5] + (image[6] << 8) + (image[7] << 16);
 }
 
 int main(int argc, char **argv) {
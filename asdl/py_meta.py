@@ -34,6 +34,10 @@ from asdl import asdl_ as asdl
 from core import util
 
 
+# Whether schemas should be loaded with MakeTypes(..., release=True).
+# bin/oil.py sets this before importing them; tests use checked mode.
+RELEASE = False
+
 def _CheckType(value, expected_desc):
   """Is value of type expected_desc?
 
@@ -98,6 +102,10 @@ def _CheckType(value, expected_desc):
 
 
 class Obj(object):
+  # Empty slots, so that UncheckedObj instances have no __dict__.  Subclasses
+  # that don't declare __slots__ still get one.
+  __slots__ = ()
+
   # NOTE: We're using CAPS for these static fields, since they are constant at
   # runtime after metaprogramming.
   DESCRIPTOR = None  # Used for type checking
@@ -121,6 +129,8 @@ class CompoundObj(Obj):
 
   Uses some metaprogramming.
   """
+  __slots__ = ()
+
   FIELDS = []  # ordered list of field names
   DESCRIPTOR_LOOKUP = {}  # field name: (asdl.Type | int | str)
 
@@ -221,6 +231,45 @@ class CompoundObj(Obj):
     return s
 
 
+class UncheckedObj(CompoundObj):
+  """A CompoundObj for release mode.
+
+  Subclasses store their fields in __slots__ and get a generated __init__ that
+  takes them positionally or by name.  Nothing is type checked, and fields
+  that aren't passed are None, or [] for arrays.
+  """
+  __slots__ = ()
+
+  __setattr__ = object.__setattr__
+
+  def CheckUnassigned(self):
+    pass  # Assignments aren't tracked.
+
+
+def _MakeInit(field_names, desc_lookup):
+  """Generate a fast __init__ for an UncheckedObj subclass."""
+  params = ''.join(', %s=None' % name for name in field_names)
+  lines = ['def __init__(self%s):' % params]
+  for name in field_names:
+    if isinstance(desc_lookup[name], asdl.ArrayType):
+      lines.append('  self.%s = [] if %s is None else %s' % (name, name, name))
+    else:
+      lines.append('  self.%s = %s' % (name, name))
+  lines.append('  pass')  # in case there are no fields
+
+  namespace = {}
+  exec('\n'.join(lines), namespace)
+  return namespace['__init__']
+
+
+def _MakeCompoundClass(name, base_class, class_attr, release):
+  if release:
+    class_attr['__slots__'] = tuple(class_attr['FIELDS'])
+    class_attr['__init__'] = _MakeInit(
+        class_attr['FIELDS'], class_attr['DESCRIPTOR_LOOKUP'])
+  return type(name, (base_class, ), class_attr)
+
+
 def _MakeFieldDescriptors(module, fields, app_types, add_spids=True):
   desc_lookup = {}
   for f in fields:
@@ -260,13 +309,16 @@ def _MakeFieldDescriptors(module, fields, app_types, add_spids=True):
   return class_attr
 
 
-def MakeTypes(module, root, app_types=None):
+def MakeTypes(module, root, app_types=None, release=False):
   """
   Args:
     module: asdl.Module
     root: an object/package to add types to
+    release: If true, generate UncheckedObj classes, which are smaller and
+      faster to construct.  Otherwise every field assignment is type checked.
   """
   app_types = app_types or {}
+  compound_base = UncheckedObj if release else CompoundObj
   for defn in module.dfns:
     typ = defn.value
 
@@ -291,7 +343,11 @@ def MakeTypes(module, root, app_types=None):
 
         # e.g. for arith_expr
         # Should this be arith_expr_t?  It is in C++.
-        base_class = type(defn.name, (CompoundObj, ), {})
+        # The DESCRIPTOR lets a decoder find the constructors.
+        class_attr = {'DESCRIPTOR': sum_type}
+        if release:
+          class_attr['__slots__'] = ()
+        base_class = type(defn.name, (compound_base, ), class_attr)
         setattr(root, defn.name, base_class)
 
         # Make a type and a enum tag for each alternative.
@@ -305,7 +361,7 @@ def MakeTypes(module, root, app_types=None):
           class_attr['DESCRIPTOR'] = cons  # asdl.Constructor
           class_attr['tag'] = tag
 
-          cls = type(cons.name, (base_class, ), class_attr)
+          cls = _MakeCompoundClass(cons.name, base_class, class_attr, release)
           setattr(root, cons.name, cls)
 
         # e.g. arith_expr_e.Const == 1
@@ -317,7 +373,7 @@ def MakeTypes(module, root, app_types=None):
       class_attr = _MakeFieldDescriptors(module, typ.fields, app_types)
       class_attr['DESCRIPTOR'] = typ
 
-      cls = type(defn.name, (CompoundObj, ), class_attr)
+      cls = _MakeCompoundClass(defn.name, compound_base, class_attr, release)
       setattr(root, defn.name, cls)
 
     else:
@@ -4,12 +4,56 @@ py_meta_test.py: Tests for py_meta.py
 """
 
 import re
+import types
 import unittest
 
+from asdl import asdl_ as asdl
+from asdl import arith_ast
 from asdl import py_meta  # module under test
 
+
+def _MakeArithTypes(release):
+  module = asdl.parse(arith_ast.schema_path)
+  root = types.ModuleType('arith_test_types')
+  py_meta.MakeTypes(module, root, release=release)
+  return root
+
+
 class AsdlTest(unittest.TestCase):
-  pass
+
+  def testReleaseMode(self):
+    a = _MakeArithTypes(True)
+
+    v = a.ArithVar('x')
+    self.assertTrue(isinstance(v, a.arith_expr))
+    self.assertTrue(isinstance(v, py_meta.CompoundObj))
+    self.assertEqual(a.arith_expr_e.ArithVar, v.tag)
+    self.assertFalse(hasattr(v, '__dict__'))
+    self.assertRaises(AttributeError, setattr, v, 'bad_field', 1)
+
+    # Defaults, and no type checks
+    s = a.Slice(a.ArithVar('foo'))
+    self.assertEqual(None, s.begin)
+    f = a.FuncCall(name='f')
+    self.assertEqual([], f.args)
+    self.assertFalse(f.args is a.FuncCall().args)
+    self.assertEqual(1, a.ArithVar(1).name)
+
+  def testModesAgree(self):
+    c = _MakeArithTypes(False)
+    r = _MakeArithTypes(True)
+    def _Make(a):
+      return a.ArithBinary(
+          a.op_id.Plus, a.Const(1),
+          a.FuncCall('f', [a.ArithVar('x'), a.Const(2)]))
+
+    self.assertEqual(repr(_Make(c)), repr(_Make(r)))
+
+    n1 = _Make(r)
+    n2 = _Make(r)
+    self.assertEqual(n1, n2)
+    n2.right.args[0].name = 'y'
+    self.assertNotEqual(n1, n2)
 
 
 if __name__ == '__main__':
@@ -41,6 +41,15 @@ asdl-cpp() {
   wc -l $src
 }
 
+# Regenerate the Python modules for the shell's schemas.  Run this after
+# changing osh/osh.asdl or core/runtime.asdl; asdl/gen_python_test.py checks
+# that they're up to date.
+gen-python() {
+  asdl/gen_python.py osh/osh.asdl id=core.id_kind.Id > osh/osh_asdl.py
+  asdl/gen_python.py core/runtime.asdl > core/runtime_asdl.py
+  wc -l osh/osh_asdl.py core/runtime_asdl.py
+}
+
 py-cpp() {
   local schema=${1:-asdl/arith.asdl}
   asdl-py $schema
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+arena_bench.py - Memory report for the two arena modes in core/alloc.py.
+
+Usage:
+  benchmarks/arena_bench.py [--copies N] [SCRIPT]
+
+Parses the same script once with a regular Arena (a line_span object per
+token) and once with a CompactArena (parallel integer arrays), each in a fresh
+child process, and reports:
+
+- the deep size of the span and debug info storage, measured with
+  sys.getsizeof()
+- the growth in peak RSS while parsing
+
+If no script is given, a synthetic one made of N copies of a function
+definition is used.
+"""
+
+import array
+import optparse
+import os
+import resource
+import sys
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+
+from core import alloc
+from core import reader
+
+from osh import parse_lib
+
+
+_TEMPLATE = """\
+f%(i)d() {
+  local x=${1:-default} y="$2 $3"
+  if test -n "$x"; then
+    echo "x=$x" | grep -q foo && echo found >> /tmp/out.$$
+  fi
+  for a in $y; do
+    case $a in *.py) echo py ;; *) echo other ;; esac
+  done
+}
+"""
+
+
+def _DeepSize(obj, seen):
+  """Approximate number of bytes reachable from obj."""
+  if id(obj) in seen:
+    return 0
+  seen.add(id(obj))
+
+  size = sys.getsizeof(obj)
+  if isinstance(obj, (str, bytes, int, float, array.array)):
+    return size
+  if isinstance(obj, (list, tuple)):
+    for item in obj:
+      size += _DeepSize(item, seen)
+  elif isinstance(obj, dict):
+    for k, v in obj.items():
+      size += _DeepSize(k, seen) + _DeepSize(v, seen)
+  elif hasattr(obj, '__dict__'):
+    size += _DeepSize(obj.__dict__, seen)
+  return size
+
+
+def _SpanStorage(arena):
+  """The containers that differ between the two arena modes."""
+  if isinstance(arena, alloc.CompactArena):
+    return [arena.span_line_ids, arena.span_cols, arena.span_lengths,
+            arena.line_src_indices, arena.line_nums]
+  else:
+    return [arena.spans, arena.debug_info]
+
+
+def _MaxRssKb():
+  return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _Measure(code_str, compact):
+  """Parse code_str and return a dict of measurements."""
+  rss_before = _MaxRssKb()
+
+  arena = alloc.Pool(compact=compact).NewArena()
+  arena.AddSourcePath('<bench>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  node = c_parser.ParseWholeFile()
+  if not node:
+    raise RuntimeError('Parse error: %s' % c_parser.Error())
+
+  return {
+      'lines': arena.next_line_id,
+      'spans': arena.NumSpans(),
+      'storage': _DeepSize(_SpanStorage(arena), set()),
+      'rss_kb': _MaxRssKb() - rss_before,
+  }
+
+
+def _MeasureInChild(code_str, compact):
+  """Run _Measure in a fresh process so peak RSS isn't shared."""
+  r, w = os.pipe()
+  pid = os.fork()
+  if pid == 0:
+    os.close(r)
+    result = _Measure(code_str, compact)
+    os.write(w, repr(result).encode('utf-8'))
+    os._exit(0)
+
+  os.close(w)
+  chunks = []
+  while True:
+    chunk = os.read(r, 4096)
+    if not chunk:
+      break
+    chunks.append(chunk)
+  os.close(r)
+  _, status = os.waitpid(pid, 0)
+  if status != 0:
+    raise RuntimeError('Child process failed with status %d' % status)
+  return eval(b''.join(chunks).decode('utf-8'))
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--copies', dest='copies', type='int', default=200,
+      help='Number of function definitions in the synthetic script')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+  if args:
+    with open(args[0]) as f:
+      code_str = f.read()
+  else:
+    code_str = ''.join(_TEMPLATE % {'i': i} for i in range(opts.copies))
+
+  results = []
+  for name, compact in [('Arena', False), ('CompactArena', True)]:
+    results.append((name, _MeasureInChild(code_str, compact)))
+
+  first = results[0][1]
+  print('%d lines, %d spans' % (first['lines'], first['spans']))
+  print()
+  print('%-14s %16s %14s %16s' % (
+        'mode', 'span storage', 'bytes/span', 'peak RSS growth'))
+  for name, r in results:
+    print('%-14s %14d B %14.1f %13d KB' % (
+          name, r['storage'], float(r['storage']) / max(r['spans'], 1),
+          r['rss_kb']))
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
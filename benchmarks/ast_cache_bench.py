@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+ast_cache_bench.py - Compare parsing scripts with loading them from the cache.
+
+Usage:
+  benchmarks/ast_cache_bench.py [--iters N] [--runs N] [FILE]...
+
+If no files are given, it uses tests/*.sh.  It reports:
+
+- in process: total time to parse every file, vs. total time for
+  AstCache.Lookup() to load and decode them.
+- end to end: average wall time of 'bin/oil.py osh SCRIPT' for a script of
+  a few hundred lines, without the cache and with a warm cache.
+"""
+
+import glob
+import optparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+OIL = os.path.join(this_dir, '..', 'bin', 'oil.py')
+
+from core import alloc
+from core import reader
+
+from osh import ast_cache
+from osh import parse_lib
+
+
+# The parser never terminates on the unterminated here doc in this file.
+_SKIP = ['09-here-doc.sh']
+
+# A few hundred lines, most of which are never run, like a typical cron job.
+_FUNC = """\
+task%d() {
+  local dir=${1:-/tmp} name="task %d"
+  if test -d "$dir"; then
+    for f in "$dir"/*.log; do
+      case $f in
+        *.gz) echo "skip $f" ;;
+        *) echo "$name: $f" > /dev/null ;;
+      esac
+    done
+  fi
+}
+"""
+_SCRIPT = (''.join(_FUNC % (i, i) for i in range(30)) +
+           'task0 /nonexistent || true\n')
+
+
+def _Parse(code_str):
+  arena = alloc.Pool().NewArena()
+  arena.AddSourcePath('<bench>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  try:
+    return c_parser.ParseWholeFile()
+  except AssertionError:  # Some unimplemented constructs fail this way.
+    return None
+
+
+def _InProcess(paths, cache, iters):
+  files = []
+  for path in paths:
+    with open(path) as f:
+      contents = f.read()
+    node = _Parse(contents)
+    if node:
+      cache.Store(path, 0.0, contents, node)
+      files.append((path, contents))
+
+  start = time.time()
+  for i in range(iters):
+    for path, contents in files:
+      _Parse(contents)
+  parse_secs = time.time() - start
+
+  start = time.time()
+  for i in range(iters):
+    for path, contents in files:
+      node = cache.Lookup(path, 0.0, contents)
+      if node is None:
+        raise RuntimeError('Cache miss for %s' % path)
+  load_secs = time.time() - start
+
+  return len(files), parse_secs, load_secs
+
+
+def _EndToEnd(script_path, cache_dir, runs):
+  argv = [sys.executable, OIL, 'osh']
+  if cache_dir:
+    argv += ['--ast-cache', cache_dir]
+  argv.append(script_path)
+
+  subprocess.check_call(argv)  # warm up the cache and the OS
+  start = time.time()
+  for i in range(runs):
+    subprocess.check_call(argv)
+  return (time.time() - start) / runs
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--iters', dest='iters', type='int', default=5,
+      help='Number of times to parse and load each file')
+  p.add_option(
+      '--runs', dest='runs', type='int', default=10,
+      help='Number of shell processes to start for the end to end test')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+  paths = args or sorted(
+      glob.glob(os.path.join(this_dir, '..', 'tests', '*.sh')))
+  paths = [p for p in paths if os.path.basename(p) not in _SKIP]
+
+  tmp_dir = tempfile.mkdtemp()
+  try:
+    cache = ast_cache.AstCache(os.path.join(tmp_dir, 'in-process'))
+    n, parse_secs, load_secs = _InProcess(paths, cache, opts.iters)
+    print('in process (%d files x %d)' % (n, opts.iters))
+    print('  parse  %8.3f s' % parse_secs)
+    print('  cache  %8.3f s  (%.1fx)' % (load_secs, parse_secs / load_secs))
+
+    script_path = os.path.join(tmp_dir, 'script.sh')
+    with open(script_path, 'w') as f:
+      f.write(_SCRIPT)
+    no_cache = _EndToEnd(script_path, None, opts.runs)
+    cached = _EndToEnd(script_path, os.path.join(tmp_dir, 'e2e'), opts.runs)
+    print('end to end (average of %d runs)' % opts.runs)
+    print('  parse  %8.3f s' % no_cache)
+    print('  cache  %8.3f s' % cached)
+  finally:
+    shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
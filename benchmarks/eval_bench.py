@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+eval_bench.py - Time the parsers that are created while a shell runs.
+
+Usage:
+  benchmarks/eval_bench.py [--evals N] [--completions N]
+
+Every 'eval', 'source', and completion request creates a new parser.  This
+reports, with one lexer definition shared by all parsers and with the lexer
+compiled for each parser (as it used to be):
+
+- eval: time to run a loop that calls 'eval' N times.
+- complete: average latency of completing a partial command line.
+"""
+
+import optparse
+import os
+import sys
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+
+from core import alloc
+from core import builtin
+from core import cmd_exec
+from core import completion
+from core import lexer
+from core import reader
+from core import ui
+from core import word_eval
+
+from osh import lex
+from osh import parse_lib
+
+
+_COMPLETE_LINES = [
+    'grep f',
+    'echo hi; grep ',
+    'ls $HO',
+    'echo "${foo:-bar}" | gr',
+]
+
+
+def _PerParserLexerDef():
+  return lexer.CompiledLexerDef(lex.LEXER_DEF)
+
+
+def _Eval(n):
+  mem = cmd_exec.Mem('', [])
+  builtins = builtin.Builtins(ui.NullStatusLine())
+  ex = cmd_exec.Executor(mem, builtins, {}, {}, cmd_exec.ExecOpts(),
+                         parse_lib.MakeParserForExecutor)
+
+  code_str = 'for i in %s; do eval "x=$i; y=${x}-suffix"; done' % (
+      ' '.join(str(i) for i in range(n)))
+  arena = alloc.Pool().NewArena()
+  arena.AddSourcePath('<bench>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  node = c_parser.ParseWholeFile()
+  if not node:
+    raise RuntimeError('Parse error')
+
+  start = time.time()
+  ex.Execute(node)
+  return time.time() - start
+
+
+def _Complete(n):
+  mem = cmd_exec.Mem('', [])
+  ev = word_eval.CompletionWordEvaluator(mem, cmd_exec.ExecOpts())
+  comp_lookup = completion.CompletionLookup()
+  words = completion.WordsAction(['grep', 'sed', 'test'])
+  comp_lookup.RegisterEmpty(words)
+  comp_lookup.RegisterFirst(words)
+  var_comp = completion.WordsAction(['$HOME', '$HOSTNAME'])
+  root_comp = completion.RootCompleter(
+      parse_lib.MakeParserForCompletion, ev, comp_lookup, var_comp)
+  status_lines = [ui.NullStatusLine()] * 10
+
+  # The completion code prints the argv of each command it completes.
+  stdout = sys.stdout
+  sys.stdout = open(os.devnull, 'w')
+  try:
+    start = time.time()
+    for i in range(n):
+      for line in _COMPLETE_LINES:
+        list(root_comp.Matches(line, status_lines))
+    elapsed = time.time() - start
+  finally:
+    sys.stdout.close()
+    sys.stdout = stdout
+  return elapsed / (n * len(_COMPLETE_LINES))
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--evals', dest='evals', type='int', default=2000,
+      help='Number of times the loop calls eval')
+  p.add_option(
+      '--completions', dest='completions', type='int', default=100,
+      help='Number of times to complete each line')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+
+  shared = parse_lib._GetLexerDef
+  print('%-12s %12s %14s' % ('lexer def', 'eval', 'complete'))
+  for name, get_def in [('per parser', _PerParserLexerDef),
+                        ('shared', shared)]:
+    parse_lib._GetLexerDef = get_def
+    try:
+      eval_secs = _Eval(opts.evals)
+      complete_secs = _Complete(opts.completions)
+    finally:
+      parse_lib._GetLexerDef = shared
+    print('%-12s %10.3f s %11.2f ms' % (name, eval_secs, complete_secs * 1000))
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
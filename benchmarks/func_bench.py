@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+func_bench.py - Time shell function calls.
+
+Usage:
+  benchmarks/func_bench.py [--runs N] [--calls N] [--fib N]
+
+Runs these loops in the shell's executor, each of which calls a function N
+times:
+
+- plain: a function that falls off the end.
+- return: a function that returns a status.
+- loop-return: a function that returns from inside two loops, like a
+  search.
+- break: a function with a loop that it leaves with break and continue.
+
+Then it computes Fibonacci numbers recursively, which makes many calls that
+each set a few locals.
+
+Function calls and loops that are left early used to raise and catch an
+exception for each break, continue, and return.
+"""
+
+import optparse
+import os
+import sys
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+
+from core import alloc
+from core import builtin
+from core import cmd_exec
+from core import reader
+from core import ui
+
+from osh import parse_lib
+
+_FUNCS = '''\
+plain() {
+  x=$1
+}
+ret() {
+  x=$1
+  return 1
+}
+loop_ret() {
+  for i in a b c; do
+    while [[ -n $i ]]; do
+      [[ $i == b ]] && return 0
+      break
+    done
+  done
+  return 1
+}
+brk() {
+  for i in a b c; do
+    [[ $i == a ]] && continue
+    break
+  done
+}
+fib() {
+  if [[ $1 == 0 || $1 == 1 ]]; then
+    r=$1
+    return
+  fi
+  fib $(($1 - 1))
+  local a=$r
+  fib $(($1 - 2))
+  r=$((a + r))
+}
+'''
+
+_LOOP = '''\
+for i in %s; do
+  %s $i
+done
+'''
+
+_CASES = [
+    ('plain', 'plain'),
+    ('return', 'ret'),
+    ('loop-return', 'loop_ret'),
+    ('break', 'brk'),
+]
+
+
+def _Parse(code_str):
+  arena = alloc.Pool().NewArena()
+  arena.AddSourcePath('<bench>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  node = c_parser.ParseWholeFile()
+  if not node:
+    raise RuntimeError('Parse error')
+  return node
+
+
+def _Run(node, runs):
+  mem = cmd_exec.Mem('', [])
+  builtins = builtin.Builtins(ui.NullStatusLine())
+  ex = cmd_exec.Executor(mem, builtins, {}, {}, cmd_exec.ExecOpts(),
+                         parse_lib.MakeParserForExecutor)
+  ex.Execute(_Parse(_FUNCS))
+
+  start = time.time()
+  for i in range(runs):
+    ex.Execute(node)
+  elapsed = time.time() - start
+  if ex.Error():
+    raise RuntimeError('Error running loop: %s' % ex.Error())
+  return ex, elapsed / runs
+
+
+def _FibValue(n):
+  a, b = 0, 1
+  for i in range(n):
+    a, b = b, a + b
+  return a
+
+
+def _FibCalls(n):
+  """Returns the number of calls fib(n) makes."""
+  if n < 2:
+    return 1
+  return 1 + _FibCalls(n - 1) + _FibCalls(n - 2)
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--runs', dest='runs', type='int', default=5,
+      help='Number of times to run each loop')
+  p.add_option(
+      '--calls', dest='calls', type='int', default=2000,
+      help='Number of function calls in each loop')
+  p.add_option(
+      '--fib', dest='fib', type='int', default=16,
+      help='Fibonacci number to compute')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+
+  words = ' '.join(str(i) for i in range(opts.calls))
+  print('%-12s %10s %12s' % ('function', 'loop', 'per call'))
+  for name, func_name in _CASES:
+    node = _Parse(_LOOP % (words, func_name))
+    _, secs = _Run(node, opts.runs)
+    print('%-12s %7.1f ms %9.1f us' % (name, secs * 1000,
+                                       secs / opts.calls * 1e6))
+
+  ex, secs = _Run(_Parse('fib %d' % opts.fib), opts.runs)
+  print('%-12s %7.1f ms %9.1f us' % ('fib %d' % opts.fib, secs * 1000,
+                                     secs / _FibCalls(opts.fib) * 1e6))
+  if ex.mem.Get('r').s != str(_FibValue(opts.fib)):
+    raise RuntimeError('fib %d is wrong: %s' % (opts.fib, ex.mem.Get('r')))
+  return 0
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
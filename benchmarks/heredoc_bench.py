@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+heredoc_bench.py - Compare ways of feeding here docs to commands.
+
+Usage:
+  benchmarks/heredoc_bench.py [--runs N] [--loops N]
+
+Runs these two scripts in the shell's executor:
+
+- big: tests/13-big-here-doc.sh, whose here doc is bigger than a pipe's
+  buffer.
+- small: a loop of 'read' and 'cat' with two-line here docs.
+
+Each one is run with a process that writes every here doc to a pipe (as the
+shell used to), then with the default: a pipe written up front if the body
+fits, and otherwise an anonymous file.
+"""
+
+import optparse
+import os
+import sys
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+
+from core import alloc
+from core import builtin
+from core import cmd_exec
+from core import process
+from core import reader
+from core import ui
+
+from osh import parse_lib
+
+BIG_SCRIPT = os.path.join(this_dir, '..', 'tests', '13-big-here-doc.sh')
+
+_SMALL_LOOP = '''\
+for i in %s; do
+  read x <<EOF
+line $i
+two
+EOF
+  cat <<EOF
+line $i
+two
+EOF
+done
+'''
+
+
+def _Parse(code_str):
+  arena = alloc.Pool().NewArena()
+  arena.AddSourcePath('<bench>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  node = c_parser.ParseWholeFile()
+  if not node:
+    raise RuntimeError('Parse error')
+  return node
+
+
+def _Run(node, runs):
+  # The script runs "$@", so pass a builtin that does nothing much.
+  mem = cmd_exec.Mem('', ['echo'])
+  builtins = builtin.Builtins(ui.NullStatusLine())
+  ex = cmd_exec.Executor(mem, builtins, {}, {}, cmd_exec.ExecOpts(),
+                         parse_lib.MakeParserForExecutor)
+
+  # Send the output of 'echo' and 'cat' to /dev/null.
+  sys.stdout.flush()
+  saved = os.dup(1)
+  null_fd = os.open(os.devnull, os.O_WRONLY)
+  os.dup2(null_fd, 1)
+  os.close(null_fd)
+  try:
+    start = time.time()
+    for i in range(runs):
+      ex.Execute(node)
+    sys.stdout.flush()
+    elapsed = time.time() - start
+  finally:
+    os.dup2(saved, 1)
+    os.close(saved)
+  return elapsed / runs
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--runs', dest='runs', type='int', default=100,
+      help='Number of times to run each script')
+  p.add_option(
+      '--loops', dest='loops', type='int', default=100,
+      help='Number of iterations of the small here doc loop')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+
+  with open(BIG_SCRIPT) as f:
+    big = _Parse(f.read())
+  small = _Parse(_SMALL_LOOP % ' '.join(str(i) for i in range(opts.loops)))
+
+  print('%-14s %12s %12s' % ('here doc', 'big', 'small'))
+  for name, fork in [('writer process', True), ('pipe or file', False)]:
+    process.HERE_DOC_FORK = fork
+    try:
+      big_secs = _Run(big, opts.runs)
+      small_secs = _Run(small, opts.runs)
+    finally:
+      process.HERE_DOC_FORK = False
+    print('%-14s %9.2f ms %9.2f ms' % (name, big_secs * 1000,
+                                       small_secs * 1000))
+  return 0
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+lexer_bench.py - Compare lexer engines by parsing a corpus of shell scripts.
+
+Usage:
+  benchmarks/lexer_bench.py [--iters N] [FILE]...
+
+If no files are given, it uses tests/*.sh.  For each engine in core/lexer.py,
+it reports:
+
+- match: time to split every line into OUTER tokens with the engine alone.
+- parse: time to parse every file, which includes token allocation and the
+  parsers themselves.
+
+It also checks that the engines produce the same tokens and trees.
+"""
+
+import glob
+import optparse
+import os
+import sys
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+
+from core import alloc
+from core import lexer
+from core import reader
+
+from osh import cmd_parse
+from osh import lex
+from osh import word_parse
+
+
+# The parser never terminates on the unterminated here doc in this file.
+_SKIP = ['09-here-doc.sh']
+
+
+def _Parse(code_str, engine):
+  """Parse a whole file, returning (node, num_spans).
+
+  node is None if there was a parse error.
+  """
+  arena = alloc.Pool().NewArena()
+  arena.AddSourcePath('<bench>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  line_lexer = lexer.LineLexer(lex.LEXER_DEF, '', arena=arena, engine=engine)
+  lx = lexer.Lexer(line_lexer, line_reader)
+  w_parser = word_parse.WordParser(lx, line_reader)
+  c_parser = cmd_parse.CommandParser(w_parser, lx, line_reader)
+  try:
+    node = c_parser.ParseWholeFile()
+  except AssertionError:  # Some unimplemented constructs fail this way.
+    node = None
+  return node, arena.next_span_id
+
+
+def _MatchLines(lines, engine):
+  """Split lines into OUTER tokens, returning a list of (tok_type, tok_val)."""
+  matcher = lexer.ENGINES[engine](lex.LEXER_DEF[lex.LexMode.OUTER])
+  tokens = []
+  for line in lines:
+    pos = 0
+    n = len(line)
+    while pos < n:
+      pos, tok_type, tok_val = matcher.Match(line, pos)
+      tokens.append((tok_type, tok_val))
+  return tokens
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--iters', dest='iters', type='int', default=3,
+      help='Number of times to parse each file')
+  p.add_option(
+      '--engine', dest='engines', action='append', default=[],
+      help='Engine to benchmark (default: all engines)')
+  return p
+
+
+def main(argv):
+  (opts, paths) = Options().parse_args(argv[1:])
+  if not paths:
+    paths = sorted(
+        p for p in glob.glob(os.path.join(this_dir, '../tests/*.sh'))
+        if os.path.basename(p) not in _SKIP)
+  engines = opts.engines or sorted(lexer.ENGINES, reverse=True)
+
+  corpus = []
+  for path in paths:
+    with open(path) as f:
+      corpus.append((path, f.read()))
+
+  lines = []
+  for _, code_str in corpus:
+    lines.extend(code_str.splitlines(True))
+  print('%d files, %d lines, %d iterations' % (
+        len(corpus), len(lines), opts.iters))
+
+  num_diffs = 0
+
+  print()
+  print('match')
+  match_times = {}
+  token_lists = {}
+  for engine in engines:
+    start = time.time()
+    for _ in range(opts.iters):
+      token_lists[engine] = _MatchLines(lines, engine)
+    match_times[engine] = time.time() - start
+
+  base = match_times[engines[0]]
+  for engine in engines:
+    t = match_times[engine]
+    num_tokens = len(token_lists[engine])
+    print('  %-8s %8.3f s  %10.0f tokens/s  %5.2fx' % (
+          engine, t, num_tokens * opts.iters / t, base / t))
+    if token_lists[engine] != token_lists[engines[0]]:
+      print('DIFFERENT TOKENS with %s' % engine, file=sys.stderr)
+      num_diffs += 1
+
+  print()
+  print('parse')
+  parse_times = {}
+  trees = {}
+  for engine in engines:
+    start = time.time()
+    for _ in range(opts.iters):
+      for path, code_str in corpus:
+        node, num_spans = _Parse(code_str, engine)
+        trees[engine, path] = node
+    parse_times[engine] = time.time() - start
+
+  base = parse_times[engines[0]]
+  for engine in engines:
+    t = parse_times[engine]
+    print('  %-8s %8.3f s  %5.2fx' % (engine, t, base / t))
+
+  for _, path in sorted(k for k in trees if k[0] == engines[0]):
+    expected = trees[engines[0], path]
+    for engine in engines[1:]:
+      if trees[engine, path] != expected:
+        print('DIFFERENT TREE: %s with %s' % (path, engine), file=sys.stderr)
+        num_diffs += 1
+  return 1 if num_diffs else 0
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+loop_bench.py - Compare compiled commands with tree-walking in loops.
+
+Usage:
+  benchmarks/loop_bench.py [--runs N] [--loops N]
+
+Runs these loops in the shell's executor, first walking the tree for each
+command (as the shell used to), then with the commands compiled to closures:
+
+- while: a 'while' loop with a [[ ]] condition and an assignment.
+- for: a 'for' loop over constant words, with 'if', '&&', and '||'.
+- echo: a 'for' loop that runs 'echo' with constant arguments.
+
+Most of the commands are cheap, so the time is mostly spent dispatching on
+nodes.
+"""
+
+import optparse
+import os
+import sys
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+
+from core import alloc
+from core import builtin
+from core import cmd_exec
+from core import reader
+from core import ui
+
+from osh import parse_lib
+
+_WHILE_LOOP = '''\
+i=
+while [[ $i != %s ]]; do
+  i=${i}x
+  x=$i
+done
+'''
+
+_FOR_LOOP = '''\
+for i in %s; do
+  if [[ $i == 0 ]]; then
+    x=zero
+  elif [[ $i == 1 ]]; then
+    x=one
+  else
+    x=other
+  fi
+  [[ $x == one ]] && y=1 || y=0
+done
+'''
+
+_ECHO_LOOP = '''\
+for i in %s; do
+  echo hello world
+  echo -n one two three
+done
+'''
+
+
+def _Parse(code_str):
+  arena = alloc.Pool().NewArena()
+  arena.AddSourcePath('<bench>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  node = c_parser.ParseWholeFile()
+  if not node:
+    raise RuntimeError('Parse error')
+  return node
+
+
+def _Run(node, runs):
+  mem = cmd_exec.Mem('', [])
+  builtins = builtin.Builtins(ui.NullStatusLine())
+  ex = cmd_exec.Executor(mem, builtins, {}, {}, cmd_exec.ExecOpts(),
+                         parse_lib.MakeParserForExecutor)
+
+  # Send the output of 'echo' to /dev/null.
+  sys.stdout.flush()
+  saved = os.dup(1)
+  null_fd = os.open(os.devnull, os.O_WRONLY)
+  os.dup2(null_fd, 1)
+  os.close(null_fd)
+  try:
+    start = time.time()
+    for i in range(runs):
+      status = ex.Execute(node)
+    sys.stdout.flush()
+    elapsed = time.time() - start
+  finally:
+    os.dup2(saved, 1)
+    os.close(saved)
+  if status != 0:
+    raise RuntimeError('Loop failed with status %d' % status)
+  return elapsed / runs
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--runs', dest='runs', type='int', default=5,
+      help='Number of times to run each loop')
+  p.add_option(
+      '--loops', dest='loops', type='int', default=2000,
+      help='Number of iterations of each loop')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+
+  words = ' '.join(str(i) for i in range(opts.loops))
+  # The 'while' loop's variable grows by a character per iteration, so keep
+  # the string comparisons from dominating.
+  loops = [
+      ('while', _Parse(_WHILE_LOOP % ('x' * (opts.loops // 4)))),
+      ('for', _Parse(_FOR_LOOP % words)),
+      ('echo', _Parse(_ECHO_LOOP % words)),
+  ]
+
+  print('%-12s %10s %10s %10s' % ('executor', 'while', 'for', 'echo'))
+  for name, compile in [('tree-walk', False), ('compiled', True)]:
+    cmd_exec.COMPILE = compile
+    try:
+      secs = [_Run(node, opts.runs) for _, node in loops]
+    finally:
+      cmd_exec.COMPILE = True
+    print('%-12s %7.1f ms %7.1f ms %7.1f ms' % (
+        (name,) + tuple(s * 1000 for s in secs)))
+  return 0
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
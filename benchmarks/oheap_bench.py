@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+oheap_bench.py - Time to load an oheap file, eagerly and lazily.
+
+Usage:
+  benchmarks/oheap_bench.py [--copies N]...
+
+Writes a tree made of N copies of a small script, then reports:
+
+- eager: decode.DecodeRoot() on the file contents.
+- lazy: decode.OpenFile(), plus reading one command from the end.  This
+  should be roughly constant as N grows; only the top-level list of commands
+  is decoded.
+"""
+
+import io
+import optparse
+import os
+import sys
+import tempfile
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+
+from asdl import decode
+from asdl import encode
+from core import alloc
+from core import reader
+
+from osh import ast_ as ast
+from osh import parse_lib
+
+
+_SCRIPT = """\
+for f in "$dir"/*.log; do
+  case $f in
+    *.gz) echo "skip $f" ;;
+    *) cp "$f" "${f%.log}.bak" 2>/dev/null || echo "failed: $f" ;;
+  esac
+done
+"""
+
+
+def _WriteOheap(copies):
+  code_str = _SCRIPT * copies
+  arena = alloc.Pool().NewArena()
+  arena.AddSourcePath('<bench>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  node = c_parser.ParseWholeFile()
+  if not node:
+    raise RuntimeError('Parse error')
+
+  fd, path = tempfile.mkstemp(suffix='.oheap')
+  with os.fdopen(fd, 'wb') as f:
+    encode.EncodeRoot(node, encode.Params(), encode.BinOutput(f))
+  return path
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--copies', dest='copies', type='int', action='append', default=[],
+      help='Number of copies of the script in the tree (repeatable)')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+  sizes = opts.copies or [100, 1000, 5000]
+
+  print('%8s %10s %10s %10s' % ('copies', 'bytes', 'eager', 'lazy'))
+  for n in sizes:
+    path = _WriteOheap(n)
+    try:
+      size = os.path.getsize(path)
+
+      start = time.time()
+      with open(path, 'rb') as f:
+        node = decode.DecodeRoot(f.read(), ast, ast.command)
+      eager = time.time() - start
+
+      start = time.time()
+      view = decode.OpenFile(path, ast, ast.command)
+      last = view.children[-1]
+      if last.tag != node.children[-1].tag:
+        raise RuntimeError('Trees differ')
+      lazy = time.time() - start
+    finally:
+      os.remove(path)
+
+    print('%8d %10d %8.3f s %8.3f s' % (n, size, eager, lazy))
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+py_meta_bench.py - Compare checked and release mode for AST classes.
+
+Usage:
+  benchmarks/py_meta_bench.py [--nodes N] [--iters N] [FILE]...
+
+The mode is chosen when osh/ast_.py is imported, so each mode runs in its own
+process.  For each one, it reports:
+
+- bytes: the size of a token and a word part, including __dict__ and the
+  _assigned dict in checked mode.
+- construct: time to create N (LiteralPart (token ...)) pairs.
+- parse: time to parse every file, by default tests/*.sh.
+"""
+
+import glob
+import optparse
+import os
+import subprocess
+import sys
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+
+from asdl import py_meta
+
+# The parser never terminates on the unterminated here doc in this file.
+_SKIP = ['09-here-doc.sh']
+
+
+def _Size(obj):
+  size = sys.getsizeof(obj)
+  d = getattr(obj, '__dict__', None)
+  if d is not None:
+    size += sys.getsizeof(d)
+    if '_assigned' in d:
+      size += sys.getsizeof(d['_assigned'])
+  return size
+
+
+def _Parse(paths, iters):
+  from core import alloc
+  from core import reader
+  from osh import parse_lib
+
+  contents = []
+  for path in paths:
+    with open(path) as f:
+      contents.append(f.read())
+
+  start = time.time()
+  for i in range(iters):
+    for code_str in contents:
+      arena = alloc.Pool().NewArena()
+      arena.AddSourcePath('<bench>')
+      line_reader = reader.StringLineReader(code_str, arena=arena)
+      _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+      try:
+        c_parser.ParseWholeFile()
+      except AssertionError:  # Some unimplemented constructs fail this way.
+        pass
+  return time.time() - start
+
+
+def RunMode(opts, paths):
+  from core.id_kind import Id
+  from osh import ast_ as ast
+
+  token = ast.token(Id.Lit_Chars, 'foo', 1)
+  part = ast.LiteralPart(token)
+  node_bytes = _Size(token) + _Size(part)
+
+  start = time.time()
+  for i in range(opts.nodes):
+    ast.LiteralPart(ast.token(Id.Lit_Chars, 'foo', i))
+  construct = time.time() - start
+
+  parse = _Parse(paths, opts.iters)
+  print('%-8s %8d %10.3f s %10.3f s' % (
+      opts.mode, node_bytes, construct, parse))
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--nodes', dest='nodes', type='int', default=200000,
+      help='Number of token/part pairs to construct')
+  p.add_option(
+      '--iters', dest='iters', type='int', default=3,
+      help='Number of times to parse each file')
+  p.add_option(
+      '--mode', dest='mode', default=None, choices=['checked', 'release'],
+      help='Run one mode in this process (used internally)')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+  paths = args or sorted(
+      glob.glob(os.path.join(this_dir, '..', 'tests', '*.sh')))
+  paths = [p for p in paths if os.path.basename(p) not in _SKIP]
+
+  if opts.mode:
+    py_meta.RELEASE = (opts.mode == 'release')
+    RunMode(opts, paths)
+    return 0
+
+  print('%-8s %8s %12s %12s' % ('mode', 'bytes', 'construct', 'parse'))
+  for mode in ('checked', 'release'):
+    child_argv = [sys.executable, argv[0], '--mode', mode,
+                  '--nodes', str(opts.nodes), '--iters', str(opts.iters)]
+    out = subprocess.check_output(child_argv + paths)
+    # The parser prints warnings for some files, so only show the last line.
+    print(out.decode('utf-8').splitlines()[-1])
+  return 0
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
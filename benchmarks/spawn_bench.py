@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+spawn_bench.py - Compare fork() and posix_spawn() for external commands.
+
+Usage:
+  benchmarks/spawn_bench.py [--procs N] [--heap-mb N]...
+
+Runs 'true' N times with process.Process, the way the shell runs a simple
+command, with and without the posix_spawn() fast path.  The cost of fork()
+grows with the size of the interpreter's heap, so it's measured again after
+allocating each --heap-mb.
+
+posix_spawn() is only available in Python 3.8+.
+"""
+
+import optparse
+import os
+import sys
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+sys.path.append(os.path.join(this_dir, '..'))
+
+from core import process
+
+
+def _RunTrue(path, n):
+  start = time.time()
+  for i in range(n):
+    thunk = process.ExternalThunk(['true'], path=path)
+    status = process.Process(thunk).Run()
+    if status != 0:
+      raise RuntimeError('true failed with status %d' % status)
+  return time.time() - start
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--procs', dest='procs', type='int', default=10000,
+      help='Number of processes to start for each measurement')
+  p.add_option(
+      '--heap-mb', dest='heap_mb', type='int', action='append', default=[],
+      help='Size of the heap to allocate before measuring (repeatable)')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+  sizes = opts.heap_mb or [0, 500]
+
+  path = process.PathHash().Search('true', os.getenv('PATH', os.defpath))
+  if path is None:
+    raise RuntimeError("Couldn't find 'true' in $PATH")
+
+  modes = [('fork', False)]
+  if process.SPAWN:
+    modes.append(('spawn', True))
+  else:
+    print('posix_spawn() is unavailable; only measuring fork()')
+
+  print('%8s %8s %10s %12s' % ('heap', 'mode', 'total', 'per proc'))
+  heap = []
+  allocated = 0
+  for size in sorted(sizes):
+    # Many small objects, like the parser and interpreter create.  This is
+    # about 1 MB.
+    while allocated < size:
+      heap.append([str(i) for i in range(17000)])
+      allocated += 1
+    for name, spawn in modes:
+      process.SPAWN = spawn
+      secs = _RunTrue(path, opts.procs)
+      print('%6d MB %8s %8.2f s %9.1f us' % (
+          size, name, secs, secs / opts.procs * 1e6))
+  return 0
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+startup_bench.py - Check the startup time of the shell against a budget.
+
+Usage:
+  benchmarks/startup_bench.py [--runs N] [--scale F] [-- SHELL_ARG...]
+
+Runs 'bin/oil.py osh --startup-profile -c true' several times and reports the
+median of each phase that --startup-profile prints, plus 'interpreter': the
+wall time not covered by the profile, i.e. starting Python itself.
+
+It exits 1 if any phase is over its budget in BUDGETS, so it can be run
+before checking in.  The budgets are generous for a fast machine; pass
+--scale 2 on a slow one.  Byte code caching is left on, since that's how the
+shell is normally run.
+"""
+
+import optparse
+import os
+import subprocess
+import sys
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+OIL = os.path.join(this_dir, '..', 'bin', 'oil.py')
+
+# Milliseconds.  Measured at about half of these under Python 2.7.
+BUDGETS = {
+    'interpreter': 40.0,
+    'schemas': 40.0,  # osh.asdl and runtime.asdl, plus what they import
+    'imports': 15.0,
+    'options': 2.0,
+    'init': 2.0,  # Mem, builtins, Executor
+    'oilrc': 2.0,
+    'parser': 10.0,  # compiling the lexer's regexes
+    'run': 10.0,  # 'true'
+    'total': 110.0,  # not counting the interpreter
+}
+
+
+def _ParseProfile(stderr):
+  """Returns a dict of phase -> milliseconds."""
+  phases = {}
+  for line in stderr.splitlines():
+    parts = line.split()
+    if len(parts) == 3 and parts[2] == 'ms':
+      phases[parts[0]] = float(parts[1])
+  if 'total' not in phases:
+    raise RuntimeError('No profile in output: %r' % stderr)
+  return phases
+
+
+def _RunOnce(shell_args):
+  env = dict(os.environ)
+  env.pop('PYTHONDONTWRITEBYTECODE', None)
+  argv = [sys.executable, OIL, 'osh', '--startup-profile'] + shell_args
+
+  start = time.time()
+  p = subprocess.Popen(argv, env=env, stdout=subprocess.PIPE,
+                       stderr=subprocess.PIPE)
+  _, stderr = p.communicate()
+  wall_ms = (time.time() - start) * 1000
+  if p.returncode != 0:
+    raise RuntimeError('%s exited with status %d:\n%s' % (
+        argv, p.returncode, stderr.decode('utf-8')))
+
+  phases = _ParseProfile(stderr.decode('utf-8'))
+  phases['interpreter'] = wall_ms - phases['total']
+  return phases
+
+
+def _Median(values):
+  values = sorted(values)
+  return values[len(values) // 2]
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--runs', dest='runs', type='int', default=11,
+      help='Number of shell processes to start')
+  p.add_option(
+      '--scale', dest='scale', type='float', default=1.0,
+      help='Multiply every budget by this factor')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+  shell_args = args or ['-c', 'true']
+
+  _RunOnce(shell_args)  # write .pyc files and warm up the OS
+  runs = [_RunOnce(shell_args) for i in range(opts.runs)]
+
+  # The order the shell reports them in, with the interpreter first.
+  names = ['interpreter', 'schemas', 'imports', 'options', 'init', 'oilrc',
+           'parser', 'completion', 'run', 'total']
+  over = []
+  print('%-12s %10s %10s' % ('phase', 'median', 'budget'))
+  for name in names:
+    if name not in runs[0]:
+      continue  # e.g. completion is only initialized in interactive mode
+    ms = _Median([r[name] for r in runs])
+    budget = BUDGETS.get(name)
+    if budget is None:
+      print('%-12s %7.2f ms' % (name, ms))
+      continue
+    budget *= opts.scale
+    print('%-12s %7.2f ms %7.2f ms' % (name, ms, budget))
+    if ms > budget:
+      over.append(name)
+
+  if over:
+    print('FAIL: over budget: %s' % ', '.join(over), file=sys.stderr)
+    return 1
+  return 0
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+from __future__ import print_function
+"""
+streaming_bench.py - Time to first command and peak RSS vs. script length.
+
+Usage:
+  benchmarks/streaming_bench.py [--lines N]...
+
+Generates scripts that print a line, then do N assignments, and runs each one
+with 'bin/oil.py osh SCRIPT'.  Scripts are parsed and executed one command
+line at a time, so both numbers should be roughly constant as N grows.
+"""
+
+import optparse
+import os
+import sys
+import tempfile
+import time
+
+this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+OIL = os.path.join(this_dir, '..', 'bin', 'oil.py')
+
+
+def _WriteScript(num_lines):
+  fd, path = tempfile.mkstemp(suffix='.sh')
+  with os.fdopen(fd, 'w') as f:
+    f.write('echo first\n')
+    for i in range(num_lines):
+      f.write('x%d=%d\n' % (i % 100, i))
+  return path
+
+
+def _Run(script_path):
+  """Returns (seconds to first output line, total seconds, peak RSS in KB)."""
+  r, w = os.pipe()
+  start = time.time()
+  pid = os.fork()
+  if pid == 0:
+    os.close(r)
+    os.dup2(w, 1)
+    os.close(w)
+    os.execvp(sys.executable, [sys.executable, OIL, 'osh', script_path])
+
+  os.close(w)
+  first = None
+  buf = b''
+  while True:
+    chunk = os.read(r, 4096)
+    if not chunk:
+      break
+    buf += chunk
+    if first is None and b'\n' in buf:
+      first = time.time() - start
+  os.close(r)
+
+  _, status, rusage = os.wait4(pid, 0)
+  total = time.time() - start
+  if status != 0:
+    raise RuntimeError('%s failed with status %d' % (script_path, status))
+  return first, total, rusage.ru_maxrss
+
+
+def Options():
+  p = optparse.OptionParser()
+  p.add_option(
+      '--lines', dest='lines', type='int', action='append', default=[],
+      help='Number of assignments after the first command (repeatable)')
+  return p
+
+
+def main(argv):
+  (opts, args) = Options().parse_args(argv[1:])
+  sizes = opts.lines or [1000, 10000, 50000]
+
+  print('%10s %16s %10s %12s' % ('lines', 'first command', 'total', 'peak RSS'))
+  for n in sizes:
+    path = _WriteScript(n)
+    try:
+      first, total, rss_kb = _Run(path)
+    finally:
+      os.remove(path)
+    print('%10d %14.3f s %8.2f s %9d KB' % (n, first, total, rss_kb))
+
+
+if __name__ == '__main__':
+  try:
+    sys.exit(main(sys.argv))
+  except RuntimeError as e:
+    print('FATAL: %s' % e, file=sys.stderr)
+    sys.exit(1)
@@ -24,16 +24,31 @@ Builtins that can be exposed:
 """
 
 import errno
+import fcntl
 import optparse
 import os
 import re
 import sys
+import time
 import traceback  # for debugging
 
+# For --startup-profile
+_START_TIME = time.time()
+
 # TODO: Set PTYHONPATH from outside?
 this_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
 sys.path.append(os.path.join(this_dir, '..'))
 
+from asdl import py_meta
+# Create AST nodes without type checks, unless debugging.  This has to be set
+# before the modules below load the schemas.
+py_meta.RELEASE = not os.getenv('OSH_TYPE_CHECK')
+
+from osh import ast_ as ast
+from core import runtime
+
+_SCHEMAS_LOADED = time.time()
+
 from asdl import format as fmt
 from asdl import encode
 
@@ -41,7 +56,7 @@ from osh import word_parse  # for tracing
 from osh import cmd_parse  # for tracing
 from core import lexer  # for tracing
 
-from osh import ast_ as ast
+from osh import ast_cache
 from osh import parse_lib
 from osh import fix
 
@@ -56,6 +71,8 @@ from core import word_eval
 from core import ui
 from core import util
 
+_IMPORTS_DONE = time.time()
+
 log = util.log
 
 
@@ -63,7 +80,7 @@ class UsageError(RuntimeError):
   """ Exception for incorrect command line usage. """
 
 
-def InteractiveLoop(opts, ex, c_parser, w_parser, line_reader):
+def InteractiveLoop(opts, ex, c_parser, w_parser, line_reader, arena):
   # Is this correct?  Are there any non-ANSI terminals?  I guess you can pass
   # -i but redirect stdout.
   if opts.ast_output == '-':
@@ -75,6 +92,7 @@ def InteractiveLoop(opts, ex, c_parser, w_parser, line_reader):
     ast_f = None
 
   while True:
+    mark = arena.Mark()
     try:
       w = c_parser.Peek()
     except KeyboardInterrupt:
@@ -107,10 +125,10 @@ def InteractiveLoop(opts, ex, c_parser, w_parser, line_reader):
       if opts.print_status:
         print('STATUS', repr(status))
 
-    # Reset prompt and clear memory.  TODO: If there are any function
-    # definitions ANYWHERE in the node, you should not clear the underlying
-    # memory.  We still need to execute those strings!
+    # Reset prompt and clear memory.  If the command defined a function, the
+    # executor pinned the arena, and its lines and spans are kept.
     line_reader.Reset()
+    arena.ReleaseToMark(mark)
 
     # Reset internal newline state.
     # NOTE: It would actually be correct to reinitialize all objects (except
@@ -142,6 +160,17 @@ def Options():
       '--ast-format', dest='ast_format', default='abbrev-text',
       choices=['text', 'abbrev-text', 'html', 'abbrev-html', 'oheap'],
       help='What format to use for the AST (text or html)')
+  p.add_option(
+      '--ast-cache', dest='ast_cache', metavar='DIR',
+      default=os.getenv('OSH_AST_CACHE_DIR'),
+      help='Cache parsed scripts and sourced files in this directory '
+           '(default: $OSH_AST_CACHE_DIR)')
+  p.add_option(
+      '--pipeline-times', dest='pipeline_times', metavar='FILE',
+      default=os.getenv('OSH_PIPELINE_TIMES'),
+      help='Append the exit status and resource usage of each stage of each '
+           'pipeline to this file; - for stderr '
+           '(default: $OSH_PIPELINE_TIMES)')
   p.add_option(
       '--fix', dest='fix', action='store_true',
       default=False,
@@ -154,6 +183,10 @@ def Options():
       '--print-status', dest='print_status', action='store_true',
       default=False,
       help='Print command status after execution')
+  p.add_option(
+      '--startup-profile', dest='startup_profile', action='store_true',
+      default=False,
+      help='Print how long each phase of startup took to stderr')
   p.add_option(
       '--trace', dest='trace', action='append', default=[],
       help='Method calls to trace: lexer|wp|cp')
@@ -179,10 +212,73 @@ def Options():
 # bash --noprofile --norc uses 'bash-4.3$ '
 OSH_PS1 = 'osh$ '
 
+# Like bash's fd 255: the script is read through a descriptor that redirects
+# like 'exec 3< file' and 'read x <<EOF' don't touch.
+_SCRIPT_FD_MIN = 100
+
+
+def _OpenScriptFd(fd):
+  """Return a file object for reading a script from a copy of fd."""
+  new_fd = fcntl.fcntl(fd, fcntl.F_DUPFD, _SCRIPT_FD_MIN)
+  fcntl.fcntl(new_fd, fcntl.F_SETFD, fcntl.FD_CLOEXEC)  # not for children
+  return os.fdopen(new_fd)
+
+
+def _OpenPipelineLog(path):
+  """Open the file for --pipeline-times, out of the way of user redirects."""
+  if path == '-':
+    return sys.stderr
+  fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+  new_fd = fcntl.fcntl(fd, fcntl.F_DUPFD, _SCRIPT_FD_MIN)
+  os.close(fd)
+  fcntl.fcntl(new_fd, fcntl.F_SETFD, fcntl.FD_CLOEXEC)  # not for children
+  return os.fdopen(new_fd, 'w')
+
+
+def _ExecuteCachedScript(ex, cache, script_name, f, arena):
+  """Execute a script, using the cached tree if it's up to date.
+
+  Unlike ExecuteLoop(), this parses the whole file before running it, so the
+  tree can be saved.
+
+  Returns:
+    The exit status, or None if there was a parse error.
+  """
+  mtime = os.fstat(f.fileno()).st_mtime
+  contents = f.read()
+  f.close()
+
+  node = cache.Lookup(script_name, mtime, contents)
+  if node is None:
+    line_reader = reader.StringLineReader(contents, arena=arena)
+    _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+    node = c_parser.ParseWholeFile()
+    if not node:
+      ui.PrintError(c_parser.Error(), arena, sys.stderr)
+      return None
+    cache.Store(script_name, mtime, contents, node)
+
+  return ex.Execute(node)
+
 
 def OshMain(argv):
   (opts, argv) = Options().parse_args(argv)
 
+  timer = util.PhaseTimer(_START_TIME)
+  timer.Mark('schemas', _SCHEMAS_LOADED)
+  timer.Mark('imports', _IMPORTS_DONE)
+  timer.Mark('options')
+  pid = os.getpid()
+  try:
+    return _OshMain(opts, argv, timer)
+  finally:
+    # Forked children also unwind through here, with sys.exit().
+    if opts.startup_profile and os.getpid() == pid:
+      timer.Mark('run')
+      timer.Report(sys.stderr)
+
+
+def _OshMain(opts, argv, timer):
   state = util.TraceState()
   if 'cp' in opts.trace:
     util.WrapMethods(cmd_parse.CommandParser, state)
@@ -201,7 +297,7 @@ def OshMain(argv):
   # It uses a different memory-management model.  It's a batch program and not
   # an interactive program.
 
-  pool = Pool()
+  pool = Pool(compact=True)
   arena = pool.NewArena()
 
   # TODO: Maybe wrap this initialization sequence up in an oil_State, like
@@ -214,13 +310,18 @@ def OshMain(argv):
   # Passed to Executor for 'complete', and passed to completion.Init
   comp_lookup = completion.CompletionLookup()
   exec_opts = cmd_exec.ExecOpts()
+  cache = ast_cache.AstCache(opts.ast_cache) if opts.ast_cache else None
+  pipeline_log = (
+      _OpenPipelineLog(opts.pipeline_times) if opts.pipeline_times else None)
 
   # TODO: How to get a handle to initialized builtins here?
   # tokens.py has it.  I think you just make a separate table, with
   # metaprogramming.
   ex = cmd_exec.Executor(
       mem, builtins, funcs, comp_lookup, exec_opts,
-      parse_lib.MakeParserForExecutor)
+      parse_lib.MakeParserForExecutor, arena=arena, ast_cache=cache,
+      pipeline_log=pipeline_log)
+  timer.Mark('init')
 
   # NOTE: The rc file can contain both commands and functions... ideally we
   # would only want to save nodes/lines for the functions.
@@ -247,7 +348,9 @@ def OshMain(argv):
   except IOError as e:
     if e.errno != errno.ENOENT:
       raise
+  timer.Mark('oilrc')
 
+  script_path = None  # set if we're running a script file
   if opts.command is not None:
     arena.AddSourcePath('<-c arg>')
     line_reader = reader.StringLineReader(opts.command, arena=arena)
@@ -266,33 +369,50 @@ def OshMain(argv):
         interactive = True
       else:
         arena.AddSourcePath('<stdin>')
-        line_reader = reader.StringLineReader(sys.stdin.read(), arena=arena)
+        f = _OpenScriptFd(sys.stdin.fileno())
+        line_reader = reader.FileLineReader(f, arena=arena)
         interactive = False
     else:
       arena.AddSourcePath(script_name)
-      with open(script_name) as f:
-        line_reader = reader.StringLineReader(f.read(), arena=arena)
+      with open(script_name) as script_f:
+        f = _OpenScriptFd(script_f.fileno())
+      script_path = script_name
+      line_reader = reader.FileLineReader(f, arena=arena)
       interactive = False
 
   # TODO: assert arena.NumSourcePaths() == 1
   # TODO: .rc file needs its own arena.
   w_parser, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  timer.Mark('parser')
 
   if interactive:
     # NOTE: We're using a different evaluator here.  The completion system can
     # also run functions... it gets the Executor through Executor._Complete.
     ev = word_eval.CompletionWordEvaluator(mem, exec_opts)
     completion.Init(builtins, mem, funcs, comp_lookup, status_lines, ev)
+    timer.Mark('completion')
 
     # TODO: Could instantiate "printer" instead of showing ops
-    InteractiveLoop(opts, ex, c_parser, w_parser, line_reader)
+    InteractiveLoop(opts, ex, c_parser, w_parser, line_reader, arena)
     status = 0  # TODO: set code
+  elif cache and script_path and opts.do_exec and not opts.ast_output and (
+      not opts.fix):
+    status = _ExecuteCachedScript(ex, cache, script_path, f, arena)
+    if status is None:
+      return 2  # parse error is code 2
+  elif opts.do_exec and not opts.ast_output and not opts.fix:
+    # Execute each command as soon as it's parsed, so memory and startup time
+    # don't depend on the length of the script.
+    status = ex.ExecuteLoop(c_parser, w_parser, arena=arena)
+    if status is None:
+      err = c_parser.Error()
+      ui.PrintError(err, arena, sys.stderr)
+      return 2  # parse error is code 2
   else:
     # Parse the whole thing up front
     #print('Parsing file')
 
-    # TODO: Do I need ParseAndEvalLoop?  How is it different than
-    # InteractiveLoop?
+    # The AST is printed or converted, so we need the whole thing.
     node = c_parser.ParseWholeFile()
     if not node:
       err = c_parser.Error()
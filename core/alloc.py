@@ -8,6 +8,11 @@ Right after executing, you remove the arena from the pool.
 Better names?  I think pool is the higher level, and arena is the lower level.
 """
 
+import array
+
+from osh import ast_ as ast
+
+
 class Arena(object):
   """A collection of lines and line spans.
 
@@ -41,6 +46,10 @@ class Arena(object):
     self.debug_info = []  # list of (src_path index, physical line number)
     self.src_paths = []  # list of source paths
     self.src_index = -1  # index of current source file
+    self.src_stack = []  # saved src_index values, for PushSource()
+
+    # ReleaseToMark() never frees anything below this.  See Pin().
+    self.pinned = (0, 0, 0)
 
   def IsComplete(self):
     """Return whether we have a full set of lines -- none of which was cleared.
@@ -51,7 +60,18 @@ class Arena(object):
   def AddSourcePath(self, src_path):
     # TODO: Should this be part of the pool?
     self.src_paths.append(src_path)
-    self.src_index += 1
+    self.src_index = len(self.src_paths) - 1
+
+  def PushSource(self, src_path):
+    """Like AddSourcePath, but PopSource() goes back to the current file.
+
+    For the 'source' builtin.
+    """
+    self.src_stack.append(self.src_index)
+    self.AddSourcePath(src_path)
+
+  def PopSource(self):
+    self.src_index = self.src_stack.pop()
 
   def AddLine(self, line, line_num):
     """
@@ -86,14 +106,57 @@ class Arena(object):
     self.next_span_id += 1
     return span_id
 
+  def NewLineSpan(self, line_id, col, length):
+    """Like AddLineSpan, but the caller doesn't allocate a line_span.
+
+    This is what the lexer calls for every token.
+    """
+    return self.AddLineSpan(ast.line_span(line_id, col, length))
+
   def GetLineSpan(self, span_id):
     assert span_id >= 0, span_id
     return self.spans[span_id]
 
+  def NumSpans(self):
+    return self.next_span_id
+
+  def _GetDebugPair(self, line_id):
+    return self.debug_info[line_id]
+
+  def Mark(self):
+    """Return the current position, to pass to ReleaseToMark() later."""
+    return self.next_line_id, self.next_span_id, len(self.src_paths)
+
+  def Pin(self):
+    """Keep everything added so far, even if ReleaseToMark() is called.
+
+    The executor calls this when it defines a function, because the function
+    body refers to spans in this arena and will be executed later.
+    """
+    self.pinned = self.Mark()
+
+  def ReleaseToMark(self, mark):
+    """Free the lines, spans, and source paths added since Mark().
+
+    This is like popstackmark() in dash.  It's called after executing a
+    top-level command, and IDs are reused by the next command.
+    """
+    line_id, span_id, num_paths = [
+        max(a, b) for a, b in zip(mark, self.pinned)]
+    self._Truncate(line_id, span_id)
+    del self.src_paths[num_paths:]
+    self.next_line_id = line_id
+    self.next_span_id = span_id
+
+  def _Truncate(self, line_id, span_id):
+    del self.lines[line_id:]
+    del self.debug_info[line_id:]
+    del self.spans[span_id:]
+
   def GetDebugInfo(self, line_id):
     """Get the path and physical line number, for parse errors."""
     assert line_id >= 0
-    src_index, line_num = self.debug_info[line_id]
+    src_index, line_num = self._GetDebugPair(line_id)
     try:
       path = self.src_paths[src_index]
     except IndexError:
@@ -102,6 +165,62 @@ class Arena(object):
     return path, line_num
 
 
+class CompactArena(Arena):
+  """An arena that stores spans and debug info in parallel integer arrays.
+
+  The lexer adds a span for every token, so for big scripts, a line_span
+  object per token takes a lot of memory.  Here a span is 3 machine integers,
+  and a line_span object is only created when someone asks for it with
+  GetLineSpan(), e.g. to print an error.
+  """
+  def __init__(self, arena_id):
+    Arena.__init__(self, arena_id)
+    self.spans = None  # Use the columns below instead
+    self.span_line_ids = array.array('i')
+    self.span_cols = array.array('i')
+    self.span_lengths = array.array('i')
+
+    self.debug_info = None
+    self.line_src_indices = array.array('i')
+    self.line_nums = array.array('i')
+
+  def AddLine(self, line, line_num):
+    line_id = self.next_line_id
+    self.lines.append(line)
+    self.next_line_id += 1
+    self.line_src_indices.append(self.src_index)
+    self.line_nums.append(line_num)
+    return line_id
+
+  def AddLineSpan(self, line_span):
+    return self.NewLineSpan(line_span.line_id, line_span.col, line_span.length)
+
+  def NewLineSpan(self, line_id, col, length):
+    span_id = self.next_span_id
+    self.span_line_ids.append(line_id)
+    self.span_cols.append(col)
+    self.span_lengths.append(length)
+    self.next_span_id += 1
+    return span_id
+
+  def GetLineSpan(self, span_id):
+    assert span_id >= 0, span_id
+    return ast.line_span(
+        self.span_line_ids[span_id], self.span_cols[span_id],
+        self.span_lengths[span_id])
+
+  def _GetDebugPair(self, line_id):
+    return self.line_src_indices[line_id], self.line_nums[line_id]
+
+  def _Truncate(self, line_id, span_id):
+    del self.lines[line_id:]
+    del self.line_src_indices[line_id:]
+    del self.line_nums[line_id:]
+    del self.span_line_ids[span_id:]
+    del self.span_cols[span_id:]
+    del self.span_lengths[span_id:]
+
+
 # In C++, InteractiveLineReader and StringLineReader should use the same
 # representation: std::string with internal NULs to terminate lines, and then
 # std::vector<char*> that points into to it.
@@ -129,7 +248,12 @@ class Pool(object):
     We also want to clean up in embedded mode.  the oil_Init() and
     oil_Destroy() methods of the API should do this.
   """
-  def __init__(self):
+  def __init__(self, compact=False):
+    """
+    Args:
+      compact: If true, create CompactArena instances instead of Arena.
+    """
+    self.arena_class = CompactArena if compact else Arena
     self.arenas = []
     self.next_arena_id = 0
 
@@ -140,7 +264,7 @@ class Pool(object):
   # only destroy the top/last arena.
   def NewArena(self):
     """Call this after parsing anything that you might want to destroy."""
-    a = Arena(self.next_arena_id)
+    a = self.arena_class(self.next_arena_id)
     self.next_arena_id += 1
     self.arenas.append(a)
     return a
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+alloc_test.py: Tests for alloc.py
+"""
+
+import unittest
+
+from core import alloc
+from core import reader
+
+from osh import parse_lib
+
+
+def _ParseWithPool(pool, code_str):
+  arena = pool.NewArena()
+  arena.AddSourcePath('<test>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  node = c_parser.ParseWholeFile()
+  assert node is not None, c_parser.Error()
+  return arena
+
+
+class AllocTest(unittest.TestCase):
+
+  def testPool(self):
+    pool = alloc.Pool()
+    self.assertEqual(alloc.Arena, type(pool.NewArena()))
+
+    pool = alloc.Pool(compact=True)
+    self.assertEqual(alloc.CompactArena, type(pool.NewArena()))
+
+  def testCompactArenaMatchesArena(self):
+    code_str = 'echo hi\nfor x in a b; do\n  echo "$x" > out\ndone\n'
+    a1 = _ParseWithPool(alloc.Pool(), code_str)
+    a2 = _ParseWithPool(alloc.Pool(compact=True), code_str)
+
+    self.assertEqual(a1.NumSpans(), a2.NumSpans())
+    self.assertTrue(a2.NumSpans() > 0)
+    for i in range(a1.NumSpans()):
+      s1 = a1.GetLineSpan(i)
+      s2 = a2.GetLineSpan(i)
+      self.assertEqual(
+          (s1.line_id, s1.col, s1.length), (s2.line_id, s2.col, s2.length))
+
+    for line_id in range(a1.next_line_id):
+      self.assertEqual(a1.GetDebugInfo(line_id), a2.GetDebugInfo(line_id))
+
+  def testReleaseToMark(self):
+    for compact in (False, True):
+      arena = alloc.Pool(compact=compact).NewArena()
+      arena.AddSourcePath('<test>')
+      arena.AddLine('echo a\n', 1)
+      arena.NewLineSpan(0, 0, 4)
+      mark = arena.Mark()
+
+      line_id = arena.AddLine('echo b\n', 2)
+      arena.NewLineSpan(line_id, 0, 4)
+      arena.ReleaseToMark(mark)
+      self.assertEqual(mark, arena.Mark())
+      self.assertEqual(('<test>', 1), arena.GetDebugInfo(0))
+
+      # IDs are reused
+      line_id = arena.AddLine('f() { echo c; }\n', 3)
+      self.assertEqual(1, line_id)
+      self.assertEqual(1, arena.NewLineSpan(line_id, 0, 1))
+      arena.Pin()
+      arena.ReleaseToMark(mark)
+      self.assertEqual((2, 2, 1), arena.Mark())
+      self.assertEqual('f', alloc.SpanValue(arena.GetLineSpan(1), arena))
+
+
+if __name__ == '__main__':
+  unittest.main()
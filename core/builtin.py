@@ -114,8 +114,38 @@ EBuiltin = util.Enum('EBuiltin', """
 NONE READ ECHO CD PUSHD POPD
 EXPORT
 EXIT SOURCE DOT TRAP EVAL EXEC SET COMPLETE COMPGEN DEBUG_LINE
+HASH WAIT
 """.split())
 
+# argv[0] -> EBuiltin.  Resolved for every simple command.
+_BUILTIN_IDS = {
+    'read': EBuiltin.READ,
+    'echo': EBuiltin.ECHO,
+    'cd': EBuiltin.CD,
+    'pushd': EBuiltin.PUSHD,
+    'popd': EBuiltin.POPD,
+
+    'export': EBuiltin.EXPORT,
+
+    'exit': EBuiltin.EXIT,
+
+    'source': EBuiltin.SOURCE,
+    '.': EBuiltin.DOT,
+
+    'trap': EBuiltin.TRAP,
+    'eval': EBuiltin.EVAL,
+    'exec': EBuiltin.EXEC,
+
+    'set': EBuiltin.SET,
+    'complete': EBuiltin.COMPLETE,
+    'compgen': EBuiltin.COMPGEN,
+
+    'debug-line': EBuiltin.DEBUG_LINE,
+
+    'hash': EBuiltin.HASH,
+    'wait': EBuiltin.WAIT,
+}
+
 
 # These can't be redefined by functions.
 # http://pubs.opengroup.org/onlinepubs/9699919799/utilities/V3_chap02.html#tag_18_14
@@ -272,6 +302,9 @@ BUILTINS = [
     # TODO: compgen should instead be a config file?
     BuiltinDef("compgen", NO_ARGS),
     BuiltinDef("debug-line", NO_ARGS),
+
+    BuiltinDef("hash", NO_ARGS),
+    BuiltinDef("wait", NO_ARGS),
 ]
 
 
@@ -319,47 +352,7 @@ class Builtins(object):
     # would be nice.
 
     # TODO: Use BuiltinDef instances in BUILTINS to initialize.
-
-    if argv0 == "read":
-      return EBuiltin.READ
-    elif argv0 == "echo":
-      return EBuiltin.ECHO
-    elif argv0 == "cd":
-      return EBuiltin.CD
-    elif argv0 == "pushd":
-      return EBuiltin.PUSHD
-    elif argv0 == "popd":
-      return EBuiltin.POPD
-
-    elif argv0 == "export":
-      return EBuiltin.EXPORT
-
-    elif argv0 == "exit":
-      return EBuiltin.EXIT
-
-    elif argv0 == "source":
-      return EBuiltin.SOURCE
-    elif argv0 == ".":
-      return EBuiltin.DOT
-
-    elif argv0 == "trap":
-      return EBuiltin.TRAP
-    elif argv0 == "eval":
-      return EBuiltin.EVAL
-    elif argv0 == "exec":
-      return EBuiltin.EXEC
-
-    elif argv0 == "set":
-      return EBuiltin.SET
-    elif argv0 == "complete":
-      return EBuiltin.COMPLETE
-    elif argv0 == "compgen":
-      return EBuiltin.COMPGEN
-
-    elif argv0 == "debug-line":
-      return EBuiltin.DEBUG_LINE
-
-    return EBuiltin.NONE
+    return _BUILTIN_IDS.get(argv0, EBuiltin.NONE)
 
 
 def main(argv):
@@ -57,13 +57,16 @@ $ < Makefile cat | < NOTES.txt head
 This just does head?  Last one wins.
 """
 
+import getopt
 import os
 import stat
 import sys
 
 from core import braces
+from core import compile as compile_
 from core import completion
 from core import expr_eval
+from core import word
 from core import word_eval
 from core import util
 
@@ -72,7 +75,8 @@ from core.id_kind import Id, RedirType, REDIR_TYPE
 from core.process import (
     FdState, Pipeline, Process,
     HereDocRedirect, DescriptorRedirect, FilenameRedirect,
-    FuncThunk, ExternalThunk, SubProgramThunk, BuiltinThunk)
+    FuncThunk, ExternalThunk, SubProgramThunk, BuiltinThunk, PathHash,
+    JobState, OpenAnonymousFile, ReadRecord)
 from core import runtime
 try:
   from core import libc  # for fnmatch
@@ -87,6 +91,95 @@ value_e = runtime.value_e
 log = util.log
 
 
+def _Unescape(s, ifs, escaped):
+  """Remove the backslashes from a line that 'read' got without -r.
+
+  Escaped IFS characters are replaced with NUL, so they aren't split on, and
+  appended to 'escaped'.
+
+  Returns:
+    (unescaped string, whether it ended with a backslash)
+  """
+  parts = []
+  i = 0
+  n = len(s)
+  while i < n:
+    j = s.find('\\', i)
+    if j == -1:
+      parts.append(s[i:])
+      break
+    parts.append(s[i:j])
+    if j + 1 == n:
+      return ''.join(parts), True
+    c = s[j + 1]
+    if c == '\n':
+      pass  # line continuation, when the delimiter isn't a newline
+    elif c in ifs:
+      escaped.append(c)
+      parts.append('\0')
+    else:
+      parts.append(c)
+    i = j + 2
+  return ''.join(parts), False
+
+
+def _SplitForRead(line, ifs, num_names):
+  """Split a line into values for the names passed to 'read'.
+
+  Like word splitting, except the last name gets the rest of the line, with
+  its trailing IFS whitespace removed.
+  """
+  ifs_whitespace = ''.join(c for c in ifs if c in ' \t\n')
+  rest = line.lstrip(ifs_whitespace) if ifs_whitespace else line
+
+  values = []
+  for i in range(num_names - 1):
+    if rest:
+      frags = word_eval._IfsSplit(rest, ifs, max_split=1)
+      values.append(frags[0])
+      rest = frags[1] if len(frags) == 2 else ''
+    else:
+      values.append('')
+
+  if rest:
+    # A single field followed by a delimiter loses the delimiter, e.g. with
+    # IFS=, 'read a b' of '1,2,' sets b to 2.
+    frags = word_eval._IfsSplit(rest, ifs, max_split=1)
+    if len(frags) == 2 and not frags[1]:
+      rest = frags[0]
+    elif ifs_whitespace:
+      rest = rest.rstrip(ifs_whitespace)
+  values.append(rest)
+  return values
+
+
+def _RestoreEscaped(values, escaped):
+  """Put back the characters that _Unescape replaced with NUL, in order."""
+  it = iter(escaped)
+  out = []
+  for v in values:
+    if '\0' in v:
+      v = ''.join(next(it) if c == '\0' else c for c in v)
+    out.append(v)
+  return out
+
+
+# Run $(...) in this process when it only calls builtins in this list and
+# functions.  Set to False to always fork, e.g. for benchmarks.
+CMD_SUB_IN_PROCESS = True
+
+# Run commands by compiling them to closures with compile.py.  Set to False to
+# walk the tree instead, e.g. for benchmarks.
+COMPILE = True
+
+# Bound on the number of nodes Executor caches the compiled form of.
+_MAX_COMPILED = 1000
+
+# Builtins that only write to stdout.  Others could change the state of the
+# shell, e.g. cd, or read from stdin, e.g. read.
+_IN_PROCESS_BUILTINS = (EBuiltin.ECHO,)
+
+
 class ExecOpts(object):
 
   def __init__(self):
@@ -98,21 +191,51 @@ class ExecOpts(object):
     self.bash_array = True
 
 
+# The scope of a function call or a temporary binding that hasn't set any
+# variables yet.  It's shared, so it must never be written to; see
+# Mem._LocalScope().
+_EMPTY_SCOPE = {}
+
+
 class Mem(object):
   """For storing variables.
   
   Mem is better than "Env" -- Env implies OS stuff.
   """
 
-  def __init__(self, argv0, argv):
+  def __init__(self, argv0, argv, environ=None):
+    """
+    Args:
+      argv0: for $0
+      argv: for $@
+      environ: the environment to import variables from.  By default it's
+        the environment of this process.
+    """
     self.top = {}  # string -> runtime.cell
     self.var_stack = [self.top]
     self.argv0 = argv0
     self.argv_stack = [argv]
     self.last_status = 0  # Mutable public variable
+    self.pipe_status = [0]  # For PIPESTATUS; also mutable and public
+    self.last_job_id = -1  # For $!; the pid of the last background job
+
+    # name -> the cell Get() finds, or None.  An entry is removed when a cell
+    # with that name is created or popped, so lookups don't walk the stack.
+    self.cache = {}
 
+    # The environment of external commands.  It's updated by name when an
+    # exported variable changes, rather than rebuilt for every command.
+    self.exported = {}
+
+    self._InitEnviron(os.environ if environ is None else environ)
     self._InitDefaults()
 
+  def _InitEnviron(self, environ):
+    """Import the environment once, as exported globals."""
+    for name, s in environ.items():
+      self.top[name] = runtime.cell(runtime.Str(s), True, False)
+    self.exported.update(environ)
+
   def _InitDefaults(self):
     # Default value; user may unset it.
     # $ echo -n "$IFS" | python -c 'import sys;print repr(sys.stdin.read())'
@@ -125,20 +248,64 @@ class Mem(object):
   #
 
   def Push(self, argv):
-    self.var_stack.append({})
+    self.var_stack.append(_EMPTY_SCOPE)  # allocated by the first local
     self.argv_stack.append(argv)
 
   def Pop(self):
-    self.var_stack.pop()
+    self._PopScope()
     self.argv_stack.pop()
 
   def PushTemp(self):
     """For FOO=bar BAR=baz command."""
-    self.var_stack.append({})
+    self.var_stack.append(_EMPTY_SCOPE)
 
   def PopTemp(self):
     """For FOO=bar BAR=baz command."""
-    self.var_stack.pop()
+    self._PopScope()
+
+  def _PopScope(self):
+    scope = self.var_stack.pop()
+    cache = self.cache
+    for name, cell in scope.items():
+      cache.pop(name, None)
+      if cell.exported:
+        self._UpdateExported(name)
+
+  def Save(self):
+    """For a subshell that runs in this process, e.g. $(myfunc).
+
+    Returns:
+      An opaque object to pass to Restore(), which undoes every change to
+      variables and argv made in between.
+    """
+    # Cells are mutated in place, so save their fields too.  Values are never
+    # mutated.
+    scopes = []
+    for scope in self.var_stack:
+      cells = [(c, c.val, c.exported, c.readonly) for c in scope.values()]
+      scopes.append((scope, dict(scope), cells))
+    return (scopes, list(self.argv_stack), self.last_status,
+            self.pipe_status, self.last_job_id)
+
+  def Restore(self, saved):
+    scopes, argv_stack, self.last_status, self.pipe_status, \
+        self.last_job_id = saved
+    self.var_stack[:] = [scope for scope, _, _ in scopes]
+    for scope, items, cells in scopes:
+      scope.clear()
+      scope.update(items)
+      for c, val, exported, readonly in cells:
+        c.val = val
+        c.exported = exported
+        c.readonly = readonly
+    self.argv_stack[:] = argv_stack
+
+    self.cache.clear()
+    self.exported.clear()
+    for scope in self.var_stack:
+      for name, cell in scope.items():
+        if cell.exported:
+          self._UpdateExported(name)
 
   def GetTraceback(self, token):
     """For runtime and parse time errors."""
@@ -176,17 +343,31 @@ class Mem(object):
     # oilopt?
     pass
 
+  def _SetCell(self, scope, name, val):
+    #log('SETTING %s -> %s', name, val)
+    assert val.tag in (value_e.Str, value_e.StrArray)
+
+    if name in scope:
+      # Preserve cell flags.  For example, could be Undef and exported!
+      cell = scope[name]
+      cell.val = val
+      if cell.exported:
+        self._UpdateExported(name)
+    else:
+      scope[name] = runtime.cell(val, False, False)
+      self.cache.pop(name, None)
+
   def _SetInScope(self, scope, pairs):
     for lhs, val in pairs:
-      #log('SETTING %s -> %s', lhs, value)
-      assert val.tag in (value_e.Str, value_e.StrArray)
+      self._SetCell(scope, lhs.name, val)
 
-      name = lhs.name
-      if name in scope:
-        # Preserve cell flags.  For example, could be Undef and exported!
-        scope[name].val = val
-      else:
-        scope[name] = runtime.cell(val, False, False)
+  def _LocalScope(self):
+    """Returns the scope on top of the stack, allocating it if necessary."""
+    scope = self.var_stack[-1]
+    if scope is _EMPTY_SCOPE:
+      scope = {}
+      self.var_stack[-1] = scope
+    return scope
 
   #
   # Globals
@@ -204,37 +385,45 @@ class Mem(object):
     """For completion."""
     self._SetInScope(self.var_stack[0], pairs)
 
+  def SetGlobal(self, name, val):
+    """Set a single global."""
+    self._SetCell(self.var_stack[0], name, val)
+
   def SetGlobalArray(self, name, a):
     """Helper for completion."""
     assert isinstance(a, list)
-    val = runtime.StrArray(a)
-    pairs = [(ast.LeftVar(name), val)]
-    self.SetGlobals(pairs)
+    self.SetGlobal(name, runtime.StrArray(a))
 
   def SetGlobalString(self, name, s):
     """Helper for completion."""
     assert isinstance(s, str)
-    val = runtime.Str(s)
-    pairs = [(ast.LeftVar(name), val)]
-    self.SetGlobals(pairs)
+    self.SetGlobal(name, runtime.Str(s))
 
   #
   # Locals
   #
 
-  def Get(self, name):
+  def _FindCell(self, name):
     # TODO: Don't implement dynamic scope
     for i in range(len(self.var_stack) - 1, -1, -1):
       scope = self.var_stack[i]
       if name in scope:
-        #log('Get %s -> %s in scope %d', name, scope[name].val, i)
-        # Don't need to use flags
-        return scope[name].val
+        return scope[name]
+    return None
+
+  def Get(self, name):
+    try:
+      cell = self.cache[name]
+    except KeyError:
+      cell = self._FindCell(name)
+      self.cache[name] = cell
+
+    if cell is not None:
+      # Don't need to use flags
+      return cell.val
 
-    # Fall back on environment
-    v = os.getenv(name)
-    if v is not None:
-      return runtime.Str(v)
+    if name == 'PIPESTATUS':
+      return runtime.StrArray([str(st) for st in self.pipe_status])
 
     return runtime.Undef()
 
@@ -248,12 +437,11 @@ class Mem(object):
 
     # TODO: Shells have dynamic scope for setting variables.  This is really
     # bad.
-    self._SetInScope(self.var_stack[-1], pairs)
+    self._SetInScope(self._LocalScope(), pairs)
 
   def SetLocal(self, name, val):
-    """Set a single local.""" 
-    pairs = [(ast.LeftVar(name), val)]
-    self.SetLocals(pairs)
+    """Set a single local."""
+    self._SetCell(self._LocalScope(), name, val)
 
   def Unset(self, name):
     # For unset -v (variable)
@@ -280,16 +468,30 @@ class Mem(object):
     if not found:
       # You can export an undefined variable!
       scope[name] = runtime.cell(runtime.Undef(), True, False)
+      self.cache.pop(name, None)
 
-  def GetExported(self):
-    exported = {}
+    self._UpdateExported(name)
+
+  def _UpdateExported(self, name):
+    """Recompute the entry for one name in the exported environment."""
     # Search from globals up.  Names higher on the stack will overwrite names
     # lower on the stack.
+    s = None
     for scope in self.var_stack:
-      for name, cell in scope.items():
-        if cell.exported and cell.val.tag == value_e.Str:
-          exported[name] = cell.val.s
-    return exported
+      cell = scope.get(name)
+      if cell is not None and cell.exported and cell.val.tag == value_e.Str:
+        s = cell.val.s
+    if s is None:
+      self.exported.pop(name, None)
+    else:
+      self.exported[name] = s
+
+  def GetExported(self):
+    """Returns the environment for external commands.
+
+    The dict is owned by Mem and changes as variables do; don't modify it.
+    """
+    return self.exported
 
   #
   # Readonly
@@ -304,7 +506,8 @@ class Mem(object):
 class DirStack:
   """State for pushd/popd."""
 
-  def __init__(self):
+  def __init__(self, stdout):
+    self.stdout = stdout  # to flush before errors
     self.dir_stack = []
 
   def Pushd(self, argv):
@@ -317,7 +520,7 @@ class DirStack:
     try:
       dest_dir = self.dir_stack.pop()
     except IndexError:
-      log('popd: directory stack is empty')
+      self.stdout.LogError('popd: directory stack is empty')
       return 1
     os.chdir(dest_dir)  # TODO: error checking
     return 0
@@ -328,10 +531,12 @@ class _FatalError(RuntimeError):
   pass
 
 
-class _ControlFlow(RuntimeError):
-  """Internal execption for control flow.
+class _ControlFlow(object):
+  """A break, continue, or return that hasn't been handled yet.
 
-  break and continue are caught by loops, return is caught by functions.
+  It isn't raised.  The command that runs it sets Executor.control_flow, and
+  lists and loops stop running commands until it's handled: break and
+  continue by loops, return by functions.
   """
 
   def __init__(self, token, arg):
@@ -356,14 +561,22 @@ class _ControlFlow(RuntimeError):
     return self.arg
 
 
+# Commands that set PIPESTATUS like a pipeline with one stage.  Compound
+# commands leave it alone.
+_ONE_STAGE_PIPELINES = (
+    command_e.SimpleCommand, command_e.Assignment, command_e.Subshell,
+    command_e.DBracket, command_e.DParen)
+
+
 class Executor(object):
-  """Executes the program by tree-walking.
+  """Executes the program by compiling it to closures (see compile.py), or by
+  tree-walking.
 
   It also does some double-dispatch by passing itself into Eval() for
   CompoundWord/WordPart.
   """
   def __init__(self, mem, builtins, funcs, comp_lookup, exec_opts,
-      make_parser):
+      make_parser, arena=None, ast_cache=None, pipeline_log=None):
     """
     Args:
       mem: Mem instance for storing variables
@@ -371,6 +584,11 @@ class Executor(object):
       funcs: registry of functions (these names are completed)
       comp_lookup: completion pattern/action
       make_parser: Callback for creating a new command parser (eval and source)
+      arena: optional Arena for eval and source.  Its memory is released
+        after the code runs, unless a function was defined.
+      ast_cache: optional AstCache for files run with source.
+      pipeline_log: optional file to write the resource usage of each
+        pipeline to.
     """
     self.mem = mem
     self.builtins = builtins
@@ -381,13 +599,20 @@ class Executor(object):
     # This is for shopt and set -o.  They are initialized by flags.
     self.exec_opts = exec_opts
     self.make_parser = make_parser
+    self.arena = arena
+    self.ast_cache = ast_cache
+    self.pipeline_log = pipeline_log
 
     self.ev = word_eval.NormalWordEvaluator(mem, exec_opts, self)
+    self.compiler = compile_.Compiler(self)
+    self.compiled = {}  # id(node) -> (node, func), for function bodies etc.
 
     self.mem.last_status = 0  # For $?
+    self.control_flow = None  # _ControlFlow that hasn't been handled
 
     self.traps = {}
     self.fd_state = FdState()
+    self.stdout = self.fd_state.stdout  # buffered output of builtins
 
     # TODO: Pass these in from main()
     self.aliases = {}  # alias name -> string
@@ -395,10 +620,33 @@ class Executor(object):
                        # metaprogramming or regular target syntax
                        # Whether argv[0] is make determines if it is executed
 
-    # sleep 5 & puts a (PID, job#) entry here.  And then "jobs" displays it.
-    self.jobs = {}
-
-    self.dir_stack = DirStack()
+    # sleep 5 & puts the process here.  'wait' collects its status.
+    self.job_state = JobState()
+
+    self.dir_stack = DirStack(self.stdout)
+    self.path_hash = PathHash()  # for external commands and 'hash'
+
+    # EBuiltin -> function that takes argv and returns a status
+    self.builtin_funcs = {
+        EBuiltin.READ: self._Read,
+        EBuiltin.ECHO: self._Echo,
+        EBuiltin.CD: self._Cd,
+        EBuiltin.PUSHD: self.dir_stack.Pushd,
+        EBuiltin.POPD: self.dir_stack.Popd,
+        EBuiltin.EXIT: self._Exit,
+        EBuiltin.EXPORT: self._Export,
+        EBuiltin.SOURCE: self._Source,
+        EBuiltin.DOT: self._Source,
+        EBuiltin.TRAP: self._Trap,
+        EBuiltin.EVAL: self._Eval,
+        EBuiltin.EXEC: self._Exec,  # may never return
+        EBuiltin.SET: self._Set,
+        EBuiltin.COMPLETE: self._Complete,
+        EBuiltin.COMPGEN: self._CompGen,
+        EBuiltin.DEBUG_LINE: self.builtins.DebugLine,
+        EBuiltin.HASH: self._Hash,
+        EBuiltin.WAIT: self._Wait,
+    }
 
     self.traceback = None
     self.traceback_msg = ''
@@ -417,25 +665,76 @@ class Executor(object):
     self.traceback_msg = msg
 
   def _Read(self, argv):
-    names = argv[1:]
-    line = sys.stdin.readline()
-    if not line:  # EOF
-      return 1
-    # TODO: split line and do that logic
-    val = runtime.Str(line.strip())
-    self.mem.SetLocal(names[0], val)
-    return 0
+    try:
+      flags, names = getopt.getopt(argv[1:], 'rd:n:')
+    except getopt.GetoptError as e:
+      self.stdout.LogError('read: %s', e)
+      return 2
+
+    raw = False
+    delim = '\n'
+    max_chars = -1
+    for flag, arg in flags:
+      if flag == '-r':
+        raw = True
+      elif flag == '-d':
+        delim = arg[:1] or '\0'  # -d '' reads up to a NUL
+      elif flag == '-n':
+        try:
+          max_chars = int(arg)
+        except ValueError:
+          self.stdout.LogError('read: %r: invalid number', arg)
+          return 2
+
+    # With no names, the whole line is assigned to REPLY, without splitting.
+    ifs = word_eval._GetIfs(self.mem) if names else ''
+    delim_byte = delim if util.PY2 else delim.encode('utf-8')
+
+    self.stdout.Flush()  # e.g. a prompt printed with echo
+
+    parts = []
+    escaped = []  # IFS characters that were escaped with a backslash
+    status = 0
+    num_read = 0
+    while True:
+      max_bytes = -1 if max_chars == -1 else max_chars - num_read
+      record, found = ReadRecord(0, delim_byte, max_bytes)
+      num_read += len(record)
+      if not found and (max_chars == -1 or num_read < max_chars):
+        status = 1  # EOF.  The variables are still set.
+      if not util.PY2:
+        record = record.decode('utf-8', 'replace')
+      record = record.replace('\0', '')  # bash ignores NUL bytes too
+
+      if raw:
+        parts.append(record)
+        break
+      record, continued = _Unescape(record, ifs, escaped)
+      parts.append(record)
+      if not (continued and found):
+        break
+      # A backslash before the delimiter.
+      if delim != '\n':
+        if delim in ifs:
+          escaped.append(delim)
+          parts.append('\0')
+        else:
+          parts.append(delim)
+    line = ''.join(parts)
+
+    if not names:
+      self.mem.SetLocal('REPLY', runtime.Str(line))
+      return status
+
+    values = _SplitForRead(line, ifs, len(names))
+    if escaped:
+      values = _RestoreEscaped(values, escaped)
+    for name, v in zip(names, values):
+      self.mem.SetLocal(name, runtime.Str(v))
+    return status
 
   def _Echo(self, argv):
-    argv = argv[1:]
-    #log('echo argv %s', argv)
-    for a in argv[:-1]:
-      sys.stdout.write(a)
-      sys.stdout.write(' ')  # arg separator
-    if argv:
-      sys.stdout.write(argv[-1])
-    sys.stdout.write('\n')
-    sys.stdout.flush()
+    self.stdout.Write(' '.join(argv[1:]) + '\n')
     return 0
 
   def _Set(self, argv):
@@ -487,7 +786,7 @@ class Executor(object):
     # Yeah you need the EvalHelper.  traps is a list of signals to parsed
     # NODES.
 
-    log(self.traps)
+    self.stdout.LogError(self.traps)
     return 0
 
   def _Complete(self, argv):
@@ -501,7 +800,7 @@ class Executor(object):
     # obviously it's better to check here.
     func = self.funcs.get(func_name)
     if func is None:
-      print('Function %r not found' % func_name)
+      self.stdout.Write('Function %r not found\n' % func_name)
       return 1
 
     chain = completion.ShellFuncAction(self, func)
@@ -509,15 +808,40 @@ class Executor(object):
     # TODO: Some feedback would be nice?
     return 0
 
-  def _EvalHelper(self, code_str):
-    c_parser = self.make_parser(code_str)
+  def _CompGen(self, argv):
+    # TODO: Generate matches with the completion actions.
+    self.stdout.LogError('compgen: not implemented')
+    return 1
+
+  def _EvalHelper(self, code_str, src_path=None, mtime=None):
+    arena = self.arena
+    if not arena:
+      c_parser = self.make_parser(code_str)
+      return self._ParseAndExecute(c_parser, code_str, src_path, mtime)
+
+    mark = arena.Mark()
+    if src_path is not None:
+      arena.PushSource(src_path)
+    try:
+      c_parser = self.make_parser(code_str, arena=arena)
+      return self._ParseAndExecute(c_parser, code_str, src_path, mtime)
+    finally:
+      if src_path is not None:
+        arena.PopSource()
+      # Nothing refers to these lines anymore, unless a function was defined,
+      # in which case Pin() was called.
+      arena.ReleaseToMark(mark)
+
+  def _ParseAndExecute(self, c_parser, code_str, src_path=None, mtime=None):
     node = c_parser.ParseWholeFile()
     # NOTE: We could model a parse error as an exception, like Python, so we
     # get a traceback.  (This won't be applicable for a static module system.)
     if not node:
-      print('Error parsing code %r' % code_str)
+      self.stdout.Write('Error parsing code %r\n' % code_str)
       return 1
-    status = self._Execute(node)
+    if self.ast_cache and mtime is not None:
+      self.ast_cache.Store(src_path, mtime, code_str, node)
+    status = self._Run(node)
     return status
 
   def _Eval(self, argv):
@@ -527,31 +851,102 @@ class Executor(object):
     return self._EvalHelper(code_str)
 
   def _Source(self, argv):
-    with open(argv[1]) as f:
+    path = argv[1]
+    with open(path) as f:
       code_str = f.read()
-    return self._EvalHelper(code_str)
+      mtime = os.fstat(f.fileno()).st_mtime
+
+    if self.ast_cache:
+      node = self.ast_cache.Lookup(path, mtime, code_str)
+      if node:
+        return self._Run(node, cache=True)
+    return self._EvalHelper(code_str, src_path=path, mtime=mtime)
 
   def _Exec(self, argv):
     # Either execute command with redirects, or apply redirects in this shell.
     # NOTE: Redirects were processed earlier.
     argv = argv[1:]
     if argv:
-      thunk = ExternalThunk(argv)
+      self.stdout.Flush()
+      thunk = ExternalThunk(argv, self.mem.GetExported())
       thunk.RunInParent()  # never returns
     else:
       return 0
 
+  def _Exit(self, argv):
+    try:
+      code = int(argv[1])
+    except IndexError:
+      code = 0
+    except ValueError as e:
+      self.stdout.LogError('Invalid argument %r', argv[1])
+      code = 1  # Runtime Error
+    # TODO: Should this be turned into our own SystemExit exception?
+    self.stdout.Flush()
+    sys.exit(code)
+
+  def _Hash(self, argv):
+    args = argv[1:]
+    if not args:
+      items = self.path_hash.Items()
+      if not items:
+        self.stdout.Write('hash: hash table empty\n')
+        return 0
+      self.stdout.Write('hits\tcommand\n')
+      for name, full_path, hits in items:
+        self.stdout.Write('%4d\t%s\n' % (hits, full_path))
+      return 0
+
+    if args[0] == '-r':
+      self.path_hash.Clear()
+      args = args[1:]
+
+    status = 0
+    path_str = self._PathStr()
+    for name in args:
+      if self.builtins.Resolve(name) != EBuiltin.NONE or name in self.funcs:
+        continue  # not hashed, like bash
+      if path_str is None or self.path_hash.Remember(name, path_str) is None:
+        self.stdout.LogError('hash: %s: not found', name)
+        status = 1
+    return status
+
+  def _Wait(self, argv):
+    args = argv[1:]
+    if not args:
+      self.job_state.WaitAll()
+      return 0
+
+    if args[0] == '-n':
+      status = self.job_state.WaitNext()
+      return 127 if status is None else status
+
+    status = 0
+    for arg in args:
+      try:
+        pid = int(arg)
+      except ValueError:
+        # TODO: job specs like %1
+        self.stdout.LogError('wait: %r: not a pid', arg)
+        status = 127
+        continue
+      status = self.job_state.WaitPid(pid)
+      if status is None:
+        self.stdout.LogError('wait: pid %d is not a child of this shell', pid)
+        status = 127
+    return status  # the last one wins
+
   def _Cd(self, argv):
     # TODO: Parse flags, error checking, etc.
     dest_dir = argv[1]
     if dest_dir == '-':
       old = self.mem.Get('OLDPWD')
       if old.tag == value_e.Undef:
-        log('OLDPWD not set')
+        self.stdout.LogError('OLDPWD not set')
         return 1
       elif old.tag == value_e.Str:
         dest_dir = old.s
-        print(dest_dir)  # Shells print the directory
+        self.stdout.Write(dest_dir + '\n')  # Shells print the directory
       elif old.tag == value_e.StrArray:
         # Prevent the user from setting to array?
         raise AssertionError
@@ -578,70 +973,14 @@ class Executor(object):
     return 0
 
   def RunBuiltin(self, builtin_id, argv):
-    restore_fd_state = True
-
     # TODO: Just test Type() == COMMAND word, and then if it's a command word,
     # type IsBuiltin().  And then builtins are NOT tokens!  Keywords might be
     # tokens, but builtins aren't.
-
-    # TODO: figure out a quicker dispatch mechanism.  Just make a table of
-    # builtins I guess.
-    if builtin_id == EBuiltin.READ:
-      status = self._Read(argv)
-
-    elif builtin_id == EBuiltin.ECHO:
-      status = self._Echo(argv)
-
-    elif builtin_id == EBuiltin.CD:
-      status = self._Cd(argv)
-
-    elif builtin_id == EBuiltin.PUSHD:
-      status = self.dir_stack.Pushd(argv)
-
-    elif builtin_id == EBuiltin.POPD:
-      status = self.dir_stack.Popd(argv)
-
-    elif builtin_id == EBuiltin.EXIT:
-      try:
-        code = int(argv[1])
-      except IndexError:
-        code = 0
-      except ValueError as e:
-        print("Invalid argument %r" % argv[1], file=sys.stderr)
-        code = 1  # Runtime Error
-      # TODO: Should this be turned into our own SystemExit exception?
-      sys.exit(code)
-
-    elif builtin_id == EBuiltin.EXPORT:
-      status = self._Export(argv)
-
-    elif builtin_id in (EBuiltin.SOURCE, EBuiltin.DOT):
-      status = self._Source(argv)
-
-    elif builtin_id == EBuiltin.TRAP:
-      status = self._Trap(argv)
-
-    elif builtin_id == EBuiltin.EVAL:
-      status = self._Eval(argv)
-
-    elif builtin_id == EBuiltin.EXEC:
-      status = self._Exec(argv)  # may never return
-      restore_fd_state = False
-
-    elif builtin_id == EBuiltin.SET:
-      status = self._Set(argv)
-
-    elif builtin_id == EBuiltin.COMPLETE:
-      status = self._Complete(argv)
-
-    elif builtin_id == EBuiltin.COMPGEN:
-      status = self._CompGen(argv)
-
-    elif builtin_id == EBuiltin.DEBUG_LINE:
-      status = self.builtins.DebugLine(argv)
-
-    else:
+    try:
+      func = self.builtin_funcs[builtin_id]
+    except KeyError:
       raise AssertionError('Unhandled builtin: %d' % builtin_id)
+    status = func(argv)
 
     assert isinstance(status, int)
     return status
@@ -655,11 +994,12 @@ class Executor(object):
 
     # Redirects still valid for functions.
     # Here doc causes a pipe and Process(SubProgramThunk).
-    try:
-      status = self._Execute(func_body)
-    except _ControlFlow as e:
-      if e.IsReturn():
-        status = e.ReturnValue()
+    status = self._Run(func_body, cache=True)
+    cf = self.control_flow
+    if cf is not None:
+      self.control_flow = None
+      if cf.IsReturn():
+        status = cf.ReturnValue()
       else:
         # break/continue used in the wrong place
         raise AssertionError('Invalid control flow')
@@ -673,7 +1013,8 @@ class Executor(object):
 
     Args:
       argv: evaluated arguments
-      more_env: evaluated environment
+      more_env: evaluated bindings like FOO=bar, which are added to the
+        environment of external commands
 
     Returns:
       is_external: If the node MUST be run in an external process.
@@ -698,7 +1039,141 @@ class Executor(object):
     if func_node is not None:
       return FuncThunk(self, func_node, argv)
 
-    return ExternalThunk(argv, more_env)
+    path = self._ResolveExternal(argv[0], more_env)
+    environ = self.mem.GetExported()
+    if more_env:
+      environ = dict(environ)
+      environ.update(more_env)
+    return ExternalThunk(argv, environ, path=path)
+
+  def _PathStr(self):
+    """Returns the value of $PATH, or None if it's not a string."""
+    val = self.mem.Get('PATH')
+    if val.tag != value_e.Str:
+      return None
+    return val.s
+
+  def _ResolveExternal(self, name, more_env):
+    """Find an external command, using the hash table.
+
+    Returns:
+      The path to execute, or None to let execvpe() search for it and report
+      the error.
+    """
+    path_str = self._PathStr()
+    if path_str is None:
+      return None
+    env_path = more_env.get('PATH', path_str)
+    if env_path != path_str:  # PATH=/bin ls doesn't change the table
+      return self.path_hash.Search(name, env_path)
+    return self.path_hash.Lookup(name, path_str)
+
+  def _CanRunInProcess(self, node, seen):
+    """Can the command in $(...) run in this process, instead of a fork?
+
+    It can if it only runs assignments, control flow, and builtins in
+    _IN_PROCESS_BUILTINS, directly or from functions.  Variables are saved
+    and restored around it.
+
+    Args:
+      node: ast.command
+      seen: set of function names already checked, for recursion
+    """
+    tag = node.tag
+    if tag == command_e.SimpleCommand:
+      if not node.words:
+        return False
+      ok, argv0, _ = word.StaticEval(node.words[0])
+      if not ok:
+        return False  # e.g. $cmd
+      # Same order as _GetThunkForSimpleCommand
+      builtin_id = self.builtins.Resolve(argv0)
+      if builtin_id != EBuiltin.NONE:
+        return builtin_id in _IN_PROCESS_BUILTINS
+      func_node = self.funcs.get(argv0)
+      if func_node is None:
+        return False  # external
+      if argv0 in seen:
+        return True
+      seen.add(argv0)
+      return self._CanRunInProcess(func_node.body, seen)
+
+    if tag in (command_e.NoOp, command_e.Assignment, command_e.ControlFlow,
+               command_e.DBracket, command_e.DParen):
+      return True
+
+    if tag == command_e.Sentence:
+      if node.terminator.id == Id.Op_Amp:
+        return False
+      return self._CanRunInProcess(node.command, seen)
+
+    if tag in (command_e.CommandList, command_e.BraceGroup, command_e.AndOr):
+      children = node.children
+    elif tag == command_e.DoGroup:
+      children = [node.child]
+    elif tag in (command_e.While, command_e.Until):
+      children = [node.cond, node.body]
+    elif tag == command_e.ForEach:
+      children = [node.body]
+    elif tag == command_e.ForExpr:
+      children = [node.body] if node.body else []
+    elif tag == command_e.If:
+      children = []
+      for arm in node.arms:
+        children.append(arm.cond)
+        children.append(arm.action)
+      if node.else_action:
+        children.append(node.else_action)
+    elif tag == command_e.Case:
+      children = [arm.action for arm in node.arms]
+    else:
+      return False  # Pipeline, Subshell, FuncDef
+
+    for child in children:
+      if not self._CanRunInProcess(child, seen):
+        return False
+    return True
+
+  def _CaptureInProcess(self, node):
+    """Run node with stdout going to a file, and return what it wrote."""
+    fd = OpenAnonymousFile('osh-command-sub')
+    sys.stdout.flush()  # Don't capture output from before
+    saved = self.mem.Save()
+    self.fd_state.PushFrame()
+    try:
+      if self.fd_state.SaveAndDup(fd, 1):
+        self.Execute(node)  # Like a child, report errors and keep going
+      sys.stdout.flush()
+    finally:
+      self.fd_state.PopAndRestore()
+      self.mem.Restore(saved)
+
+    os.lseek(fd, 0, os.SEEK_SET)
+    chunks = []
+    while True:
+      byte_str = os.read(fd, 65536)
+      if not byte_str:
+        break
+      chunks.append(byte_str)
+    os.close(fd)
+
+    byte_str = b''.join(chunks)
+    if util.PY2:
+      return byte_str
+    return byte_str.decode('utf-8')
+
+  def RunCommandSub(self, node):
+    """Run the command in $(...) and return what it wrote to stdout."""
+    if CMD_SUB_IN_PROCESS and self._CanRunInProcess(node, set()):
+      return self._CaptureInProcess(node)
+
+    p = self._GetProcessForNode(node)
+    # NOTE: We could do an optimization for pipelines.  Pick the last
+    # process element, and do pi.procs[-1].CaptureOutput()
+    stdout = []
+    p.CaptureOutput(stdout)
+    p.Run()
+    return ''.join(stdout)
 
   def _GetProcessForNode(self, node):
     """
@@ -710,7 +1185,7 @@ class Executor(object):
       if argv is None:
         err = self.ev.Error()
         raise AssertionError("Error evaluating words: %s" % err)
-      more_env = self.mem.GetExported()
+      more_env = {}
       self._EvalEnv(node.more_env, more_env)
       thunk = self._GetThunkForSimpleCommand(argv, more_env)
 
@@ -841,9 +1316,11 @@ class Executor(object):
 
     #print(pi)
 
-    # TODO: Set PipeStatus() in self.mem
     pipe_status = pi.Run()
     #log('pipe_status %s', pipe_status)
+    self.mem.pipe_status = pipe_status
+    if self.pipeline_log:
+      pi.Report(self.pipeline_log)
 
     if self.exec_opts.pipefail:
       # If any process failed, the status of the entire pipeline is 1.
@@ -856,55 +1333,166 @@ class Executor(object):
 
     return status
 
-  def _Execute(self, node):
+  def _RunJobInBackground(self, node):
+    """For 'foo &'.  Start a process without waiting for it.
+
+    Compound commands like { foo; bar; } & and pipelines run in a subshell.
+    """
+    p = self._GetProcessForNode(node)
+    self.mem.last_job_id = self.job_state.Start(p)
+    return 0
+
+  def _RunSimpleCommand(self, node, redirects, argv=None):
     """
     Args:
-      node: of type AstNode
+      node: SimpleCommand
+      redirects: evaluated redirects
+      argv: if not None, the argv that the words always evaluate to
     """
-    redirects = self._EvalRedirects(node)
-
     # TODO: Only eval argv[0] once.  It can have side effects!
-    if node.tag == command_e.SimpleCommand:
+    if argv is None:
       words = braces.BraceExpandWords(node.words)
       argv = self.ev.EvalWordSequence(words)
 
       if argv is None:
         self.error_stack.extend(self.ev.Error())
         raise _FatalError()
-      more_env = self.mem.GetExported()
+    more_env = {}
+    if node.more_env:
       self._EvalEnv(node.more_env, more_env)
-      thunk = self._GetThunkForSimpleCommand(argv, more_env)
+    thunk = self._GetThunkForSimpleCommand(argv, more_env)
 
-      # Don't waste a process if we'd launch one anyway.
-      if thunk.IsExternal():
-        p = Process(thunk, fd_state=self.fd_state, redirects=redirects)
-        status = p.Run()
+    # Don't waste a process if we'd launch one anyway.
+    if thunk.IsExternal():
+      p = Process(thunk, fd_state=self.fd_state, redirects=redirects)
+      return p.Run()
 
-      else:  # Internal
-        #log('ARGV %s', argv)
+    # Internal
+    #log('ARGV %s', argv)
 
-        # NOTE: _EvalRedirects turns LST nodes into core/process.py nodes.  And
-        # then we use polymorphism here.  Does it make sense to use functional
-        # style based on the RedirType?  Might be easier to read.
+    # NOTE: _EvalRedirects turns LST nodes into core/process.py nodes.  And
+    # then we use polymorphism here.  Does it make sense to use functional
+    # style based on the RedirType?  Might be easier to read.
 
-        self.fd_state.PushFrame()
+    self.fd_state.PushFrame()
+    for r in redirects:
+      r.ApplyInParent(self.fd_state)
+
+    status = thunk.RunInParent()
+    restore_fd_state = thunk.ShouldRestoreFdState()
+
+    # Special case for exec 1>&2 (with no args): we permanently change the
+    # fd state.  BUT we don't want to restore later.
+    # TODO: Instead of this, maybe r.ApplyPermaent(self.fd_state)?
+    if restore_fd_state:
+      self.fd_state.PopAndRestore()
+    else:
+      self.fd_state.PopAndForget()
+    return status
+
+  def _RunDBracket(self, node):
+    bool_ev = expr_eval.BoolEvaluator(self.mem, self.ev)
+    ok = bool_ev.Eval(node.expr)
+    if ok:
+      return 0 if bool_ev.Result() else 1
+    else:
+      raise AssertionError('Error evaluating boolean: %s' % bool_ev.Error())
+
+  def _RunDParen(self, node):
+    arith_ev = expr_eval.ArithEvaluator(self.mem, self.ev)
+    ok = arith_ev.Eval(node.child)
+    if ok:
+      i = arith_ev.Result()
+      # Negate the value: non-zero in arithmetic is true, which is zero in
+      # shell land
+      return 0 if i != 0 else 1
+    else:
+      raise AssertionError('Error evaluating (( )): %s' % arith_ev.Error())
+
+  def _RunAssignment(self, node):
+    if node.keyword == Id.Assign_Local:
+      set_var = self.mem.SetLocal
+    else:  # could be readonly/export/etc.
+      set_var = self.mem.SetGlobal
+
+    # a=1 b=$a sets each one before evaluating the next, but like other
+    # builtins, 'local a=1 b=$a' evaluates all its arguments first.
+    sequential = node.keyword == Id.Assign_None
+    pairs = []
+    for pair in node.pairs:
+      # RHS can be a string or array.
+      ok, val = self.ev.EvalWordToAny(pair.rhs)
+      assert isinstance(val, runtime.value), val
+      #log('RHS %s -> %s', pair.rhs, val)
+      if not ok:
+        self.error_stack.extend(self.ev.Error())
+        raise _FatalError()
+      if sequential:
+        set_var(pair.lhs.name, val)
+      else:
+        pairs.append((pair.lhs.name, val))
+
+    for name, val in pairs:
+      set_var(name, val)
+
+    # TODO: This should be eval of RHS, unlike bash!
+    return 0
+
+  def _RunControlFlow(self, node):
+    if node.arg_word:  # Evaluate the argument
+      ok, val = self.ev.EvalWordToString(node.arg_word)
+      if not ok:
+        self.error_stack.extend(self.ev.Error())
+        raise _FatalError()
+      assert val.tag == value_e.Str
+      arg = int(val.s)  # They all take integers
+    else:
+      arg = 0  # return 0, break 0 levels, etc.
+
+    cf = _ControlFlow(node.token, arg)
+    self.control_flow = cf
+    return cf.ReturnValue() if cf.IsReturn() else 0
+
+  def _CheckErrExit(self, status):
+    if status != 0:
+      # TODO: token should be set to what?  Is it node.begin_word and
+      # node.end_word?
+      token = None
+      tb = self.mem.GetTraceback(token)
+      self._SetException(tb,
+          "Command %s exited with code %d" % ('TODO', status))
+      # TODO: raise _ControlFlow?  Except?
+      # Dummy?
+
+  def _Execute(self, node, redirects=None):
+    """
+    Args:
+      node: of type AstNode
+      redirects: [] if the node's redirects were already applied
+    """
+    if redirects is None:
+      redirects = self._EvalRedirects(node)
+
+    # Compound commands like 'while read line; do ...; done < file' apply their
+    # redirects in this process, around the whole command.
+    if redirects and node.tag != command_e.SimpleCommand:
+      self.fd_state.PushFrame()
+      try:
         for r in redirects:
           r.ApplyInParent(self.fd_state)
+        return self._Execute(node, redirects=[])
+      finally:
+        self.fd_state.PopAndRestore()
 
-        status = thunk.RunInParent()
-        restore_fd_state = thunk.ShouldRestoreFdState()
-
-        # Special case for exec 1>&2 (with no args): we permanently change the
-        # fd state.  BUT we don't want to restore later.
-        # TODO: Instead of this, maybe r.ApplyPermaent(self.fd_state)?
-        if restore_fd_state:
-          self.fd_state.PopAndRestore()
-        else:
-          self.fd_state.PopAndForget()
+    if node.tag == command_e.SimpleCommand:
+      status = self._RunSimpleCommand(node, redirects)
 
     elif node.tag == command_e.Sentence:
       # TODO: Compile this away.
-      status = self._Execute(node.command)
+      if node.terminator.id == Id.Op_Amp:
+        status = self._RunJobInBackground(node.command)
+      else:
+        status = self._Execute(node.command)
 
     elif node.tag == command_e.Pipeline:
       status = self._RunPipeline(node)
@@ -915,56 +1503,16 @@ class Executor(object):
       status = p.Run()
 
     elif node.tag == command_e.DBracket:
-      bool_ev = expr_eval.BoolEvaluator(self.mem, self.ev)
-      ok = bool_ev.Eval(node.expr)
-      if ok:
-        status = 0 if bool_ev.Result() else 1
-      else:
-        raise AssertionError('Error evaluating boolean: %s' % bool_ev.Error())
+      status = self._RunDBracket(node)
 
     elif node.tag == command_e.DParen:
-      arith_ev = expr_eval.ArithEvaluator(self.mem, self.ev)
-      ok = arith_ev.Eval(node.child)
-      if ok:
-        i = arith_ev.Result()
-        # Negate the value: non-zero in arithmetic is true, which is zero in
-        # shell land
-        status = 0 if i != 0 else 1
-      else:
-        raise AssertionError('Error evaluating (( )): %s' % arith_ev.Error())
+      status = self._RunDParen(node)
 
     elif node.tag == command_e.Assignment:
-      pairs = []
-      for pair in node.pairs:
-        # RHS can be a string or array.
-        ok, val = self.ev.EvalWordToAny(pair.rhs)
-        assert isinstance(val, runtime.value), val
-        #log('RHS %s -> %s', pair.rhs, val)
-        if not ok:
-          self.error_stack.extend(self.ev.Error())
-          raise _FatalError()
-        pairs.append((pair.lhs, val))
-
-      if node.keyword == Id.Assign_Local:
-        self.mem.SetLocals(pairs)
-      else:  # could be readonly/export/etc.
-        self.mem.SetGlobals(pairs)
-
-      # TODO: This should be eval of RHS, unlike bash!
-      status = 0
+      status = self._RunAssignment(node)
 
     elif node.tag == command_e.ControlFlow:
-      if node.arg_word:  # Evaluate the argument
-        ok, val = self.ev.EvalWordToString(node.arg_word)
-        if not ok:
-          self.error_stack.extend(self.ev.Error())
-          raise _FatalError()
-        assert val.tag == value_e.Str
-        arg = int(val.s)  # They all take integers
-      else:
-        arg = 0  # return 0, break 0 levels, etc.
-
-      raise _ControlFlow(node.token, arg)
+      status = self._RunControlFlow(node)
 
     # The only difference between these two is that CommandList has no
     # redirects.  We already took care of that above.
@@ -972,20 +1520,29 @@ class Executor(object):
       status = 0  # for empty list
       for child in node.children:
         status = self._Execute(child)  # last status wins
+        if self.control_flow is not None:
+          break
 
     elif node.tag == command_e.AndOr:
-      #print(node.children)
-      left, right = node.children
-      status = self._Execute(left)
-
-      if node.op_id == Id.Op_DPipe:
-        if status != 0:
-          status = self._Execute(right)
-      elif node.op_id == Id.Op_DAmp:
-        if status == 0:
-          status = self._Execute(right)
-      else:
-        raise AssertionError
+      # The parser makes 'a && b || c' right recursive, but it runs left to
+      # right: c runs if a fails.
+      and_or = node
+      status = self._Execute(and_or.children[0])
+      while True:
+        right = and_or.children[1]
+        is_chain = right.tag == command_e.AndOr
+        child = right.children[0] if is_chain else right
+        if and_or.op_id == Id.Op_DPipe:
+          if status != 0:
+            status = self._Execute(child)
+        elif and_or.op_id == Id.Op_DAmp:
+          if status == 0:
+            status = self._Execute(child)
+        else:
+          raise AssertionError
+        if not is_chain or self.control_flow is not None:
+          break
+        and_or = right
 
     elif node.tag in (command_e.While, command_e.Until):
       # TODO: Compile this out?
@@ -994,22 +1551,20 @@ class Executor(object):
       else:
         _DonePredicate = lambda status: status == 0
 
+      status = 0  # in case we don't loop
       while True:
-        status = self._Execute(node.cond)
-        done = status != 0
-        if _DonePredicate(status):
+        done = _DonePredicate(self._Execute(node.cond))
+        if done or self.control_flow is not None:
           break
-        try:
-          status = self._Execute(node.body)  # last one wins
-        except _ControlFlow as e:
-          if e.IsBreak():
-            status = 0
+        status = self._Execute(node.body)  # last one wins
+        cf = self.control_flow
+        if cf is not None:
+          if cf.IsReturn():  # return needs to pop up more
+            break
+          self.control_flow = None
+          status = 0
+          if cf.IsBreak():
             break
-          elif e.IsContinue():
-            status = 0
-            continue
-          else:  # return needs to pop up more
-            raise
 
     elif node.tag == command_e.ForEach:
       iter_name = node.iter_name
@@ -1027,17 +1582,15 @@ class Executor(object):
         self.mem.SetLocal(iter_name, runtime.Str(x))
         #log('<')
 
-        try:
-          status = self._Execute(node.body)  # last one wins
-        except _ControlFlow as e:
-          if e.IsBreak():
-            status = 0
+        status = self._Execute(node.body)  # last one wins
+        cf = self.control_flow
+        if cf is not None:
+          if cf.IsReturn():  # return needs to pop up more
+            break
+          self.control_flow = None
+          status = 0
+          if cf.IsBreak():
             break
-          elif e.IsContinue():
-            status = 0
-            continue
-          else:  # return needs to pop up more
-            raise
 
     elif node.tag == command_e.ForExpr:
       raise NotImplementedError(node.tag)
@@ -1049,12 +1602,18 @@ class Executor(object):
 
     elif node.tag == command_e.FuncDef:
       self.funcs[node.name] = node
+      # The body is executed later, so keep its lines and spans.
+      if self.arena:
+        self.arena.Pin()
       status = 0
 
     elif node.tag == command_e.If:
       done = False
       for arm in node.arms:
         status = self._Execute(arm.cond)
+        if self.control_flow is not None:
+          done = True
+          break
         if status == 0:
           status = self._Execute(arm.action)
           done = True
@@ -1089,36 +1648,110 @@ class Executor(object):
       raise AssertionError(node.tag)
 
     if self.exec_opts.errexit:
-      if status != 0:
-        # TODO: token should be set to what?  Is it node.begin_word and
-        # node.end_word?
-        token = None
-        tb = self.mem.GetTraceback(token)
-        self._SetException(tb,
-            "Command %s exited with code %d" % ('TODO', status))
-        # TODO: raise _ControlFlow?  Except?
-        # Dummy?
+      self._CheckErrExit(status)
 
     # TODO: Is this the right place to put it?  Does it need a stack for
     # function calls?
     self.mem.last_status = status
+    if node.tag in _ONE_STAGE_PIPELINES:
+      self.mem.pipe_status = [status]
     return status
 
+  def _Run(self, node, cache=False):
+    """Compile a node and run it.
+
+    Args:
+      node: ast.command
+      cache: whether to keep the compiled form, for nodes that are run more
+        than once, like function bodies.
+    """
+    if not COMPILE:
+      return self._Execute(node)
+
+    if cache:
+      entry = self.compiled.get(id(node))
+      if entry is not None and entry[0] is node:
+        return entry[1]()
+
+    func = self.compiler.Compile(node)
+    if cache:
+      if len(self.compiled) >= _MAX_COMPILED:
+        self.compiled.clear()
+      self.compiled[id(node)] = (node, func)
+    return func()
+
+  def _ControlFlowAtTopLevel(self):
+    # TODO: Make this error message better.
+    self.control_flow = None
+    self.stdout.Flush()
+    print('Break/continue/return bubbled up to top level', file=sys.stderr)
+    return 1
+
   def Execute(self, node):
     """Execute a top level LST node."""
     # Use exceptions internally, but exit codes externally.
     try:
-      status = self._Execute(node)
-    except _ControlFlow as e:
-      # TODO: Make this error message better.
-      print('Break/continue/return bubbled up to top level', file=sys.stderr)
-      status = 1 
+      status = self._Run(node)
+      if self.control_flow is not None:
+        status = self._ControlFlowAtTopLevel()
     except _FatalError:
       # TODO: Nicer runtime error message.
+      self.control_flow = None
+      self.stdout.Flush()
       print(self.error_stack, file=sys.stderr)
       status = 1
+    finally:
+      self.stdout.Flush()  # e.g. on sys.exit()
 
     # TODO: Hook this up
     #print('break / continue can only be used inside loop')
     #status = 129  # TODO: Fix this.  Use correct macros
     return status
+
+  def ExecuteLoop(self, c_parser, w_parser, arena=None):
+    """Parse and execute one command line at a time, like InteractiveLoop.
+
+    Unlike ParseWholeFile() then Execute(), the first command runs before the
+    rest of the input is read, and each command's lines and spans are released
+    after it runs.
+
+    Returns:
+      Status of the last command, or None on a parse error.  Call
+      c_parser.Error() to get it.
+    """
+    status = 0
+    while True:
+      if arena:
+        mark = arena.Mark()
+
+      w = c_parser.Peek()
+      if w is None:
+        return None
+      c_id = word.CommandId(w)
+      if c_id == Id.Eof_Real:
+        break
+
+      if c_id != Id.Op_Newline:  # blank line
+        node = c_parser.ParseCommandLine()
+        if not node:
+          return None
+
+        # Stop executing on errors, like ParseWholeFile() then Execute().
+        try:
+          status = self._Run(node)
+          if self.control_flow is not None:
+            return self._ControlFlowAtTopLevel()
+        except _FatalError:
+          self.control_flow = None
+          self.stdout.Flush()
+          print(self.error_stack, file=sys.stderr)
+          return 1
+        finally:
+          self.stdout.Flush()  # e.g. on sys.exit()
+
+      if arena:
+        arena.ReleaseToMark(mark)
+      w_parser.Reset()
+      c_parser.Reset()
+
+    return status
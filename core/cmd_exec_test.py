@@ -10,13 +10,21 @@ cmd_exec_test.py: Tests for cmd_exec.py
 """
 
 import os
+import shutil
+import signal
+import time
 import unittest
 
-from core.builtin import Builtins
+from core import alloc
+from core import braces
+from core.builtin import Builtins, EBuiltin
 from core import cmd_exec  # module under test
 from core.cmd_exec import *
 from core.id_kind import Id
+from core import reader
+from core import process
 from core import ui
+from core import util
 from core import word_eval
 from core import runtime
 
@@ -38,7 +46,7 @@ def InitCommandParser(code_str):
   return c_parser
 
 
-def InitExecutor():
+def InitExecutor(arena=None):
   mem = cmd_exec.Mem('', [])
   status_line = ui.NullStatusLine()
   builtins = Builtins(status_line)
@@ -46,7 +54,7 @@ def InitExecutor():
   comp_funcs = {}
   exec_opts = cmd_exec.ExecOpts()
   return cmd_exec.Executor(mem, builtins, funcs, comp_funcs, exec_opts,
-                           parse_lib.MakeParserForExecutor)
+                           parse_lib.MakeParserForExecutor, arena=arena)
 
 
 def InitEvaluator():
@@ -159,6 +167,74 @@ class RedirectTest(unittest.TestCase):
 
     fd_state.PopAndRestore()
 
+  def testHereDocDelivery(self):
+    def ReadBody(body_str):
+      r = HereDocRedirect(Id.Redir_DLess, 0, body_str)
+      r.BeforeFork(FdState())
+      if r.w != -1:  # like the child, so we get EOF
+        os.close(r.w)
+        r.w = -1
+      chunks = []
+      while True:
+        chunk = os.read(r.r, 65536)
+        if not chunk:
+          break
+        chunks.append(chunk)
+      r.AfterForkInParent()
+      return r, b''.join(chunks).decode('utf-8')
+
+    # Written to a pipe up front
+    r, s = ReadBody('hello\n')
+    self.assertEqual('hello\n', s)
+    self.assertEqual(None, r.here_proc)
+    self.assertEqual(-1, r.w)
+
+    # Too big for a pipe, so it's written to a file
+    body = 'x' * 1000000
+    r, s = ReadBody(body)
+    self.assertEqual(body, s)
+    self.assertEqual(None, r.here_proc)
+
+    process.HERE_DOC_FORK = True
+    try:
+      r, s = ReadBody(body)
+    finally:
+      process.HERE_DOC_FORK = False
+    self.assertEqual(body, s)
+    self.assertEqual(0, r.here_proc.status)
+
+    # Non-ASCII.  Under Python 2 the body is already UTF-8 bytes.
+    expected = u'h\u00e9llo\n'
+    body = expected.encode('utf-8') if util.PY2 else expected
+    r, s = ReadBody(body)
+    self.assertEqual(expected, s)
+
+    process.HERE_DOC_FORK = True
+    try:
+      r, s = ReadBody(body)
+    finally:
+      process.HERE_DOC_FORK = False
+    self.assertEqual(expected, s)
+    self.assertEqual(0, r.here_proc.status)
+
+  def testHereDocWriterIsWaitedFor(self):
+    body = 'line\n' * 100000  # too big for a pipe
+    # The command reads all of it, or stops early so the writer gets SIGPIPE.
+    for num_bytes, status in [(len(body), 0), (5, 128 + signal.SIGPIPE)]:
+      fd_state = FdState()
+      fd_state.PushFrame()
+      r = HereDocRedirect(Id.Redir_DLess, 0, body)
+      process.HERE_DOC_FORK = True
+      try:
+        r.ApplyInParent(fd_state)
+      finally:
+        process.HERE_DOC_FORK = False
+      n = 0
+      while n < num_bytes:
+        n += len(os.read(0, num_bytes - n))
+      fd_state.PopAndRestore()  # waits for the writer
+      self.assertEqual(status, r.here_proc.status)
+
   def testFilenameRedirect(self):
     print('BEFORE', os.listdir('/dev/fd'))
 
@@ -210,6 +286,180 @@ class RedirectTest(unittest.TestCase):
     print('FDs AFTER', os.listdir('/dev/fd'))
 
 
+def _ReadAll(fd):
+  chunks = []
+  while True:
+    chunk = os.read(fd, 65536)
+    if not chunk:
+      break
+    chunks.append(chunk)
+  return b''.join(chunks).decode('utf-8')
+
+
+class OutputBufferTest(unittest.TestCase):
+
+  def testBuffering(self):
+    r, w = os.pipe()
+    out = process.OutputBuffer(w, max_size=10)
+    out.Write('abc')
+    out.Write('def')
+    self.assertEqual(6, out.size)  # not written yet
+    out.Write('ghij')  # full
+    self.assertEqual(0, out.size)
+    out.Write('k')
+    out.Flush()
+    os.close(w)
+    self.assertEqual('abcdefghijk', _ReadAll(r))
+    os.close(r)
+
+  def testFlushedBeforeRedirect(self):
+    # Output from before a redirect shouldn't go to the file, and output
+    # after it should.
+    ex = InitExecutor()
+    path = os.path.abspath('_tmp/output-buffer.txt')
+    r, w = os.pipe()
+    ex.fd_state.PushFrame()
+    ex.fd_state.SaveAndDup(w, 1)
+    os.close(w)
+
+    node = InitCommandParser(
+        'echo one; echo two > %s; echo three' % path).ParseWholeFile()
+    ex.Execute(node)
+    ex.fd_state.PopAndRestore()
+
+    self.assertEqual('one\nthree\n', _ReadAll(r))
+    os.close(r)
+    with open(path) as f:
+      self.assertEqual('two\n', f.read())
+    os.remove(path)
+
+  def testBatchedAcrossBuiltins(self):
+    # Each builtin runs in its own descriptor frame, but the output should
+    # only be written when the redirect is undone.
+    ex = InitExecutor()
+    path = os.path.abspath('_tmp/output-buffer.txt')
+    writes = []
+    orig_write_all = process._WriteAll
+    def WriteAll(fd, s):
+      writes.append(s)
+      orig_write_all(fd, s)
+
+    process._WriteAll = WriteAll
+    try:
+      node = InitCommandParser(
+          '{ echo a; echo b; echo c; } > %s\n'
+          'for i in d e f; do echo $i; done > %s' % (path, path)
+          ).ParseWholeFile()
+      ex.Execute(node)
+    finally:
+      process._WriteAll = orig_write_all
+
+    self.assertEqual([b'a\nb\nc\n', b'd\ne\nf\n'], writes)
+    with open(path) as f:
+      self.assertEqual('d\ne\nf\n', f.read())
+    os.remove(path)
+
+  def testErrorsInOrder(self):
+    # Error messages from builtins come after the output they already wrote.
+    ex = InitExecutor()
+    path = os.path.abspath('_tmp/output-buffer.txt')
+    node = InitCommandParser(
+        '{ echo one; wait 99999; echo two; hash nonexistent-cmd; echo three; }'
+        ' > %s 2>&1' % path).ParseWholeFile()
+    ex.Execute(node)
+
+    with open(path) as f:
+      lines = f.read().splitlines()
+    os.remove(path)
+    self.assertEqual(
+        ['one', 'wait: pid 99999 is not a child of this shell', 'two',
+         'hash: nonexistent-cmd: not found', 'three'], lines)
+
+
+class ReadTest(unittest.TestCase):
+
+  def testReadRecord(self):
+    path = os.path.abspath('_tmp/read-record.txt')
+    with open(path, 'w') as f:
+      f.write('one\ntwo\nthree')
+    fd = os.open(path, os.O_RDONLY)
+    self.assertEqual((b'one', True), process.ReadRecord(fd, b'\n'))
+    self.assertEqual(4, os.lseek(fd, 0, os.SEEK_CUR))  # seeked back
+    self.assertEqual((b'tw', False), process.ReadRecord(fd, b'\n', 2))
+    self.assertEqual((b'o', True), process.ReadRecord(fd, b'\n'))
+    self.assertEqual((b'three', False), process.ReadRecord(fd, b'\n'))
+    self.assertEqual((b'', False), process.ReadRecord(fd, b'\n'))
+    os.close(fd)
+    os.remove(path)
+
+    # The rest of a pipe is left for the next reader.
+    r, w = os.pipe()
+    os.write(w, b'a:b\n')
+    os.close(w)
+    self.assertEqual((b'a', True), process.ReadRecord(r, b':'))
+    self.assertEqual('b\n', _ReadAll(r))
+    os.close(r)
+
+  def testSplitForRead(self):
+    split = cmd_exec._SplitForRead
+    self.assertEqual(['a', 'b c d'], split('a b c d', ' \t\n', 2))
+    self.assertEqual(['a', 'b   c'], split('  a   b   c  ', ' \t\n', 2))
+    self.assertEqual(['a', '', ''], split('a', ' \t\n', 3))
+    self.assertEqual(['1', '2'], split('1,2,', ',', 2))
+    self.assertEqual(['1', '2,3,'], split('1,2,3,', ',', 2))
+    self.assertEqual(['1', '2 , 3'], split(' 1 , 2 , 3 ', ', ', 2))
+    self.assertEqual(['1', '', '2'], split('1,,2', ', ', 3))
+    self.assertEqual([':x:'], split(':x:', ':', 1))
+    self.assertEqual(['  x  '], split('  x  ', '', 1))
+
+  def testRead(self):
+    ex = InitExecutor()
+    path = os.path.abspath('_tmp/read.txt')
+    with open(path, 'w') as f:
+      f.write('x\\ y z\nline\\\ncontinued\na:b\n')
+
+    node = InitCommandParser(
+        'read a b < %s; '
+        '{ read -r c d; read e; read -d : f; read -n 1 g; read h; } < %s' %
+        (path, path)).ParseWholeFile()
+    ex.Execute(node)
+    self.assertEqual('x y', ex.mem.Get('a').s)
+    self.assertEqual('z', ex.mem.Get('b').s)
+    self.assertEqual('x\\', ex.mem.Get('c').s)
+    self.assertEqual('y z', ex.mem.Get('d').s)
+    self.assertEqual('linecontinued', ex.mem.Get('e').s)
+    self.assertEqual('a', ex.mem.Get('f').s)
+    self.assertEqual('b', ex.mem.Get('g').s)
+    self.assertEqual('', ex.mem.Get('h').s)
+
+    node = InitCommandParser('read h < /dev/null').ParseWholeFile()
+    self.assertEqual(1, ex.Execute(node))  # EOF
+
+    with open(path) as f:  # not truncated by the redirects
+      self.assertEqual('x\\ y z\nline\\\ncontinued\na:b\n', f.read())
+    os.remove(path)
+
+  def testReadLoop(self):
+    ex = InitExecutor()
+    path = os.path.abspath('_tmp/read-loop.txt')
+    with open(path, 'w') as f:
+      f.write('1 one\n2 two\n3 three\n')
+    r, w = os.pipe()
+    ex.fd_state.PushFrame()
+    ex.fd_state.SaveAndDup(w, 1)
+    os.close(w)
+
+    node = InitCommandParser(
+        'while read n name; do echo $name $n; done < %s' % path
+        ).ParseWholeFile()
+    ex.Execute(node)
+    ex.fd_state.PopAndRestore()
+
+    self.assertEqual('one 1\ntwo 2\nthree 3\n', _ReadAll(r))
+    os.close(r)
+    os.remove(path)
+
+
 class MemTest(unittest.TestCase):
 
   def testGet(self):
@@ -219,6 +469,119 @@ class MemTest(unittest.TestCase):
     mem.Pop()
     print(mem.Get('NONEXISTENT'))
 
+  def testSaveAndRestore(self):
+    mem = cmd_exec.Mem('', ['a'], environ={})
+    mem.SetGlobalString('x', 'old')
+    saved = mem.Save()
+
+    mem.SetGlobalString('x', 'new')
+    mem.SetGlobalString('y', 'new')
+    mem.SetExportFlag('x', True)
+    mem.Push(['b'])
+    mem.last_status = 1
+
+    mem.Restore(saved)
+    self.assertEqual('old', mem.Get('x').s)
+    self.assertEqual({}, mem.GetExported())
+    self.assertEqual(value_e.Undef, mem.Get('y').tag)
+    self.assertEqual(['a'], mem.GetArgv())
+    self.assertEqual(1, len(mem.var_stack))
+    self.assertEqual(0, mem.last_status)
+
+  def testExported(self):
+    mem = cmd_exec.Mem('', [], environ={'HOME': '/home/x', 'y': 'env'})
+    exported = mem.GetExported()
+    self.assertEqual({'HOME': '/home/x', 'y': 'env'}, exported)
+    self.assertEqual('/home/x', mem.Get('HOME').s)
+
+    mem.SetGlobalString('x', '1')
+    self.assertFalse('x' in exported)
+    mem.SetExportFlag('x', True)
+    self.assertEqual('1', exported['x'])
+    mem.SetGlobalString('x', '2')
+    self.assertEqual('2', exported['x'])
+
+    # Variables from the environment are exported.
+    mem.SetGlobalString('y', 'shell')
+    self.assertEqual('shell', exported['y'])
+
+    # Exported in a function, then popped.
+    mem.Push([])
+    mem.SetLocal('x', runtime.Str('local'))
+    self.assertEqual('2', exported['x'])
+    mem.SetLocal('z', runtime.Str('z'))
+    mem.SetExportFlag('z', True)
+    mem.SetExportFlag('x', True)
+    self.assertEqual('local', exported['x'])
+    self.assertEqual('z', exported['z'])
+    mem.Pop()
+    self.assertEqual('2', exported['x'])
+    self.assertFalse('z' in exported)
+
+    # The same dict is updated, not rebuilt.
+    self.assertTrue(exported is mem.GetExported())
+
+  def testGetIsCached(self):
+    mem = cmd_exec.Mem('', [], environ={'HOME': '/home/x'})
+    self.assertEqual(value_e.Undef, mem.Get('x').tag)
+    self.assertEqual(None, mem.cache['x'])
+
+    mem.SetGlobalString('x', 'global')
+    self.assertEqual('global', mem.Get('x').s)
+    mem.SetGlobalString('x', 'changed')  # the cell is mutated
+    self.assertEqual('changed', mem.Get('x').s)
+
+    for i in range(5):
+      mem.Push([])
+    self.assertEqual('changed', mem.Get('x').s)
+    self.assertEqual('/home/x', mem.Get('HOME').s)
+    mem.SetLocal('x', runtime.Str('local'))
+    self.assertEqual('local', mem.Get('x').s)
+    mem.Pop()
+    self.assertEqual('changed', mem.Get('x').s)
+
+    mem.Push([])
+    mem.SetExportFlag('y', True)  # creates an undefined variable
+    self.assertEqual(value_e.Undef, mem.Get('y').tag)
+    mem.Pop()
+
+    saved = mem.Save()
+    mem.SetLocal('z', runtime.Str('z'))
+    self.assertEqual('z', mem.Get('z').s)
+    mem.Restore(saved)
+    self.assertEqual(value_e.Undef, mem.Get('z').tag)
+
+  def testFrames(self):
+    mem = cmd_exec.Mem('', [], environ={})
+    mem.Push(['a'])
+    mem.Push(['b'])
+    # No dict until a local is set.
+    self.assertTrue(mem.var_stack[-1] is cmd_exec._EMPTY_SCOPE)
+    self.assertEqual(['b'], mem.GetArgv())
+
+    mem.SetLocal('x', runtime.Str('1'))
+    self.assertEqual(['x'], list(mem.var_stack[-1]))
+    self.assertTrue(mem.var_stack[-2] is cmd_exec._EMPTY_SCOPE)
+    mem.SetGlobal('y', runtime.Str('2'))
+    self.assertEqual('2', mem.GetGlobal('y').s)
+    mem.Pop()
+
+    self.assertEqual(value_e.Undef, mem.Get('x').tag)
+    self.assertEqual(['a'], mem.GetArgv())
+    mem.Pop()
+    self.assertEqual({}, cmd_exec._EMPTY_SCOPE)
+
+  def testExternalEnviron(self):
+    ex = InitExecutor()
+    _Define(ex, 'export x=1')
+    thunk = ex._GetThunkForSimpleCommand(['ls'], {})
+    self.assertTrue(thunk.environ is ex.mem.GetExported())
+
+    thunk = ex._GetThunkForSimpleCommand(['ls'], {'y': '2'})
+    self.assertEqual('1', thunk.environ['x'])
+    self.assertEqual('2', thunk.environ['y'])
+    self.assertFalse('y' in ex.mem.GetExported())
+
 
 class ExpansionTest(unittest.TestCase):
 
@@ -233,6 +596,32 @@ class ExpansionTest(unittest.TestCase):
 
     #print(ex._ExpandWords(node.words))
 
+  def testStaticArgs(self):
+    node = InitCommandParser(
+        'echo hi --x=1 "a b"\'c\' d\\* "" ~ $x *.py [ab] "*"'
+        ).ParseCommandLine()
+    static = [word_eval._StaticArg(w) for w in node.words]
+    self.assertEqual(
+        ['echo', 'hi', '--x=1', 'a bc', 'd*', '', None, None, None, None,
+         '*'],
+        static)
+
+    ev = InitEvaluator()
+    argv = ev.EvalWordSequence(node.words)
+    self.assertEqual(['echo', 'hi', '--x=1', 'a bc', 'd*', ''], argv[:6])
+    self.assertEqual('*', argv[-1])
+    self.assertEqual(len(node.words), len(ev.static_args))
+
+    # Cached, and the same again.
+    self.assertEqual(argv, ev.EvalWordSequence(node.words))
+    self.assertEqual(len(node.words), len(ev.static_args))
+
+    # An empty alternative is elided, not a constant ''.
+    node = InitCommandParser('echo {X,,Y}').ParseCommandLine()
+    self.assertEqual(
+        ['echo', 'X', 'Y'],
+        ev.EvalWordSequence(braces.BraceExpandWords(node.words)))
+
 
 class VarOpTest(unittest.TestCase):
 
@@ -255,5 +644,447 @@ class VarOpTest(unittest.TestCase):
     print(ev.part_ev._EvalWordPart(set_sub))
 
 
+def _ExecuteLoop(code_str, arena):
+  ex = InitExecutor(arena=arena)
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  w_parser, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  status = ex.ExecuteLoop(c_parser, w_parser, arena=arena)
+  return ex, status
+
+
+class ExecuteLoopTest(unittest.TestCase):
+
+  def testMemoryStaysFlat(self):
+    arena = alloc.Pool(compact=True).NewArena()
+    arena.AddSourcePath('<test>')
+
+    n = 100000
+    code_str = ''.join('x=%d\n' % i for i in range(n))
+    ex, status = _ExecuteLoop(code_str, arena)
+
+    self.assertEqual(0, status)
+    self.assertEqual(str(n - 1), ex.mem.Get('x').s)
+    # Only the EOF line is left.
+    self.assertEqual((1, 0, 1), arena.Mark())
+
+  def testFuncDefIsKept(self):
+    arena = alloc.Pool().NewArena()
+    arena.AddSourcePath('<test>')
+
+    code_str = 'x=1\nf() { echo hi; }\ny=2\neval \'g() { echo g; }\'\nz=3\n'
+    ex, status = _ExecuteLoop(code_str, arena)
+
+    # x=1, y=2, and z=3 are freed.  None is the EOF "line" of eval and of
+    # the top level.
+    self.assertEqual(
+        ['f() { echo hi; }\n', "eval 'g() { echo g; }'\n",
+         'g() { echo g; }\n', None, None],
+        arena.lines)
+
+    # Spans in the function body still point to its line.
+    tok = ex.funcs['f'].body.children[0].command.words[0].parts[0].token
+    span = arena.GetLineSpan(tok.span_id)
+    self.assertEqual('echo', alloc.SpanValue(span, arena))
+
+  def testParseError(self):
+    arena = alloc.Pool().NewArena()
+    arena.AddSourcePath('<test>')
+
+    # Commands before the error are executed.
+    ex, status = _ExecuteLoop('x=1\necho )\nx=2\n', arena)
+    self.assertEqual(None, status)
+    self.assertEqual('1', ex.mem.Get('x').s)
+
+  def testControlFlowAtTopLevel(self):
+    # Like Execute() on the whole file, the rest of it isn't run.
+    for keyword in ('return', 'break', 'continue'):
+      arena = alloc.Pool().NewArena()
+      arena.AddSourcePath('<test>')
+      ex, status = _ExecuteLoop('x=1\n%s\nx=2\n' % keyword, arena)
+      self.assertEqual(1, status)
+      self.assertEqual('1', ex.mem.Get('x').s)
+      self.assertEqual(None, ex.control_flow)
+
+  def testSourceRestoresPath(self):
+    arena = alloc.Pool().NewArena()
+    arena.AddSourcePath('<outer>')
+    ex = InitExecutor(arena=arena)
+
+    path = '_tmp/arena_release_test.sh'
+    with open(path, 'w') as f:
+      f.write('a=1\nb=2\n')
+
+    mark = arena.Mark()
+    ex.RunBuiltin(EBuiltin.SOURCE, ['source', path])
+    self.assertEqual(mark, arena.Mark())
+    self.assertEqual(['<outer>'], arena.src_paths)
+
+    arena.AddLine('echo\n', 1)
+    self.assertEqual(('<outer>', 1), arena.GetDebugInfo(0))
+
+
+class PathHashTest(unittest.TestCase):
+
+  def setUp(self):
+    # Not tempfile, which opens /dev/urandom as fd 5 in Python 2.  That
+    # breaks testFilenameRedirect.
+    self.tmp_dir = os.path.abspath('_tmp/path-hash-test')
+    if os.path.exists(self.tmp_dir):
+      shutil.rmtree(self.tmp_dir)
+    os.makedirs(self.tmp_dir)
+    self.dirs = []
+    for name in ('a', 'b'):
+      d = os.path.join(self.tmp_dir, name)
+      os.mkdir(d)
+      path = os.path.join(d, 'cmd')
+      with open(path, 'w') as f:
+        f.write('#!/bin/sh\n')
+      os.chmod(path, 0o755)
+      self.dirs.append(d)
+    self.a_cmd = os.path.join(self.dirs[0], 'cmd')
+    self.b_cmd = os.path.join(self.dirs[1], 'cmd')
+
+  def tearDown(self):
+    shutil.rmtree(self.tmp_dir)
+
+  def testLookup(self):
+    h = process.PathHash()
+    path_str = ':'.join(self.dirs)
+    self.assertEqual(self.a_cmd, h.Lookup('cmd', path_str))
+    self.assertEqual(self.a_cmd, h.Lookup('cmd', path_str))
+    self.assertEqual([('cmd', self.a_cmd, 2)], h.Items())
+
+    self.assertEqual(None, h.Lookup('nonexistent', path_str))
+    self.assertEqual('./cmd', h.Lookup('./cmd', path_str))
+    self.assertEqual(1, len(h.Items()))
+
+    # Assigning PATH clears the table.
+    self.assertEqual(self.b_cmd, h.Lookup('cmd', self.dirs[1]))
+    self.assertEqual([('cmd', self.b_cmd, 1)], h.Items())
+
+  def testEntryIsRemembered(self):
+    h = process.PathHash()
+    h.Lookup('cmd', ':'.join(self.dirs))
+    os.remove(self.a_cmd)
+    # Like bash, there's no stat() when the command is found in the table.
+    self.assertEqual(self.a_cmd, h.Lookup('cmd', ':'.join(self.dirs)))
+    h.Clear()
+    self.assertEqual(self.b_cmd, h.Lookup('cmd', ':'.join(self.dirs)))
+
+  def testExecutor(self):
+    ex = InitExecutor()
+    ex.mem.SetGlobalString('PATH', ':'.join(self.dirs))
+    thunk = ex._GetThunkForSimpleCommand(['cmd'], {})
+    self.assertEqual(self.a_cmd, thunk.path)
+
+    # PATH=... cmd searches without changing the table.
+    thunk = ex._GetThunkForSimpleCommand(['cmd'], {'PATH': self.dirs[1]})
+    self.assertEqual(self.b_cmd, thunk.path)
+    self.assertEqual([('cmd', self.a_cmd, 1)], ex.path_hash.Items())
+
+    self.assertEqual(1, ex.RunBuiltin(EBuiltin.HASH, ['hash', 'nonexistent']))
+    self.assertEqual(0, ex.RunBuiltin(EBuiltin.HASH, ['hash', '-r']))
+    self.assertEqual([], ex.path_hash.Items())
+
+  def testHashBuiltin(self):
+    # 'hash cmd' adds an entry that later lookups use.
+    ex = InitExecutor()
+    ex.mem.SetGlobalString('PATH', ':'.join(self.dirs))
+    self.assertEqual(0, ex.RunBuiltin(EBuiltin.HASH, ['hash', 'cmd']))
+    self.assertEqual([('cmd', self.a_cmd, 0)], ex.path_hash.Items())
+
+    os.remove(self.a_cmd)  # so a new search would find b/cmd
+    thunk = ex._GetThunkForSimpleCommand(['cmd'], {})
+    self.assertEqual(self.a_cmd, thunk.path)
+    self.assertEqual([('cmd', self.a_cmd, 1)], ex.path_hash.Items())
+
+
+class PipelineStatusTest(unittest.TestCase):
+
+  def testStatusesInOrder(self):
+    # The first stage exits last, so os.wait() would return its status last.
+    pi = Pipeline()
+    pi.Add(Process(ExternalThunk(['sh', '-c', 'sleep 0.2; exit 3'])))
+    pi.Add(Process(ExternalThunk(['sh', '-c', 'exit 5'])))
+    self.assertEqual([3, 5], pi.Run())
+
+    path = '_tmp/pipeline-report.txt'
+    with open(path, 'w') as f:
+      pi.Report(f)
+    with open(path) as f:
+      lines = f.read().splitlines()
+    os.remove(path)
+    self.assertEqual(3, len(lines))
+    self.assertTrue(lines[0].startswith('pipeline '), lines[0])
+    self.assertTrue('status 3' in lines[1], lines[1])
+    self.assertTrue(lines[2].endswith('sh -c exit 5'), lines[2])
+
+  def testSignal(self):
+    p = Process(ExternalThunk(['sh', '-c', 'kill -9 $$']))
+    self.assertEqual(128 + 9, p.Run())
+    self.assertTrue(p.rusage is not None)
+
+  def testPipeStatus(self):
+    ex = InitExecutor()
+    node = InitCommandParser('false | true').ParseWholeFile()
+    self.assertEqual(0, ex.Execute(node))
+    self.assertEqual([1, 0], ex.mem.pipe_status)
+    self.assertEqual(['1', '0'], ex.mem.Get('PIPESTATUS').strs)
+
+    node = InitCommandParser('false').ParseWholeFile()
+    ex.Execute(node)
+    self.assertEqual(['1'], ex.mem.Get('PIPESTATUS').strs)
+
+
+class CompileTest(unittest.TestCase):
+
+  def _Run(self, code_str, compile):
+    ex = InitExecutor()
+    node = InitCommandParser(code_str).ParseWholeFile()
+    cmd_exec.COMPILE = compile
+    try:
+      status = ex.Execute(node)
+    finally:
+      cmd_exec.COMPILE = True
+    out = ex.mem.Get('out')
+    return status, (out.s if out.tag == value_e.Str else None)
+
+  def _AssertSame(self, expected_out, code_str):
+    """Compiled and tree-walking runs give the same $? and $out."""
+    status, out = self._Run(code_str, True)
+    self.assertEqual(expected_out, out)
+    self.assertEqual(self._Run(code_str, False), (status, out))
+    return status
+
+  def testCompiledMatchesTreeWalking(self):
+    self._AssertSame('b', 'false && out=a || out=b')
+    self._AssertSame('ac', 'out=a; true || out=b && out=${out}c')
+    self.assertEqual(1, self._AssertSame('', 'out=; true && false'))
+
+    self._AssertSame(
+        '13', 'for i in 1 2 3; do [[ $i == 2 ]] && continue; out=$out$i; done')
+    self._AssertSame(
+        '12', 'i=; while true; do i=x$i; [[ $i == xxx ]] && break;'
+              ' out=${out}${#i}; done')
+    self._AssertSame('xxx', 'out=; until [[ $out == xxx ]]; do out=x$out; done')
+    # The status of the last command in the body, not the condition.
+    self.assertEqual(0, self._AssertSame(
+        'x', 'out=x; while false; do out=y; done'))
+    self._AssertSame(
+        'elif', 'if false; then out=t; elif true; then out=elif; fi')
+    self.assertEqual(7, self._AssertSame(
+        'a', 'f() { for x in a b; do [[ $x == b ]] && return 7; out=$x; done; }'
+             '; f'))
+    self._AssertSame('c', 'case x in x) out=c;; esac')
+
+    # Assignments are done in order, but local evaluates all its words first.
+    self._AssertSame('2', 'a=1; a=2 out=$a')
+    self._AssertSame('1', 'a=1; f() { local a=2 b=$a; out=$b; }; f')
+
+  def testControlFlow(self):
+    # return from inside two loops
+    self.assertEqual(4, self._AssertSame(
+        'a', 'f() { while true; do for x in a b; do [[ $x == b ]] && return 4;'
+             ' out=$x; done; done; out=no; }; f'))
+    # return in a condition, an && list, and eval
+    self.assertEqual(3, self._AssertSame(
+        '', 'out=; f() { if return 3; then out=no; fi; out=no; }; f'))
+    self.assertEqual(5, self._AssertSame(
+        '', 'out=; f() { true && return 5 || out=no; out=no; }; f'))
+    self.assertEqual(6, self._AssertSame(
+        '', "out=; f() { eval 'return 6'; out=no; }; f"))
+    # break only leaves the inner loop
+    self._AssertSame(
+        '1a2a', 'for i in 1 2; do for j in a b; do [[ $j == b ]] && break;'
+                ' out=$out$i$j; done; done')
+
+  def testControlFlowAtTopLevel(self):
+    for compile in (True, False):
+      ex = InitExecutor()
+      node = InitCommandParser('out=a; break; out=b').ParseWholeFile()
+      cmd_exec.COMPILE = compile
+      try:
+        self.assertEqual(1, ex.Execute(node))
+      finally:
+        cmd_exec.COMPILE = True
+      self.assertEqual('a', ex.mem.Get('out').s)
+      self.assertEqual(None, ex.control_flow)
+
+  def testLoopRedirect(self):
+    path = '_tmp/compile-test.txt'
+    code_str = 'for i in 1 2; do echo $i; done > %s; read out < %s' % (
+        path, path)
+    try:
+      self._AssertSame('1', code_str)
+      with open(path) as f:
+        self.assertEqual('1\n2\n', f.read())
+    finally:
+      os.remove(path)
+
+  def testConstantArgv(self):
+    ex = InitExecutor()
+    node = InitCommandParser('echo a b').ParseCommandLine()
+    argvs = []
+    ex._RunSimpleCommand = lambda node, redirects, argv=None: argvs.append(argv)
+    func = ex.compiler.Compile(node)
+    func()
+    func()
+    self.assertEqual([['echo', 'a', 'b'], ['echo', 'a', 'b']], argvs)
+    self.assertFalse(argvs[0] is argvs[1])  # copied for each run
+
+
+def _Define(ex, code_str):
+  ex.Execute(InitCommandParser(code_str).ParseWholeFile())
+
+
+class CommandSubTest(unittest.TestCase):
+
+  def testCanRunInProcess(self):
+    ex = InitExecutor()
+    _Define(ex, 'f() { echo $1; x=1; }; g() { f; ls; }; r() { r; }')
+
+    def CanRun(code_str):
+      node = InitCommandParser(code_str).ParseWholeFile()
+      return ex._CanRunInProcess(node, set())
+
+    self.assertTrue(CanRun('echo hi'))
+    self.assertTrue(CanRun('x=1; echo $x >&2'))
+    self.assertTrue(CanRun('for i in 1 2; do f $i; done'))
+    self.assertTrue(CanRun('if [[ -n x ]]; then echo a; else f; fi'))
+    self.assertTrue(CanRun('r'))  # recursive
+
+    self.assertFalse(CanRun('ls'))
+    self.assertFalse(CanRun('g'))  # calls ls
+    self.assertFalse(CanRun('cd /'))
+    self.assertFalse(CanRun('$cmd'))
+    self.assertFalse(CanRun('echo a | f'))
+    self.assertFalse(CanRun('echo a &'))
+    self.assertFalse(CanRun('( echo a )'))
+    self.assertFalse(CanRun('h() { echo; }'))
+
+  def testCaptureInProcess(self):
+    ex = InitExecutor()
+    _Define(ex, 'f() { g=global; echo "f $1"; echo err >&2; echo done; }')
+    node = InitCommandParser('f 1').ParseWholeFile()
+    self.assertEqual('f 1\ndone\n', ex._CaptureInProcess(node))
+    self.assertEqual(value_e.Undef, ex.mem.Get('g').tag)  # isolated
+
+    # More than a pipe can hold
+    code_str = 'for i in %s; do echo %s; done' % (
+        ' '.join(str(i) for i in range(2000)), '0123456789' * 4)
+    node = InitCommandParser(code_str).ParseWholeFile()
+    self.assertEqual(2000 * 41, len(ex._CaptureInProcess(node)))
+
+  def testRunCommandSub(self):
+    ex = InitExecutor()
+    node = InitCommandParser('x=$(echo a $(echo b)); y=$(ls -d /)')
+    node = node.ParseWholeFile()
+    ex.Execute(node)
+    self.assertEqual('a b', ex.mem.Get('x').s)
+    self.assertEqual('/', ex.mem.Get('y').s)
+
+
+def _Job(code_str):
+  return Process(ExternalThunk(['sh', '-c', code_str]))
+
+
+class JobStateTest(unittest.TestCase):
+
+  def testWaitPid(self):
+    job_state = process.JobState()
+    slow = job_state.Start(_Job('sleep 0.1; exit 3'))
+    fast = job_state.Start(_Job('exit 4'))
+    self.assertEqual(3, job_state.WaitPid(slow))
+    self.assertEqual(4, job_state.WaitPid(fast))
+    self.assertEqual(4, job_state.WaitPid(fast))  # still remembered
+    self.assertEqual(None, job_state.WaitPid(1))  # not a child
+
+  def testWaitNext(self):
+    job_state = process.JobState()
+    job_state.Start(_Job('sleep 0.2; exit 1'))
+    job_state.Start(_Job('exit 2'))
+    self.assertEqual(2, job_state.WaitNext())
+    self.assertEqual(1, job_state.WaitNext())
+    self.assertEqual(None, job_state.WaitNext())
+
+  def testReapedBySignalHandler(self):
+    job_state = process.JobState()
+    pid = job_state.Start(_Job('exit 5'))
+    for i in range(50):
+      if not job_state.NumRunning():
+        break
+      time.sleep(0.01)
+    self.assertEqual(0, job_state.NumRunning())
+    self.assertEqual(5, job_state.WaitPid(pid))
+
+  def testStatusesAreBounded(self):
+    job_state = process.JobState()
+    for pid in range(100000, 100000 + process.MAX_JOB_STATUSES + 10):
+      job_state._Finish(pid, pid % 256)
+    self.assertEqual(process.MAX_JOB_STATUSES, len(job_state.statuses))
+    self.assertEqual(process.MAX_JOB_STATUSES, len(job_state.finished))
+
+    # The oldest are forgotten
+    self.assertEqual(None, job_state.WaitPid(100000))
+    last = 100000 + process.MAX_JOB_STATUSES + 9
+    self.assertEqual(last % 256, job_state.WaitPid(last))
+
+  def testBackgroundCommand(self):
+    ex = InitExecutor()
+    node = InitCommandParser(
+        '{ sleep 0.05; exit 9; } & wait $!').ParseWholeFile()
+    self.assertEqual(9, ex.Execute(node))
+    self.assertTrue(ex.mem.last_job_id > 0)
+
+    node = InitCommandParser('false & true & wait').ParseWholeFile()
+    self.assertEqual(0, ex.Execute(node))
+    self.assertEqual(0, ex.job_state.NumRunning())
+
+
+class SpawnTest(unittest.TestCase):
+
+  def tearDown(self):
+    process.SPAWN = hasattr(os, 'posix_spawn')
+
+  def testSpawnActions(self):
+    thunk = ExternalThunk(['echo', 'hi'], path='/bin/echo')
+    p = Process(thunk, redirects=[
+        FilenameRedirect(Id.Redir_Great, 1, '_tmp/spawn-out.txt'),
+        DescriptorRedirect(Id.Redir_GreatAnd, 2, 1)])
+    process.SPAWN = False
+    self.assertEqual(None, p._SpawnActions())
+    if not hasattr(os, 'posix_spawn'):
+      return
+
+    process.SPAWN = True
+    self.assertEqual(2, len(p._SpawnActions()))
+
+    # Python code has to run in a forked child.
+    process.SPAWN = True
+    p = Process(SubProgramThunk(InitExecutor(), None))
+    self.assertEqual(None, p._SpawnActions())
+    # So does a command that wasn't found in $PATH.
+    p = Process(ExternalThunk(['nonexistent']))
+    self.assertEqual(None, p._SpawnActions())
+
+  def testSameOutput(self):
+    modes = [False]
+    if hasattr(os, 'posix_spawn'):
+      modes.append(True)
+    for spawn in modes:
+      process.SPAWN = spawn
+      path = '_tmp/spawn-out.txt'
+      thunk = ExternalThunk(['ls', '-d', '/', '/nonexistent'], path='/bin/ls')
+      p = Process(thunk, redirects=[
+          FilenameRedirect(Id.Redir_Great, 1, path),
+          DescriptorRedirect(Id.Redir_GreatAnd, 2, 1)])
+      self.assertEqual(2, p.Run())
+      with open(path) as f:
+        lines = f.read().splitlines()
+      os.remove(path)
+      self.assertEqual(2, len(lines), lines)
+      self.assertTrue('/' in lines, lines)
+
+
 if __name__ == '__main__':
   unittest.main()
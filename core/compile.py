@@ -1,11 +1,39 @@
 from __future__ import print_function
 """
-compile.py: osh.asdl -> ovm.asdl
+compile.py: osh.asdl -> Python closures
 
-Things the compiler should do:
+The executor used to walk the tree for every command it ran, so a loop paid
+for dispatching on node.tag, evaluating (empty) redirects, and unwrapping
+Sentence and DoGroup nodes on every iteration.  Instead, each command is
+compiled once to a function that takes no arguments and returns the exit
+status.  The functions for child nodes and the executor's methods are bound
+in closures.
 
-- AndOr is parsed with right recursion?  So expand that into a list?  Or
-  execute with left recursion?
+What the compiler does:
+
+- AndOr is parsed with right recursion.  It's flattened into a list and run
+  left to right.
+
+- while/until are compiled to the same thing.
+
+- DoGroup/BraceGroup/CommandList are flattened into one list of functions.
+  Sentence is compiled to its child, except for & (Fork).
+
+- else_action in If is compiled uniformly, with the arms.
+
+- constant folding: a simple command whose words are all constant, like
+  'echo hello world', has its argv computed at compile time.  So does a for
+  loop over constant words.
+
+- redirects are only evaluated for nodes that have them.
+
+- break, continue, and return aren't exceptions.  They set
+  Executor.control_flow, and lists and loops check it after each command.
+
+Pipelines, subshells, function definitions, case, and background jobs are
+run by the tree-walking Executor._Execute(), as before.
+
+Still TODO:
 
 - assignments need to be desugared into a lot of differrent things.
   - for now everything is Dynamic?  ONLY hash tables.
@@ -13,38 +41,346 @@ Things the compiler should do:
   - oil will have a proper compiler I think.  It can do stack analysis.
     Because it requires "global" and so forth.
 
-- while/until compiled to same thing.
-  - maybe
-
-- DoGroup/BraceGroup compiled to same thing
-  - CommandList might be removed later
-
-- Sentence is compiled to Fork(), or nothing for ;
-
-- else_action in If should be compiled uniformly
 - might want to also compile case/if to same thing
 
 - [[ ]] and arith languages will have grouping parens for printing.  Eliminate
   those and use tree structure.
 
-- constant folding:
-  - especially of literal strings, concatenating escapes, etc.
-
 - maybe compile differently based on module-level :option
-
-- not sure if redirects need to be separate into primitive push/pop
 """
 
-import sys
+from core import braces
+from core import runtime
+from core import word_eval
+from core.id_kind import Id
+
+from osh import ast_ as ast
+
+command_e = ast.command_e
+
+# Run by Executor._Execute(), which also applies their redirects.
+_FALLBACK = (
+    command_e.Pipeline, command_e.Subshell, command_e.FuncDef,
+    command_e.Case, command_e.ForExpr)
+
+# Nodes without a 'redirects' field, and SimpleCommand, which applies its own.
+_NO_REDIRECTS = (
+    command_e.NoOp, command_e.SimpleCommand, command_e.Sentence,
+    command_e.Assignment, command_e.ControlFlow, command_e.AndOr,
+    command_e.CommandList)
+
+
+class Compiler(object):
+  """Compiles command nodes to functions that run them.
+
+  Each function behaves like Executor._Execute() on the same node: it sets $?
+  and PIPESTATUS, and records errexit failures.
+  """
+
+  def __init__(self, ex):
+    """
+    Args:
+      ex: Executor
+    """
+    self.ex = ex
+
+  def Compile(self, node):
+    """
+    Args:
+      node: ast.command
+
+    Returns:
+      A function that runs the command and returns its status.
+    """
+    if node.tag in _FALLBACK or (node.tag == command_e.Sentence and
+                                 node.terminator.id == Id.Op_Amp):
+      execute = self.ex._Execute
+
+      def Fallback():
+        return execute(node)
+      return Fallback
+
+    func = self._Compile(node)
+
+    # Compound commands like 'while read line; do ...; done < file' apply their
+    # redirects around the whole command.
+    if node.tag not in _NO_REDIRECTS and node.redirects:
+      func = self._WithRedirects(node, func)
+    return func
+
+  def _WithRedirects(self, node, func):
+    ex = self.ex
+    fd_state = ex.fd_state
+
+    def WithRedirects():
+      redirects = ex._EvalRedirects(node)
+      fd_state.PushFrame()
+      try:
+        for r in redirects:
+          r.ApplyInParent(fd_state)
+        return func()
+      finally:
+        fd_state.PopAndRestore()
+    return WithRedirects
+
+  def _Finisher(self, one_stage):
+    """Return a function that does what _Execute() does after every node."""
+    ex = self.ex
+    mem = ex.mem
+    exec_opts = ex.exec_opts
+    check = ex._CheckErrExit
+
+    if one_stage:
+      def Finish(status):
+        if exec_opts.errexit:
+          check(status)
+        mem.last_status = status
+        mem.pipe_status = [status]
+        return status
+    else:
+      def Finish(status):
+        if exec_opts.errexit:
+          check(status)
+        mem.last_status = status
+        return status
+    return Finish
+
+  def _Compile(self, node):
+    tag = node.tag
+    ex = self.ex
+
+    if tag == command_e.SimpleCommand:
+      return self._CompileSimpleCommand(node)
+
+    if tag == command_e.Sentence:
+      return self.Compile(node.command)
+
+    if tag in (command_e.CommandList, command_e.BraceGroup,
+               command_e.DoGroup):
+      return self._CompileList(node)
+
+    if tag == command_e.AndOr:
+      return self._CompileAndOr(node)
+
+    if tag in (command_e.While, command_e.Until):
+      return self._CompileWhile(node)
+
+    if tag == command_e.ForEach:
+      return self._CompileForEach(node)
+
+    if tag == command_e.If:
+      return self._CompileIf(node)
+
+    if tag == command_e.Assignment:
+      return self._CompileCall(ex._RunAssignment, node, True)
+
+    if tag == command_e.DBracket:
+      return self._CompileCall(ex._RunDBracket, node, True)
+
+    if tag == command_e.DParen:
+      return self._CompileCall(ex._RunDParen, node, True)
+
+    if tag == command_e.ControlFlow:
+      return self._CompileCall(ex._RunControlFlow, node, False)
+
+    if tag == command_e.NoOp:
+      finish = self._Finisher(False)
+
+      def NoOp():
+        return finish(0)
+      return NoOp
+
+    raise AssertionError(tag)
+
+  def _CompileCall(self, run, node, one_stage):
+    finish = self._Finisher(one_stage)
+
+    def Call():
+      return finish(run(node))
+    return Call
+
+  def _CompileSimpleCommand(self, node):
+    ex = self.ex
+    run = ex._RunSimpleCommand
+    eval_redirects = ex._EvalRedirects
+    has_redirects = bool(node.redirects)
+    finish = self._Finisher(True)
+
+    # Constant folding: 'echo hello world' always has the same argv.
+    static = [word_eval._StaticArg(w) for w in node.words]
+    if None in static:
+      argv = None
+    else:
+      argv = static
+
+    if argv is None:
+      def SimpleCommand():
+        redirects = eval_redirects(node) if has_redirects else []
+        return finish(run(node, redirects))
+    else:
+      def SimpleCommand():
+        redirects = eval_redirects(node) if has_redirects else []
+        # Copy it, since a builtin could change it.
+        return finish(run(node, redirects, argv=list(argv)))
+    return SimpleCommand
+
+  def _Flatten(self, node, out):
+    """Append the children of nested lists to 'out'."""
+    if node.tag == command_e.DoGroup and not node.redirects:
+      self._Flatten(node.child, out)
+    elif (node.tag == command_e.CommandList or
+          (node.tag == command_e.BraceGroup and not node.redirects)):
+      for child in node.children:
+        self._Flatten(child, out)
+    elif (node.tag == command_e.Sentence and
+          node.terminator.id != Id.Op_Amp):
+      self._Flatten(node.command, out)
+    else:
+      out.append(node)
+
+  def _CompileList(self, node):
+    children = []
+    if node.tag == command_e.DoGroup:
+      self._Flatten(node.child, children)
+    else:
+      for child in node.children:
+        self._Flatten(child, children)
+    funcs = [self.Compile(child) for child in children]
+
+    if len(funcs) == 1:
+      return funcs[0]
+
+    if not funcs:
+      finish = self._Finisher(False)
+
+      def EmptyList():
+        return finish(0)
+      return EmptyList
+
+    ex = self.ex
+
+    # The last function sets $?, so there's nothing to finish.
+    def CommandList():
+      status = 0
+      for func in funcs:
+        status = func()
+        if ex.control_flow is not None:
+          break
+      return status
+    return CommandList
+
+  def _CompileAndOr(self, node):
+    first = self.Compile(node.children[0])
+    rest = []  # (is_or, func)
+    while True:
+      right = node.children[1]
+      is_chain = right.tag == command_e.AndOr
+      child = right.children[0] if is_chain else right
+      if node.op_id not in (Id.Op_DPipe, Id.Op_DAmp):
+        raise AssertionError(node.op_id)
+      rest.append((node.op_id == Id.Op_DPipe, self.Compile(child)))
+      if not is_chain:
+        break
+      node = right
+
+    ex = self.ex
+
+    # Every function that runs sets $?.
+    def AndOr():
+      status = first()
+      for is_or, func in rest:
+        if ex.control_flow is not None:
+          break
+        if (status != 0) == is_or:
+          status = func()
+      return status
+    return AndOr
+
+  def _CompileWhile(self, node):
+    cond = self.Compile(node.cond)
+    body = self.Compile(node.body)
+    is_while = node.tag == command_e.While
+    finish = self._Finisher(False)
+    ex = self.ex
+
+    def While():
+      status = 0  # in case we don't loop
+      while True:
+        done = (cond() != 0) == is_while  # until stops when it's 0
+        if done or ex.control_flow is not None:
+          break
+        status = body()  # last one wins
+        cf = ex.control_flow
+        if cf is not None:
+          if cf.IsReturn():  # return needs to pop up more
+            break
+          ex.control_flow = None
+          status = 0
+          if cf.IsBreak():
+            break
+      return finish(status)
+    return While
+
+  def _CompileForEach(self, node):
+    ex = self.ex
+    mem = ex.mem
+    ev = ex.ev
+    iter_name = node.iter_name
+    body = self.Compile(node.body)
+    finish = self._Finisher(False)
+
+    # Constant folding: 'for i in 1 2 3' always loops over the same words.
+    iter_words = node.iter_words
+    const_list = None
+    if not node.do_arg_iter:
+      static = [word_eval._StaticArg(w) for w in iter_words]
+      if None not in static:
+        const_list = static
 
+    def ForEach():
+      if node.do_arg_iter:
+        iter_list = mem.GetArgv()
+      elif const_list is not None:
+        iter_list = const_list
+      else:
+        # We need word splitting and so forth
+        iter_list = ev.EvalWordSequence(braces.BraceExpandWords(iter_words))
 
-def main(argv):
-  print('Hello from compile.py')
+      status = 0  # in case we don't loop
+      for x in iter_list:
+        mem.SetLocal(iter_name, runtime.Str(x))
+        status = body()  # last one wins
+        cf = ex.control_flow
+        if cf is not None:
+          if cf.IsReturn():  # return needs to pop up more
+            break
+          ex.control_flow = None
+          status = 0
+          if cf.IsBreak():
+            break
+      return finish(status)
+    return ForEach
 
+  def _CompileIf(self, node):
+    arms = [(self.Compile(arm.cond), self.Compile(arm.action))
+            for arm in node.arms]
+    if node.else_action is not None:
+      else_action = self.Compile(node.else_action)
+    else:
+      else_action = None
+    finish = self._Finisher(False)
+    ex = self.ex
 
-if __name__ == '__main__':
-  try:
-    main(sys.argv)
-  except RuntimeError as e:
-    print('FATAL: %s' % e, file=sys.stderr)
-    sys.exit(1)
+    def If():
+      for cond, action in arms:
+        status = cond()
+        if ex.control_flow is not None:
+          break
+        if status == 0:
+          status = action()
+          break
+      else:
+        if else_action is not None:
+          status = else_action()
+      return finish(status)
+    return If
@@ -7,10 +7,24 @@
 #   http://www.apache.org/licenses/LICENSE-2.0
 """
 lexer.py - Library for lexing.
+
+There are two engines for matching a lexer mode against a line:
+
+- 'regex': Try every regex in the mode at the current position and take the
+  FIRST longest match.  This is the reference implementation.
+- 'dfa': Compile all patterns in the mode into a single NFA, and lazily build
+  a DFA from it while lexing (like RE2).  It has the same "first longest match"
+  semantics, but each token costs one pass over its characters rather than one
+  regex call per pattern.
 """
 
 import re
 
+try:
+  from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+  import sre_parse
+
 from core import util
 from core.id_kind import Id, IdName
 
@@ -52,18 +66,254 @@ def FindLongestMatch(re_list, s, pos):
   return end_index, tok_type, tok_val
 
 
+class _RegexMatcher(object):
+  """Match a lexer mode by trying every regex.  See FindLongestMatch."""
+
+  def __init__(self, pat_list):
+    self.re_list = CompileAll(pat_list)
+
+  def Match(self, s, pos):
+    return FindLongestMatch(self.re_list, s, pos)
+
+
+class _Nfa(object):
+  """A Thompson NFA for all the patterns in a lexer mode.
+
+  States are integers.  Each state has a list of character edges and a list of
+  epsilon edges.  A character edge is (chars, negated, target), and it matches
+  c if (c in chars) != negated.
+  """
+  def __init__(self):
+    self.char_edges = []
+    self.eps_edges = []
+    self.accepts = {}  # state -> index of the pattern, for "first" match
+
+  def NewState(self):
+    self.char_edges.append([])
+    self.eps_edges.append([])
+    return len(self.char_edges) - 1
+
+  def AddConst(self, start, s):
+    for c in s:
+      end = self.NewState()
+      self.char_edges[start].append((frozenset([c]), False, end))
+      start = end
+    return start
+
+  def AddRegex(self, start, pat):
+    return self._Seq(sre_parse.parse(pat), start)
+
+  def _Seq(self, items, start):
+    for op, arg in items:
+      start = self._Item(op, arg, start)
+    return start
+
+  def _Chars(self, start, chars, negated):
+    end = self.NewState()
+    self.char_edges[start].append((frozenset(chars), negated, end))
+    return end
+
+  def _Item(self, op, arg, start):
+    """Add one sre_parse item to the NFA, and return its end state.
+
+    Raises NotImplementedError for constructs that don't have a simple DFA
+    translation with the same semantics as the backtracking engine, e.g.
+    non-greedy repetition, anchors, and backreferences.
+    """
+    if op == sre_parse.LITERAL:
+      return self._Chars(start, [chr(arg)], False)
+
+    if op == sre_parse.NOT_LITERAL:
+      return self._Chars(start, [chr(arg)], True)
+
+    if op == sre_parse.ANY:  # . doesn't match newline without re.DOTALL
+      return self._Chars(start, ['\n'], True)
+
+    if op == sre_parse.IN:
+      chars = []
+      negated = False
+      for in_op, in_arg in arg:
+        if in_op == sre_parse.NEGATE:
+          negated = True
+        elif in_op == sre_parse.LITERAL:
+          chars.append(chr(in_arg))
+        elif in_op == sre_parse.RANGE:
+          lo, hi = in_arg
+          chars.extend(chr(i) for i in range(lo, hi + 1))
+        else:
+          raise NotImplementedError(in_op)
+      return self._Chars(start, chars, negated)
+
+    if op == sre_parse.SUBPATTERN:
+      return self._Seq(arg[-1], start)  # the layout differs across versions
+
+    if op == sre_parse.BRANCH:
+      end = self.NewState()
+      for alt in arg[1]:
+        alt_start = self.NewState()
+        self.eps_edges[start].append(alt_start)
+        alt_end = self._Seq(alt, alt_start)
+        self.eps_edges[alt_end].append(end)
+      return end
+
+    if op == sre_parse.MAX_REPEAT:
+      lo, hi, sub = arg
+      for _ in range(lo):
+        start = self._Seq(sub, start)
+      if hi == sre_parse.MAXREPEAT:
+        loop = self.NewState()
+        self.eps_edges[start].append(loop)
+        loop_end = self._Seq(sub, loop)
+        self.eps_edges[loop_end].append(loop)
+        return loop
+      for _ in range(hi - lo):
+        end = self.NewState()
+        self.eps_edges[start].append(end)
+        opt_end = self._Seq(sub, start)
+        self.eps_edges[opt_end].append(end)
+        start = end
+      return start
+
+    raise NotImplementedError(op)
+
+  def Closure(self, states):
+    result = set(states)
+    stack = list(states)
+    while stack:
+      s = stack.pop()
+      for t in self.eps_edges[s]:
+        if t not in result:
+          result.add(t)
+          stack.append(t)
+    return frozenset(result)
+
+
+class _DState(object):
+  """A DFA state: a set of NFA states, with lazily computed transitions."""
+
+  def __init__(self, nfa_states, accept):
+    self.nfa_states = nfa_states
+    self.accept = accept  # pattern index, or -1
+    self.trans = {}  # char -> _DState
+
+
+class _DfaMatcher(object):
+  """Match a lexer mode with a lazily constructed DFA.
+
+  DFA states and transitions are only computed the first time a (state, char)
+  pair is seen, so construction cost is proportional to the input actually
+  lexed, not the size of the alphabet.
+  """
+
+  def __init__(self, pat_list):
+    nfa = _Nfa()
+    start = nfa.NewState()
+    self.tok_types = []
+    for i, (is_regex, pat, tok_type) in enumerate(pat_list):
+      pat_start = nfa.NewState()
+      nfa.eps_edges[start].append(pat_start)
+      if is_regex:
+        pat_end = nfa.AddRegex(pat_start, pat)
+      else:
+        pat_end = nfa.AddConst(pat_start, pat)
+      nfa.accepts[pat_end] = i
+      self.tok_types.append(tok_type)
+
+    self.nfa = nfa
+    self.dstates = {}  # frozenset of NFA states -> _DState
+    self.dead = self._GetDState(frozenset())
+    self.start = self._GetDState(nfa.Closure([start]))
+
+  def _GetDState(self, nfa_states):
+    d = self.dstates.get(nfa_states)
+    if d is None:
+      accepts = [
+          self.nfa.accepts[s] for s in nfa_states if s in self.nfa.accepts]
+      d = _DState(nfa_states, min(accepts) if accepts else -1)
+      self.dstates[nfa_states] = d
+    return d
+
+  def _Step(self, d, c):
+    targets = []
+    for s in d.nfa_states:
+      for chars, negated, t in self.nfa.char_edges[s]:
+        if (c in chars) != negated:
+          targets.append(t)
+    next_d = self._GetDState(self.nfa.Closure(targets))
+    d.trans[c] = next_d
+    return next_d
+
+  def Match(self, s, pos):
+    """Like FindLongestMatch, but with one pass over the characters."""
+    d = self.start
+    dead = self.dead
+    n = len(s)
+    i = pos
+    end_index = pos
+    accept = d.accept  # some patterns can match the empty string, e.g. .*
+    while i < n:
+      c = s[i]
+      next_d = d.trans.get(c)
+      if next_d is None:
+        next_d = self._Step(d, c)
+      if next_d is dead:
+        break
+      d = next_d
+      i += 1
+      if d.accept != -1:
+        end_index = i
+        accept = d.accept
+
+    if accept == -1:
+      raise AssertionError('no match at position %d: %r' % (pos, s))
+    return end_index, self.tok_types[accept], s[pos:end_index]
+
+
+def CompileDfa(pat_list):
+  """Return a _DfaMatcher, or a _RegexMatcher if a pattern is unsupported."""
+  try:
+    return _DfaMatcher(pat_list)
+  except NotImplementedError:
+    return _RegexMatcher(pat_list)
+
+
+# Engine name -> function that compiles a list of patterns to a matcher.
+ENGINES = {
+    'regex': _RegexMatcher,
+    'dfa': CompileDfa,
+}
+
+
+class CompiledLexerDef(object):
+  """The matchers for every mode of a lexer definition.
+
+  Compiling is the expensive part of creating a LineLexer, and the matchers
+  are immutable except for the DFA cache, so one instance can be shared by all
+  the LineLexers in a process.  Sharing also lets them reuse DFA states.
+  """
+
+  def __init__(self, lexer_def, engine='dfa'):
+    compile_func = ENGINES[engine]
+    self.matchers = {}  # lex mode -> matcher
+    for state, pat_list in lexer_def.items():
+      self.matchers[state] = compile_func(pat_list)
+
+
 class LineLexer(object):
-  def __init__(self, lexer_def, line, arena=None):
-    # Compile all regexes
-    self.lexer_def = {}
+  def __init__(self, lexer_def, line, arena=None, engine='dfa'):
+    """
+    Args:
+      lexer_def: CompiledLexerDef, or a dict of lex mode -> patterns, which
+        is compiled for this instance with the given engine.
+    """
+    if not isinstance(lexer_def, CompiledLexerDef):
+      lexer_def = CompiledLexerDef(lexer_def, engine=engine)
+    self.lexer_def = lexer_def.matchers
     self.arena = arena
 
     self.arena_skip = False  # For MaybeUnreadOne
     self.last_span_id = -1  # For MaybeUnreadOne
 
-    for state, pat_list in lexer_def.items():
-      self.lexer_def[state] = CompileAll(pat_list)
-
     self.Reset(line, -1)  # Invalid arena index to start
 
   def Reset(self, line, line_id):
@@ -92,9 +342,8 @@ class LineLexer(object):
         t = ast.token(Id.Eof_Real, '')  # no location
         return t
 
-      re_list = self.lexer_def[lex_mode]
-      end_index, tok_type, tok_val = FindLongestMatch(
-          re_list, self.line, pos)
+      matcher = self.lexer_def[lex_mode]
+      end_index, tok_type, tok_val = matcher.Match(self.line, pos)
       # NOTE: Instead of hard-coding this token, we could pass it in.  This one
       # only appears in OUTER state!  LookAhead(lex_mode, past_token_type)
       if tok_type != Id.WS_Space:
@@ -110,10 +359,8 @@ class LineLexer(object):
     if self.AtEnd():
       raise AssertionError('EOF')
 
-    re_list = self.lexer_def[lex_mode]
-
-    end_index, tok_type, tok_val = FindLongestMatch(
-        re_list, self.line, self.line_pos)
+    matcher = self.lexer_def[lex_mode]
+    end_index, tok_type, tok_val = matcher.Match(self.line, self.line_pos)
 
     # NOTE: tok_val is redundant, but even in osh.asdl we have some separation
     # between data needed for formatting and data needed for execution.  Could
@@ -121,7 +368,6 @@ class LineLexer(object):
 
     # TODO: Add this back once arena is threaded everywhere
     #assert self.line_id != -1
-    line_span = ast.line_span(self.line_id, self.line_pos, len(tok_val))
 
     # NOTE: We're putting the arena hook in LineLexer and not Lexer because we
     # want it to be "low level".  The only thing fabricated here is a newline
@@ -133,7 +379,8 @@ class LineLexer(object):
         span_id = self.last_span_id
         self.arena_skip = False
       else:
-        span_id = self.arena.AddLineSpan(line_span)
+        span_id = self.arena.NewLineSpan(
+            self.line_id, self.line_pos, len(tok_val))
         self.last_span_id = span_id
     else:
       # Completion parser might not have arena?
@@ -11,33 +11,180 @@ process.py - Runtime library for launching processes and manipulating file
 descriptors.
 """
 
+import collections
+import errno
 import fcntl
 import os
+import signal
+import stat
 import sys
+import time
 
 from core import util
 from core.util import log
-from core.id_kind import REDIR_DEFAULT_FD
+from core.id_kind import Id, REDIR_DEFAULT_FD
+
+# Start external commands with posix_spawn() when possible, rather than
+# fork() of the interpreter and exec().  It's only in Python 3.8+.  Set to
+# False to always fork, e.g. for benchmarks.
+SPAWN = hasattr(os, 'posix_spawn')
+
+# Always start a process to write here docs to a pipe, like we used to.  For
+# benchmarks.
+HERE_DOC_FORK = False
+
+# How many statuses of finished background jobs to remember for 'wait'.  Like
+# bash, the oldest are forgotten, so a shell that never waits doesn't grow.
+MAX_JOB_STATUSES = 1024
+
+
+def OpenAnonymousFile(name):
+  """Return a read-write descriptor for a file that has no path.
+
+  It's closed on exec().  It's a memfd where available, and otherwise a file in
+  $TMPDIR that's unlinked right away.
+  """
+  if hasattr(os, 'memfd_create'):
+    try:
+      return os.memfd_create(name, os.MFD_CLOEXEC)
+    except OSError:
+      pass  # e.g. an old kernel
+
+  # Not the tempfile module: in Python 2 it keeps /dev/urandom open on a low
+  # descriptor, which the user's redirects could clobber.
+  tmp_dir = os.getenv('TMPDIR') or '/tmp'
+  flags = os.O_RDWR | os.O_CREAT | os.O_EXCL
+  for i in range(100):
+    path = os.path.join(tmp_dir, '%s-%d-%d' % (name, os.getpid(), i))
+    try:
+      fd = os.open(path, flags, 0o600)
+    except OSError as e:
+      if e.errno == errno.EEXIST:
+        continue
+      raise
+    os.unlink(path)
+    fcntl.fcntl(fd, fcntl.F_SETFD, fcntl.FD_CLOEXEC)
+    return fd
+  raise OSError(errno.EEXIST, "Couldn't create a file in %s" % tmp_dir)
 
 
 class _FdFrame:
   def __init__(self):
     self.saved = []
     self.need_close = []
+    self.need_wait = []  # processes, e.g. here doc writers
 
   def __repr__(self):
-    return '<_FdFrame %s %s>' % (self.saved, self.need_close)
+    return '<_FdFrame %s %s %s>' % (
+        self.saved, self.need_close, self.need_wait)
+
+
+def _WriteAll(fd, byte_str):
+  while byte_str:
+    n = os.write(fd, byte_str)
+    byte_str = byte_str[n:]
+
+
+class OutputBuffer(object):
+  """Output of builtins to a descriptor, written with few system calls.
+
+  It's written when it gets big, when the descriptor is about to change, before
+  forking, and after each top-level command.  If the descriptor is a terminal,
+  it's written on every call to Write().
+  """
+  def __init__(self, fd, max_size=65536):
+    self.fd = fd
+    self.max_size = max_size
+    self.chunks = []
+    self.size = 0
+    self.is_tty = None  # checked on the first write after each flush
+
+  def Write(self, s):
+    self.chunks.append(s)
+    self.size += len(s)
+    if self.is_tty is None:
+      self.is_tty = os.isatty(self.fd)
+    if self.is_tty or self.size >= self.max_size:
+      self.Flush()
+
+  def LogError(self, msg, *args):
+    """Print an error message to stderr, after the output so far."""
+    self.Flush()
+    log(msg, *args)
+
+  def Flush(self):
+    self.is_tty = None  # The descriptor may change after this
+    if not self.chunks:
+      return
+    s = ''.join(self.chunks)
+    self.chunks = []
+    self.size = 0
+    if not util.PY2:
+      s = s.encode('utf-8')
+    try:
+      _WriteAll(self.fd, s)
+    except OSError as e:  # e.g. EPIPE.  The output is lost.
+      log('osh: write error: %s', e)
+
+
+def ReadRecord(fd, delim, max_bytes=-1):
+  """Read from a descriptor up to a delimiter, without consuming anything after it.
+
+  Regular files are read in blocks, and the offset is moved back to just after
+  the delimiter.  Anything else, e.g. a pipe, is read a byte at a time, so the
+  rest is left for the next command.
+
+  Args:
+    fd: descriptor to read from
+    delim: one-byte delimiter
+    max_bytes: stop after this many bytes, if not -1
+
+  Returns:
+    (bytes read without the delimiter, whether the delimiter was found)
+  """
+  seekable = stat.S_ISREG(os.fstat(fd).st_mode)
+  block_size = 512 if seekable else 1
+  chunks = []
+  num_read = 0
+  while True:
+    n = block_size
+    if max_bytes != -1:
+      n = min(n, max_bytes - num_read)
+      if n <= 0:
+        break
+    chunk = os.read(fd, n)
+    if not chunk:  # EOF
+      break
+    i = chunk.find(delim)
+    if i != -1:
+      extra = len(chunk) - i - 1
+      if extra:
+        os.lseek(fd, -extra, os.SEEK_CUR)
+      chunks.append(chunk[:i])
+      return b''.join(chunks), True
+    chunks.append(chunk)
+    num_read += len(chunk)
+    if seekable:
+      block_size = min(block_size * 2, 65536)  # for long lines
+  return b''.join(chunks), False
 
 
 class FdState:
   """This is for the current process, as opposed to child processes. 
 
   For example, you can do 'myfunc > out.txt' without forking.
+
+  It also owns the buffer for builtins that write to stdout, which must be
+  flushed before descriptor 1 changes.
   """
   def __init__(self, next_fd=10):
     self.next_fd = next_fd  # where to start saving descriptors
     self.cur_frame = _FdFrame()  # for the top level
     self.stack = [self.cur_frame]
+    self.stdout = OutputBuffer(1)
+
+  def Flush(self):
+    self.stdout.Flush()
 
   def PushFrame(self):
     #log('> PushFrame')
@@ -49,10 +196,13 @@ class FdState:
     """
     Save fd2 and dup fd1 onto fd2.
     """
+    self.stdout.Flush()
     #log('---- SaveAndDup %s %s\n', fd1, fd2)
-    fcntl.fcntl(fd2, fcntl.F_DUPFD, self.next_fd)
+    # NOTE: F_DUPFD returns the lowest free descriptor >= next_fd, which isn't
+    # next_fd if the process inherited or opened it.
+    new_fd = fcntl.fcntl(fd2, fcntl.F_DUPFD, self.next_fd)
     os.close(fd2)
-    fcntl.fcntl(self.next_fd, fcntl.F_SETFD, fcntl.FD_CLOEXEC)
+    fcntl.fcntl(new_fd, fcntl.F_SETFD, fcntl.FD_CLOEXEC)
 
     #log('==== dup %s %s\n' % (fd1, fd2))
     try:
@@ -61,29 +211,34 @@ class FdState:
       #print("%s: %s %s" % (e, fd1, fd2))
       print(e, file=sys.stderr)
       # Restore and return error
-      os.dup2(self.next_fd, fd2)
-      os.close(self.next_fd)
+      os.dup2(new_fd, fd2)
+      os.close(new_fd)
       # Undo it
       return False
 
     # Oh this is wrong?
     #os.close(fd1)
 
-    self.cur_frame.saved.append((self.next_fd, fd2))
-    self.next_fd += 1
+    self.cur_frame.saved.append((new_fd, fd2))
+    self.next_fd = new_fd + 1
     return True
 
   def NeedClose(self, fd):
     self.cur_frame.need_close.append(fd)
 
+  def NeedWait(self, proc):
+    self.cur_frame.need_wait.append(proc)
+
   def PopAndRestore(self):
     frame = self.stack.pop()
     #log('< Pop %s', frame)
+    if frame.saved:  # Otherwise the buffered output goes to the same place
+      self.stdout.Flush()
     for saved, orig in reversed(frame.saved):
       os.dup2(saved, orig)
       os.close(saved)
       #log('dup2 %s %s', saved, orig)
-      self.next_fd -= 1  # Count down
+      self.next_fd = saved  # Count down
 
     for fd in frame.need_close:
       #log('Close %d', fd)
@@ -93,6 +248,10 @@ class FdState:
         log('Error closing descriptor %d: %s', fd, e)
         raise
 
+    # After closing, so a writer that's blocked on a full pipe gets EPIPE.
+    for proc in frame.need_wait:
+      proc.Wait()
+
   def PopAndForget(self):
     self.stack.pop()
 
@@ -115,6 +274,13 @@ class Redirect(object):
   def AfterForkInParent(self):
     pass
 
+  def SpawnActions(self):
+    """Returns the equivalent of ApplyInChild() as posix_spawn() file actions.
+
+    None means it can't be expressed that way, so the process has to fork.
+    """
+    return None
+
 
 class ReadPipeRedirect(Redirect):
   def __init__(self, fd):
@@ -127,6 +293,10 @@ class ReadPipeRedirect(Redirect):
   def AfterForkInParent(self):
     os.close(self.fd)
 
+  def SpawnActions(self):
+    return [(os.POSIX_SPAWN_DUP2, self.fd, 0),
+            (os.POSIX_SPAWN_CLOSE, self.fd)]
+
 
 class WritePipeRedirect(Redirect):
   def __init__(self, fd):
@@ -139,6 +309,10 @@ class WritePipeRedirect(Redirect):
   def AfterForkInParent(self):
     os.close(self.fd)
 
+  def SpawnActions(self):
+    return [(os.POSIX_SPAWN_DUP2, self.fd, 1),
+            (os.POSIX_SPAWN_CLOSE, self.fd)]
+
 
 class UserRedirect(Redirect):
   """Redirects written in source code?"""
@@ -150,23 +324,35 @@ class UserRedirect(Redirect):
     self.op_id = op_id
 
 
+_OPEN_FLAGS = {
+    Id.Redir_Less: os.O_RDONLY,
+    Id.Redir_Great: os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+    Id.Redir_Clobber: os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+    Id.Redir_DGreat: os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+    Id.Redir_LessGreat: os.O_RDWR | os.O_CREAT,
+}
+
+
 class FilenameRedirect(UserRedirect):
   def __init__(self, op_id, fd, filename):
     UserRedirect.__init__(self, op_id, fd)
     self.filename = filename
+    self.flags = _OPEN_FLAGS[op_id]
 
   def ApplyInChild(self):
-    # TODO: Implement stdin
-    target_fd = os.open(self.filename, os.O_CREAT | os.O_RDWR | os.O_TRUNC)
+    target_fd = os.open(self.filename, self.flags, 0o666)
     os.dup2(target_fd, self.fd)
     os.close(target_fd)
 
   def ApplyInParent(self, fd_state):
-    target_fd = os.open(self.filename, os.O_CREAT | os.O_RDWR | os.O_TRUNC)
+    target_fd = os.open(self.filename, self.flags, 0o666)
     #log('fd %d - target fd %d', self.fd, target_fd)
     fd_state.SaveAndDup(target_fd, self.fd)
     fd_state.NeedClose(target_fd)
 
+  def SpawnActions(self):
+    return [(os.POSIX_SPAWN_OPEN, self.fd, self.filename, self.flags, 0o666)]
+
 
 class DescriptorRedirect(UserRedirect):
   def __init__(self, op_id, fd, target_fd):
@@ -179,69 +365,97 @@ class DescriptorRedirect(UserRedirect):
   def ApplyInParent(self, fd_state):
     fd_state.SaveAndDup(self.target_fd, self.fd)
 
+  def SpawnActions(self):
+    return [(os.POSIX_SPAWN_DUP2, self.target_fd, self.fd)]
+
+
+def _PipeCapacity(fd):
+  """How many bytes can be written to the pipe without blocking."""
+  try:
+    # Linux only.  The constant is in Python 3.10+.
+    return fcntl.fcntl(fd, getattr(fcntl, 'F_GETPIPE_SZ', 1032))
+  except (IOError, OSError):
+    return 4096  # The smallest buffer of any Unix
+
 
 class HereDocRedirect(UserRedirect):
+  """Feed the body of a here doc to a descriptor.
+
+  The body is written to a pipe up front if it fits in the pipe's buffer.
+  Otherwise it's written to an anonymous file, which the command reads from
+  the start.  A process that writes to a pipe is the last resort, e.g. if
+  $TMPDIR isn't writable.
+  """
   def __init__(self, op_id, fd, body_str):
     UserRedirect.__init__(self, op_id, fd)
     self.body_str = body_str
-    self.r = -1
-    self.w = -1
+    self.r = -1  # what the command reads
+    self.w = -1  # the pipe the writer process writes to, if any
     self.here_proc = None
 
   def _CreatePipeAndMaybeProcess(self, fd_state):
-    """
-    Create a pipe to write the here doc to.  For big here docs, create a
-    separate process to avoid deadlock.
-    """
+    """Set self.r to a descriptor with the body of the here doc."""
+    body_str = self.body_str
+    byte_str = body_str if util.PY2 else body_str.encode('utf-8')
+
+    if not HERE_DOC_FORK:
+      r, w = os.pipe()
+      if len(byte_str) <= _PipeCapacity(w):
+        os.write(w, byte_str)  # never blocks
+        os.close(w)
+        self.r = r
+        return
+      os.close(r)
+      os.close(w)
+
+      try:
+        fd = OpenAnonymousFile('osh-here-doc')
+      except OSError:
+        pass
+      else:
+        _WriteAll(fd, byte_str)
+        os.lseek(fd, 0, os.SEEK_SET)
+        self.r = fd
+        return
+
     self.r, self.w = os.pipe()
-    thunk = HereDocWriterThunk(self.w, self.body_str)
-    start_process = len(self.body_str) > 10  # TODO: Use correct heuristic
-
-    start_process = True
-    if start_process:
-      #print('starting here doc helper process')
-      self.here_proc = Process(thunk)
-      self.here_proc.Start()  # who waits for this guy?
-
-      # here proc is not going to read.  Or really you don't have to worry
-      # about this?
-      #self.here_proc.ChildClose(self.r)
-    else:
-      #print('writing %s to pipe in %d shell process' % (self.here_lines,)
-      #    self.w)
-      thunk.RunInParent()
-      os.close(self.w)
+    self.here_proc = Process(HereDocWriterThunk(self.w, self.body_str))
+    # Otherwise the writer never gets EPIPE if the command stops reading.
+    self.here_proc.close_in_child.append(self.r)
+    self.here_proc.Start()
 
-  def BeforeFork(self, fd_state):  # applying in child
-    #print('!!! BeforeFork')
+  def BeforeFork(self, fd_state):
     self._CreatePipeAndMaybeProcess(fd_state)
 
-  def ApplyInChild(self):  # in child
+  def ApplyInChild(self):
     """When we have an external command."""
-    #print('!! ApplyInChild')
-    os.dup2(self.r, 0)  # TODO: self.fd
+    os.dup2(self.r, self.fd)
+    if self.w != -1:
+      os.close(self.w)  # child is not going to write
 
-    # NOTE: If we write the short doc to the pipe synchronously, we can't close
-    # here!
-    #print(os.listdir('/dev/fd'))
-    #print('CLOSING', self.w)
-    os.close(self.w)  # child is not going to write
+  def SpawnActions(self):
+    actions = [(os.POSIX_SPAWN_DUP2, self.r, self.fd)]
+    if self.w != -1:
+      actions.append((os.POSIX_SPAWN_CLOSE, self.w))
+    return actions
 
-  def AfterForkInParent(self):  # applying in child
+  def AfterForkInParent(self):
     os.close(self.r)  # parent isn't going to read or write
-    os.close(self.w)
+    if self.w != -1:
+      os.close(self.w)
 
-    #print('!! AfterForkInParent')
     if self.here_proc:
-      status = self.here_proc.Wait()
-      #print('Here doc writer finished with status %d' % status)
+      self.here_proc.Wait()
 
   # Separate path: Apply the whole thing in the parent
   def ApplyInParent(self, fd_state):
     """When we have a builtin command."""
-    #print('!! ApplyInParent')
     self._CreatePipeAndMaybeProcess(fd_state)
-    fd_state.SaveAndDup(self.r, 0)  # dup stdin.  TODO: self.fd
+    fd_state.SaveAndDup(self.r, self.fd)
+    fd_state.NeedClose(self.r)
+    if self.w != -1:
+      os.close(self.w)
+      fd_state.NeedWait(self.here_proc)
 
 
 class CommandSubRedirect(Redirect):
@@ -273,6 +487,10 @@ class CommandSubRedirect(Redirect):
     os.dup2(self.w, 1)
     os.close(self.r)  # child is not going read
 
+  def SpawnActions(self):
+    return [(os.POSIX_SPAWN_DUP2, self.w, 1),
+            (os.POSIX_SPAWN_CLOSE, self.r)]
+
   def AfterForkInParent(self):
     os.close(self.w)  # not going to read
     while True:
@@ -293,14 +511,13 @@ class Thunk(object):
     """Returns a status code."""
     raise NotImplementedError
 
-  def RunInChild(self):
-    """Never returns."""
-    self.RunInParent()
+  def DisplayName(self):
+    """For pipeline reports."""
+    return '<%s>' % self.__class__.__name__
 
-    # TODO: How do we communicate a bad status to the parent process?  It
-    # waits?  Signal?
-    # The problem is that a subshell cannot fail!
-    sys.exit(0)  # This is required
+  def RunInChild(self):
+    """Returns the status that the child process exits with."""
+    return self.RunInParent() or 0  # the here doc writer returns None
 
   def IsExternal(self):
     """Test if a thunk represents an external process (ExternalThunk)."""
@@ -314,26 +531,53 @@ class Thunk(object):
 class ExternalThunk(Thunk):
   """An external executable."""
 
-  def __init__(self, argv, more_env=None):
+  def __init__(self, argv, environ=None, path=None):
+    """
+    Args:
+      environ: the whole environment of the process, which isn't copied.  By
+        default it's the shell's environment.
+      path: absolute path of the executable, if it was already resolved.
+        Otherwise argv[0] is looked up in $PATH by execvpe().
+    """
     self.argv = argv
-    self.more_env = more_env or {}
+    self.environ = environ
+    self.path = path
 
   def IsExternal(self):
     return True
 
+  def DisplayName(self):
+    return ' '.join(self.argv)
+
+  def _Env(self):
+    if self.environ is None:
+      return os.environ
+    return self.environ
+
+  def Spawn(self, file_actions):
+    """Start the command with posix_spawn(), instead of forking.
+
+    Returns:
+      The pid.  Raises OSError if the command couldn't be executed.
+    """
+    assert self.path, self.argv
+    return os.posix_spawn(self.path, self.argv, self._Env(),
+                          file_actions=file_actions,
+                          setsigdef=(signal.SIGPIPE,))
+
   def RunInParent(self):
     """
     An ExternalThunk is run in parent for the exec builtin.
     """
     # TODO: If there is an error, like the file isn't executable, then we
     # should exit, and the parent will reap it.  Should it capture stderr?
-
-    # NOTE: Do we have to do this?
-    env = dict(os.environ)
-    env.update(self.more_env)
+    env = self._Env()
 
     try:
-      os.execvpe(self.argv[0], self.argv, env)
+      if self.path:
+        os.execve(self.path, self.argv, env)
+      else:
+        os.execvpe(self.argv[0], self.argv, env)
     except OSError as e:
       log('Unexpected error in execvpe(%r, %r, ...): %s', self.argv[0],
           self.argv, e)
@@ -342,6 +586,80 @@ class ExternalThunk(Thunk):
     # no return
 
 
+class PathHash(object):
+  """Remembers where commands were found in $PATH, like the bash hash table.
+
+  The table is valid for one value of $PATH.  It's cleared when a lookup is
+  done with a different value, i.e. after PATH is assigned.
+  """
+
+  def __init__(self):
+    self.path_str = None  # the $PATH the entries were found in
+    self.table = {}  # command name -> absolute path
+    self.hits = {}  # command name -> number of lookups, for 'hash'
+
+  def Clear(self):
+    self.table.clear()
+    self.hits.clear()
+
+  def _SetPath(self, path_str):
+    if path_str != self.path_str:
+      self.Clear()
+      self.path_str = path_str
+
+  def Lookup(self, name, path_str):
+    """Find an executable.
+
+    Args:
+      name: argv[0]
+      path_str: the value of $PATH
+
+    Returns:
+      The path to execute, or None if it's not in $PATH.  A name containing a
+      slash is returned as is.
+    """
+    if '/' in name:
+      return name
+
+    self._SetPath(path_str)
+    full_path = self.table.get(name)
+    if full_path is None:
+      full_path = self.Search(name, path_str, remember=True)
+    if name in self.table:
+      self.hits[name] += 1
+    return full_path
+
+  def Remember(self, name, path_str):
+    """Search $PATH and add the result to the table, for 'hash NAME'.
+
+    Returns:
+      The path, or None if it's not in $PATH.
+    """
+    self._SetPath(path_str)
+    return self.Search(name, path_str, remember=True)
+
+  def Search(self, name, path_str, remember=False):
+    """Search $PATH, bypassing the table.
+
+    Args:
+      remember: whether to add the result to the table
+    """
+    for dir_name in path_str.split(':'):
+      full_path = os.path.join(dir_name or '.', name)
+      if os.path.isfile(full_path) and os.access(full_path, os.X_OK):
+        # Entries in a relative dir depend on the working directory.
+        if remember and full_path.startswith('/'):
+          self.table[name] = full_path
+          self.hits[name] = 0
+        return full_path
+    return None
+
+  def Items(self):
+    """Returns a list of (name, path, hits), sorted by name."""
+    return [(name, self.table[name], self.hits[name])
+            for name in sorted(self.table)]
+
+
 class SubProgramThunk(Thunk):
   """A subprogram that can be executed in another process."""
 
@@ -375,6 +693,9 @@ class BuiltinThunk(Thunk):
     self.builtin_id = builtin_id
     self.argv = argv
 
+  def DisplayName(self):
+    return ' '.join(self.argv)
+
   def RunInParent(self):
     return self.ex.RunBuiltin(self.builtin_id, self.argv)
 
@@ -390,6 +711,9 @@ class FuncThunk(Thunk):
     self.func_node = func_node
     self.argv = argv
 
+  def DisplayName(self):
+    return ' '.join(self.argv)
+
   def RunInParent(self):
     return self.ex.RunFunc(self.func_node, self.argv)
 
@@ -404,7 +728,8 @@ class HereDocWriterThunk(Thunk):
     self.body_str = body_str
 
   def RunInParent(self):
-    byte_str = self.body_str.encode('utf-8')
+    body_str = self.body_str
+    byte_str = body_str if util.PY2 else body_str.encode('utf-8')
     os.write(self.w, byte_str)
     # Don't bother to close, since the process will die
     #os.close(self.w)
@@ -435,6 +760,13 @@ class Capturable(object):
     raise NotImplementedError
 
 
+def _StatusFromWait(raw_status):
+  """Turn a status from wait() into a shell exit status."""
+  if os.WIFSIGNALED(raw_status):
+    return 128 + os.WTERMSIG(raw_status)
+  return os.WEXITSTATUS(raw_status)
+
+
 class Process(object):
   """A process to run.
 
@@ -463,6 +795,11 @@ class Process(object):
 
     self.inputs = []
 
+    self.close_in_child = []  # other descriptors the child shouldn't keep
+    self.pid = -1  # set by Start()
+    self.status = -1  # set by Wait()
+    self.rusage = None  # resource usage of the child, set by Wait()
+
   def __repr__(self):
     return '<Process %s>' % self.thunk
 
@@ -472,43 +809,98 @@ class Process(object):
   def CaptureOutput(self, var):
     self.redirects.append(CommandSubRedirect(var))
 
+  def _SpawnActions(self):
+    """Returns posix_spawn() file actions, or None if we have to fork."""
+    if not SPAWN or not isinstance(self.thunk, ExternalThunk):
+      return None  # Python code has to run in the child.
+    if not self.thunk.path:
+      return None  # let execvpe() search, and report errors
+    actions = [(os.POSIX_SPAWN_CLOSE, fd) for fd in self.close_in_child]
+    for r in self.redirects:
+      r_actions = r.SpawnActions()
+      if r_actions is None:
+        return None
+      actions.extend(r_actions)
+    return actions
+
   def Start(self):
     """
     Start a process.
     """
+    if self.fd_state:
+      self.fd_state.Flush()  # Or the child would write it too
     for r in self.redirects:
       r.BeforeFork(self.fd_state)
 
+    # Fast path: an external command doesn't need a copy of the interpreter.
+    file_actions = self._SpawnActions()
+    if file_actions is not None:
+      try:
+        self.pid = self.thunk.Spawn(file_actions)
+      except OSError:
+        pass  # fork and report the error in the child, as usual
+      else:
+        for r in self.redirects:
+          r.AfterForkInParent()
+        return
+
     pid = os.fork()
     if pid < 0:
       # When does this happen?
       raise RuntimeError('Fatal error in os.fork()')
 
     elif pid == 0:  # child
+      # Python ignores SIGPIPE, and children would inherit that.  A writer
+      # in a pipeline should be killed when the reader exits, like in other
+      # shells.
+      signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+      for fd in self.close_in_child:
+        os.close(fd)
       # NOTE: We never call RestoreAll().  It doesn't really matter since
       # the process is torn down.
       for r in self.redirects:
         r.ApplyInChild()
 
-      self.thunk.RunInChild()
-      # Never returns
+      try:
+        status = self.thunk.RunInChild()
+      except SystemExit as e:  # 'exit' in a subshell, or exec() failed
+        status = e.code or 0
+      self._ExitChild(status)  # Never returns
 
+    self.pid = pid
     for r in self.redirects:  # here docs
       r.AfterForkInParent()
 
-  # TODO: Should be a free function.  Not using self!
+  def _ExitChild(self, status):
+    # The parent gets the status from wait(), e.g. for 'false &' and
+    # 'wait $!'.  Don't unwind the stack, which belongs to the parent.
+    if self.fd_state:
+      self.fd_state.Flush()
+    for f in (sys.stdout, sys.stderr):
+      try:
+        f.flush()
+      except (IOError, OSError):
+        pass
+    os._exit(status)
+
   def Wait(self):
-    # NOTE: Need to check errors
-    wait_pid, status = os.wait()
+    """Wait for this process to exit.
 
-    # TODO: change status in more cases.
-    if os.WIFSIGNALED(status):
-      pass
-    elif os.WIFEXITED(status):
-      status = os.WEXITSTATUS(status)
-      #log('exit status: %s', status)
+    Returns:
+      The exit status, or 128 + the signal number if it was killed.  It's
+      also saved in self.status, along with self.rusage.
+    """
+    assert self.pid != -1, 'Process not started'
+    while True:
+      try:
+        _, raw_status, self.rusage = os.wait4(self.pid, 0)
+        break
+      except OSError as e:
+        if e.errno != errno.EINTR:  # Python 2 doesn't retry
+          raise
 
-    return status
+    self.status = _StatusFromWait(raw_status)
+    return self.status
 
   def Run(self):
     self.Start()
@@ -534,6 +926,7 @@ class Pipeline(object):
   def __init__(self):
     self.procs = []
     self.pipes = []  # there is a pipe for every pair of procs.
+    self.elapsed = 0.0  # wall time of Run()
 
   def __repr__(self):
     return '<Pipeline %s>' % ' '.join(repr(p) for p in self.procs)
@@ -548,6 +941,7 @@ class Pipeline(object):
       return
 
     r, w = os.pipe()
+    self.pipes.append((r, w))
     prev = self.procs[-1]
 
     prev.AddRedirect(WritePipeRedirect(w))
@@ -566,20 +960,168 @@ class Pipeline(object):
     self.procs[-1].CaptureOutput(var)
 
   def Run(self):
-    for p in self.procs:
+    """Start every process and wait for all of them.
+
+    Returns:
+      A list of exit statuses, one for each process, in order.
+    """
+    start_time = time.time()
+    for i, p in enumerate(self.procs):
+      # All the pipes were created up front.  A child must not keep the read
+      # end of its own output, or the pipes of later stages.  Otherwise the
+      # writer never gets EPIPE, or the reader never gets EOF.
+      if i < len(self.pipes):
+        p.close_in_child.append(self.pipes[i][0])
+      for r, w in self.pipes[i+1:]:
+        p.close_in_child.extend((r, w))
       #print('start', p)
       p.Start()
-      # TODO: Return pid
 
     pipe_status = []
 
     # TODO: Could do some sort of garbage collection here  too.
     for p in self.procs:
-      # BUG: This doesn't do things in order!  It just calls os.wait()!
-      # Need to key off wait_pid
-
       status = p.Wait()
       #log('Process %s returned status %s', p, status)
       pipe_status.append(status)
 
+    self.elapsed = time.time() - start_time
     return pipe_status
+
+  def Report(self, f):
+    """Write the status and resource usage of each process to f.
+
+    maxrss includes the shell's memory before the child called exec(), so
+    it's never less than the size of the shell.
+    """
+    f.write('pipeline %.3f s\n' % self.elapsed)
+    for i, p in enumerate(self.procs):
+      ru = p.rusage
+      # ru_maxrss is in kilobytes on Linux.
+      f.write(
+          '  %d  pid %d  status %d  user %.3f  sys %.3f  maxrss %d KB  %s\n' %
+          (i, p.pid, p.status, ru.ru_utime, ru.ru_stime, ru.ru_maxrss,
+           p.thunk.DisplayName()))
+    f.flush()  # so forked children don't write it again
+
+
+class JobState(object):
+  """Background jobs started with &, and their statuses for 'wait'.
+
+  Once a job is started, a SIGCHLD handler reaps jobs as they exit, so they
+  don't stay zombies until 'wait'.  It polls the pid of each running job; it
+  never waits for -1, which could take the status of a foreground Process.
+  """
+
+  def __init__(self):
+    self.running = {}  # pid -> Process
+    # pid -> status of jobs that exited.  'wait -n' reports each one once, in
+    # the order they exited, but 'wait $pid' can still get it afterward.
+    self.finished = collections.OrderedDict()
+    self.statuses = collections.OrderedDict()  # at most MAX_JOB_STATUSES
+    self.handler_installed = False
+
+  def _InstallHandler(self):
+    if self.handler_installed:
+      return
+    signal.signal(signal.SIGCHLD, self._OnSigChld)
+    # Restart interrupted system calls, e.g. read() in Python 2.
+    signal.siginterrupt(signal.SIGCHLD, False)
+    self.handler_installed = True
+
+  def _OnSigChld(self, sig_num, unused_frame):
+    for pid in list(self.running):
+      self._Poll(pid)
+
+  def _Poll(self, pid):
+    """Record the status of a job if it has exited."""
+    try:
+      got, raw_status = os.waitpid(pid, os.WNOHANG)
+    except OSError:
+      return  # ECHILD: reaped by a blocking wait in progress
+    if got == pid:
+      self._Finish(pid, _StatusFromWait(raw_status))
+
+  def _Finish(self, pid, status):
+    p = self.running.pop(pid, None)
+    if p:
+      p.status = status
+    self.finished[pid] = status
+    self.statuses[pid] = status
+    if len(self.statuses) > MAX_JOB_STATUSES:
+      old_pid, _ = self.statuses.popitem(last=False)
+      self.finished.pop(old_pid, None)
+
+  def _WaitBlocking(self, pid):
+    """Block until pid, or any child if it's -1, exits.
+
+    Returns:
+      The pid that exited, or -1 if there are no children left.
+    """
+    try:
+      got, raw_status = os.waitpid(pid, 0)
+    except OSError as e:
+      if e.errno == errno.EINTR:  # Python 2 doesn't retry
+        return 0
+      if e.errno != errno.ECHILD:
+        raise
+      return -1
+    if got in self.running:
+      self._Finish(got, _StatusFromWait(raw_status))
+    return got
+
+  def Start(self, p):
+    """Start a Process in the background.
+
+    Returns:
+      Its pid, for $!.
+    """
+    self._InstallHandler()
+    p.Start()
+    # The pid may belong to an old job that was never waited for.
+    self.finished.pop(p.pid, None)
+    self.statuses.pop(p.pid, None)
+    self.running[p.pid] = p
+    # If it already exited, SIGCHLD came before it was in self.running.
+    self._Poll(p.pid)
+    return p.pid
+
+  def NumRunning(self):
+    return len(self.running)
+
+  def WaitPid(self, pid):
+    """Wait for one job.
+
+    Returns:
+      Its exit status, or None if it isn't a job of this shell.
+    """
+    if pid not in self.running and pid not in self.statuses:
+      return None
+    while pid in self.running:
+      if self._WaitBlocking(pid) == -1 and pid in self.running:
+        # Not our child, e.g. a job of the parent of a subshell.
+        self._Finish(pid, 127)
+    self.finished.pop(pid, None)
+    return self.statuses[pid]
+
+  def WaitNext(self):
+    """Wait for the next job to exit, for 'wait -n'.
+
+    Returns:
+      Its exit status, or None if there are no jobs.
+    """
+    while not self.finished:
+      if not self.running:
+        return None
+      if self._WaitBlocking(-1) == -1:
+        for pid in list(self.running):
+          self._Finish(pid, 127)
+    _, status = self.finished.popitem(last=False)
+    return status
+
+  def WaitAll(self):
+    """Wait for every job, and forget their statuses."""
+    for pid in list(self.running):
+      self.WaitPid(pid)
+    self.finished.clear()
+    self.statuses.clear()
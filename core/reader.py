@@ -86,6 +86,28 @@ class StringLineReader(_Reader):
     return line
 
 
+class FileLineReader(_Reader):
+  """For scripts and stdin.  Lines are read as the parser asks for them."""
+
+  def __init__(self, f, arena=None):
+    """
+    Args:
+      f: file object open for reading
+    """
+    _Reader.__init__(self, arena)
+    self.f = f
+
+  def _GetLine(self):
+    line = self.f.readline()
+    if not line:
+      return None
+
+    # Like StringLineReader
+    if not line.endswith('\n'):
+      line += '\n'
+    return line
+
+
 # C++ ownership notes:
 # - used for file input (including source)
 # - used for -c arg (NUL terminated, likely no newline)
@@ -1,30 +1,8 @@
 #!/usr/bin/env python3
 """
-core/runtime.py -- Parse runtime.asdl and dynamically create classes on this module.
+core/runtime.py -- The classes for runtime.asdl.
 
-Similar to osh/ast_.py.
+Similar to osh/ast_.py.  They're generated by asdl/gen_python.py.
 """
 
-import os
-import sys
-
-from asdl import py_meta
-from asdl import asdl_ as asdl
-
-def _ParseAndMakeTypes(schema_path, root):
-  module = asdl.parse(schema_path)
-
-  app_types = {}
-
-  # Check for type errors
-  if not asdl.check(module, app_types):
-    raise AssertionError('ASDL file is invalid')
-  py_meta.MakeTypes(module, root, app_types)
-
-
-bin_dir = os.path.dirname(os.path.abspath(sys.argv[0]))  # ~/git/oil/bin
-schema_path = os.path.join(bin_dir, '../core/runtime.asdl')  # ~/git/oil/osh
-
-root = sys.modules[__name__]
-
-_ParseAndMakeTypes(schema_path, root)
+from core.runtime_asdl import *
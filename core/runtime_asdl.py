@@ -0,0 +1,269 @@
+"""
+Generated by asdl/gen_python.py from core/runtime.asdl.  Don't edit.
+"""
+
+from asdl import asdl_ as asdl
+from asdl import py_meta
+
+# sha1 of the schema, for caches of encoded trees.
+SCHEMA_SHA1 = '9bede99a29e4df3a3bb67dc538204471f638e17d'
+
+_STR = asdl.DESCRIPTORS_BY_NAME['string']
+_INT = asdl.DESCRIPTORS_BY_NAME['int']
+_BOOL = asdl.DESCRIPTORS_BY_NAME['bool']
+_SPIDS = asdl.ArrayType(asdl.IntType())
+
+if py_meta.RELEASE:
+  _CompoundObj = py_meta.UncheckedObj
+else:
+  _CompoundObj = py_meta.CompoundObj
+
+_part_value_desc = asdl.Sum([
+    asdl.Constructor('UndefPartValue'),
+    asdl.Constructor('StringPartValue', [
+        asdl.Field('string', 's'),
+        asdl.Field('bool', 'do_split_elide'),
+        asdl.Field('bool', 'do_glob'),
+    ]),
+    asdl.Constructor('ArrayPartValue', [
+        asdl.Field('string', 'strs', seq=True),
+    ]),
+])
+_fragment_desc = asdl.Product([
+    asdl.Field('string', 's'),
+    asdl.Field('bool', 'do_elide'),
+    asdl.Field('bool', 'do_glob'),
+])
+_arg_value_desc = asdl.Sum([
+    asdl.Constructor('ConstArg', [
+        asdl.Field('string', 's'),
+    ]),
+    asdl.Constructor('GlobArg', [
+        asdl.Field('string', 's'),
+    ]),
+])
+_value_desc = asdl.Sum([
+    asdl.Constructor('Undef'),
+    asdl.Constructor('Str', [
+        asdl.Field('string', 's'),
+    ]),
+    asdl.Constructor('StrArray', [
+        asdl.Field('string', 'strs', seq=True),
+    ]),
+])
+_cell_desc = asdl.Product([
+    asdl.Field('value', 'val'),
+    asdl.Field('bool', 'exported'),
+    asdl.Field('bool', 'readonly'),
+])
+
+
+class part_value(_CompoundObj):
+  DESCRIPTOR = _part_value_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class UndefPartValue(part_value):
+  tag = 1
+  DESCRIPTOR = _part_value_desc.types[0]
+  FIELDS = ['spids']
+  DESCRIPTOR_LOOKUP = {
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('spids',)
+    def __init__(self, spids=None):
+      self.spids = [] if spids is None else spids
+
+
+class StringPartValue(part_value):
+  tag = 2
+  DESCRIPTOR = _part_value_desc.types[1]
+  FIELDS = ['s', 'do_split_elide', 'do_glob', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      's': _STR,
+      'do_split_elide': _BOOL,
+      'do_glob': _BOOL,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('s', 'do_split_elide', 'do_glob', 'spids')
+    def __init__(self, s=None, do_split_elide=None, do_glob=None, spids=None):
+      self.s = s
+      self.do_split_elide = do_split_elide
+      self.do_glob = do_glob
+      self.spids = [] if spids is None else spids
+
+
+class ArrayPartValue(part_value):
+  tag = 3
+  DESCRIPTOR = _part_value_desc.types[2]
+  FIELDS = ['strs', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'strs': asdl.ArrayType(_STR),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('strs', 'spids')
+    def __init__(self, strs=None, spids=None):
+      self.strs = [] if strs is None else strs
+      self.spids = [] if spids is None else spids
+
+
+class part_value_e(object):
+  UndefPartValue = 1
+  StringPartValue = 2
+  ArrayPartValue = 3
+
+
+class fragment(_CompoundObj):
+  DESCRIPTOR = _fragment_desc
+  FIELDS = ['s', 'do_elide', 'do_glob', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      's': _STR,
+      'do_elide': _BOOL,
+      'do_glob': _BOOL,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('s', 'do_elide', 'do_glob', 'spids')
+    def __init__(self, s=None, do_elide=None, do_glob=None, spids=None):
+      self.s = s
+      self.do_elide = do_elide
+      self.do_glob = do_glob
+      self.spids = [] if spids is None else spids
+
+
+class arg_value(_CompoundObj):
+  DESCRIPTOR = _arg_value_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class ConstArg(arg_value):
+  tag = 1
+  DESCRIPTOR = _arg_value_desc.types[0]
+  FIELDS = ['s', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      's': _STR,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('s', 'spids')
+    def __init__(self, s=None, spids=None):
+      self.s = s
+      self.spids = [] if spids is None else spids
+
+
+class GlobArg(arg_value):
+  tag = 2
+  DESCRIPTOR = _arg_value_desc.types[1]
+  FIELDS = ['s', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      's': _STR,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('s', 'spids')
+    def __init__(self, s=None, spids=None):
+      self.s = s
+      self.spids = [] if spids is None else spids
+
+
+class arg_value_e(object):
+  ConstArg = 1
+  GlobArg = 2
+
+
+class value(_CompoundObj):
+  DESCRIPTOR = _value_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class Undef(value):
+  tag = 1
+  DESCRIPTOR = _value_desc.types[0]
+  FIELDS = ['spids']
+  DESCRIPTOR_LOOKUP = {
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('spids',)
+    def __init__(self, spids=None):
+      self.spids = [] if spids is None else spids
+
+
+class Str(value):
+  tag = 2
+  DESCRIPTOR = _value_desc.types[1]
+  FIELDS = ['s', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      's': _STR,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('s', 'spids')
+    def __init__(self, s=None, spids=None):
+      self.s = s
+      self.spids = [] if spids is None else spids
+
+
+class StrArray(value):
+  tag = 3
+  DESCRIPTOR = _value_desc.types[2]
+  FIELDS = ['strs', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'strs': asdl.ArrayType(_STR),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('strs', 'spids')
+    def __init__(self, strs=None, spids=None):
+      self.strs = [] if strs is None else strs
+      self.spids = [] if spids is None else spids
+
+
+class value_e(object):
+  Undef = 1
+  Str = 2
+  StrArray = 3
+
+
+class cell(_CompoundObj):
+  DESCRIPTOR = _cell_desc
+  FIELDS = ['val', 'exported', 'readonly', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'val': _value_desc,
+      'exported': _BOOL,
+      'readonly': _BOOL,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('val', 'exported', 'readonly', 'spids')
+    def __init__(self, val=None, exported=None, readonly=None, spids=None):
+      self.val = val
+      self.exported = exported
+      self.readonly = readonly
+      self.spids = [] if spids is None else spids
+
+
+__all__ = [
+    'part_value',
+    'UndefPartValue',
+    'StringPartValue',
+    'ArrayPartValue',
+    'part_value_e',
+    'fragment',
+    'arg_value',
+    'ConstArg',
+    'GlobArg',
+    'arg_value_e',
+    'value',
+    'Undef',
+    'Str',
+    'StrArray',
+    'value_e',
+    'cell',
+]
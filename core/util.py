@@ -28,6 +28,7 @@ import io
 import os
 import pwd
 import sys
+import time
 import types
 
 
@@ -62,6 +63,27 @@ def GetHomeDir():
     return e.pw_dir
 
 
+class PhaseTimer(object):
+  """Record how long each phase of a task takes, e.g. shell startup."""
+
+  def __init__(self, start_time=None):
+    self.last = start_time or time.time()
+    self.phases = []  # list of (name, seconds)
+
+  def Mark(self, name, now=None):
+    """Attribute the time since the last mark to the phase 'name'."""
+    now = now or time.time()
+    self.phases.append((name, now - self.last))
+    self.last = now
+
+  def Report(self, f):
+    total = 0.0
+    for name, secs in self.phases:
+      f.write('%-12s %8.2f ms\n' % (name, secs * 1000))
+      total += secs
+    f.write('%-12s %8.2f ms\n' % ('total', total * 1000))
+
+
 class _EnumValue(object):
   """A unique name."""
   def __init__(self, namespace, name, value):
@@ -75,5 +75,31 @@ class EnumTest(unittest.TestCase):
       self.fail("Expected error")
 
 
+class _Output(object):
+  """Collects writes; io.StringIO only accepts unicode in Python 2."""
+
+  def __init__(self):
+    self.chunks = []
+
+  def write(self, s):
+    self.chunks.append(s)
+
+
+class PhaseTimerTest(unittest.TestCase):
+
+  def testPhases(self):
+    timer = util.PhaseTimer(10.0)
+    timer.Mark('a', 10.5)
+    timer.Mark('b', 12.0)
+    self.assertEqual([('a', 0.5), ('b', 1.5)], timer.phases)
+
+    f = _Output()
+    timer.Report(f)
+    lines = ''.join(f.chunks).splitlines()
+    self.assertEqual(3, len(lines))
+    self.assertEqual(['a', '500.00', 'ms'], lines[0].split())
+    self.assertEqual(['total', '2000.00', 'ms'], lines[2].split())
+
+
 if __name__ == '__main__':
   unittest.main()
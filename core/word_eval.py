@@ -8,6 +8,7 @@ import sys
 
 from core import braces
 from core import expr_eval  # ArithEval
+from core import word
 from core.glob_ import Globber, GlobEscape
 from core.id_kind import Id, Kind, IdName, LookupKind
 from core import util
@@ -15,6 +16,7 @@ from core import runtime
 from osh import ast_ as ast
 
 bracket_op_e = ast.bracket_op_e
+word_e = ast.word_e
 part_value_e = runtime.part_value_e
 value_e = runtime.value_e
 arg_value_e = runtime.arg_value_e
@@ -75,85 +77,103 @@ def _GetJoinChar(mem):
     raise AssertionError("IFS shouldn't be an array")
 
 
-def _Split(s, ifs):
-  """Helper function for IFS split."""
-  parts = ['']
-  for c in s:
-    if c in ifs:
-      parts.append('')
-    else:
-      parts[-1] += c
-  return parts
-
+class _IfsSplitter(object):
+  """Splits strings by one value of IFS.
 
-def _IfsSplit(s, ifs):
-  """
   http://pubs.opengroup.org/onlinepubs/9699919799/utilities/V3_chap02.html#tag_18_06_05
   https://www.gnu.org/software/bash/manual/bashref.html#Word-Splitting
 
   Summary:
-  1. ' \t\n' is special.  Whitespace is trimmed off the front and back.
-  2. if IFS is '', no field splitting is performed.
-  3. Otherwise, suppose IFS = ' ,\t'.  Then IFS whitespace is space or comma.
-    a.  IFS whitespace isgnored at beginning and end.
-    b. any other IFS char delimits the field, along with adjacent IFS
-       whitespace.
-    c. IFS whitespace shall delimit a field.
-
-  # Can we do this be regex or something?  Use regex match?
+  1. if IFS is '', no field splitting is performed.
+  2. IFS whitespace is the space, tab, and newline chars in IFS.  It's ignored
+     at the beginning and end.
+  3. Any other IFS char delimits a field, along with adjacent IFS whitespace.
+     So with IFS=', ', 'a , b' is two fields, and 'a,,b' is three.
+  4. A run of IFS whitespace delimits a field.
+
+  The delimiters are matched by one compiled regex, so splitting takes time
+  linear in the length of the string.
   """
-  assert isinstance(ifs, str), ifs
-  if not ifs:
-    return [s]  # no splitting
-
-  # print("IFS SPLIT %r %r" % (s, ifs))
-  # TODO: This detect if it's ALL whitespace?  If ifs_other is empty?
-  if ifs == ' \t\n':
-    return _Split(s, ifs)
-
-  # Detect IFS whitespace
-  ifs_whitespace = ''
-  ifs_other = ''
-  for c in ifs:
-    if c in ' \t\n':
-      ifs_whitespace += c
+  def __init__(self, ifs):
+    assert isinstance(ifs, str), ifs
+    self.ifs = ifs
+    self.whitespace = ''.join(c for c in ifs if c in ' \t\n')
+    self.other = ''.join(c for c in ifs if c not in ' \t\n')
+
+    # Hm this escapes \t as \\\t?  I guess that works.
+    ws_re = re.escape(self.whitespace)
+    other_re = re.escape(self.other)
+
+    self.regex = None
+    self.leading_other = None  # matches a field that's empty because of IFS
+    if self.whitespace and self.other:
+      # ifs_ws* non_ws_ifs ifs_ws* | ifs_ws+
+      # The second alternative is rule 4.  It has to come second, or 'a , b'
+      # would be split at the space before the comma, and then at the comma.
+      pat = '[%s]*[%s][%s]*|[%s]+' % (ws_re, other_re, ws_re, ws_re)
+      self.leading_other = re.compile('[%s]*[%s]' % (ws_re, other_re))
+    elif self.whitespace:
+      pat = '[%s]+' % ws_re
+    elif self.other:
+      pat = '[%s]' % other_re
+      self.leading_other = re.compile(pat)
     else:
-      ifs_other += c
+      return  # no splitting
+    self.regex = re.compile(pat)
 
-  # TODO: Rule 3a. Ignore leading and trailing IFS whitespace?
+  def Split(self, s, max_split=0):
+    """Split a string into fields, like re.split().
 
-  # hack to make an RE
+    If it starts or ends with a delimiter, the first or last field is empty.
 
-  # Hm this escapes \t as \\\t?  I guess that works.
-  ws_re = re.escape(ifs_whitespace)
+    Args:
+      max_split: if not 0, split at most this many times and leave the rest of
+        s in the last field.  'read' uses this.
+    """
+    if self.regex is None:
+      return [s]
+    return self.regex.split(s, max_split)
 
-  other_re = re.escape(ifs_other)
-  #print('chars', repr(ifs_whitespace), repr(ifs_other))
-  #print('RE', repr(ws_re), repr(other_re))
+  def SplitToFragments(self, s, do_glob):
+    """Split the value of an unquoted substitution.
 
-  # BUG: re.split() is the wrong model.  It works with the 'delimiting' model.
-  # Forward iteration.  TODO: grep for IFS in dash/mksh/bash/ash.
+    Returns:
+      runtime.fragment[].  An empty field from a non-whitespace delimiter, as
+      in 'a,,b', isn't elided.  Other empty fragments just mark where a field
+      ends, e.g. in ${x}post.
+    """
+    frags = self.Split(s)
+    res = [runtime.fragment(f, True, do_glob) for f in frags]
+    if self.other and len(frags) > 1:
+      # The last field is never one of these: a delimiter ends a field.
+      for i in range(len(frags) - 1):
+        if not frags[i] and (i > 0 or self.leading_other.match(s)):
+          res[i] = runtime.fragment('', False, do_glob)
+    return res
+
+
+# IFS value -> _IfsSplitter.  There are usually only one or two.
+_SPLITTERS = {}
+
+
+def _GetSplitter(ifs):
+  """Return the splitter for a value of IFS, compiling it the first time."""
+  try:
+    return _SPLITTERS[ifs]
+  except KeyError:
+    if len(_SPLITTERS) >= 100:  # e.g. IFS is assigned in a loop
+      _SPLITTERS.clear()
+    splitter = _IfsSplitter(ifs)
+    _SPLITTERS[ifs] = splitter
+    return splitter
 
-  # ifs_ws | ifs_ws* non_ws_ifs ifs_ws*
-  if ifs_whitespace and ifs_other:
-    # first alternative is rule 3c.
-    # BUG: It matches the whitespace first?
-    pat = '[%s]+|[%s]*[%s][%s]*' % (ws_re, ws_re, other_re, ws_re)
-  elif ifs_whitespace:
-    pat = '[%s]+' % ws_re
-  elif ifs_other:
-    pat = '[%s]' % other_re
-  else:
-    raise AssertionError
 
-  #print('PAT', repr(pat))
-  regex = re.compile(pat)
-  frags = regex.split(s)
-  #log('split %r by %r -> frags %s', s, pat, frags)
-  return frags
+def _IfsSplit(s, ifs, max_split=0):
+  """Split s by IFS.  See _IfsSplitter."""
+  return _GetSplitter(ifs).Split(s, max_split)
 
 
-def _SplitPartsIntoFragments(part_vals, ifs):
+def _SplitPartsIntoFragments(part_vals, splitter):
   """
   part_value[] -> part_value[]
   Depends on no_glob
@@ -162,10 +182,9 @@ def _SplitPartsIntoFragments(part_vals, ifs):
   frag_arrays = []
   for p in part_vals:
     if p.tag == part_value_e.StringPartValue:
-      #log("SPLITTING %s with ifs %r", p, ifs)
+      #log("SPLITTING %s with ifs %r", p, splitter.ifs)
       if p.do_split_elide:
-        frags = _IfsSplit(p.s, ifs)
-        res = [runtime.fragment(f, True, p.do_glob) for f in frags]
+        res = splitter.SplitToFragments(p.s, p.do_glob)
         #log("RES %s", res)
       else:
         # Example: 'a b' and "a b" don't need to be split.
@@ -204,7 +223,7 @@ def _Reframe(frag_arrays):
   return res
 
 
-def _JoinElideEscape(frag_arrays, elide_empty, glob_escape):
+def _JoinElideEscape(frag_arrays, glob_escape):
   """Join parts without globbing or eliding.
 
   Returns:
@@ -237,8 +256,7 @@ def _JoinElideEscape(frag_arrays, elide_empty, glob_escape):
       arg = runtime.ConstArg(''.join(frag.s for frag in frag_array))
 
     # Elide $a$b, but not $a"$b" or $a''
-    if (elide_empty and
-        not arg.s and all(frag.do_elide for frag in frag_array)):
+    if not arg.s and all(frag.do_elide for frag in frag_array):
       #log('eliding frag_array %s', frag_array)
       continue
 
@@ -340,6 +358,11 @@ class _WordPartEvaluator:
       # External commands need WIFEXITED test.  What about subshells?
       return runtime.Str(str(self.mem.last_status)), False
 
+    elif op_id == Id.VSub_Bang:  # $!
+      if self.mem.last_job_id == -1:
+        return runtime.Undef(), False  # no background job yet
+      return runtime.Str(str(self.mem.last_job_id)), False
+
     elif op_id == Id.VSub_Pound:  # $#
       argv = self.mem.GetArgv()
       s = str(len(argv))
@@ -847,6 +870,32 @@ class _WordPartEvaluator:
       raise AssertionError(part.tag)
 
 
+# Unquoted, these make a word a glob pattern.
+_GLOB_CHARS_RE = re.compile(r'[*?[]')
+
+# Limit on the number of words whose _StaticArg() is remembered.  Words made
+# by brace expansion and eval are new every time.
+_MAX_STATIC_ARGS = 10000
+
+
+def _StaticArg(w):
+  """Return the string a word always evaluates to, or None.
+
+  That's a word with only literal and quoted parts, like --flag or 'a b'"c",
+  and no unquoted glob chars.  It's never split, elided, or globbed.
+  """
+  if w.tag != word_e.CompoundWord:
+    return None
+  ok, s, quoted = word.StaticEval(w)
+  if not ok or (not s and not quoted):  # {X,,Y} has an empty word to elide
+    return None
+  for part in w.parts:
+    if (part.tag == word_part_e.LiteralPart and
+        _GLOB_CHARS_RE.search(part.token.val)):
+      return None
+  return s
+
+
 class _WordEvaluator:
   """Abstract base class for word evaluators.
 
@@ -863,6 +912,10 @@ class _WordEvaluator:
     self.part_ev = part_ev
     self.globber = Globber(exec_opts)
 
+    # id(word) -> (word, _StaticArg(word)).  Holding the word keeps its id
+    # from being reused.
+    self.static_args = {}
+
     self.error_stack = []
 
   def _AddErrorContext(self, msg, *args):
@@ -991,22 +1044,14 @@ class _WordEvaluator:
     """
     part_vals = self._EvalParts(word)
     #log('part_vals after _EvalParts %s', part_vals)
-    ifs = _GetIfs(self.mem)
-    frag_arrays = _SplitPartsIntoFragments(part_vals, ifs)
+    splitter = _GetSplitter(_GetIfs(self.mem))
+    frag_arrays = _SplitPartsIntoFragments(part_vals, splitter)
     #log('Fragments after split: %s', frag_arrays)
     frag_arrays = _Reframe(frag_arrays)
     #log('Fragments after reframe: %s', frag_arrays)
 
     glob_escape = not self.exec_opts.noglob
-
-    # NOTE: Empirically, elision depends on IFS.  I don't see it in the POSIX
-    # spec though.  This may need to be revised to have ' \t\n'.
-    elide_empty = True
-    for c in ifs:
-      if c not in ' \t\n':
-        elide_empty = False
-
-    args = _JoinElideEscape(frag_arrays, elide_empty, glob_escape)
+    args = _JoinElideEscape(frag_arrays, glob_escape)
     #log('After _JoinElideEscape %s', args)
     return args
 
@@ -1034,8 +1079,20 @@ class _WordEvaluator:
     # 5. globbing -- several exec_opts affect this: nullglob, safeglob, etc.
 
     #log('W %s', words)
+    static_args = self.static_args
     argv = []
     for w in words:
+      # Fast path for constant words, e.g. all of 'echo hello world'.
+      entry = static_args.get(id(w))
+      if entry is None or entry[0] is not w:
+        if len(static_args) >= _MAX_STATIC_ARGS:
+          static_args.clear()
+        entry = (w, _StaticArg(w))
+        static_args[id(w)] = entry
+      if entry[1] is not None:
+        argv.append(entry[1])
+        continue
+
       args = self._EvalWordAndReframe(w)
       #log('A %s', args)
       for arg in args:
@@ -1066,12 +1123,7 @@ class _NormalPartEvaluator(_WordPartEvaluator):
     self.ex = ex
 
   def _EvalCommandSub(self, node, quoted):
-    p = self.ex._GetProcessForNode(node)
-    # NOTE: We could do an optimization for pipelines.  Pick the last
-    # process element, and do pi.procs[-1].CaptureOutput()
-    stdout = []
-    p.CaptureOutput(stdout)
-    status = p.Run()
+    stdout = self.ex.RunCommandSub(node)
 
     # Runtime errors:
     # what if the command sub was "echo foo > $@".  That is invalid.  Then
@@ -1080,7 +1132,7 @@ class _NormalPartEvaluator(_WordPartEvaluator):
 
     # I think $() does a strip basically?
     # argv $(echo ' hi')$(echo bye) -> hibye
-    s = ''.join(stdout).strip()
+    s = stdout.strip()
     return runtime.StringPartValue(s, not quoted, not quoted)
 
 
@@ -59,8 +59,9 @@ class SplitTest(unittest.TestCase):
         ['a', '', 'c'],
         word_eval._IfsSplit('abbc', 'b '))
 
+    # ' b\t' is one delimiter, and 'b ' is another.  bash gives a, '', cd.
     self.assertEqual(
-        ['', 'a', '', '', 'cd', ''],
+        ['', 'a', '', 'cd', ''],
         word_eval._IfsSplit('\ta b\tb cd\n', 'b \t\n'))
 
     self.assertEqual(
@@ -68,8 +69,6 @@ class SplitTest(unittest.TestCase):
         word_eval._IfsSplit('\tabcd\n', 'b \t\n'))
 
   def testIfsSplit_Mixed2(self):
-    # Doesn't work yet
-    return
     self.assertEqual(
         ['a', '', '', 'b'],
         word_eval._IfsSplit('a _  _ _  b', '_ '))
@@ -93,6 +92,49 @@ class SplitTest(unittest.TestCase):
         ['', ''],
         word_eval._IfsSplit('_', '_'))
 
+  def testIfsSplitMax(self):
+    self.assertEqual(
+        ['a', 'b  c '],
+        word_eval._IfsSplit('a  b  c ', ' \t\n', max_split=1))
+
+    self.assertEqual(
+        ['a', 'b , c'],
+        word_eval._IfsSplit('a , b , c', ', ', max_split=1))
+
+    self.assertEqual(
+        ['a'],
+        word_eval._IfsSplit('a', ',', max_split=1))
+
+  def testSplitterIsCached(self):
+    splitter = word_eval._GetSplitter(', ')
+    self.assertTrue(splitter is word_eval._GetSplitter(', '))
+    self.assertFalse(splitter is word_eval._GetSplitter(' '))
+
+  def testSplitToFragments(self):
+    def Frags(s, ifs):
+      splitter = word_eval._GetSplitter(ifs)
+      return [(f.s, f.do_elide) for f in splitter.SplitToFragments(s, True)]
+
+    # Whitespace only marks where fields end.
+    self.assertEqual(
+        [('', True), ('a', True), ('', True)], Frags(' a ', ' \t\n'))
+    self.assertEqual(
+        [('', True), ('a', True), ('', True)], Frags(' a ', ', '))
+
+    # Non-whitespace delimiters make empty fields, except at the end.
+    self.assertEqual(
+        [('', False), ('a', True), ('', False), ('b', True), ('', True)],
+        Frags(',a,,b,', ','))
+    self.assertEqual([('', False), ('a', True)], Frags(' ,a', ', '))
+    self.assertEqual([('', True)], Frags('', ','))
+
+  def testSplitIsLinear(self):
+    # These took minutes when each field was built a char at a time.
+    s = 'x' * 1000000
+    self.assertEqual([s], word_eval._IfsSplit(s, ' \t\n'))
+    words = ['word%d' % i for i in range(200000)]
+    self.assertEqual(words, word_eval._IfsSplit(' '.join(words), ' \t\n'))
+
 
 if __name__ == '__main__':
   unittest.main()
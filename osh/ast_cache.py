@@ -0,0 +1,105 @@
+"""
+ast_cache.py - Cache parsed scripts on disk in the oheap format.
+
+Each file has one entry, named by a hash of its absolute path.  The entry
+records the file's mtime, a hash of its contents, a hash of osh.asdl, a hash of
+the Id numbering, and the oheap format version, so a stale entry is never used,
+even if the mtime didn't change.
+
+The cached tree has no line spans, which is fine since the executor doesn't
+use them.  Parse errors are never cached, so they're still reported with
+location info.
+"""
+
+import binascii
+import hashlib
+import io
+import os
+import tempfile
+
+from asdl import decode
+from asdl import encode
+from core import id_kind
+from core import util
+from osh import ast_ as ast
+from osh import osh_asdl
+
+_MAGIC = b'osh-ast-cache 1'
+
+
+def _Sha1(s):
+  if not util.PY2 and not isinstance(s, bytes):
+    s = s.encode('utf-8')
+  return hashlib.sha1(s).hexdigest()
+
+
+def _IdTableSha1():
+  """Hash the Id numbering, since Ids are encoded as numbers."""
+  return _Sha1(repr(sorted(id_kind.ID_SPEC.token_names.items())))
+
+
+class AstCache(object):
+  """Look up and store the trees for script files.
+
+  Errors reading or writing the cache are ignored; the caller just parses the
+  file again.
+  """
+
+  def __init__(self, cache_dir):
+    self.cache_dir = cache_dir
+    # Everything that decides how a tree is encoded, besides the file itself.
+    self.format_key = ' '.join([
+        osh_asdl.SCHEMA_SHA1, _IdTableSha1(),
+        binascii.hexlify(encode.MAGIC).decode('ascii')])
+
+  def _EntryPath(self, path):
+    return os.path.join(self.cache_dir, _Sha1(os.path.abspath(path)))
+
+  def _Header(self, mtime, contents):
+    fields = [self.format_key, repr(mtime), _Sha1(contents)]
+    return _MAGIC + b' ' + ' '.join(fields).encode('ascii') + b'\n'
+
+  def Lookup(self, path, mtime, contents):
+    """
+    Args:
+      path: path of the script, as passed to the shell
+      mtime: st_mtime of the open file
+      contents: the text that was read from it
+
+    Returns:
+      ast.command, or None if there's no valid entry
+    """
+    try:
+      with open(self._EntryPath(path), 'rb') as f:
+        data = f.read()
+    except (IOError, OSError):
+      return None
+
+    header = self._Header(mtime, contents)
+    if not data.startswith(header):
+      return None
+
+    try:
+      return decode.DecodeRoot(data[len(header):], ast, ast.command)
+    except (decode.DecodeError, IndexError, KeyError, ValueError):
+      return None  # corrupt entry
+
+  def Store(self, path, mtime, contents, node):
+    """Write an entry for a file that was just parsed."""
+    f = io.BytesIO()
+    try:
+      encode.EncodeRoot(node, encode.Params(), encode.BinOutput(f))
+    except RuntimeError:
+      return  # e.g. a file too big for 3-byte refs
+
+    try:
+      if not os.path.isdir(self.cache_dir):
+        os.makedirs(self.cache_dir)
+      # Write and rename, so concurrent shells never see a partial entry.
+      fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+      with os.fdopen(fd, 'wb') as out:
+        out.write(self._Header(mtime, contents))
+        out.write(f.getvalue())
+      os.rename(tmp_path, self._EntryPath(path))
+    except (IOError, OSError):
+      pass
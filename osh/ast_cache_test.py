@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+ast_cache_test.py: Tests for ast_cache.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from asdl import encode
+from core import alloc
+from core import id_kind
+from core import reader
+from osh import ast_cache  # module under test
+from osh import parse_lib
+
+
+def _Parse(code_str):
+  arena = alloc.Pool().NewArena()
+  arena.AddSourcePath('<test>')
+  line_reader = reader.StringLineReader(code_str, arena=arena)
+  _, c_parser = parse_lib.MakeParserForTop(line_reader, arena=arena)
+  return c_parser.ParseWholeFile()
+
+
+class AstCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    self.tmp_dir = tempfile.mkdtemp()
+    self.cache_dir = os.path.join(self.tmp_dir, 'cache')
+
+  def tearDown(self):
+    shutil.rmtree(self.tmp_dir)
+
+  def testLookupAndStore(self):
+    cache = ast_cache.AstCache(self.cache_dir)
+    code_str = 'echo hi\nfor x in a b; do echo $x; done\n'
+    node = _Parse(code_str)
+
+    self.assertEqual(None, cache.Lookup('foo.sh', 1.5, code_str))
+
+    cache.Store('foo.sh', 1.5, code_str, node)  # creates the dir
+    self.assertEqual(node, cache.Lookup('foo.sh', 1.5, code_str))
+
+    # The same path relative to a different dir
+    self.assertEqual(
+        node, cache.Lookup(os.path.join(os.getcwd(), 'foo.sh'), 1.5, code_str))
+
+    # Changes to the mtime or contents invalidate it
+    self.assertEqual(None, cache.Lookup('foo.sh', 2.5, code_str))
+    self.assertEqual(None, cache.Lookup('foo.sh', 1.5, code_str + 'echo\n'))
+    self.assertEqual(None, cache.Lookup('bar.sh', 1.5, code_str))
+
+    # A new entry replaces the old one
+    code_str2 = 'echo bye\n'
+    node2 = _Parse(code_str2)
+    cache.Store('foo.sh', 2.5, code_str2, node2)
+    self.assertEqual(node2, cache.Lookup('foo.sh', 2.5, code_str2))
+    self.assertEqual(None, cache.Lookup('foo.sh', 1.5, code_str))
+
+  def testFormatChanges(self):
+    code_str = 'echo hi\n'
+    node = _Parse(code_str)
+    ast_cache.AstCache(self.cache_dir).Store('foo.sh', 1.5, code_str, node)
+    self.assertEqual(
+        node, ast_cache.AstCache(self.cache_dir).Lookup('foo.sh', 1.5, code_str))
+
+    # Ids are renumbered
+    token_names = id_kind.ID_SPEC.token_names
+    token_names[len(token_names) + 1] = 'Test_New'
+    try:
+      cache = ast_cache.AstCache(self.cache_dir)
+    finally:
+      del token_names[len(token_names)]
+    self.assertEqual(None, cache.Lookup('foo.sh', 1.5, code_str))
+
+    # A new oheap format version
+    orig_magic = encode.MAGIC
+    encode.MAGIC = b'OHP\x03'
+    try:
+      cache = ast_cache.AstCache(self.cache_dir)
+    finally:
+      encode.MAGIC = orig_magic
+    self.assertEqual(None, cache.Lookup('foo.sh', 1.5, code_str))
+
+  def testCorruptEntry(self):
+    cache = ast_cache.AstCache(self.cache_dir)
+    code_str = 'echo hi\n'
+    cache.Store('foo.sh', 1.5, code_str, _Parse(code_str))
+
+    path = cache._EntryPath('foo.sh')
+    with open(path, 'rb') as f:
+      data = f.read()
+    with open(path, 'wb') as f:
+      f.write(data[:-10])  # truncated
+    self.assertEqual(None, cache.Lookup('foo.sh', 1.5, code_str))
+
+  def testUnwritableDir(self):
+    path = os.path.join(self.tmp_dir, 'file')
+    with open(path, 'w') as f:
+      f.write('not a dir')
+    cache = ast_cache.AstCache(path)
+    code_str = 'echo hi\n'
+    cache.Store('foo.sh', 1.5, code_str, _Parse(code_str))  # no error
+    self.assertEqual(None, cache.Lookup('foo.sh', 1.5, code_str))
+
+
+if __name__ == '__main__':
+  unittest.main()
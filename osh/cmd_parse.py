@@ -1333,8 +1333,8 @@ class CommandParser(object):
 
   def ParseCommandLine(self):
     """
-    NOTE: This is only called in InteractiveLoop.  Oh crap I need to really
-    read and execute a line at a time then?
+    NOTE: This is called by InteractiveLoop and Executor.ExecuteLoop(), which
+    read and execute a line at a time.
 
     BUG: sleep 1 & sleep 1 &  doesn't work here, when written in REPL.   But it
     does work with '-c', because that calls ParseFile and not ParseCommandLine
@@ -1379,12 +1379,17 @@ class CommandParser(object):
 
         if not self._Peek(): return None
         if self.c_id == Id.Op_Newline:
+          # Read ALL here docs so far.  cat <<EOF; echo hi <newline>
+          for c in children:
+            self._MaybeReadHereDocs(c)
           self._MaybeReadHereDocs(child)
           done = True
         elif self.c_id == Id.Eof_Real:
           done = True
 
       elif self.c_id == Id.Op_Newline:
+        for c in children:
+          self._MaybeReadHereDocs(c)
         self._MaybeReadHereDocs(child)
         done = True
 
@@ -1393,7 +1398,8 @@ class CommandParser(object):
 
       else:
         self.AddErrorContext(
-            'ParseCommandLine: Unexpected token %s', self.cur_word)
+            'ParseCommandLine: Unexpected token %s', self.cur_word,
+            word=self.cur_word)
         return None
 
       children.append(child)
@@ -1433,6 +1439,7 @@ class CommandParser(object):
     # - Why aren't we doing 'for c in children' too?
 
     children = []
+    num_read = 0  # children whose here docs have been read
     done = False
     while not done:
       if not self._Peek(): return None
@@ -1453,9 +1460,12 @@ class CommandParser(object):
       if not self._Peek(): return None
       if self.c_id == Id.Op_Newline:
         # Read ALL Here docs so far.  cat <<EOF; echo hi <newline>
-        for c in children:
+        # Children before the last newline were already done; looking at them
+        # again would make long files quadratic.
+        for c in children[num_read:]:
           self._MaybeReadHereDocs(c)
         self._MaybeReadHereDocs(child)  # Read last child's here docs
+        num_read = len(children) + 1
         self._Next()
 
         if not self._Peek(): return None
@@ -1468,9 +1478,10 @@ class CommandParser(object):
 
         if not self._Peek(): return None
         if self.c_id == Id.Op_Newline:
-          for c in children:
+          for c in children[num_read:]:
             self._MaybeReadHereDocs(c)
           self._MaybeReadHereDocs(child)  # Read last child's
+          num_read = len(children) + 1
 
           self._Next()  # skip over newline
 
@@ -1493,7 +1504,7 @@ class CommandParser(object):
 
     if not self._Peek(): return None
     if self.c_id == Id.Op_Newline:
-      for c in children:
+      for c in children[num_read:]:
         self._MaybeReadHereDocs(c)
 
     if len(children) == 1:
@@ -1525,8 +1536,9 @@ class CommandParser(object):
 
     Very similar to ParseCommandList, but we allow empty files.
 
-    TODO: This should be turned into a Parse and Execute loop, freeing arenas
-    if they don't contain functions.
+    NOTE: Scripts are executed with Executor.ExecuteLoop(), which calls
+    ParseCommandLine() repeatedly.  This is for when we need the whole tree,
+    e.g. for --ast-output and --fix, and for eval and source.
     """
     if not self._NewlineOk(): return None
 
@@ -360,6 +360,22 @@ EOF
     self.assertEqual(2, len(node.children))
     assertHereDocToken(self, 'PIPE 1\n', node.children[0].command)
 
+  def testTwoHereDocsInCommandLine(self):
+    # Here docs of every command on the line are read at the newline.
+    node = assertParseCommandLine(self, """\
+cat <<EOF1; cat <<EOF2
+PIPE 1
+PIPE 2
+EOF1
+PIPE 3
+PIPE 4
+EOF2
+""")
+    self.assertEqual(node.tag, command_e.CommandList)
+    self.assertEqual(2, len(node.children))
+    assertHereDocToken(self, 'PIPE 1\n', node.children[0].command)
+    assertHereDocToken(self, 'PIPE 3\n', node.children[1])
+
   def testCommandSubInHereDoc(self):
     node = assertParseCommandLine(self, """\
 cat <<EOF
@@ -1208,6 +1224,14 @@ class ErrorLocationsTest(unittest.TestCase):
 
     err = _assertParseCommandListError(self, 'foo$(invalid) () { echo hi; }')
 
+  def testUnexpectedToken(self):
+    arena, c_parser = InitCommandParser('echo )\n')
+    self.assertEqual(None, c_parser.ParseCommandLine())
+    err = c_parser.Error()[-1]
+    span_id = word.LeftMostSpanForWord(err.word)
+    self.assertNotEqual(-1, span_id)
+    self.assertEqual(5, arena.GetLineSpan(span_id).col)
+
   def testErrorInHereDoc(self):
     return
     # Here doc body.  Hm this should be failing.  Does it just fail to get
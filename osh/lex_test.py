@@ -6,7 +6,8 @@ lex_test.py: Tests for lex.py
 import unittest
 
 from core.id_kind import Id, Kind, LookupKind
-from core.lexer import CompileAll, Lexer, LineLexer, FindLongestMatch
+from core import lexer
+from core.lexer import CompileAll, Lexer, LineLexer, FindLongestMatch, R
 from core.test_lib import TokensEqual
 
 from osh import parse_lib
@@ -192,6 +193,77 @@ class FunctionTest(unittest.TestCase):
     self.assertEqual(tok_val, '"')
 
 
+# Lines that exercise every lexer mode.
+_ENGINE_LINES = [
+    'ls /home/ foo=bar a+=b 2>&1 >|out 3<>f <<-EOF <<<x\n',
+    'for x in a b; do echo "$x ${y:-z}" \'q\' $\'\\n\'; done\n',
+    'if [[ -n $a && $b =~ ^(x|y)$ ]]; then (( i += 0x1f )); fi\n',
+    'echo $(echo `date`) $((1+2)) $[3] <(a) >(b) ${#a} ${a[@]} ~/x\n',
+    '${a%%.py} ${a/x/y} ${a#*/} ${!a} ${11} $$ $? $@ $* $# $- $!\n',
+    'case $x in a|b) ;; esac; f() { return 1; } && x || y &\n',
+    '# a comment \\\n',
+    '"unterminated \\\n',
+    '\0',
+    '',
+]
+
+
+class EngineTest(unittest.TestCase):
+
+  def testEnginesAgree(self):
+    """The DFA engine should give the same FIRST longest match as regexes."""
+    for lex_mode, pat_list in LEXER_DEF.items():
+      regex_m = lexer.ENGINES['regex'](pat_list)
+      dfa_m = lexer.ENGINES['dfa'](pat_list)
+      for line in _ENGINE_LINES:
+        for pos in range(len(line) + 1):
+          try:
+            expected = regex_m.Match(line, pos)
+          except AssertionError:
+            expected = None
+          try:
+            actual = dfa_m.Match(line, pos)
+          except AssertionError:
+            actual = None
+          self.assertEqual(expected, actual,
+              '%s %r at %d: %s != %s' % (lex_mode, line, pos, expected, actual))
+
+  def testUsesDfa(self):
+    # All modes are supported by the DFA compiler.
+    for pat_list in LEXER_DEF.values():
+      self.assertTrue(isinstance(lexer.CompileDfa(pat_list), lexer._DfaMatcher))
+
+  def testUnsupportedFallsBack(self):
+    pat_list = [R(r'a+?', Id.Lit_Chars)]  # non-greedy
+    self.assertTrue(
+        isinstance(lexer.CompileDfa(pat_list), lexer._RegexMatcher))
+
+  def testLineLexerEngine(self):
+    for engine in lexer.ENGINES:
+      l = LineLexer(LEXER_DEF, 'echo $(( 1 ))', engine=engine)
+      self.assertTrue(TokensEqual(
+          ast.token(Id.Lit_Chars, 'echo'), l.Read(LexMode.OUTER)))
+      self.assertTrue(TokensEqual(
+          ast.token(Id.WS_Space, ' '), l.Read(LexMode.OUTER)))
+      self.assertTrue(TokensEqual(
+          ast.token(Id.Left_ArithSub, '$(('), l.Read(LexMode.OUTER)))
+
+  def testSharedLexerDef(self):
+    lexer_def = lexer.CompiledLexerDef(LEXER_DEF)
+    l1 = LineLexer(lexer_def, 'echo hi')
+    l2 = LineLexer(lexer_def, 'ls')
+    self.assertTrue(l1.lexer_def is l2.lexer_def)
+    self.assertTrue(TokensEqual(
+        ast.token(Id.Lit_Chars, 'echo'), l1.Read(LexMode.OUTER)))
+    self.assertTrue(TokensEqual(
+        ast.token(Id.Lit_Chars, 'ls'), l2.Read(LexMode.OUTER)))
+
+    # All parsers share one instance.
+    _, lx1 = parse_lib.InitLexer('echo')
+    _, lx2 = parse_lib.InitLexer('ls')
+    self.assertTrue(lx1.line_lexer.lexer_def is lx2.line_lexer.lexer_def)
+
+
 class RegexTest(unittest.TestCase):
 
   def testOuter(self):
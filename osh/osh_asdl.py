@@ -0,0 +1,1809 @@
+"""
+Generated by asdl/gen_python.py from osh/osh.asdl.  Don't edit.
+"""
+
+from asdl import asdl_ as asdl
+from asdl import py_meta
+from core.id_kind import Id
+
+# sha1 of the schema, for caches of encoded trees.
+SCHEMA_SHA1 = 'e6bb841bd32ca446f75dd8507193fbe83ac2dee5'
+
+_STR = asdl.DESCRIPTORS_BY_NAME['string']
+_INT = asdl.DESCRIPTORS_BY_NAME['int']
+_BOOL = asdl.DESCRIPTORS_BY_NAME['bool']
+_SPIDS = asdl.ArrayType(asdl.IntType())
+_id = asdl.UserType(Id)
+
+if py_meta.RELEASE:
+  _CompoundObj = py_meta.UncheckedObj
+else:
+  _CompoundObj = py_meta.CompoundObj
+
+_line_span_desc = asdl.Product([
+    asdl.Field('int', 'line_id'),
+    asdl.Field('int', 'col'),
+    asdl.Field('int', 'length'),
+])
+_token_desc = asdl.Product([
+    asdl.Field('id', 'id'),
+    asdl.Field('string', 'val'),
+    asdl.Field('int', 'span_id', opt=True),
+])
+_bracket_op_desc = asdl.Sum([
+    asdl.Constructor('WholeArray', [
+        asdl.Field('id', 'op_id'),
+    ]),
+    asdl.Constructor('ArrayIndex', [
+        asdl.Field('arith_expr', 'expr'),
+    ]),
+])
+_suffix_op_desc = asdl.Sum([
+    asdl.Constructor('StringUnary', [
+        asdl.Field('id', 'op_id'),
+        asdl.Field('word', 'arg_word'),
+    ]),
+    asdl.Constructor('PatSub', [
+        asdl.Field('word', 'pat'),
+        asdl.Field('word', 'replace', opt=True),
+        asdl.Field('bool', 'do_all'),
+        asdl.Field('bool', 'do_prefix'),
+        asdl.Field('bool', 'do_suffix'),
+    ]),
+    asdl.Constructor('Slice', [
+        asdl.Field('arith_expr', 'begin', opt=True),
+        asdl.Field('arith_expr', 'length', opt=True),
+    ]),
+])
+_array_item_desc = asdl.Sum([
+    asdl.Constructor('ArrayWord', [
+        asdl.Field('word', 'w'),
+    ]),
+    asdl.Constructor('ArrayPair', [
+        asdl.Field('word', 'key'),
+        asdl.Field('word', 'value'),
+    ]),
+])
+_word_part_desc = asdl.Sum([
+    asdl.Constructor('ArrayLiteralPart', [
+        asdl.Field('word', 'words', seq=True),
+    ]),
+    asdl.Constructor('LiteralPart', [
+        asdl.Field('token', 'token'),
+    ]),
+    asdl.Constructor('EscapedLiteralPart', [
+        asdl.Field('token', 'token'),
+    ]),
+    asdl.Constructor('SingleQuotedPart', [
+        asdl.Field('token', 'tokens', seq=True),
+    ]),
+    asdl.Constructor('DoubleQuotedPart', [
+        asdl.Field('word_part', 'parts', seq=True),
+    ]),
+    asdl.Constructor('SimpleVarSub', [
+        asdl.Field('token', 'token'),
+    ]),
+    asdl.Constructor('BracedVarSub', [
+        asdl.Field('token', 'token'),
+        asdl.Field('id', 'prefix_op', opt=True),
+        asdl.Field('bracket_op', 'bracket_op', opt=True),
+        asdl.Field('suffix_op', 'suffix_op', opt=True),
+    ]),
+    asdl.Constructor('TildeSubPart', [
+        asdl.Field('string', 'prefix'),
+    ]),
+    asdl.Constructor('CommandSubPart', [
+        asdl.Field('command', 'command_list'),
+    ]),
+    asdl.Constructor('ArithSubPart', [
+        asdl.Field('arith_expr', 'anode'),
+    ]),
+    asdl.Constructor('BracedAltPart', [
+        asdl.Field('word', 'words', seq=True),
+    ]),
+    asdl.Constructor('BracedIntRangePart', [
+        asdl.Field('int', 'start'),
+        asdl.Field('int', 'end'),
+        asdl.Field('int', 'step', opt=True),
+    ]),
+    asdl.Constructor('BracedCharRangePart', [
+        asdl.Field('string', 'start'),
+        asdl.Field('string', 'end'),
+        asdl.Field('int', 'step', opt=True),
+    ]),
+])
+_word_desc = asdl.Sum([
+    asdl.Constructor('TokenWord', [
+        asdl.Field('token', 'token'),
+    ]),
+    asdl.Constructor('CompoundWord', [
+        asdl.Field('word_part', 'parts', seq=True),
+    ]),
+    asdl.Constructor('BracedWordTree', [
+        asdl.Field('word_part', 'parts', seq=True),
+    ]),
+])
+_lvalue_desc = asdl.Sum([
+    asdl.Constructor('LeftVar', [
+        asdl.Field('string', 'name'),
+    ]),
+    asdl.Constructor('LeftIndex', [
+        asdl.Field('arith_expr', 'obj'),
+        asdl.Field('arith_expr', 'index'),
+    ]),
+])
+_arith_expr_desc = asdl.Sum([
+    asdl.Constructor('RightVar', [
+        asdl.Field('string', 'name'),
+    ]),
+    asdl.Constructor('ArithWord', [
+        asdl.Field('word', 'w'),
+    ]),
+    asdl.Constructor('ArithUnary', [
+        asdl.Field('id', 'op_id'),
+        asdl.Field('arith_expr', 'child'),
+    ]),
+    asdl.Constructor('ArithBinary', [
+        asdl.Field('id', 'op_id'),
+        asdl.Field('arith_expr', 'left'),
+        asdl.Field('arith_expr', 'right'),
+    ]),
+    asdl.Constructor('ArithAssign', [
+        asdl.Field('id', 'op_id'),
+        asdl.Field('lvalue', 'left'),
+        asdl.Field('arith_expr', 'right'),
+    ]),
+    asdl.Constructor('TernaryOp', [
+        asdl.Field('arith_expr', 'cond'),
+        asdl.Field('arith_expr', 'true_expr'),
+        asdl.Field('arith_expr', 'false_expr'),
+    ]),
+    asdl.Constructor('FuncCall', [
+        asdl.Field('arith_expr', 'func'),
+        asdl.Field('arith_expr', 'args', seq=True),
+    ]),
+])
+_bool_expr_desc = asdl.Sum([
+    asdl.Constructor('WordTest', [
+        asdl.Field('word', 'w'),
+    ]),
+    asdl.Constructor('BoolBinary', [
+        asdl.Field('id', 'op_id'),
+        asdl.Field('word', 'left'),
+        asdl.Field('word', 'right'),
+    ]),
+    asdl.Constructor('BoolUnary', [
+        asdl.Field('id', 'op_id'),
+        asdl.Field('word', 'child'),
+    ]),
+    asdl.Constructor('LogicalNot', [
+        asdl.Field('bool_expr', 'child'),
+    ]),
+    asdl.Constructor('LogicalAnd', [
+        asdl.Field('bool_expr', 'left'),
+        asdl.Field('bool_expr', 'right'),
+    ]),
+    asdl.Constructor('LogicalOr', [
+        asdl.Field('bool_expr', 'left'),
+        asdl.Field('bool_expr', 'right'),
+    ]),
+])
+_redir_desc = asdl.Sum([
+    asdl.Constructor('Redirect', [
+        asdl.Field('id', 'op_id'),
+        asdl.Field('word', 'arg_word'),
+        asdl.Field('int', 'fd'),
+    ]),
+    asdl.Constructor('HereDoc', [
+        asdl.Field('id', 'op_id'),
+        asdl.Field('word', 'arg_word', opt=True),
+        asdl.Field('int', 'fd'),
+        asdl.Field('int', 'do_expansion'),
+        asdl.Field('string', 'here_end'),
+        asdl.Field('bool', 'was_filled'),
+    ]),
+])
+_assign_pair_desc = asdl.Product([
+    asdl.Field('lvalue', 'lhs'),
+    asdl.Field('word', 'rhs', opt=True),
+])
+_env_pair_desc = asdl.Product([
+    asdl.Field('string', 'name'),
+    asdl.Field('word', 'val'),
+])
+_case_arm_desc = asdl.Product([
+    asdl.Field('word', 'pat_list', seq=True),
+    asdl.Field('command', 'action'),
+])
+_if_arm_desc = asdl.Product([
+    asdl.Field('command', 'cond'),
+    asdl.Field('command', 'action'),
+])
+_iterable_desc = asdl.Sum([
+    asdl.Constructor('IterArgv'),
+    asdl.Constructor('IterArray', [
+        asdl.Field('word', 'words', seq=True),
+    ]),
+])
+_command_desc = asdl.Sum([
+    asdl.Constructor('NoOp'),
+    asdl.Constructor('SimpleCommand', [
+        asdl.Field('word', 'words', seq=True),
+        asdl.Field('redir', 'redirects', seq=True),
+        asdl.Field('env_pair', 'more_env', seq=True),
+    ]),
+    asdl.Constructor('Sentence', [
+        asdl.Field('command', 'command'),
+        asdl.Field('token', 'terminator'),
+    ]),
+    asdl.Constructor('Assignment', [
+        asdl.Field('id', 'keyword'),
+        asdl.Field('assign_pair', 'pairs', seq=True),
+    ]),
+    asdl.Constructor('ControlFlow', [
+        asdl.Field('token', 'token'),
+        asdl.Field('word', 'arg_word', opt=True),
+    ]),
+    asdl.Constructor('Pipeline', [
+        asdl.Field('command', 'children', seq=True),
+        asdl.Field('bool', 'negated'),
+        asdl.Field('int', 'stderr_indices', seq=True),
+    ]),
+    asdl.Constructor('AndOr', [
+        asdl.Field('command', 'children', seq=True),
+        asdl.Field('id', 'op_id'),
+    ]),
+    asdl.Constructor('CommandList', [
+        asdl.Field('command', 'children', seq=True),
+    ]),
+    asdl.Constructor('DoGroup', [
+        asdl.Field('command', 'child'),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('BraceGroup', [
+        asdl.Field('command', 'children', seq=True),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('Subshell', [
+        asdl.Field('command', 'children', seq=True),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('DParen', [
+        asdl.Field('arith_expr', 'child'),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('DBracket', [
+        asdl.Field('bool_expr', 'expr'),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('ForEach', [
+        asdl.Field('string', 'iter_name'),
+        asdl.Field('word', 'iter_words', seq=True),
+        asdl.Field('bool', 'do_arg_iter'),
+        asdl.Field('command', 'body'),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('ForExpr', [
+        asdl.Field('arith_expr', 'init', opt=True),
+        asdl.Field('arith_expr', 'cond', opt=True),
+        asdl.Field('arith_expr', 'update', opt=True),
+        asdl.Field('command', 'body', opt=True),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('While', [
+        asdl.Field('command', 'cond'),
+        asdl.Field('command', 'body'),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('Until', [
+        asdl.Field('command', 'cond'),
+        asdl.Field('command', 'body'),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('If', [
+        asdl.Field('if_arm', 'arms', seq=True),
+        asdl.Field('command', 'else_action', opt=True),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('Case', [
+        asdl.Field('word', 'to_match'),
+        asdl.Field('case_arm', 'arms', seq=True),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+    asdl.Constructor('FuncDef', [
+        asdl.Field('string', 'name'),
+        asdl.Field('command', 'body'),
+        asdl.Field('redir', 'redirects', seq=True),
+    ]),
+])
+_and_or_desc = asdl.Sum([
+    asdl.Constructor('DAmp'),
+    asdl.Constructor('DPipe'),
+])
+_arena_desc = asdl.Product([
+    asdl.Field('string', 'lines', seq=True),
+    asdl.Field('line_span', 'spans', seq=True),
+    asdl.Field('command', 'root'),
+])
+_whole_file_desc = asdl.Product([
+    asdl.Field('string', 'path'),
+    asdl.Field('arena', 'a'),
+])
+_partial_file_desc = asdl.Product([
+    asdl.Field('string', 'path'),
+    asdl.Field('arena', 'funcs', seq=True),
+])
+
+
+class line_span(_CompoundObj):
+  DESCRIPTOR = _line_span_desc
+  FIELDS = ['line_id', 'col', 'length', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'line_id': _INT,
+      'col': _INT,
+      'length': _INT,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('line_id', 'col', 'length', 'spids')
+    def __init__(self, line_id=None, col=None, length=None, spids=None):
+      self.line_id = line_id
+      self.col = col
+      self.length = length
+      self.spids = [] if spids is None else spids
+
+
+class token(_CompoundObj):
+  DESCRIPTOR = _token_desc
+  FIELDS = ['id', 'val', 'span_id', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'id': _id,
+      'val': _STR,
+      'span_id': asdl.MaybeType(_INT),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('id', 'val', 'span_id', 'spids')
+    def __init__(self, id=None, val=None, span_id=None, spids=None):
+      self.id = id
+      self.val = val
+      self.span_id = span_id
+      self.spids = [] if spids is None else spids
+
+
+class bracket_op(_CompoundObj):
+  DESCRIPTOR = _bracket_op_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class WholeArray(bracket_op):
+  tag = 1
+  DESCRIPTOR = _bracket_op_desc.types[0]
+  FIELDS = ['op_id', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'op_id': _id,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('op_id', 'spids')
+    def __init__(self, op_id=None, spids=None):
+      self.op_id = op_id
+      self.spids = [] if spids is None else spids
+
+
+class ArrayIndex(bracket_op):
+  tag = 2
+  DESCRIPTOR = _bracket_op_desc.types[1]
+  FIELDS = ['expr', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'expr': _arith_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('expr', 'spids')
+    def __init__(self, expr=None, spids=None):
+      self.expr = expr
+      self.spids = [] if spids is None else spids
+
+
+class bracket_op_e(object):
+  WholeArray = 1
+  ArrayIndex = 2
+
+
+class suffix_op(_CompoundObj):
+  DESCRIPTOR = _suffix_op_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class StringUnary(suffix_op):
+  tag = 1
+  DESCRIPTOR = _suffix_op_desc.types[0]
+  FIELDS = ['op_id', 'arg_word', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'op_id': _id,
+      'arg_word': _word_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('op_id', 'arg_word', 'spids')
+    def __init__(self, op_id=None, arg_word=None, spids=None):
+      self.op_id = op_id
+      self.arg_word = arg_word
+      self.spids = [] if spids is None else spids
+
+
+class PatSub(suffix_op):
+  tag = 2
+  DESCRIPTOR = _suffix_op_desc.types[1]
+  FIELDS = ['pat', 'replace', 'do_all', 'do_prefix', 'do_suffix', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'pat': _word_desc,
+      'replace': asdl.MaybeType(_word_desc),
+      'do_all': _BOOL,
+      'do_prefix': _BOOL,
+      'do_suffix': _BOOL,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('pat', 'replace', 'do_all', 'do_prefix', 'do_suffix', 'spids')
+    def __init__(self, pat=None, replace=None, do_all=None, do_prefix=None, do_suffix=None, spids=None):
+      self.pat = pat
+      self.replace = replace
+      self.do_all = do_all
+      self.do_prefix = do_prefix
+      self.do_suffix = do_suffix
+      self.spids = [] if spids is None else spids
+
+
+class Slice(suffix_op):
+  tag = 3
+  DESCRIPTOR = _suffix_op_desc.types[2]
+  FIELDS = ['begin', 'length', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'begin': asdl.MaybeType(_arith_expr_desc),
+      'length': asdl.MaybeType(_arith_expr_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('begin', 'length', 'spids')
+    def __init__(self, begin=None, length=None, spids=None):
+      self.begin = begin
+      self.length = length
+      self.spids = [] if spids is None else spids
+
+
+class suffix_op_e(object):
+  StringUnary = 1
+  PatSub = 2
+  Slice = 3
+
+
+class array_item(_CompoundObj):
+  DESCRIPTOR = _array_item_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class ArrayWord(array_item):
+  tag = 1
+  DESCRIPTOR = _array_item_desc.types[0]
+  FIELDS = ['w', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'w': _word_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('w', 'spids')
+    def __init__(self, w=None, spids=None):
+      self.w = w
+      self.spids = [] if spids is None else spids
+
+
+class ArrayPair(array_item):
+  tag = 2
+  DESCRIPTOR = _array_item_desc.types[1]
+  FIELDS = ['key', 'value', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'key': _word_desc,
+      'value': _word_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('key', 'value', 'spids')
+    def __init__(self, key=None, value=None, spids=None):
+      self.key = key
+      self.value = value
+      self.spids = [] if spids is None else spids
+
+
+class array_item_e(object):
+  ArrayWord = 1
+  ArrayPair = 2
+
+
+class word_part(_CompoundObj):
+  DESCRIPTOR = _word_part_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class ArrayLiteralPart(word_part):
+  tag = 1
+  DESCRIPTOR = _word_part_desc.types[0]
+  FIELDS = ['words', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'words': asdl.ArrayType(_word_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('words', 'spids')
+    def __init__(self, words=None, spids=None):
+      self.words = [] if words is None else words
+      self.spids = [] if spids is None else spids
+
+
+class LiteralPart(word_part):
+  tag = 2
+  DESCRIPTOR = _word_part_desc.types[1]
+  FIELDS = ['token', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'token': _token_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('token', 'spids')
+    def __init__(self, token=None, spids=None):
+      self.token = token
+      self.spids = [] if spids is None else spids
+
+
+class EscapedLiteralPart(word_part):
+  tag = 3
+  DESCRIPTOR = _word_part_desc.types[2]
+  FIELDS = ['token', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'token': _token_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('token', 'spids')
+    def __init__(self, token=None, spids=None):
+      self.token = token
+      self.spids = [] if spids is None else spids
+
+
+class SingleQuotedPart(word_part):
+  tag = 4
+  DESCRIPTOR = _word_part_desc.types[3]
+  FIELDS = ['tokens', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'tokens': asdl.ArrayType(_token_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('tokens', 'spids')
+    def __init__(self, tokens=None, spids=None):
+      self.tokens = [] if tokens is None else tokens
+      self.spids = [] if spids is None else spids
+
+
+class DoubleQuotedPart(word_part):
+  tag = 5
+  DESCRIPTOR = _word_part_desc.types[4]
+  FIELDS = ['parts', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'parts': asdl.ArrayType(_word_part_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('parts', 'spids')
+    def __init__(self, parts=None, spids=None):
+      self.parts = [] if parts is None else parts
+      self.spids = [] if spids is None else spids
+
+
+class SimpleVarSub(word_part):
+  tag = 6
+  DESCRIPTOR = _word_part_desc.types[5]
+  FIELDS = ['token', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'token': _token_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('token', 'spids')
+    def __init__(self, token=None, spids=None):
+      self.token = token
+      self.spids = [] if spids is None else spids
+
+
+class BracedVarSub(word_part):
+  tag = 7
+  DESCRIPTOR = _word_part_desc.types[6]
+  FIELDS = ['token', 'prefix_op', 'bracket_op', 'suffix_op', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'token': _token_desc,
+      'prefix_op': asdl.MaybeType(_id),
+      'bracket_op': asdl.MaybeType(_bracket_op_desc),
+      'suffix_op': asdl.MaybeType(_suffix_op_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('token', 'prefix_op', 'bracket_op', 'suffix_op', 'spids')
+    def __init__(self, token=None, prefix_op=None, bracket_op=None, suffix_op=None, spids=None):
+      self.token = token
+      self.prefix_op = prefix_op
+      self.bracket_op = bracket_op
+      self.suffix_op = suffix_op
+      self.spids = [] if spids is None else spids
+
+
+class TildeSubPart(word_part):
+  tag = 8
+  DESCRIPTOR = _word_part_desc.types[7]
+  FIELDS = ['prefix', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'prefix': _STR,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('prefix', 'spids')
+    def __init__(self, prefix=None, spids=None):
+      self.prefix = prefix
+      self.spids = [] if spids is None else spids
+
+
+class CommandSubPart(word_part):
+  tag = 9
+  DESCRIPTOR = _word_part_desc.types[8]
+  FIELDS = ['command_list', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'command_list': _command_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('command_list', 'spids')
+    def __init__(self, command_list=None, spids=None):
+      self.command_list = command_list
+      self.spids = [] if spids is None else spids
+
+
+class ArithSubPart(word_part):
+  tag = 10
+  DESCRIPTOR = _word_part_desc.types[9]
+  FIELDS = ['anode', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'anode': _arith_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('anode', 'spids')
+    def __init__(self, anode=None, spids=None):
+      self.anode = anode
+      self.spids = [] if spids is None else spids
+
+
+class BracedAltPart(word_part):
+  tag = 11
+  DESCRIPTOR = _word_part_desc.types[10]
+  FIELDS = ['words', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'words': asdl.ArrayType(_word_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('words', 'spids')
+    def __init__(self, words=None, spids=None):
+      self.words = [] if words is None else words
+      self.spids = [] if spids is None else spids
+
+
+class BracedIntRangePart(word_part):
+  tag = 12
+  DESCRIPTOR = _word_part_desc.types[11]
+  FIELDS = ['start', 'end', 'step', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'start': _INT,
+      'end': _INT,
+      'step': asdl.MaybeType(_INT),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('start', 'end', 'step', 'spids')
+    def __init__(self, start=None, end=None, step=None, spids=None):
+      self.start = start
+      self.end = end
+      self.step = step
+      self.spids = [] if spids is None else spids
+
+
+class BracedCharRangePart(word_part):
+  tag = 13
+  DESCRIPTOR = _word_part_desc.types[12]
+  FIELDS = ['start', 'end', 'step', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'start': _STR,
+      'end': _STR,
+      'step': asdl.MaybeType(_INT),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('start', 'end', 'step', 'spids')
+    def __init__(self, start=None, end=None, step=None, spids=None):
+      self.start = start
+      self.end = end
+      self.step = step
+      self.spids = [] if spids is None else spids
+
+
+class word_part_e(object):
+  ArrayLiteralPart = 1
+  LiteralPart = 2
+  EscapedLiteralPart = 3
+  SingleQuotedPart = 4
+  DoubleQuotedPart = 5
+  SimpleVarSub = 6
+  BracedVarSub = 7
+  TildeSubPart = 8
+  CommandSubPart = 9
+  ArithSubPart = 10
+  BracedAltPart = 11
+  BracedIntRangePart = 12
+  BracedCharRangePart = 13
+
+
+class word(_CompoundObj):
+  DESCRIPTOR = _word_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class TokenWord(word):
+  tag = 1
+  DESCRIPTOR = _word_desc.types[0]
+  FIELDS = ['token', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'token': _token_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('token', 'spids')
+    def __init__(self, token=None, spids=None):
+      self.token = token
+      self.spids = [] if spids is None else spids
+
+
+class CompoundWord(word):
+  tag = 2
+  DESCRIPTOR = _word_desc.types[1]
+  FIELDS = ['parts', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'parts': asdl.ArrayType(_word_part_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('parts', 'spids')
+    def __init__(self, parts=None, spids=None):
+      self.parts = [] if parts is None else parts
+      self.spids = [] if spids is None else spids
+
+
+class BracedWordTree(word):
+  tag = 3
+  DESCRIPTOR = _word_desc.types[2]
+  FIELDS = ['parts', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'parts': asdl.ArrayType(_word_part_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('parts', 'spids')
+    def __init__(self, parts=None, spids=None):
+      self.parts = [] if parts is None else parts
+      self.spids = [] if spids is None else spids
+
+
+class word_e(object):
+  TokenWord = 1
+  CompoundWord = 2
+  BracedWordTree = 3
+
+
+class lvalue(_CompoundObj):
+  DESCRIPTOR = _lvalue_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class LeftVar(lvalue):
+  tag = 1
+  DESCRIPTOR = _lvalue_desc.types[0]
+  FIELDS = ['name', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'name': _STR,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('name', 'spids')
+    def __init__(self, name=None, spids=None):
+      self.name = name
+      self.spids = [] if spids is None else spids
+
+
+class LeftIndex(lvalue):
+  tag = 2
+  DESCRIPTOR = _lvalue_desc.types[1]
+  FIELDS = ['obj', 'index', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'obj': _arith_expr_desc,
+      'index': _arith_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('obj', 'index', 'spids')
+    def __init__(self, obj=None, index=None, spids=None):
+      self.obj = obj
+      self.index = index
+      self.spids = [] if spids is None else spids
+
+
+class lvalue_e(object):
+  LeftVar = 1
+  LeftIndex = 2
+
+
+class arith_expr(_CompoundObj):
+  DESCRIPTOR = _arith_expr_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class RightVar(arith_expr):
+  tag = 1
+  DESCRIPTOR = _arith_expr_desc.types[0]
+  FIELDS = ['name', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'name': _STR,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('name', 'spids')
+    def __init__(self, name=None, spids=None):
+      self.name = name
+      self.spids = [] if spids is None else spids
+
+
+class ArithWord(arith_expr):
+  tag = 2
+  DESCRIPTOR = _arith_expr_desc.types[1]
+  FIELDS = ['w', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'w': _word_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('w', 'spids')
+    def __init__(self, w=None, spids=None):
+      self.w = w
+      self.spids = [] if spids is None else spids
+
+
+class ArithUnary(arith_expr):
+  tag = 3
+  DESCRIPTOR = _arith_expr_desc.types[2]
+  FIELDS = ['op_id', 'child', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'op_id': _id,
+      'child': _arith_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('op_id', 'child', 'spids')
+    def __init__(self, op_id=None, child=None, spids=None):
+      self.op_id = op_id
+      self.child = child
+      self.spids = [] if spids is None else spids
+
+
+class ArithBinary(arith_expr):
+  tag = 4
+  DESCRIPTOR = _arith_expr_desc.types[3]
+  FIELDS = ['op_id', 'left', 'right', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'op_id': _id,
+      'left': _arith_expr_desc,
+      'right': _arith_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('op_id', 'left', 'right', 'spids')
+    def __init__(self, op_id=None, left=None, right=None, spids=None):
+      self.op_id = op_id
+      self.left = left
+      self.right = right
+      self.spids = [] if spids is None else spids
+
+
+class ArithAssign(arith_expr):
+  tag = 5
+  DESCRIPTOR = _arith_expr_desc.types[4]
+  FIELDS = ['op_id', 'left', 'right', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'op_id': _id,
+      'left': _lvalue_desc,
+      'right': _arith_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('op_id', 'left', 'right', 'spids')
+    def __init__(self, op_id=None, left=None, right=None, spids=None):
+      self.op_id = op_id
+      self.left = left
+      self.right = right
+      self.spids = [] if spids is None else spids
+
+
+class TernaryOp(arith_expr):
+  tag = 6
+  DESCRIPTOR = _arith_expr_desc.types[5]
+  FIELDS = ['cond', 'true_expr', 'false_expr', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'cond': _arith_expr_desc,
+      'true_expr': _arith_expr_desc,
+      'false_expr': _arith_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('cond', 'true_expr', 'false_expr', 'spids')
+    def __init__(self, cond=None, true_expr=None, false_expr=None, spids=None):
+      self.cond = cond
+      self.true_expr = true_expr
+      self.false_expr = false_expr
+      self.spids = [] if spids is None else spids
+
+
+class FuncCall(arith_expr):
+  tag = 7
+  DESCRIPTOR = _arith_expr_desc.types[6]
+  FIELDS = ['func', 'args', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'func': _arith_expr_desc,
+      'args': asdl.ArrayType(_arith_expr_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('func', 'args', 'spids')
+    def __init__(self, func=None, args=None, spids=None):
+      self.func = func
+      self.args = [] if args is None else args
+      self.spids = [] if spids is None else spids
+
+
+class arith_expr_e(object):
+  RightVar = 1
+  ArithWord = 2
+  ArithUnary = 3
+  ArithBinary = 4
+  ArithAssign = 5
+  TernaryOp = 6
+  FuncCall = 7
+
+
+class bool_expr(_CompoundObj):
+  DESCRIPTOR = _bool_expr_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class WordTest(bool_expr):
+  tag = 1
+  DESCRIPTOR = _bool_expr_desc.types[0]
+  FIELDS = ['w', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'w': _word_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('w', 'spids')
+    def __init__(self, w=None, spids=None):
+      self.w = w
+      self.spids = [] if spids is None else spids
+
+
+class BoolBinary(bool_expr):
+  tag = 2
+  DESCRIPTOR = _bool_expr_desc.types[1]
+  FIELDS = ['op_id', 'left', 'right', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'op_id': _id,
+      'left': _word_desc,
+      'right': _word_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('op_id', 'left', 'right', 'spids')
+    def __init__(self, op_id=None, left=None, right=None, spids=None):
+      self.op_id = op_id
+      self.left = left
+      self.right = right
+      self.spids = [] if spids is None else spids
+
+
+class BoolUnary(bool_expr):
+  tag = 3
+  DESCRIPTOR = _bool_expr_desc.types[2]
+  FIELDS = ['op_id', 'child', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'op_id': _id,
+      'child': _word_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('op_id', 'child', 'spids')
+    def __init__(self, op_id=None, child=None, spids=None):
+      self.op_id = op_id
+      self.child = child
+      self.spids = [] if spids is None else spids
+
+
+class LogicalNot(bool_expr):
+  tag = 4
+  DESCRIPTOR = _bool_expr_desc.types[3]
+  FIELDS = ['child', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'child': _bool_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('child', 'spids')
+    def __init__(self, child=None, spids=None):
+      self.child = child
+      self.spids = [] if spids is None else spids
+
+
+class LogicalAnd(bool_expr):
+  tag = 5
+  DESCRIPTOR = _bool_expr_desc.types[4]
+  FIELDS = ['left', 'right', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'left': _bool_expr_desc,
+      'right': _bool_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('left', 'right', 'spids')
+    def __init__(self, left=None, right=None, spids=None):
+      self.left = left
+      self.right = right
+      self.spids = [] if spids is None else spids
+
+
+class LogicalOr(bool_expr):
+  tag = 6
+  DESCRIPTOR = _bool_expr_desc.types[5]
+  FIELDS = ['left', 'right', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'left': _bool_expr_desc,
+      'right': _bool_expr_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('left', 'right', 'spids')
+    def __init__(self, left=None, right=None, spids=None):
+      self.left = left
+      self.right = right
+      self.spids = [] if spids is None else spids
+
+
+class bool_expr_e(object):
+  WordTest = 1
+  BoolBinary = 2
+  BoolUnary = 3
+  LogicalNot = 4
+  LogicalAnd = 5
+  LogicalOr = 6
+
+
+class redir(_CompoundObj):
+  DESCRIPTOR = _redir_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class Redirect(redir):
+  tag = 1
+  DESCRIPTOR = _redir_desc.types[0]
+  FIELDS = ['op_id', 'arg_word', 'fd', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'op_id': _id,
+      'arg_word': _word_desc,
+      'fd': _INT,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('op_id', 'arg_word', 'fd', 'spids')
+    def __init__(self, op_id=None, arg_word=None, fd=None, spids=None):
+      self.op_id = op_id
+      self.arg_word = arg_word
+      self.fd = fd
+      self.spids = [] if spids is None else spids
+
+
+class HereDoc(redir):
+  tag = 2
+  DESCRIPTOR = _redir_desc.types[1]
+  FIELDS = ['op_id', 'arg_word', 'fd', 'do_expansion', 'here_end', 'was_filled', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'op_id': _id,
+      'arg_word': asdl.MaybeType(_word_desc),
+      'fd': _INT,
+      'do_expansion': _INT,
+      'here_end': _STR,
+      'was_filled': _BOOL,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('op_id', 'arg_word', 'fd', 'do_expansion', 'here_end', 'was_filled', 'spids')
+    def __init__(self, op_id=None, arg_word=None, fd=None, do_expansion=None, here_end=None, was_filled=None, spids=None):
+      self.op_id = op_id
+      self.arg_word = arg_word
+      self.fd = fd
+      self.do_expansion = do_expansion
+      self.here_end = here_end
+      self.was_filled = was_filled
+      self.spids = [] if spids is None else spids
+
+
+class redir_e(object):
+  Redirect = 1
+  HereDoc = 2
+
+
+class assign_pair(_CompoundObj):
+  DESCRIPTOR = _assign_pair_desc
+  FIELDS = ['lhs', 'rhs', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'lhs': _lvalue_desc,
+      'rhs': asdl.MaybeType(_word_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('lhs', 'rhs', 'spids')
+    def __init__(self, lhs=None, rhs=None, spids=None):
+      self.lhs = lhs
+      self.rhs = rhs
+      self.spids = [] if spids is None else spids
+
+
+class env_pair(_CompoundObj):
+  DESCRIPTOR = _env_pair_desc
+  FIELDS = ['name', 'val', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'name': _STR,
+      'val': _word_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('name', 'val', 'spids')
+    def __init__(self, name=None, val=None, spids=None):
+      self.name = name
+      self.val = val
+      self.spids = [] if spids is None else spids
+
+
+class case_arm(_CompoundObj):
+  DESCRIPTOR = _case_arm_desc
+  FIELDS = ['pat_list', 'action', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'pat_list': asdl.ArrayType(_word_desc),
+      'action': _command_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('pat_list', 'action', 'spids')
+    def __init__(self, pat_list=None, action=None, spids=None):
+      self.pat_list = [] if pat_list is None else pat_list
+      self.action = action
+      self.spids = [] if spids is None else spids
+
+
+class if_arm(_CompoundObj):
+  DESCRIPTOR = _if_arm_desc
+  FIELDS = ['cond', 'action', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'cond': _command_desc,
+      'action': _command_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('cond', 'action', 'spids')
+    def __init__(self, cond=None, action=None, spids=None):
+      self.cond = cond
+      self.action = action
+      self.spids = [] if spids is None else spids
+
+
+class iterable(_CompoundObj):
+  DESCRIPTOR = _iterable_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class IterArgv(iterable):
+  tag = 1
+  DESCRIPTOR = _iterable_desc.types[0]
+  FIELDS = ['spids']
+  DESCRIPTOR_LOOKUP = {
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('spids',)
+    def __init__(self, spids=None):
+      self.spids = [] if spids is None else spids
+
+
+class IterArray(iterable):
+  tag = 2
+  DESCRIPTOR = _iterable_desc.types[1]
+  FIELDS = ['words', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'words': asdl.ArrayType(_word_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('words', 'spids')
+    def __init__(self, words=None, spids=None):
+      self.words = [] if words is None else words
+      self.spids = [] if spids is None else spids
+
+
+class iterable_e(object):
+  IterArgv = 1
+  IterArray = 2
+
+
+class command(_CompoundObj):
+  DESCRIPTOR = _command_desc
+  if py_meta.RELEASE:
+    __slots__ = ()
+
+
+class NoOp(command):
+  tag = 1
+  DESCRIPTOR = _command_desc.types[0]
+  FIELDS = ['spids']
+  DESCRIPTOR_LOOKUP = {
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('spids',)
+    def __init__(self, spids=None):
+      self.spids = [] if spids is None else spids
+
+
+class SimpleCommand(command):
+  tag = 2
+  DESCRIPTOR = _command_desc.types[1]
+  FIELDS = ['words', 'redirects', 'more_env', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'words': asdl.ArrayType(_word_desc),
+      'redirects': asdl.ArrayType(_redir_desc),
+      'more_env': asdl.ArrayType(_env_pair_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('words', 'redirects', 'more_env', 'spids')
+    def __init__(self, words=None, redirects=None, more_env=None, spids=None):
+      self.words = [] if words is None else words
+      self.redirects = [] if redirects is None else redirects
+      self.more_env = [] if more_env is None else more_env
+      self.spids = [] if spids is None else spids
+
+
+class Sentence(command):
+  tag = 3
+  DESCRIPTOR = _command_desc.types[2]
+  FIELDS = ['command', 'terminator', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'command': _command_desc,
+      'terminator': _token_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('command', 'terminator', 'spids')
+    def __init__(self, command=None, terminator=None, spids=None):
+      self.command = command
+      self.terminator = terminator
+      self.spids = [] if spids is None else spids
+
+
+class Assignment(command):
+  tag = 4
+  DESCRIPTOR = _command_desc.types[3]
+  FIELDS = ['keyword', 'pairs', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'keyword': _id,
+      'pairs': asdl.ArrayType(_assign_pair_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('keyword', 'pairs', 'spids')
+    def __init__(self, keyword=None, pairs=None, spids=None):
+      self.keyword = keyword
+      self.pairs = [] if pairs is None else pairs
+      self.spids = [] if spids is None else spids
+
+
+class ControlFlow(command):
+  tag = 5
+  DESCRIPTOR = _command_desc.types[4]
+  FIELDS = ['token', 'arg_word', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'token': _token_desc,
+      'arg_word': asdl.MaybeType(_word_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('token', 'arg_word', 'spids')
+    def __init__(self, token=None, arg_word=None, spids=None):
+      self.token = token
+      self.arg_word = arg_word
+      self.spids = [] if spids is None else spids
+
+
+class Pipeline(command):
+  tag = 6
+  DESCRIPTOR = _command_desc.types[5]
+  FIELDS = ['children', 'negated', 'stderr_indices', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'children': asdl.ArrayType(_command_desc),
+      'negated': _BOOL,
+      'stderr_indices': asdl.ArrayType(_INT),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('children', 'negated', 'stderr_indices', 'spids')
+    def __init__(self, children=None, negated=None, stderr_indices=None, spids=None):
+      self.children = [] if children is None else children
+      self.negated = negated
+      self.stderr_indices = [] if stderr_indices is None else stderr_indices
+      self.spids = [] if spids is None else spids
+
+
+class AndOr(command):
+  tag = 7
+  DESCRIPTOR = _command_desc.types[6]
+  FIELDS = ['children', 'op_id', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'children': asdl.ArrayType(_command_desc),
+      'op_id': _id,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('children', 'op_id', 'spids')
+    def __init__(self, children=None, op_id=None, spids=None):
+      self.children = [] if children is None else children
+      self.op_id = op_id
+      self.spids = [] if spids is None else spids
+
+
+class CommandList(command):
+  tag = 8
+  DESCRIPTOR = _command_desc.types[7]
+  FIELDS = ['children', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'children': asdl.ArrayType(_command_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('children', 'spids')
+    def __init__(self, children=None, spids=None):
+      self.children = [] if children is None else children
+      self.spids = [] if spids is None else spids
+
+
+class DoGroup(command):
+  tag = 9
+  DESCRIPTOR = _command_desc.types[8]
+  FIELDS = ['child', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'child': _command_desc,
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('child', 'redirects', 'spids')
+    def __init__(self, child=None, redirects=None, spids=None):
+      self.child = child
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class BraceGroup(command):
+  tag = 10
+  DESCRIPTOR = _command_desc.types[9]
+  FIELDS = ['children', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'children': asdl.ArrayType(_command_desc),
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('children', 'redirects', 'spids')
+    def __init__(self, children=None, redirects=None, spids=None):
+      self.children = [] if children is None else children
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class Subshell(command):
+  tag = 11
+  DESCRIPTOR = _command_desc.types[10]
+  FIELDS = ['children', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'children': asdl.ArrayType(_command_desc),
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('children', 'redirects', 'spids')
+    def __init__(self, children=None, redirects=None, spids=None):
+      self.children = [] if children is None else children
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class DParen(command):
+  tag = 12
+  DESCRIPTOR = _command_desc.types[11]
+  FIELDS = ['child', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'child': _arith_expr_desc,
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('child', 'redirects', 'spids')
+    def __init__(self, child=None, redirects=None, spids=None):
+      self.child = child
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class DBracket(command):
+  tag = 13
+  DESCRIPTOR = _command_desc.types[12]
+  FIELDS = ['expr', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'expr': _bool_expr_desc,
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('expr', 'redirects', 'spids')
+    def __init__(self, expr=None, redirects=None, spids=None):
+      self.expr = expr
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class ForEach(command):
+  tag = 14
+  DESCRIPTOR = _command_desc.types[13]
+  FIELDS = ['iter_name', 'iter_words', 'do_arg_iter', 'body', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'iter_name': _STR,
+      'iter_words': asdl.ArrayType(_word_desc),
+      'do_arg_iter': _BOOL,
+      'body': _command_desc,
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('iter_name', 'iter_words', 'do_arg_iter', 'body', 'redirects', 'spids')
+    def __init__(self, iter_name=None, iter_words=None, do_arg_iter=None, body=None, redirects=None, spids=None):
+      self.iter_name = iter_name
+      self.iter_words = [] if iter_words is None else iter_words
+      self.do_arg_iter = do_arg_iter
+      self.body = body
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class ForExpr(command):
+  tag = 15
+  DESCRIPTOR = _command_desc.types[14]
+  FIELDS = ['init', 'cond', 'update', 'body', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'init': asdl.MaybeType(_arith_expr_desc),
+      'cond': asdl.MaybeType(_arith_expr_desc),
+      'update': asdl.MaybeType(_arith_expr_desc),
+      'body': asdl.MaybeType(_command_desc),
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('init', 'cond', 'update', 'body', 'redirects', 'spids')
+    def __init__(self, init=None, cond=None, update=None, body=None, redirects=None, spids=None):
+      self.init = init
+      self.cond = cond
+      self.update = update
+      self.body = body
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class While(command):
+  tag = 16
+  DESCRIPTOR = _command_desc.types[15]
+  FIELDS = ['cond', 'body', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'cond': _command_desc,
+      'body': _command_desc,
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('cond', 'body', 'redirects', 'spids')
+    def __init__(self, cond=None, body=None, redirects=None, spids=None):
+      self.cond = cond
+      self.body = body
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class Until(command):
+  tag = 17
+  DESCRIPTOR = _command_desc.types[16]
+  FIELDS = ['cond', 'body', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'cond': _command_desc,
+      'body': _command_desc,
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('cond', 'body', 'redirects', 'spids')
+    def __init__(self, cond=None, body=None, redirects=None, spids=None):
+      self.cond = cond
+      self.body = body
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class If(command):
+  tag = 18
+  DESCRIPTOR = _command_desc.types[17]
+  FIELDS = ['arms', 'else_action', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'arms': asdl.ArrayType(_if_arm_desc),
+      'else_action': asdl.MaybeType(_command_desc),
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('arms', 'else_action', 'redirects', 'spids')
+    def __init__(self, arms=None, else_action=None, redirects=None, spids=None):
+      self.arms = [] if arms is None else arms
+      self.else_action = else_action
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class Case(command):
+  tag = 19
+  DESCRIPTOR = _command_desc.types[18]
+  FIELDS = ['to_match', 'arms', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'to_match': _word_desc,
+      'arms': asdl.ArrayType(_case_arm_desc),
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('to_match', 'arms', 'redirects', 'spids')
+    def __init__(self, to_match=None, arms=None, redirects=None, spids=None):
+      self.to_match = to_match
+      self.arms = [] if arms is None else arms
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class FuncDef(command):
+  tag = 20
+  DESCRIPTOR = _command_desc.types[19]
+  FIELDS = ['name', 'body', 'redirects', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'name': _STR,
+      'body': _command_desc,
+      'redirects': asdl.ArrayType(_redir_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('name', 'body', 'redirects', 'spids')
+    def __init__(self, name=None, body=None, redirects=None, spids=None):
+      self.name = name
+      self.body = body
+      self.redirects = [] if redirects is None else redirects
+      self.spids = [] if spids is None else spids
+
+
+class command_e(object):
+  NoOp = 1
+  SimpleCommand = 2
+  Sentence = 3
+  Assignment = 4
+  ControlFlow = 5
+  Pipeline = 6
+  AndOr = 7
+  CommandList = 8
+  DoGroup = 9
+  BraceGroup = 10
+  Subshell = 11
+  DParen = 12
+  DBracket = 13
+  ForEach = 14
+  ForExpr = 15
+  While = 16
+  Until = 17
+  If = 18
+  Case = 19
+  FuncDef = 20
+
+
+class and_or(py_meta.SimpleObj):
+  DESCRIPTOR = _and_or_desc
+
+and_or.DAmp = and_or(1, 'DAmp')
+and_or.DPipe = and_or(2, 'DPipe')
+
+
+class arena(_CompoundObj):
+  DESCRIPTOR = _arena_desc
+  FIELDS = ['lines', 'spans', 'root', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'lines': asdl.ArrayType(_STR),
+      'spans': asdl.ArrayType(_line_span_desc),
+      'root': _command_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('lines', 'spans', 'root', 'spids')
+    def __init__(self, lines=None, spans=None, root=None, spids=None):
+      self.lines = [] if lines is None else lines
+      self.spans = [] if spans is None else spans
+      self.root = root
+      self.spids = [] if spids is None else spids
+
+
+class whole_file(_CompoundObj):
+  DESCRIPTOR = _whole_file_desc
+  FIELDS = ['path', 'a', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'path': _STR,
+      'a': _arena_desc,
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('path', 'a', 'spids')
+    def __init__(self, path=None, a=None, spids=None):
+      self.path = path
+      self.a = a
+      self.spids = [] if spids is None else spids
+
+
+class partial_file(_CompoundObj):
+  DESCRIPTOR = _partial_file_desc
+  FIELDS = ['path', 'funcs', 'spids']
+  DESCRIPTOR_LOOKUP = {
+      'path': _STR,
+      'funcs': asdl.ArrayType(_arena_desc),
+      'spids': _SPIDS,
+  }
+  if py_meta.RELEASE:
+    __slots__ = ('path', 'funcs', 'spids')
+    def __init__(self, path=None, funcs=None, spids=None):
+      self.path = path
+      self.funcs = [] if funcs is None else funcs
+      self.spids = [] if spids is None else spids
+
+
+__all__ = [
+    'line_span',
+    'token',
+    'bracket_op',
+    'WholeArray',
+    'ArrayIndex',
+    'bracket_op_e',
+    'suffix_op',
+    'StringUnary',
+    'PatSub',
+    'Slice',
+    'suffix_op_e',
+    'array_item',
+    'ArrayWord',
+    'ArrayPair',
+    'array_item_e',
+    'word_part',
+    'ArrayLiteralPart',
+    'LiteralPart',
+    'EscapedLiteralPart',
+    'SingleQuotedPart',
+    'DoubleQuotedPart',
+    'SimpleVarSub',
+    'BracedVarSub',
+    'TildeSubPart',
+    'CommandSubPart',
+    'ArithSubPart',
+    'BracedAltPart',
+    'BracedIntRangePart',
+    'BracedCharRangePart',
+    'word_part_e',
+    'word',
+    'TokenWord',
+    'CompoundWord',
+    'BracedWordTree',
+    'word_e',
+    'lvalue',
+    'LeftVar',
+    'LeftIndex',
+    'lvalue_e',
+    'arith_expr',
+    'RightVar',
+    'ArithWord',
+    'ArithUnary',
+    'ArithBinary',
+    'ArithAssign',
+    'TernaryOp',
+    'FuncCall',
+    'arith_expr_e',
+    'bool_expr',
+    'WordTest',
+    'BoolBinary',
+    'BoolUnary',
+    'LogicalNot',
+    'LogicalAnd',
+    'LogicalOr',
+    'bool_expr_e',
+    'redir',
+    'Redirect',
+    'HereDoc',
+    'redir_e',
+    'assign_pair',
+    'env_pair',
+    'case_arm',
+    'if_arm',
+    'iterable',
+    'IterArgv',
+    'IterArray',
+    'iterable_e',
+    'command',
+    'NoOp',
+    'SimpleCommand',
+    'Sentence',
+    'Assignment',
+    'ControlFlow',
+    'Pipeline',
+    'AndOr',
+    'CommandList',
+    'DoGroup',
+    'BraceGroup',
+    'Subshell',
+    'DParen',
+    'DBracket',
+    'ForEach',
+    'ForExpr',
+    'While',
+    'Until',
+    'If',
+    'Case',
+    'FuncDef',
+    'command_e',
+    'and_or',
+    'arena',
+    'whole_file',
+    'partial_file',
+]
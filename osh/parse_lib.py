@@ -12,9 +12,20 @@ from osh import word_parse
 from osh import cmd_parse
 
 
+_lexer_def = None  # lexer.CompiledLexerDef shared by every parser
+
+
+def _GetLexerDef():
+  """Compile lex.LEXER_DEF the first time a parser is created."""
+  global _lexer_def
+  if _lexer_def is None:
+    _lexer_def = lexer.CompiledLexerDef(lex.LEXER_DEF)
+  return _lexer_def
+
+
 def InitLexer(s, arena=None):
   """For tests only."""
-  line_lexer = lexer.LineLexer(lex.LEXER_DEF, '', arena=arena)
+  line_lexer = lexer.LineLexer(_GetLexerDef(), '', arena=arena)
   line_reader = reader.StringLineReader(s, arena=arena)
   lx = lexer.Lexer(line_lexer, line_reader)
   return line_reader, lx
@@ -29,7 +40,7 @@ def InitLexer(s, arena=None):
 def MakeParserForTop(line_reader, arena=None):
   """Top level parser."""
   # AtEnd() is true
-  line_lexer = lexer.LineLexer(lex.LEXER_DEF, '', arena=arena)
+  line_lexer = lexer.LineLexer(_GetLexerDef(), '', arena=arena)
   lx = lexer.Lexer(line_lexer, line_reader)
   w_parser = word_parse.WordParser(lx, line_reader)
   c_parser = cmd_parse.CommandParser(w_parser, lx, line_reader)
@@ -45,23 +56,27 @@ def MakeParserForCompletion(code_str):
   # NOTE: We don't need to use a arena here?  Or we need a "scratch arena" that
   # doesn't interfere with the rest of the program.
   line_reader = reader.StringLineReader(code_str)
-  line_lexer = lexer.LineLexer(lex.LEXER_DEF, '')  # AtEnd() is true
+  line_lexer = lexer.LineLexer(_GetLexerDef(), '')  # AtEnd() is true
   lx = lexer.Lexer(line_lexer, line_reader)
   w_parser = word_parse.WordParser(lx, line_reader)
   c_parser = cmd_parse.CommandParser(w_parser, lx, line_reader)
   return w_parser, c_parser
 
 
-def MakeParserForExecutor(code_str):
+def MakeParserForExecutor(code_str, arena=None):
   """Parser for source / eval."""
-  _, c_parser = MakeParserForCompletion(code_str)
+  if arena:
+    line_reader = reader.StringLineReader(code_str, arena=arena)
+    _, c_parser = MakeParserForTop(line_reader, arena=arena)
+  else:
+    _, c_parser = MakeParserForCompletion(code_str)
   return c_parser
 
 
 # TODO: This has to take an arena so it gets the spans.
 def MakeWordParserForHereDoc(lines):
   line_reader = reader.VirtualLineReader(lines)
-  line_lexer = lexer.LineLexer(lex.LEXER_DEF, '')
+  line_lexer = lexer.LineLexer(_GetLexerDef(), '')
   lx = lexer.Lexer(line_lexer, line_reader)
   return word_parse.WordParser(lx, line_reader)
 